@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+import path_util  # noqa: F401
+
+from hummingbot.data_feed.candles_feed.candles_downloader import DEFAULT_MAX_CONCURRENT_REQUESTS, CandlesDownloader
+
+
+def parse_date(value: str) -> float:
+    return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp()
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Download historical candles without starting the client. Interrupted downloads "
+                                     "are resumed from the chunks already stored.")
+        self.add_argument("connector", type=str,
+                          help="Candles feed connector (binance, binance_perpetual, gate_io, gate_io_perpetual, "
+                               "kucoin, ascend_ex).")
+        self.add_argument("--trading-pairs", "-p", type=str, required=True,
+                          help="Comma separated trading pairs (e.g. BTC-USDT,ETH-USDT).")
+        self.add_argument("--intervals", "-i", type=str, default="1m",
+                          help="Comma separated candles intervals (default: 1m).")
+        self.add_argument("--start", "-s", type=parse_date, required=True,
+                          help="First day to download (YYYY-MM-DD, UTC).")
+        self.add_argument("--end", "-e", type=parse_date, default=None,
+                          help="Day where the download ends (YYYY-MM-DD, UTC). Defaults to the current time.")
+        self.add_argument("--data-dir", "-d", type=str, default=None,
+                          help="Directory for the downloaded candles. Defaults to the client data directory.")
+        self.add_argument("--max-concurrent-requests", "-c", type=int, default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+                          help=f"Requests sent at the same time, within the connector rate limits "
+                               f"(default: {DEFAULT_MAX_CONCURRENT_REQUESTS}).")
+
+
+async def main(args: argparse.Namespace):
+    downloader = CandlesDownloader(connector=args.connector,
+                                   trading_pairs=args.trading_pairs.split(","),
+                                   intervals=args.intervals.split(","),
+                                   start_time=args.start,
+                                   end_time=args.end,
+                                   data_dir=args.data_dir,
+                                   max_concurrent_requests=args.max_concurrent_requests)
+    results = await downloader.download()
+    for (trading_pair, interval), result in results.items():
+        print(f"{trading_pair} {interval}: {result.records} candles, {len(result.gaps)} gaps -> {result.file_path}")
+        for gap_start, gap_end in result.gaps:
+            print(f"    missing candles between {gap_start} and {gap_end}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.get_event_loop().run_until_complete(main(CmdlineParser().parse_args()))
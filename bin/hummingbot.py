@@ -23,6 +23,7 @@ from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.utils import detect_available_port
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.exchange_info_cache import init_exchange_info_cache
 
 
 class UIStartListener(EventListener):
@@ -56,6 +57,7 @@ async def main_async(client_config_map: ClientConfigAdapter):
     init_logging("hummingbot_logs.yml", client_config_map)
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
+    init_exchange_info_cache(client_config_map)
 
     hb = HummingbotApplication.main_application(client_config_map)
 
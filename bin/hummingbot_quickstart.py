@@ -31,6 +31,7 @@ from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.management.console import start_management_console
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.exchange_info_cache import init_exchange_info_cache
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -82,12 +83,12 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
         logging.getLogger().error("Invalid password.")
         return
 
-    await Security.wait_til_decryption_done()
     await create_yml_files_legacy()
     init_logging("hummingbot_logs.yml", client_config_map)
     await read_system_configs_from_yml()
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
+    init_exchange_info_cache(client_config_map)
 
     hb = HummingbotApplication.main_application(client_config_map=client_config_map)
     # Todo: validate strategy and config_file_name before assinging
@@ -138,6 +138,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.log_queue import install_log_queue, uninstall_log_queue
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -161,7 +162,12 @@ def init_logging(conf_filename: str,
             for logger in config_dict["loggers"]:
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        queue_config: Dict = config_dict.pop("queue", None) or {}
+        # The records queued for the current handlers are written before they are replaced
+        uninstall_log_queue()
         logging.config.dictConfig(config_dict)
+        if queue_config.get("enabled", False):
+            install_log_queue(config_dict, queue_config)
 
 
 def get_strategy_list() -> List[str]:
@@ -62,6 +62,12 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_notifier",
                              "mqtt_commands",
                              "mqtt_events",
+                             "mqtt_events_batch_window",
+                             "mqtt_events_compression",
+                             "mqtt_events_queue_size",
+                             "mqtt_market_data",
+                             "mqtt_market_data_depth",
+                             "mqtt_market_data_interval",
                              "mqtt_external_events",
                              "mqtt_autostart",
                              "instance_id",
@@ -72,6 +78,8 @@ client_configs_to_display = ["autofill_import",
                              "gateway",
                              "gateway_api_host",
                              "gateway_api_port",
+                             "gateway_quote_cache_ttl",
+                             "gateway_local_nonce_manager",
                              "rate_oracle_source",
                              "extra_tokens",
                              "global_token",
@@ -83,10 +91,34 @@ client_configs_to_display = ["autofill_import",
                              "other_commands_timeout",
                              "tables_format",
                              "tick_size",
+                             "strategy_tick_size",
                              "market_data_collection",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "trading_pairs_cache",
+                             "trading_pairs_cache_enabled",
+                             "trading_pairs_cache_ttl",
+                             "exchange_info_cache_enabled",
+                             "market_data_workers",
+                             "market_data_workers_enabled",
+                             "market_data_workers_depth",
+                             "market_data_workers_interval",
+                             "http_connections",
+                             "connection_limit",
+                             "connection_limit_per_host",
+                             "dns_cache_ttl",
+                             "keepalive_timeout",
+                             "keepalive_warmup_enabled",
+                             "keepalive_warmup_connections",
+                             "keepalive_warmup_interval",
+                             "market_data_relay",
+                             "market_data_relay_enabled",
+                             "market_data_relay_socket",
+                             "rate_limits_budget",
+                             "rate_limits_budget_sharing",
+                             "rate_limits_budget_dir",
+                             "high_priority_reserve_pct",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
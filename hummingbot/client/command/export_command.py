@@ -1,8 +1,7 @@
 import os
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
-import pandas as pd
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, joinedload
 
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
@@ -46,7 +45,7 @@ class ExportCommand:
 
     async def prompt_new_export_file_name(self,  # type: HummingbotApplication
                                           path):
-        input = await self.app.prompt(prompt="Enter a new csv file name >>> ")
+        input = await self.app.prompt(prompt="Enter a new csv (or parquet) file name >>> ")
         if input is None or input == "":
             self.notify("Value is required.")
             return await self.prompt_new_export_file_name(path)
@@ -64,10 +63,8 @@ class ExportCommand:
     async def export_trades(self,  # type: HummingbotApplication
                             ):
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(self.init_time * 1e3),
-                session=session)
-            if len(trades) == 0:
+            filters = self._get_trades_filters(int(self.init_time * 1e3))
+            if session.query(TradeFill.exchange_trade_id).filter(*filters).first() is None:
                 self.notify("No past trades to export.")
                 return
             self.placeholder_mode = True
@@ -80,8 +77,7 @@ class ExportCommand:
                 return
             file_path = os.path.join(path, file_name)
             try:
-                df: pd.DataFrame = TradeFill.to_pandas(trades)
-                df.to_csv(file_path, header=True)
+                self._export_trades_to_file(session, filters, file_path)
                 self.notify(f"Successfully exported trades to {file_path}")
             except Exception as e:
                 self.notify(f"Error exporting trades to {path}: {e}")
@@ -89,19 +85,62 @@ class ExportCommand:
             self.placeholder_mode = False
             self.app.hide_input = False
 
+    @staticmethod
+    def _export_trades_to_file(session: Session, filters: List[Any], file_path: str):
+        """
+        Writes the trades to a CSV file, or a Parquet file if the file name ends with .parquet, one chunk at a time.
+        """
+        chunks = TradeFill.iter_pandas_chunks(session, filters)
+        if file_path.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            writer = None
+            try:
+                for df in chunks:
+                    df = df.astype({"Price": float, "Amount": float})
+                    table = pa.Table.from_pandas(df, schema=writer.schema if writer is not None else None)
+                    if writer is None:
+                        writer = pq.ParquetWriter(file_path, table.schema)
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+        else:
+            for i, df in enumerate(chunks):
+                df.to_csv(file_path, mode="w" if i == 0 else "a", header=i == 0)
+
+    @staticmethod
+    def _get_trades_filters(start_timestamp: int,
+                            config_file_path: str = None,
+                            market: str = None,
+                            trading_pair: str = None) -> List[Any]:
+        filters = [TradeFill.timestamp >= start_timestamp]
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        if market is not None:
+            filters.append(TradeFill.market == market)
+        if trading_pair is not None:
+            filters.append(TradeFill.symbol == trading_pair)
+        return filters
+
     def _get_trades_from_session(self,  # type: HummingbotApplication
                                  start_timestamp: int,
                                  session: Session,
                                  number_of_rows: Optional[int] = None,
-                                 config_file_path: str = None) -> List[TradeFill]:
+                                 config_file_path: str = None,
+                                 market: str = None,
+                                 trading_pair: str = None,
+                                 load_orders: bool = False) -> List[TradeFill]:
 
-        filters = [TradeFill.timestamp >= start_timestamp]
-        if config_file_path is not None:
-            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        filters = self._get_trades_filters(start_timestamp, config_file_path, market, trading_pair)
         query: Query = (session
                         .query(TradeFill)
                         .filter(*filters)
                         .order_by(TradeFill.timestamp.desc()))
+        if load_orders:
+            # The orders are loaded in the same query instead of one query per trade
+            query = query.options(joinedload(TradeFill.order))
         if number_of_rows is None:
             result: List[TradeFill] = query.all() or []
         else:
@@ -138,11 +138,20 @@ class GatewayCommand(GatewayChainApiManager):
                     self.notify("There are currently no connectors online.")
                 else:
                     self.notify(pd.DataFrame(status))
+                self._notify_quote_cache_metrics()
             except Exception:
                 self.notify("\nError: Unable to fetch status of connected Gateway server.")
         else:
             self.notify("\nNo connection to Gateway server exists. Ensure Gateway server is running.")
 
+    def _notify_quote_cache_metrics(self):
+        metrics = self._get_gateway_instance().quote_cache_metrics
+        requests_count = metrics.hits + metrics.coalesced + metrics.misses
+        if requests_count > 0:
+            self.notify(f"\nPrice quotes: {requests_count} requested, {metrics.hits} served from the cache, "
+                        f"{metrics.coalesced} coalesced with identical requests "
+                        f"({metrics.hit_ratio:.1%} not sent to Gateway).")
+
     async def _update_gateway_configuration(self, key: str, value: Any):
         try:
             response = await self._get_gateway_instance().update_config(key, value)
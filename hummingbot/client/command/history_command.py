@@ -11,7 +11,7 @@ from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill import MarketTradesSummary, TradeFill
 from hummingbot.user.user_balances import UserBalances
 
 s_float_0 = float(0)
@@ -41,16 +41,15 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            markets_summary: List[MarketTradesSummary] = TradeFill.get_markets_summary(
+                session,
+                self._get_trades_filters(int(start_time * 1e3), config_file_path=self.strategy_file_name))
+        if not markets_summary:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        safe_ensure_future(self.history_report_by_market(start_time, markets_summary, precision))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -75,18 +74,56 @@ class HistoryCommand:
         return_pcts = []
         for market, symbol in market_info:
             cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await self._market_performance(market, symbol, cur_trades)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
+        return self._report_average_return(return_pcts, display_report)
+
+    async def history_report_by_market(self,  # type: HummingbotApplication
+                                       start_time: float,
+                                       markets_summary: List[MarketTradesSummary],
+                                       precision: Optional[int] = None,
+                                       display_report: bool = True) -> Decimal:
+        """
+        Reports the performance of the markets, loading the trades of one market at a time from the database instead
+        of all the trades of the strategy.
+        """
+        if display_report:
+            self.report_header(start_time)
+        return_pcts = []
+        for market_summary in markets_summary:
+            # The session is closed before waiting for the balances, to not keep the database connection meanwhile
+            with self.trade_fill_db.get_new_session() as session:
+                cur_trades: List[TradeFill] = self._get_trades_from_session(
+                    int(start_time * 1e3),
+                    session=session,
+                    config_file_path=self.strategy_file_name,
+                    market=market_summary.market,
+                    trading_pair=market_summary.symbol)
+            perf = await self._market_performance(market_summary.market, market_summary.symbol, cur_trades)
+            if display_report:
+                self.report_performance_by_market(market_summary.market, market_summary.symbol, perf, precision)
+            return_pcts.append(perf.return_pct)
+        return self._report_average_return(return_pcts, display_report)
+
+    async def _market_performance(self,  # type: HummingbotApplication
+                                  market: str,
+                                  symbol: str,
+                                  trades: List[TradeFill]) -> PerformanceMetrics:
+        network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+        try:
+            cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
+        return await PerformanceMetrics.create(symbol, trades, cur_balances)
+
+    def _report_average_return(self,  # type: HummingbotApplication
+                               return_pcts: List[Decimal],
+                               display_report: bool) -> Decimal:
         avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
         if display_report and len(return_pcts) > 1:
             self.notify(f"\nAveraged Return = {avg_return:.2%}")
@@ -204,11 +241,10 @@ class HistoryCommand:
         start_time = self.init_time
 
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+            markets_summary: List[MarketTradesSummary] = TradeFill.get_markets_summary(
+                session,
+                self._get_trades_filters(int(start_time * 1e3), config_file_path=self.strategy_file_name))
+        avg_return = await self.history_report_by_market(start_time, markets_summary, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -224,7 +260,8 @@ class HistoryCommand:
                 int(start_time * 1e3),
                 session=session,
                 number_of_rows=MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1,
-                config_file_path=self.strategy_file_name)
+                config_file_path=self.strategy_file_name,
+                load_orders=True)
             df: pd.DataFrame = TradeFill.to_pandas(queried_trades)
 
         if len(df) > 0:
@@ -15,6 +15,7 @@ from hummingbot.client.command.gateway_api_manager import GatewayChainApiManager
 from hummingbot.client.config.config_helpers import get_strategy_starter_file
 from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.security import Security
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
 from hummingbot.core.clock import Clock, ClockMode
@@ -117,6 +118,10 @@ class StartCommand(GatewayChainApiManager):
             appnope.nope()
 
         self._initialize_notifiers()
+        if self.is_current_strategy_script_strategy():
+            # The connectors of a script are only known from its markets, and the status checks that wait for their
+            # configs to be decrypted are skipped when it is started directly
+            await Security.wait_til_connectors_decrypted(self.load_script_class().markets)
         try:
             self._initialize_strategy(self.strategy_name)
         except NotImplementedError:
@@ -243,7 +248,10 @@ class StartCommand(GatewayChainApiManager):
                         self.notify(f"Canceling dangling limit orders on {market.name}...")
                         await market.cancel_all(5.0)
             if self.strategy:
-                self.clock.add_iterator(self.strategy)
+                strategy_tick_size = self.client_config_map.strategy_tick_size
+                if strategy_tick_size is not None:
+                    self.logger().info(f"Running the strategy with tick size: {strategy_tick_size}")
+                self.clock.add_iterator(self.strategy, tick_interval=strategy_tick_size)
             try:
                 self._pmm_script_iterator = self.client_config_map.pmm_script_mode.get_iterator(
                     self.strategy_name, list(self.markets.values()), self.strategy
@@ -75,11 +75,28 @@ class StatusCommand:
             st_status = await self.strategy.format_status()
         else:
             st_status = self.strategy.format_status()
-        status = paper_trade + "\n" + st_status
+        status = paper_trade + "\n" + st_status + self._format_connection_metrics()
         if self._pmm_script_iterator is not None and live is False:
             self._pmm_script_iterator.request_status()
         return status
 
+    def _format_connection_metrics(self,  # type: HummingbotApplication
+                                   ) -> str:
+        """
+        Returns a table with the HTTP connections reuse of every connector and host, or an empty string if the
+        connectors don't report connection metrics
+        """
+        rows = []
+        for connector_name, connector in self.markets.items():
+            for host, metrics in getattr(connector, "connection_metrics", {}).items():
+                rows.append([connector_name, host, metrics.requests, metrics.new_connections,
+                             metrics.reused_connections, f"{metrics.reuse_ratio:.1%}"])
+        if len(rows) == 0:
+            return ""
+        df = pd.DataFrame(rows, columns=["Exchange", "Host", "Requests", "New connections", "Reused", "Reuse ratio"])
+        lines = ["", "  HTTP connections:"] + ["    " + line for line in df.to_string(index=False).split("\n")]
+        return "\n".join(lines)
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -154,9 +171,8 @@ class StatusCommand:
             self.notify('  - Strategy check: Please import or create a strategy.')
             return False
 
-        if not Security.is_decryption_done():
-            self.notify('  - Security check: Encrypted files are being processed. Please wait and try again later.')
-            return False
+        # Only the configs of the strategy connectors are needed, they are decrypted now if still pending
+        await Security.wait_til_connectors_decrypted(required_exchanges)
 
         missing_configs = self.missing_configurations_legacy()
         if missing_configs:
@@ -31,6 +31,8 @@ from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.exchange.gate_io.gate_io_utils import GateIOConfigMap
 from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.api_throttler.rate_limits_budget import DEFAULT_RATE_LIMITS_BUDGET_DIR
+from hummingbot.core.data_type.market_data_relay import DEFAULT_MARKET_DATA_RELAY_SOCKET
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
@@ -130,6 +132,59 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_events_batch_window: float = Field(
+        default=0.0,
+        ge=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the time window in seconds to forward the events in batches (0 to forward each event "
+                "in its own message)"
+            ),
+        ),
+    )
+    mqtt_events_compression: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable zlib compression of the forwarded events"
+            ),
+        ),
+    )
+    mqtt_events_queue_size: int = Field(
+        default=10000,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of events waiting to be forwarded. New events are dropped when it is full"
+            ),
+        ),
+    )
+    mqtt_market_data: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable market data streaming to MQTT broker"
+            ),
+        ),
+    )
+    mqtt_market_data_depth: int = Field(
+        default=5,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of order book levels streamed on each side"
+            ),
+        ),
+    )
+    mqtt_market_data_interval: float = Field(
+        default=1.0,
+        gt=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the minimum time in seconds between two market data messages of the same topic"
+            ),
+        ),
+    )
     mqtt_external_events: bool = Field(
         default=True,
         client_data=ClientFieldData(
@@ -183,6 +238,213 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class MarketDataWorkersConfigMap(BaseClientModel):
+    market_data_workers_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable running the order book tracking of each connector in a separate worker process"
+            ),
+        ),
+    )
+    market_data_workers_depth: int = Field(
+        default=20,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of order book levels published by the market data workers (Default=20)"
+            ),
+        ),
+    )
+    market_data_workers_interval: float = Field(
+        default=0.05,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds between order book updates published by the market data workers"
+                " (Default=0.05)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "market_data_workers"
+
+
+class MarketDataRelayConfigMap(BaseClientModel):
+    market_data_relay_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable receiving the order books of the connectors from a local market data relay"
+            ),
+        ),
+    )
+    market_data_relay_socket: str = Field(
+        default=DEFAULT_MARKET_DATA_RELAY_SOCKET,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Set the path of the market data relay socket (Default={DEFAULT_MARKET_DATA_RELAY_SOCKET})"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "market_data_relay"
+
+
+class RateLimitsBudgetSharingMode(str, ClientConfigEnum):
+    disabled = "disabled"
+    process = "process"
+    host = "host"
+
+
+class RateLimitsBudgetConfigMap(BaseClientModel):
+    rate_limits_budget_sharing: RateLimitsBudgetSharingMode = Field(
+        default=RateLimitsBudgetSharingMode.disabled,
+        description="Share the API rate limits of a connector (exchange and domain) between all its instances in this"
+                    "\nprocess (process) or in all the bots of the host (host), instead of each instance assuming it"
+                    "\nowns the full limits.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Select how the API rate limits are shared between the connectors"
+                f" ({'/'.join(list(RateLimitsBudgetSharingMode))})"
+            ),
+        ),
+    )
+    rate_limits_budget_dir: str = Field(
+        default=DEFAULT_RATE_LIMITS_BUDGET_DIR,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Set the directory of the rate limits shared by the bots of the host"
+                f" (Default={DEFAULT_RATE_LIMITS_BUDGET_DIR})"
+            ),
+        ),
+    )
+    high_priority_reserve_pct: Decimal = Field(
+        default=Decimal("20"),
+        ge=Decimal("0"),
+        lt=Decimal("100"),
+        description="Percentage of the shared rate limits reserved to orders creation and cancelation requests.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What percentage of the shared rate limits do you want to reserve to orders creation and cancelation?"
+                " (Enter 20 to indicate 20%)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "rate_limits_budget"
+
+    @validator("high_priority_reserve_pct", pre=True)
+    def validate_decimals(cls, v: str, field: Field):
+        """Used for client-friendly error output."""
+        return super().validate_decimal(v, field)
+
+
+class HttpConnectionsConfigMap(BaseClientModel):
+    connection_limit: int = Field(
+        default=100,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of simultaneous HTTP connections of each connector (0 for no limit)"
+            ),
+        ),
+    )
+    connection_limit_per_host: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of simultaneous HTTP connections of each connector to the same host"
+                " (0 for no limit)"
+            ),
+        ),
+    )
+    dns_cache_ttl: int = Field(
+        default=10,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of seconds the resolved host addresses are cached (0 to disable the cache)"
+            ),
+        ),
+    )
+    keepalive_timeout: float = Field(
+        default=15.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of seconds idle HTTP connections are kept open to be reused (Default=15)"
+            ),
+        ),
+    )
+    keepalive_warmup_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable opening the trading connectors HTTP connections in advance and keeping them alive"
+                " while idle"
+            ),
+        ),
+    )
+    keepalive_warmup_connections: int = Field(
+        default=2,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of HTTP connections kept alive for each trading connector (Default=2)"
+            ),
+        ),
+    )
+    keepalive_warmup_interval: float = Field(
+        default=10.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval in seconds between keep alive requests. It should be lower than the keep alive"
+                " timeout (Default=10)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "http_connections"
+
+
+class TradingPairsCacheConfigMap(BaseClientModel):
+    trading_pairs_cache_enabled: bool = Field(
+        default=True,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the local cache of the connectors trading pairs and symbol maps"
+            ),
+        ),
+    )
+    trading_pairs_cache_ttl: int = Field(
+        default=86400,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set how long (in seconds) the cached trading pairs are used before refreshing them (Default=86400)"
+            ),
+        ),
+    )
+    exchange_info_cache_enabled: bool = Field(
+        default=True,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the local cache of the connectors exchange info and trading rules"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "trading_pairs_cache"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -558,7 +820,6 @@ class PMMScriptEnabledMode(PMMScriptMode):
             pmm_script_file,
             markets,
             strategy,
-            queue_check_interval=0.1,
         )
         return pmm_script_iterator
 
@@ -593,6 +854,27 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_quote_cache_ttl: Optional[float] = Field(
+        default=None,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the number of seconds Gateway price quotes are cached (empty to use the chain block time,"
+                " 0 to disable the cache)"
+            ),
+            prompt_on_new=False,
+        ),
+    )
+    gateway_local_nonce_manager: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Assign the nonces of EVM transactions locally, to send several transactions concurrently"
+                " (Yes/No)?"
+            ),
+            prompt_on_new=False,
+        ),
+    )
 
     class Config:
         title = "gateway"
@@ -1109,7 +1391,23 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    strategy_tick_size: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="The frequency with which the clock notifies the strategy. It allows latency sensitive strategies"
+                    "\nto run their logic more often than the connectors are updated. If not set, the tick size is used.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What strategy tick size (in seconds) do you want to use? (Leave empty to use the tick size)"
+            ),
+        ),
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    trading_pairs_cache: TradingPairsCacheConfigMap = Field(default=TradingPairsCacheConfigMap())
+    market_data_workers: MarketDataWorkersConfigMap = Field(default=MarketDataWorkersConfigMap())
+    http_connections: HttpConnectionsConfigMap = Field(default=HttpConnectionsConfigMap())
+    market_data_relay: MarketDataRelayConfigMap = Field(default=MarketDataRelayConfigMap())
+    rate_limits_budget: RateLimitsBudgetConfigMap = Field(default=RateLimitsBudgetConfigMap())
 
     class Config:
         title = "client_config_map"
@@ -1,6 +1,8 @@
 import binascii
+import hmac
 import json
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from eth_account import Account
 from eth_keyfile.keyfile import (
@@ -8,9 +10,13 @@ from eth_keyfile.keyfile import (
     SCRYPT_P,
     SCRYPT_R,
     Random,
+    _derive_pbkdf_key,
+    _derive_scrypt_key,
     _pbkdf2_hash,
     _scrypt_hash,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
@@ -43,6 +49,16 @@ class BaseSecretsManager(ABC):
 
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    """
+    Encrypts the secret values as ETH v3 keyfiles. The keys derived from the password are kept for the session, keyed
+    by the KDF parameters (which include the salt), so a value is never derived twice and the derivations can be done
+    in advance, in parallel, with `pending_key_derivations` and `add_derived_key`.
+    """
+
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._derived_keys: Dict[Tuple[str, str], bytes] = {}
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
@@ -57,9 +73,43 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
         value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        keyfile_json = json.loads(value.decode())
+        crypto = _v3_keyfile_crypto(keyfile_json)
+        if crypto is None:
+            decrypted_value = Account.decrypt(keyfile_json, self._password).decode()
+        else:
+            derived_key = self._derived_key(crypto)
+            decrypted_value = _decrypt_v3_keyfile_crypto(crypto, derived_key).decode()
         return decrypted_value
 
+    def pending_key_derivations(self, encrypted_values: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        :param encrypted_values: values encrypted by this manager, the values that are not keyfiles are ignored
+        :return: the crypto sections of the keyfiles whose key has not been derived yet, without duplicates
+        """
+        pending = {}
+        for value in encrypted_values:
+            try:
+                crypto = _v3_keyfile_crypto(json.loads(binascii.unhexlify(value).decode()))
+            except (ValueError, TypeError, UnicodeDecodeError):
+                crypto = None
+            if crypto is not None:
+                cache_key = _derived_key_cache_key(crypto)
+                if cache_key not in self._derived_keys:
+                    pending[cache_key] = crypto
+        return list(pending.values())
+
+    def add_derived_key(self, crypto: Dict[str, Any], derived_key: bytes):
+        self._derived_keys[_derived_key_cache_key(crypto)] = derived_key
+
+    def _derived_key(self, crypto: Dict[str, Any]) -> bytes:
+        cache_key = _derived_key_cache_key(crypto)
+        derived_key = self._derived_keys.get(cache_key)
+        if derived_key is None:
+            derived_key = derive_keyfile_key(crypto, self._password.encode())
+            self._derived_keys[cache_key] = derived_key
+        return derived_key
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -142,3 +192,41 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
         'version': 3,
         'alias': '',  # Add this line to include the 'alias' field with an empty string value
     }
+
+
+def derive_keyfile_key(crypto: Dict[str, Any], password: bytes) -> bytes:
+    """
+    Runs the key derivation function of a v3 keyfile. This is the expensive part of the decryption, it is a module
+    function so it can be sent to a process pool.
+    """
+    if crypto["kdf"] == "pbkdf2":
+        return _derive_pbkdf_key(crypto, password)
+    return _derive_scrypt_key(crypto, password)
+
+
+def _v3_keyfile_crypto(keyfile_json: Any) -> Optional[Dict[str, Any]]:
+    """
+    :return: the crypto section of the keyfile if it can be decrypted with a cached key, None otherwise
+    """
+    if not isinstance(keyfile_json, dict) or keyfile_json.get("version") != 3:
+        return None
+    crypto = keyfile_json.get("crypto")
+    if not isinstance(crypto, dict) or crypto.get("kdf") not in ("pbkdf2", "scrypt"):
+        return None
+    return crypto
+
+
+def _derived_key_cache_key(crypto: Dict[str, Any]) -> Tuple[str, str]:
+    return crypto["kdf"], json.dumps(crypto["kdfparams"], sort_keys=True)
+
+
+def _decrypt_v3_keyfile_crypto(crypto: Dict[str, Any], derived_key: bytes) -> bytes:
+    """
+    Same as eth_keyfile.keyfile._decode_keyfile_json_v3, with the key already derived.
+    """
+    ciphertext = decode_hex(crypto["ciphertext"])
+    mac = keccak(derived_key[16:32] + ciphertext)
+    if not hmac.compare_digest(mac, decode_hex(crypto["mac"])):
+        raise ValueError("MAC mismatch")
+    iv = big_endian_to_int(decode_hex(crypto["cipherparams"]["iv"]))
+    return decrypt_aes_ctr(ciphertext, derived_key[:16], iv)
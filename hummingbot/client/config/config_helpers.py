@@ -25,6 +25,7 @@ from hummingbot.client.config.config_data_types import BaseClientModel, ClientCo
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map, init_fee_overrides_config
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
+from hummingbot.client.connector_manifest import timed_import_module
 from hummingbot.client.settings import (
     CLIENT_CONFIG_PATH,
     CONF_DIR_PATH,
@@ -556,8 +557,7 @@ def _merge_dicts(*args: Dict[str, ConfigVar]) -> OrderedDict:
 
 def get_connector_class(connector_name: str) -> Callable:
     conn_setting = AllConnectorSettings.get_connector_settings()[connector_name]
-    mod = __import__(conn_setting.module_path(),
-                     fromlist=[conn_setting.class_name()])
+    mod = timed_import_module(conn_setting.module_path())
     return getattr(mod, conn_setting.class_name())
 
 
@@ -1,8 +1,22 @@
 import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
+import yaml
+
+from hummingbot.client.config.config_crypt import (
+    PASSWORD_VERIFICATION_PATH,
+    BaseSecretsManager,
+    ETHKeyFileSecretManger,
+    derive_keyfile_key,
+    validate_password,
+)
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
     api_keys_from_connector_config_map,
@@ -16,21 +30,36 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
 
 
 class Security:
+    # The client process is multithreaded when the keys are derived, so the workers are spawned instead of forked to
+    # avoid inheriting locks held by other threads
+    KEY_DERIVATION_START_METHOD = "spawn"
+
     __instance = None
+    _logger: Optional[HummingbotLogger] = None
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
+    _pending_config_files: Dict[str, Path] = {}
+    _decryption_futures: Dict[str, Future] = {}
+    _decryption_lock = threading.RLock()
     _decryption_done = asyncio.Event()
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
     @staticmethod
     def new_password_required() -> bool:
         return not PASSWORD_VERIFICATION_PATH.exists()
 
     @classmethod
     def any_secure_configs(cls):
-        return len(cls._secure_configs) > 0
+        return len(cls._secure_configs) > 0 or len(cls._pending_config_files) > 0
 
     @staticmethod
     def connector_config_file_exists(connector_name: str) -> bool:
@@ -42,23 +71,115 @@ class Security:
         if not validate_password(secrets_manager):
             return False
         cls.secrets_manager = secrets_manager
-        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
+        # The files are registered before returning, so the connectors can wait for their own files right away
+        cls._register_encrypted_files()
+        coro = AsyncCallScheduler.shared_instance().call_async(cls._decrypt_pending_configs, timeout_seconds=30)
         safe_ensure_future(coro)
         return True
 
     @classmethod
     def decrypt_all(cls):
-        cls._secure_configs.clear()
-        cls._decryption_done.clear()
-        encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        """
+        Decrypts all the connector config files. The keys of all the secure values are derived in a process pool
+        first, then the files are loaded. The files of some connectors can also be decrypted while this is running
+        (see `wait_til_connectors_decrypted`), so a connector does not have to wait for all the others.
+        """
+        cls._register_encrypted_files()
+        cls._decrypt_pending_configs()
+
+    @classmethod
+    def _register_encrypted_files(cls):
+        with cls._decryption_lock:
+            cls._secure_configs.clear()
+            cls._decryption_done.clear()
+            cls._pending_config_files = {connector_name_from_file(file): file for file in list_connector_configs()}
+            cls._decryption_futures = {connector_name: Future() for connector_name in cls._pending_config_files}
+
+    @classmethod
+    def _decrypt_pending_configs(cls):
+        cls.derive_keys_in_parallel(list(cls._pending_config_files.values()))
+        for connector_name in list(cls._pending_config_files):
+            cls._decrypt_pending_connector_config(connector_name)
         cls._decryption_done.set()
 
+    @classmethod
+    def derive_keys_in_parallel(cls, file_paths: Iterable[Path]):
+        """
+        Derives the keys of the secure values of the files in a process pool, and adds them to the secrets manager
+        cache. If the pool can't be used the keys are derived later, when the values are decrypted.
+        """
+        if not isinstance(cls.secrets_manager, ETHKeyFileSecretManger):
+            return
+        encrypted_values = []
+        for file_path in file_paths:
+            encrypted_values.extend(cls._encrypted_values_in_file(file_path))
+        key_derivations = cls.secrets_manager.pending_key_derivations(encrypted_values)
+        if len(key_derivations) < 2:
+            return
+        password = cls.secrets_manager.password.get_secret_value().encode()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(len(key_derivations), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context(cls.KEY_DERIVATION_START_METHOD),
+            ) as executor:
+                derived_keys = list(executor.map(derive_keyfile_key, key_derivations, repeat(password)))
+        except Exception:
+            cls.logger().warning("Could not derive the secure config keys in parallel, decrypting them sequentially.",
+                                 exc_info=True)
+            return
+        for crypto, derived_key in zip(key_derivations, derived_keys):
+            cls.secrets_manager.add_derived_key(crypto, derived_key)
+
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
         connector_name = connector_name_from_file(file_path)
-        cls._secure_configs[connector_name] = load_connector_config_map_from_file(file_path)
+        with cls._decryption_lock:
+            cls._secure_configs[connector_name] = load_connector_config_map_from_file(file_path)
+            cls._pending_config_files.pop(connector_name, None)
+            cls._resolve_decryption_future(connector_name)
+
+    @classmethod
+    def decrypt_connectors(cls, connector_names: Iterable[str]):
+        for connector_name in connector_names:
+            cls._decrypt_pending_connector_config(connector_name)
+
+    @classmethod
+    def _decrypt_pending_connector_config(cls, connector_name: str):
+        if connector_name not in cls._pending_config_files:
+            return
+        with cls._decryption_lock:
+            file_path = cls._pending_config_files.get(connector_name)
+            if file_path is not None:
+                try:
+                    cls.decrypt_connector_config(file_path)
+                except Exception as e:
+                    future = cls._decryption_futures.pop(connector_name, None)
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                    raise
+
+    @classmethod
+    def _resolve_decryption_future(cls, connector_name: str):
+        future = cls._decryption_futures.pop(connector_name, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    @staticmethod
+    def _encrypted_values_in_file(file_path: Path) -> List[str]:
+        try:
+            with open(file_path) as f:
+                data = yaml.safe_load(f)
+        except (OSError, yaml.YAMLError):
+            return []
+        values = []
+        items: List[Any] = [data]
+        while items:
+            item = items.pop()
+            if isinstance(item, dict):
+                items.extend(item.values())
+            elif isinstance(item, str):
+                values.append(item)
+        return values
 
     @classmethod
     def update_secure_config(cls, connector_config: ClientConfigAdapter):
@@ -73,14 +194,24 @@ class Security:
         file_path = get_connector_config_yml_path(connector_name)
         file_path.unlink(missing_ok=True)
         reset_connector_hb_config(connector_name)
-        cls._secure_configs.pop(connector_name)
+        with cls._decryption_lock:
+            cls._pending_config_files.pop(connector_name, None)
+            cls._secure_configs.pop(connector_name, None)
+            cls._resolve_decryption_future(connector_name)
 
     @classmethod
     def is_decryption_done(cls):
         return cls._decryption_done.is_set()
 
+    @classmethod
+    def is_connector_decrypted(cls, connector_name: str) -> bool:
+        return connector_name not in cls._pending_config_files
+
     @classmethod
     def decrypted_value(cls, key: str) -> Optional[ClientConfigAdapter]:
+        """
+        :return: the config of the connector, or None while it is still pending (see `wait_til_connectors_decrypted`)
+        """
         return cls._secure_configs.get(key, None)
 
     @classmethod
@@ -91,6 +222,20 @@ class Security:
     async def wait_til_decryption_done(cls):
         await cls._decryption_done.wait()
 
+    @classmethod
+    async def wait_til_connectors_decrypted(cls, connector_names: Iterable[str]):
+        """
+        Waits only for the config files of the connectors. Their decryption is started in an executor thread, so it is
+        not queued behind the decryption of all the files, and the wait ends with whichever decrypts them first.
+        """
+        with cls._decryption_lock:
+            futures = [cls._decryption_futures[name] for name in connector_names if name in cls._decryption_futures]
+        if len(futures) > 0:
+            loop = asyncio.get_event_loop()
+            pending_names = [name for name in connector_names if not cls.is_connector_decrypted(name)]
+            loop.run_in_executor(None, cls.decrypt_connectors, pending_names)
+            await asyncio.wait_for(asyncio.gather(*[asyncio.wrap_future(future) for future in futures]), timeout=30)
+
     @classmethod
     def api_keys(cls, connector_name: str) -> Dict[str, Optional[str]]:
         connector_config = cls.decrypted_value(connector_name)
@@ -0,0 +1,277 @@
+"""
+Precomputed metadata of the connectors shipped with the client.
+
+Building the connector settings requires reading a few constants (fees, example pair, domains...) from every
+`<connector>_utils` module. Importing all those modules, together with their dependencies, is one of the main startup
+costs of the client. The manifest stores those constants in a JSON file in the data directory, built the first time the
+client starts, so that the following starts only import the modules of the connectors actually used. Every entry
+records a signature of the source files of its connector (the number of files and their latest modification time), and
+entries are rebuilt when any of them changes. The whole manifest is rebuilt when the client version changes.
+
+The manifest can be regenerated with `python -m hummingbot.client.connector_manifest`.
+"""
+import importlib
+import json
+import logging
+import os
+import time
+from decimal import Decimal
+from os import DirEntry, scandir
+from os.path import exists, join
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Union, cast
+
+from hummingbot import data_path, root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+CONNECTOR_MANIFEST_FILE_NAME = "connector_manifest.json"
+CONNECTOR_MANIFEST_VERSION = 2
+CONNECTORS_PATH = root_path() / "hummingbot" / "connector"
+HUMMINGBOT_VERSION_PATH = root_path() / "hummingbot" / "VERSION"
+CONNECTOR_TYPE_DIRS_EXCLUDED = ["test_support", "utilities", "gateway"]
+CONNECTOR_DIRS_EXCLUDED = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+
+_import_costs: Dict[str, float] = {}
+
+
+def connector_manifest_path() -> Path:
+    return Path(data_path()) / CONNECTOR_MANIFEST_FILE_NAME
+
+
+def hummingbot_version() -> str:
+    try:
+        return HUMMINGBOT_VERSION_PATH.read_text().strip()
+    except OSError:
+        return ""
+
+
+def connector_sources_signature(connector_path: str) -> str:
+    """
+    :return: the number of python source files of the connector and their latest modification time
+    """
+    mtimes = [os.path.getmtime(join(dir_path, file_name))
+              for dir_path, _, file_names in os.walk(connector_path)
+              for file_name in file_names if file_name.endswith((".py", ".pyx", ".pxd"))]
+    return f"{len(mtimes)}:{max(mtimes, default=0)}"
+
+
+def timed_import_module(module_path: str) -> ModuleType:
+    """
+    Imports a module recording the time spent in the import, to be reported by `import_cost_report`.
+    Modules that were already imported are returned without registering any cost.
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(module_path)
+    if module_path not in _import_costs:
+        _import_costs[module_path] = time.perf_counter() - start
+    return module
+
+
+def import_costs() -> Dict[str, float]:
+    return _import_costs.copy()
+
+
+def import_cost_report() -> str:
+    """
+    :return: a human readable summary of the modules imported through `timed_import_module`, most expensive first
+    """
+    lines = [f"{cost * 1e3:10.1f} ms  {module_path}"
+             for module_path, cost in sorted(_import_costs.items(), key=lambda item: item[1], reverse=True)]
+    lines.append(f"{sum(_import_costs.values()) * 1e3:10.1f} ms  total ({len(_import_costs)} modules)")
+    return "\n".join(lines)
+
+
+def trade_fee_settings_to_json(trade_fee_settings: Optional[Union[TradeFeeSchema, List[float]]]) -> Any:
+    if not isinstance(trade_fee_settings, TradeFeeSchema):
+        return trade_fee_settings
+    return {
+        "percent_fee_token": trade_fee_settings.percent_fee_token,
+        "maker_percent_fee_decimal": str(trade_fee_settings.maker_percent_fee_decimal),
+        "taker_percent_fee_decimal": str(trade_fee_settings.taker_percent_fee_decimal),
+        "buy_percent_fee_deducted_from_returns": trade_fee_settings.buy_percent_fee_deducted_from_returns,
+        "maker_fixed_fees": [[fee.token, str(fee.amount)] for fee in trade_fee_settings.maker_fixed_fees],
+        "taker_fixed_fees": [[fee.token, str(fee.amount)] for fee in trade_fee_settings.taker_fixed_fees],
+    }
+
+
+def trade_fee_settings_from_json(json_value: Any) -> Optional[Union[TradeFeeSchema, List[float]]]:
+    if not isinstance(json_value, dict):
+        return json_value
+    return TradeFeeSchema(
+        percent_fee_token=json_value["percent_fee_token"],
+        maker_percent_fee_decimal=Decimal(json_value["maker_percent_fee_decimal"]),
+        taker_percent_fee_decimal=Decimal(json_value["taker_percent_fee_decimal"]),
+        buy_percent_fee_deducted_from_returns=json_value["buy_percent_fee_deducted_from_returns"],
+        maker_fixed_fees=[TokenAmount(token, Decimal(amount)) for token, amount in json_value["maker_fixed_fees"]],
+        taker_fixed_fees=[TokenAmount(token, Decimal(amount)) for token, amount in json_value["taker_fixed_fees"]],
+    )
+
+
+class ConnectorManifest:
+    """
+    Loads, validates and regenerates the connectors manifest.
+
+    The manifest entries are keyed by connector name, and contain the connector type directory, the path of the
+    utils module, the signature of the connector source files when the entry was built and the module constants used
+    to build the connector settings.
+    """
+    _logger: Optional[logging.Logger] = None
+
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, manifest_path: Optional[Path] = None, connectors_path: Path = CONNECTORS_PATH):
+        """
+        :param manifest_path: path of the manifest file, in the data directory by default
+        :param connectors_path: directory of the connector packages
+        """
+        self._manifest_path = manifest_path or connector_manifest_path()
+        self._connectors_path = connectors_path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._rebuilt_entries: List[str] = []
+
+    @property
+    def manifest_path(self) -> Path:
+        return self._manifest_path
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        return self._entries
+
+    @property
+    def rebuilt_entries(self) -> List[str]:
+        """
+        Names of the connectors whose entry was missing or outdated and had to be built by importing the module
+        """
+        return self._rebuilt_entries
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Loads the manifest, validating every entry against the connector modules present on disk. Missing and
+        outdated entries are rebuilt, and the manifest file is updated if anything changed.
+
+        :return: the manifest entries
+        """
+        stored_entries = self._read_manifest_file()
+        self._entries = {}
+        self._rebuilt_entries = []
+        for type_dir, connector_dir, _ in self._connector_modules():
+            entry = stored_entries.get(connector_dir.name)
+            if (entry is None
+                    or entry["type_dir"] != type_dir.name
+                    or entry["sources_signature"] != connector_sources_signature(connector_dir.path)):
+                entry = self._build_entry(type_dir.name, connector_dir.name, connector_dir.path)
+                if entry is None:
+                    continue
+                self._rebuilt_entries.append(connector_dir.name)
+            if connector_dir.name in self._entries:
+                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            self._entries[connector_dir.name] = entry
+        if len(self._rebuilt_entries) > 0 or self._entries.keys() != stored_entries.keys():
+            self.save()
+        return self._entries
+
+    def build(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Builds all the entries importing every connector utils module, and stores the result in the manifest file
+        """
+        self._entries = {}
+        self._rebuilt_entries = []
+        for type_dir, connector_dir, _ in self._connector_modules():
+            entry = self._build_entry(type_dir.name, connector_dir.name, connector_dir.path)
+            if entry is not None:
+                self._entries[connector_dir.name] = entry
+                self._rebuilt_entries.append(connector_dir.name)
+        self.save()
+        return self._entries
+
+    def save(self):
+        content = {
+            "version": CONNECTOR_MANIFEST_VERSION,
+            "hummingbot_version": hummingbot_version(),
+            "connectors": self._entries,
+        }
+        try:
+            self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._manifest_path.with_suffix(self._manifest_path.suffix + ".tmp")
+            with open(temp_path, "w") as manifest_file:
+                json.dump(content, manifest_file, indent=2, sort_keys=True)
+            os.replace(temp_path, self._manifest_path)
+        except OSError:
+            # The manifest is only an optimization; the entries are validated again the next time
+            self.logger().debug(f"Could not write the connector manifest {self._manifest_path}.", exc_info=True)
+
+    def _read_manifest_file(self) -> Dict[str, Dict[str, Any]]:
+        if not self._manifest_path.exists():
+            return {}
+        try:
+            with open(self._manifest_path, "r") as manifest_file:
+                content = json.load(manifest_file)
+        except Exception:
+            self.logger().warning(f"Could not read the connector manifest {self._manifest_path}. It will be rebuilt.")
+            return {}
+        if (content.get("version") != CONNECTOR_MANIFEST_VERSION
+                or content.get("hummingbot_version") != hummingbot_version()):
+            return {}
+        return content.get("connectors", {})
+
+    def _connector_modules(self):
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(self._connectors_path)
+            if f.is_dir() and f.name not in CONNECTOR_TYPE_DIRS_EXCLUDED
+        ]
+        for type_dir in type_dirs:
+            connector_dirs: List[DirEntry] = [
+                cast(DirEntry, f) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+            ]
+            for connector_dir in connector_dirs:
+                if connector_dir.name.startswith("_") or connector_dir.name in CONNECTOR_DIRS_EXCLUDED:
+                    continue
+                utils_path = join(connector_dir.path, f"{connector_dir.name}_utils.py")
+                if not exists(utils_path):
+                    continue
+                yield type_dir, connector_dir, utils_path
+
+    @staticmethod
+    def _build_entry(type_dir_name: str, connector_name: str, connector_path: str) -> Optional[Dict[str, Any]]:
+        utils_module_path = f"hummingbot.connector.{type_dir_name}.{connector_name}.{connector_name}_utils"
+        try:
+            util_module = timed_import_module(utils_module_path)
+        except ModuleNotFoundError:
+            return None
+        other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+        return {
+            "type_dir": type_dir_name,
+            "utils_module": utils_module_path,
+            "sources_signature": connector_sources_signature(connector_path),
+            "centralised": getattr(util_module, "CENTRALIZED", True),
+            "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+            "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            "default_fees": trade_fee_settings_to_json(getattr(util_module, "DEFAULT_FEES", None)),
+            "other_domains": {
+                domain: {
+                    "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    "default_fees": trade_fee_settings_to_json(
+                        getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]),
+                    "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                }
+                for domain in other_domains
+            },
+        }
+
+
+def main():
+    manifest = ConnectorManifest()
+    entries = manifest.build()
+    print(f"Connector manifest generated with {len(entries)} connectors in {manifest.manifest_path}")
+    print(import_cost_report())
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
+from hummingbot.client.connector_manifest import import_cost_report
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
@@ -316,6 +317,8 @@ class HummingbotApplication(*commands):
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
 
+        self.logger().debug(f"Connector modules import cost:\n{import_cost_report()}")
+
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
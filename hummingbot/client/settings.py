@@ -1,15 +1,19 @@
-import importlib
 import json
 from decimal import Decimal
 from enum import Enum
-from os import DirEntry, scandir
 from os.path import exists, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
+from hummingbot.client.connector_manifest import (
+    CONNECTOR_TYPE_DIRS_EXCLUDED,
+    ConnectorManifest,
+    timed_import_module,
+    trade_fee_settings_from_json,
+)
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
@@ -61,7 +65,7 @@ PAPER_TRADE_EXCHANGES = [  # todo: fix after global config map refactor
     "mock_paper_exchange",
 ]
 
-CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = CONNECTOR_TYPE_DIRS_EXCLUDED
 
 
 class ConnectorType(Enum):
@@ -306,12 +310,16 @@ class ConnectorSetting(NamedTuple):
 
     def non_trading_connector_instance_with_default_configuration(
             self,
-            trading_pairs: Optional[List[str]] = None) -> 'ConnectorBase':
+            trading_pairs: Optional[List[str]] = None,
+            client_config_map: Optional["ClientConfigAdapter"] = None) -> 'ConnectorBase':
         from hummingbot.client.config.config_helpers import ClientConfigAdapter
-        from hummingbot.client.hummingbot_application import HummingbotApplication
+
+        if client_config_map is None:
+            from hummingbot.client.hummingbot_application import HummingbotApplication
+            client_config_map = HummingbotApplication.main_application().client_config_map
 
         trading_pairs = trading_pairs or []
-        connector_class = getattr(importlib.import_module(self.module_path()), self.class_name())
+        connector_class = getattr(timed_import_module(self.module_path()), self.class_name())
         kwargs = {}
         if isinstance(self.config_keys, Dict):
             kwargs = {key: (config.value or "") for key, config in self.config_keys.items()}  # legacy
@@ -328,7 +336,7 @@ class ConnectorSetting(NamedTuple):
             trading_pairs=trading_pairs,
             trading_required=False,
             api_keys=kwargs,
-            client_config_map=HummingbotApplication.main_application().client_config_map,
+            client_config_map=client_config_map,
         )
         kwargs = self.add_domain_parameter(kwargs)
         connector = connector_class(**kwargs)
@@ -346,7 +354,7 @@ class ConnectorSetting(NamedTuple):
         parent_package = f"hummingbot.connector.gateway.{self._get_module_package()}.data_sources"
         module_package = self.name.rsplit(sep="_", maxsplit=2)[0]
         module_path = f"{parent_package}.{module_package}.{module_name}"
-        module: ModuleType = importlib.import_module(module_path)
+        module: ModuleType = timed_import_module(module_path)
         api_data_source_class = getattr(module, self.get_api_data_source_class_name())
         instance = api_data_source_class(
             trading_pairs=trading_pairs,
@@ -359,75 +367,86 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class LazyConnectorSetting(ConnectorSetting):
+    """
+    ConnectorSetting built from the connectors manifest. The connector utils module, where the configuration keys
+    are defined, is only imported the first time the keys are requested.
+    """
+
+    def __new__(cls, utils_module_path: str, config_keys_domain: Optional[str] = None, **kwargs):
+        setting = super().__new__(cls, config_keys=None, **kwargs)
+        setting._utils_module_path = utils_module_path
+        setting._config_keys_domain = config_keys_domain
+        return setting
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        utils_module_path = getattr(self, "_utils_module_path", None)
+        if utils_module_path is None:
+            # Instances created with _make/_replace behave like a regular ConnectorSetting
+            return self[ConnectorSetting._fields.index("config_keys")]
+        util_module = timed_import_module(utils_module_path)
+        if self._config_keys_domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[self._config_keys_domain]
+
+    def lazy_copy(self, **kwargs) -> "LazyConnectorSetting":
+        """
+        Creates a new setting that loads the same configuration keys
+        """
+        return LazyConnectorSetting(
+            utils_module_path=self._utils_module_path, config_keys_domain=self._config_keys_domain, **kwargs
+        )
+
+
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Create a dictionary of exchange names to ConnectorSetting from the connectors manifest. The connectors utils
+        modules are only imported when their manifest entry is missing or outdated.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
+
+        for connector_name, entry in ConnectorManifest().load().items():
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_name, trade_fee_settings_from_json(entry["default_fees"])
+            )
+            cls.all_connector_settings[connector_name] = LazyConnectorSetting(
+                utils_module_path=entry["utils_module"],
+                name=connector_name,
+                type=ConnectorType[entry["type_dir"].capitalize()],
+                centralised=entry["centralised"],
+                example_pair=entry["example_pair"],
+                use_ethereum_wallet=entry["use_ethereum_wallet"],
+                trade_fee_schema=trade_fee_schema,
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+            )
+            # Adds other domains of connector
+            for domain, domain_entry in entry["other_domains"].items():
+                trade_fee_schema = cls._validate_trade_fee_schema(
+                    domain, trade_fee_settings_from_json(domain_entry["default_fees"])
                 )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                parent = cls.all_connector_settings[connector_name]
+                cls.all_connector_settings[domain] = LazyConnectorSetting(
+                    utils_module_path=entry["utils_module"],
+                    config_keys_domain=domain,
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=domain_entry["example_pair"],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
                     trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=domain_entry["domain_parameter"],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
                 )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -457,19 +476,24 @@ class AllConnectorSettings:
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                paper_trade_settings_kwargs = dict(
                     name=f"{e}_paper_trade",
                     type=base_connector_settings.type,
                     centralised=base_connector_settings.centralised,
                     example_pair=base_connector_settings.example_pair,
                     use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
                     trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
                     use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
+                if isinstance(base_connector_settings, LazyConnectorSetting):
+                    paper_trade_settings = base_connector_settings.lazy_copy(**paper_trade_settings_kwargs)
+                else:
+                    paper_trade_settings = ConnectorSetting(
+                        config_keys=base_connector_settings.config_keys, **paper_trade_settings_kwargs
+                    )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
     @classmethod
@@ -605,6 +629,7 @@ def gateway_connector_trading_pairs(connector: str) -> List[str]:
 
 MAXIMUM_OUTPUT_PANE_LINE_COUNT = 1000
 MAXIMUM_LOG_PANE_LINE_COUNT = 1000
+LOG_PANE_REFRESH_INTERVAL = 0.1
 MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT = 100
 
 STRATEGIES: List[str] = get_strategy_list()
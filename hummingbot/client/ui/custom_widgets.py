@@ -1,22 +1,28 @@
 from __future__ import unicode_literals
 
+import asyncio
 import re
+import threading
+import time
 from collections import deque
-from typing import Callable, Deque, Dict, List, Tuple
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 import six
+from prompt_toolkit.application.current import get_app
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
 from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.completion import DynamicCompleter
+from prompt_toolkit.data_structures import Point
 from prompt_toolkit.document import Document
 from prompt_toolkit.filters import Condition, has_focus, is_done, is_true, to_filter
 from prompt_toolkit.formatted_text.base import StyleAndTextTuples
 from prompt_toolkit.layout.containers import Window, WindowAlign
-from prompt_toolkit.layout.controls import BufferControl
+from prompt_toolkit.layout.controls import BufferControl, UIContent
 from prompt_toolkit.layout.margins import NumberedMargin, ScrollbarMargin
 from prompt_toolkit.layout.processors import AppendAutoSuggestion, BeforeInput, ConditionalProcessor, PasswordProcessor
 from prompt_toolkit.lexers import DynamicLexer
 from prompt_toolkit.lexers.base import Lexer
+from prompt_toolkit.utils import Event
 from prompt_toolkit.widgets.toolbars import SearchToolbar
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -124,6 +130,7 @@ class CustomTextArea:
         self.read_only = read_only
         self.wrap_lines = wrap_lines
         self.max_line_count = max_line_count
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
 
         self.buffer = CustomBuffer(
             document=Document(text, 0),
@@ -136,7 +143,7 @@ class CustomTextArea:
             accept_handler=accept_handler,
             history=history)
 
-        self.control = BufferControl(
+        self.control = self._create_control(
             buffer=self.buffer,
             lexer=DynamicLexer(lambda: self.lexer),
             input_processors=[
@@ -182,7 +189,6 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
         self.log(initial_text)
 
     @property
@@ -221,7 +227,10 @@ class CustomTextArea:
     def __pt_container__(self):
         return self.window
 
-    def log(self, text: str, save_log: bool = True, silent: bool = False):
+    def _create_control(self, **kwargs) -> BufferControl:
+        return BufferControl(**kwargs)
+
+    def _split_log_text(self, text: str) -> List[str]:
         # Getting the max width of the window area
         if self.window.render_info is None:
             max_width = 100
@@ -242,13 +251,168 @@ class CustomTextArea:
                 new_lines.append(line[0:max_width])
                 line = line[max_width:]
             new_lines.append(line)
+        return new_lines
 
+    def log(self, text: str, save_log: bool = True, silent: bool = False):
+        new_lines = self._split_log_text(text)
         if save_log:
             self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
             new_text: str = "\n".join(self.log_lines)
         else:
             new_text: str = "\n".join(new_lines)
         if not silent:
             self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+
+class LogPaneControl(BufferControl):
+    """
+    Control of the log pane. The log lines are kept in an append only bounded deque, and only the visible lines are
+    lexed when the pane is rendered, instead of joining all the lines in a new buffer document for every logged text.
+
+    The buffer document is only built (once per change of the lines) while searching the logs, since the search
+    works on the buffer. Redraws requested by the logged lines are batched to one per refresh interval.
+    """
+
+    def __init__(self, log_lines: Deque[str], refresh_interval: float, **kwargs):
+        super().__init__(**kwargs)
+        self.log_lines = log_lines
+        self.on_lines_appended = Event(self)
+        self._refresh_interval = refresh_interval
+        self._lines_lock = threading.Lock()
+        self._lines_version = 0
+        self._lines_snapshot: List[str] = []
+        self._snapshot_version = -1
+        self._buffer_version = -1
+        # None when following the last line
+        self._cursor_line: Optional[int] = None
+        self._render_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redraw_scheduled = False
+        self._last_redraw_timestamp = 0.0
+
+    def append_lines(self, lines: List[str]):
+        """
+        Appends lines to the log, dropping the oldest ones above the maximum line count. Can be called from any thread.
+        """
+        with self._lines_lock:
+            self.log_lines.extend(lines)
+            self._lines_version += 1
+        self._cursor_line = None
+
+    def replace_lines(self, lines: List[str]):
+        with self._lines_lock:
+            self.log_lines.clear()
+            self.log_lines.extend(lines)
+            self._lines_version += 1
+        self._cursor_line = None
+
+    def request_redraw(self):
+        """
+        Schedules a redraw of the pane in the UI event loop, at most one per refresh interval. Can be called from
+        any thread. Nothing is scheduled before the first render, which shows all the lines anyway.
+        """
+        loop = self._render_loop
+        if loop is None:
+            return
+        with self._lines_lock:
+            if self._redraw_scheduled:
+                return
+            self._redraw_scheduled = True
+        loop.call_soon_threadsafe(self._schedule_redraw)
+
+    def create_content(self, width: int, height: int, preview_search: bool = False) -> UIContent:
+        app = get_app()
+        if app.loop is not None:
+            self._render_loop = app.loop
+
+        if self._is_search_target():
+            self._sync_buffer_document()
+            content = super().create_content(width, height, preview_search)
+            self._cursor_line = self.buffer.document.cursor_position_row
+            return content
+
+        lines = self._get_lines_snapshot()
+        line_count = max(1, len(lines))
+        cursor_line = line_count - 1 if self._cursor_line is None else min(self._cursor_line, line_count - 1)
+
+        def get_line(i: int) -> StyleAndTextTuples:
+            if i >= len(lines):
+                return [("", " ")]
+            return self.lexer.lex_document(Document(lines[i]))(0) + [("", " ")]
+
+        return UIContent(get_line=get_line, line_count=line_count, cursor_position=Point(x=0, y=cursor_line))
+
+    def move_cursor_down(self):
+        if self._is_search_target():
+            return super().move_cursor_down()
+        if self._cursor_line is not None:
+            self._cursor_line += 1
+            if self._cursor_line >= len(self.log_lines) - 1:
+                self._cursor_line = None
+
+    def move_cursor_up(self):
+        if self._is_search_target():
+            return super().move_cursor_up()
+        cursor_line = len(self.log_lines) - 1 if self._cursor_line is None else self._cursor_line
+        self._cursor_line = max(0, cursor_line - 1)
+
+    def get_invalidate_events(self) -> Iterable[Event]:
+        yield from super().get_invalidate_events()
+        yield self.on_lines_appended
+
+    def _is_search_target(self) -> bool:
+        return get_app().layout.search_target_buffer_control == self
+
+    def _get_lines_snapshot(self) -> List[str]:
+        with self._lines_lock:
+            if self._snapshot_version != self._lines_version:
+                self._lines_snapshot = list(self.log_lines)
+                self._snapshot_version = self._lines_version
+            return self._lines_snapshot
+
+    def _sync_buffer_document(self):
+        if self._buffer_version == self._lines_version:
+            return
+        lines = self._get_lines_snapshot()
+        self._buffer_version = self._snapshot_version
+        text = "\n".join(lines)
+        if self._cursor_line is None or self._cursor_line >= len(lines):
+            cursor_position = len(text)
+        else:
+            cursor_position = sum(len(line) + 1 for line in lines[:self._cursor_line])
+        self.buffer.set_document(Document(text=text, cursor_position=cursor_position), bypass_readonly=True)
+
+    def _schedule_redraw(self):
+        delay = max(0.0, self._last_redraw_timestamp + self._refresh_interval - self._time())
+        self._render_loop.call_later(delay, self._redraw)
+
+    def _redraw(self):
+        with self._lines_lock:
+            self._redraw_scheduled = False
+        self._last_redraw_timestamp = self._time()
+        self.on_lines_appended.fire()
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+class LogPaneTextArea(CustomTextArea):
+    """
+    Text area of the log pane, rendered incrementally by a `LogPaneControl`.
+    """
+
+    def __init__(self, *args, refresh_interval: float = 0.1, **kwargs):
+        self._refresh_interval = refresh_interval
+        super().__init__(*args, **kwargs)
+
+    def _create_control(self, **kwargs) -> LogPaneControl:
+        return LogPaneControl(log_lines=self.log_lines, refresh_interval=self._refresh_interval, **kwargs)
+
+    def log(self, text: str, save_log: bool = True, silent: bool = False):
+        new_lines = self._split_log_text(text)
+        if save_log:
+            self.control.append_lines(new_lines)
+        else:
+            self.control.replace_lines(new_lines)
+        if not silent:
+            self.control.request_redraw()
@@ -1,9 +1,11 @@
 import asyncio
 import logging
 from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Set
 
 from cachetools import TTLCache
 
@@ -28,6 +30,10 @@ if TYPE_CHECKING:
 
 cot_logger = None
 
+# Set while processing the updates requested by the connector status polling, to tell them apart from the updates
+# received through the user stream or in the responses of order creation and cancelation requests
+_processing_polled_updates: ContextVar[bool] = ContextVar("processing_polled_updates", default=False)
+
 
 class ClientOrderTracker:
 
@@ -61,6 +67,9 @@ class ClientOrderTracker:
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
+        self._order_updates_count: int = 0
+        self._last_pushed_order_update_numbers: Dict[str, int] = {}
+        self._last_pushed_trade_update_numbers: Dict[str, int] = {}
 
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
@@ -132,6 +141,14 @@ class ClientOrderTracker:
         """
         return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
 
+    @property
+    def order_updates_count(self) -> int:
+        """
+        Returns the number of order and trade updates processed so far. Each update gets the counter value as its
+        number.
+        """
+        return self._order_updates_count
+
     @property
     def lost_order_count_limit(self) -> int:
         return self._lost_order_count_limit
@@ -197,11 +214,65 @@ class ClientOrderTracker:
 
         return found_order
 
+    @staticmethod
+    @contextmanager
+    def processing_polled_updates():
+        """
+        Marks the order updates processed inside the context (and in the tasks created from it) as obtained by polling
+        """
+        token = _processing_polled_updates.set(True)
+        try:
+            yield
+        finally:
+            _processing_polled_updates.reset(token)
+
+    def orders_with_pushed_updates_since(self, order_updates_count: int) -> Set[str]:
+        """
+        Returns the client order ids of the orders that received updates not obtained by polling (user stream events
+        or order creation and cancelation responses) after the order updates counter reached the specified value.
+
+        :param order_updates_count: a previous value of `order_updates_count`
+        """
+        return self._pushed_update_orders_since(self._last_pushed_order_update_numbers, order_updates_count)
+
+    def orders_with_pushed_fills_since(self, order_updates_count: int) -> Set[str]:
+        """
+        Returns the client order ids of the orders that received trade updates not obtained by polling after the order
+        updates counter reached the specified value. The filled orders whose trades don't complete their amount are
+        not included, since some of their fills were not received.
+
+        :param order_updates_count: a previous value of `order_updates_count`
+        """
+        fillable_orders = self.all_fillable_orders
+        orders_with_pushed_fills = set()
+        for client_order_id in self._pushed_update_orders_since(self._last_pushed_trade_update_numbers,
+                                                                order_updates_count):
+            order = fillable_orders[client_order_id]
+            if order.current_state != OrderState.FILLED or order.executed_amount_base >= order.amount:
+                orders_with_pushed_fills.add(client_order_id)
+        return orders_with_pushed_fills
+
+    def _pushed_update_orders_since(self, last_pushed_update_numbers: Dict[str, int], order_updates_count: int) -> Set[str]:
+        fillable_orders = self.all_fillable_orders
+        for client_order_id in list(last_pushed_update_numbers):
+            if client_order_id not in fillable_orders:
+                del last_pushed_update_numbers[client_order_id]
+        return {
+            client_order_id for client_order_id, update_number in last_pushed_update_numbers.items()
+            if update_number > order_updates_count
+        }
+
     def process_order_update(self, order_update: OrderUpdate):
+        self._order_updates_count += 1
+        if not _processing_polled_updates.get() and order_update.client_order_id is not None:
+            self._last_pushed_order_update_numbers[order_update.client_order_id] = self._order_updates_count
         return safe_ensure_future(self._process_order_update(order_update))
 
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
+        self._order_updates_count += 1
+        if not _processing_polled_updates.get() and client_order_id is not None:
+            self._last_pushed_trade_update_numbers[client_order_id] = self._order_updates_count
 
         tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
 
@@ -51,14 +51,31 @@ class BinancePerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
 
     async def get_funding_info(self, trading_pair: str) -> FundingInfo:
         symbol_info: Dict[str, Any] = await self._request_complete_funding_info(trading_pair)
-        funding_info = FundingInfo(
-            trading_pair=trading_pair,
-            index_price=Decimal(symbol_info["indexPrice"]),
-            mark_price=Decimal(symbol_info["markPrice"]),
-            next_funding_utc_timestamp=int(symbol_info["nextFundingTime"]),
-            rate=Decimal(symbol_info["lastFundingRate"]),
-        )
-        return funding_info
+        return self._funding_info_from_symbol_info(trading_pair, symbol_info)
+
+    async def get_all_funding_info(self, trading_pairs: List[str]) -> Dict[str, FundingInfo]:
+        """
+        Requests the funding information of all the markets at once (the premium index endpoint returns all of them
+        when no symbol is specified), instead of sending one request per trading pair.
+        """
+        symbols = {}
+        for trading_pair in trading_pairs:
+            symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            symbols[symbol] = trading_pair
+        data = await self._connector._api_get(
+            path_url=CONSTANTS.MARK_PRICE_URL,
+            is_auth_required=True,
+            limit_id=CONSTANTS.ALL_MARK_PRICES_LIMIT_ID)
+        funding_infos = {
+            symbols[symbol_info["symbol"]]: self._funding_info_from_symbol_info(
+                symbols[symbol_info["symbol"]], symbol_info)
+            for symbol_info in data
+            if symbol_info.get("symbol") in symbols
+        }
+        missing_trading_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in funding_infos]
+        if len(missing_trading_pairs) > 0:
+            funding_infos.update(await super().get_all_funding_info(missing_trading_pairs))
+        return funding_infos
 
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
@@ -195,6 +212,16 @@ class BinancePerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
 
         message_queue.put_nowait(funding_info)
 
+    @staticmethod
+    def _funding_info_from_symbol_info(trading_pair: str, symbol_info: Dict[str, Any]) -> FundingInfo:
+        return FundingInfo(
+            trading_pair=trading_pair,
+            index_price=Decimal(symbol_info["indexPrice"]),
+            mark_price=Decimal(symbol_info["markPrice"]),
+            next_funding_utc_timestamp=int(symbol_info["nextFundingTime"]),
+            rate=Decimal(symbol_info["lastFundingRate"]),
+        )
+
     async def _request_complete_funding_info(self, trading_pair: str):
         ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         data = await self._connector._api_get(
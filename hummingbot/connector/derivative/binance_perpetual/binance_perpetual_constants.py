@@ -45,10 +45,13 @@ CHANGE_POSITION_MODE_URL = "/positionSide/dual"
 
 POST_POSITION_MODE_LIMIT_ID = f"POST{CHANGE_POSITION_MODE_URL}"
 GET_POSITION_MODE_LIMIT_ID = f"GET{CHANGE_POSITION_MODE_URL}"
+# The premium index of all the symbols (requested without symbol) has a higher weight
+ALL_MARK_PRICES_LIMIT_ID = f"ALL{MARK_PRICE_URL}"
 
 # Private API v2 Endpoints
 ACCOUNT_INFO_URL = "/account"
 POSITION_INFORMATION_URL = "/positionRisk"
+POSITIONS_POLLING_INTERVAL = 60.0
 
 # Private API Endpoints
 BINANCE_USER_STREAM_ENDPOINT = "/listenKey"
@@ -128,4 +131,6 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5)]),
     RateLimit(limit_id=MARK_PRICE_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE, weight=1,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
+    RateLimit(limit_id=ALL_MARK_PRICES_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE, weight=10,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=10)]),
 ]
@@ -116,6 +116,15 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     def funding_fee_poll_interval(self) -> int:
         return 120
 
+    @property
+    def position_engine_enabled(self) -> bool:
+        return True
+
+    @property
+    def positions_polling_interval(self) -> float:
+        # Positions are also updated by the ACCOUNT_UPDATE user stream events
+        return CONSTANTS.POSITIONS_POLLING_INTERVAL
+
     def supported_order_types(self) -> List[OrderType]:
         """
         :return a list of OrderType supported by this connector
@@ -457,14 +466,21 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                 position = self._perpetual_trading.get_position(hb_trading_pair, side)
                 if position is not None:
                     amount = Decimal(asset["pa"])
+                    pos_key = self._perpetual_trading.position_key(hb_trading_pair, side)
+                    # The transaction time is the exchange time of the fills included in the update
+                    update_timestamp = event_message["T"] * 1e-3 if event_message.get("T") else None
                     if amount == Decimal("0"):
-                        pos_key = self._perpetual_trading.position_key(hb_trading_pair, side)
-                        self._perpetual_trading.remove_position(pos_key)
+                        self._perpetual_trading.remove_position(pos_key, update_timestamp)
                     else:
-                        position.update_position(position_side=PositionSide[asset["ps"]],
-                                                 unrealized_pnl=Decimal(asset["up"]),
-                                                 entry_price=Decimal(asset["ep"]),
-                                                 amount=Decimal(asset["pa"]))
+                        _position = Position(
+                            trading_pair=hb_trading_pair,
+                            position_side=side,
+                            unrealized_pnl=Decimal(asset["up"]),
+                            entry_price=Decimal(asset["ep"]),
+                            amount=amount,
+                            leverage=position.leverage,
+                        )
+                        self._perpetual_trading.set_position(pos_key, _position, update_timestamp)
                 else:
                     await self._update_positions()
         elif event_type == "MARGIN_CALL":
@@ -616,6 +632,8 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             entry_price = Decimal(position.get("entryPrice"))
             amount = Decimal(position.get("positionAmt"))
             leverage = Decimal(position.get("leverage"))
+            update_time = position.get("updateTime")
+            update_timestamp = update_time * 1e-3 if update_time else None
             pos_key = self._perpetual_trading.position_key(hb_trading_pair, position_side)
             if amount != 0:
                 _position = Position(
@@ -626,9 +644,9 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                     amount=amount,
                     leverage=leverage
                 )
-                self._perpetual_trading.set_position(pos_key, _position)
+                self._perpetual_trading.set_position(pos_key, _position, update_timestamp)
             else:
-                self._perpetual_trading.remove_position(pos_key)
+                self._perpetual_trading.remove_position(pos_key, update_timestamp)
 
     async def _update_order_fills_from_trades(self):
         last_tick = int(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
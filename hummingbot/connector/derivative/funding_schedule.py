@@ -0,0 +1,96 @@
+from typing import Dict, List, Optional
+
+# Timestamps above this value are considered to be in milliseconds
+MILLISECONDS_TIMESTAMP_THRESHOLD = 1e11
+DEFAULT_FUNDING_INTERVAL = 8 * 60 * 60
+
+
+def timestamp_in_seconds(timestamp: float) -> float:
+    """
+    Normalizes the timestamps received from the exchanges, some of them in seconds and others in milliseconds.
+    """
+    return timestamp / 1000 if timestamp > MILLISECONDS_TIMESTAMP_THRESHOLD else timestamp
+
+
+class FundingSchedule:
+    """
+    Index of the funding timestamps of the trading pairs of a perpetual connector, used to request the funding payments
+    only for the trading pairs that had a funding event since their last payment was received.
+
+    A funding event is due from the moment it happens plus the settlement delay until a payment at or after its
+    timestamp is received, or until the maximum wait time passes (there is no payment without a position).
+
+    Once the next funding timestamp is settled it is rolled forward by the funding interval, for the exchanges that
+    keep reporting a funding timestamp that already passed.
+    """
+
+    def __init__(self,
+                 settlement_delay: float = 0,
+                 max_payment_wait: float = 600,
+                 funding_interval: float = DEFAULT_FUNDING_INTERVAL):
+        """
+        :param settlement_delay: seconds between the funding timestamp and the payment being available
+        :param max_payment_wait: seconds after the funding timestamp to stop waiting for its payment
+        :param funding_interval: seconds between funding events
+        """
+        self._settlement_delay = settlement_delay
+        self._max_payment_wait = max_payment_wait
+        self._funding_interval = funding_interval
+        self._next_funding_timestamps: Dict[str, float] = {}
+        self._due_funding_timestamps: Dict[str, float] = {}
+        self._settled_funding_timestamps: Dict[str, float] = {}
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._next_funding_timestamps)
+
+    def next_funding_timestamp(self, trading_pair: str) -> Optional[float]:
+        return self._next_funding_timestamps.get(trading_pair)
+
+    def update(self, trading_pair: str, next_funding_timestamp: float):
+        """
+        Registers the next funding timestamp of a trading pair. When it moves forward the previous one becomes due.
+        Timestamps already settled are ignored, the schedule keeps the one rolled forward.
+        """
+        next_funding_timestamp = timestamp_in_seconds(next_funding_timestamp)
+        if next_funding_timestamp <= self._settled_funding_timestamps.get(trading_pair, 0):
+            return
+        previous_timestamp = self._next_funding_timestamps.get(trading_pair)
+        if previous_timestamp is not None and next_funding_timestamp > previous_timestamp:
+            self._due_funding_timestamps[trading_pair] = previous_timestamp
+        self._next_funding_timestamps[trading_pair] = next_funding_timestamp
+
+    def due_trading_pairs(self, timestamp: float) -> List[str]:
+        """
+        Returns the trading pairs with a funding event waiting for its payment at the timestamp (in seconds).
+        """
+        return [trading_pair for trading_pair in self._next_funding_timestamps
+                if self._due_funding_timestamp(trading_pair, timestamp) is not None]
+
+    def register_payment(self, trading_pair: str, payment_timestamp: float, timestamp: float):
+        """
+        Registers the last payment received for a trading pair when requested at the timestamp (in seconds).
+        """
+        due_timestamp = self._due_funding_timestamp(trading_pair, timestamp)
+        if due_timestamp is None:
+            return
+        payment_received = timestamp_in_seconds(payment_timestamp) >= due_timestamp
+        if payment_received or timestamp >= due_timestamp + self._max_payment_wait:
+            self._settled_funding_timestamps[trading_pair] = due_timestamp
+            if self._due_funding_timestamps.get(trading_pair) == due_timestamp:
+                del self._due_funding_timestamps[trading_pair]
+            next_funding_timestamp = self._next_funding_timestamps[trading_pair]
+            while next_funding_timestamp <= due_timestamp:
+                next_funding_timestamp += self._funding_interval
+            self._next_funding_timestamps[trading_pair] = next_funding_timestamp
+
+    def _due_funding_timestamp(self, trading_pair: str, timestamp: float) -> Optional[float]:
+        settled_timestamp = self._settled_funding_timestamps.get(trading_pair, 0)
+        # The next funding timestamp is also checked, in case the funding info was not updated after the event
+        candidates = [self._due_funding_timestamps.get(trading_pair), self._next_funding_timestamps.get(trading_pair)]
+        due_timestamps = [
+            funding_timestamp for funding_timestamp in candidates
+            if funding_timestamp is not None
+            and settled_timestamp < funding_timestamp <= timestamp - self._settlement_delay
+        ]
+        return min(due_timestamps) if due_timestamps else None
@@ -1,6 +1,7 @@
 import asyncio
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from bidict import bidict
 
@@ -173,6 +174,10 @@ class GateIoPerpetualDerivative(PerpetualDerivativePyBase):
         # API documentation does not clarify the error message for timestamp related problems
         return False
 
+    def _rate_limits_budget_scope(self) -> str:
+        # The spot and perpetual requests are sent to the same host and counted in the same points limits
+        return urlparse(CONSTANTS.REST_URL).netloc
+
     def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
         # TODO: implement this method correctly for the connector
         # The default implementation was added when the functionality to detect not found orders was introduced in the
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from typing import Optional
 
 from hummingbot.core.data_type.common import PositionSide
 
@@ -17,6 +18,11 @@ class Position:
         self._entry_price = entry_price
         self._amount = amount
         self._leverage = leverage
+        # Risk values estimated by the position engine between positions updates from the exchange
+        self._mark_price: Optional[Decimal] = None
+        self._margin: Optional[Decimal] = None
+        self._margin_ratio: Optional[Decimal] = None
+        self._liquidation_price: Optional[Decimal] = None
 
     def __repr__(self) -> str:
         return (
@@ -54,6 +60,42 @@ class Position:
     def leverage(self) -> Decimal:
         return self._leverage
 
+    @property
+    def mark_price(self) -> Optional[Decimal]:
+        return self._mark_price
+
+    @property
+    def margin(self) -> Optional[Decimal]:
+        """
+        Initial margin of the position (isolated margin estimation)
+        """
+        return self._margin
+
+    @property
+    def margin_ratio(self) -> Optional[Decimal]:
+        """
+        Maintenance margin divided by the position margin balance (margin plus unrealized PnL). The position is
+        liquidated when it reaches 1.
+        """
+        return self._margin_ratio
+
+    @property
+    def liquidation_price(self) -> Optional[Decimal]:
+        """
+        Estimated liquidation price (isolated margin estimation)
+        """
+        return self._liquidation_price
+
+    def update_risk(self,
+                    mark_price: Decimal,
+                    margin: Decimal,
+                    margin_ratio: Decimal,
+                    liquidation_price: Decimal):
+        self._mark_price = mark_price
+        self._margin = margin
+        self._margin_ratio = margin_ratio
+        self._liquidation_price = liquidation_price
+
     def update_position(self,
                         position_side: PositionSide = None,
                         unrealized_pnl: Decimal = None,
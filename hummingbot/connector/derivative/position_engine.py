@@ -0,0 +1,167 @@
+import logging
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Optional
+
+from hummingbot.connector.derivative.position import Position
+from hummingbot.core.data_type.common import PositionAction, PositionMode, PositionSide, TradeType
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.connector.perpetual_trading import PerpetualTrading
+
+# Lowest maintenance margin tier of the main exchanges, used when the connector does not provide the rate
+DEFAULT_MAINTENANCE_MARGIN_RATE = Decimal("0.005")
+
+s_decimal_0 = Decimal("0")
+
+
+class PositionEngine:
+    """
+    Keeps the positions of a perpetual connector up to date between the positions updates received from the exchange.
+
+    The unrealized PnL, margin ratio and estimated liquidation price of the positions are recalculated with every mark
+    price received in the funding info stream, and the fills of the connector orders are applied to the positions
+    amount and entry price. The positions received from the exchange always replace the estimated ones. Fills executed
+    by the exchange before the update time of the last position received are assumed to be included in it, so fills
+    and positions are compared with the exchange timestamps, never with the local processing time.
+
+    The margin values are isolated margin estimations based on the position leverage and the maintenance margin rate.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, perpetual_trading: "PerpetualTrading"):
+        self._perpetual_trading = perpetual_trading
+        self._mark_prices: Dict[str, Decimal] = {}
+        self._maintenance_margin_rates: Dict[str, Decimal] = {}
+        self._reconciliation_timestamps: Dict[str, float] = {}
+        self._last_fill_timestamps: Dict[str, float] = {}
+
+    def mark_price(self, trading_pair: str) -> Optional[Decimal]:
+        return self._mark_prices.get(trading_pair)
+
+    def maintenance_margin_rate(self, trading_pair: str) -> Decimal:
+        return self._maintenance_margin_rates.get(trading_pair, DEFAULT_MAINTENANCE_MARGIN_RATE)
+
+    def set_maintenance_margin_rate(self, trading_pair: str, rate: Decimal):
+        self._maintenance_margin_rates[trading_pair] = rate
+        self._update_trading_pair_positions(trading_pair)
+
+    def update_mark_price(self, trading_pair: str, mark_price: Decimal):
+        if mark_price is None or mark_price <= s_decimal_0 or self._mark_prices.get(trading_pair) == mark_price:
+            return
+        self._mark_prices[trading_pair] = mark_price
+        self._update_trading_pair_positions(trading_pair)
+
+    def reconcile(self, pos_key: str, position: Optional[Position], timestamp: Optional[float] = None):
+        """
+        Registers a position received from the exchange, or the lack of position if `position` is None.
+
+        :param timestamp: exchange update time of the position (seconds). When the exchange does not provide it, the
+            position is assumed to include all the fills already applied
+        """
+        estimated_position = self._perpetual_trading.account_positions.get(pos_key)
+        estimated_amount = estimated_position.amount if estimated_position is not None else s_decimal_0
+        exchange_amount = position.amount if position is not None else s_decimal_0
+        if estimated_amount != exchange_amount and pos_key in self._reconciliation_timestamps:
+            self.logger().debug(f"Position {pos_key} amount corrected from {estimated_amount} to {exchange_amount} "
+                                f"with the exchange positions.")
+        if timestamp is None:
+            timestamp = self._last_fill_timestamps.get(pos_key, 0)
+        self._reconciliation_timestamps[pos_key] = max(timestamp, self._reconciliation_timestamps.get(pos_key, 0))
+        if position is not None:
+            self._update_risk(position)
+
+    def apply_fill(self,
+                   trading_pair: str,
+                   trade_type: TradeType,
+                   position_action: PositionAction,
+                   price: Decimal,
+                   amount: Decimal,
+                   leverage: Decimal,
+                   timestamp: Optional[float]):
+        """
+        Applies an order fill to the position it opens, increases or reduces.
+
+        :param timestamp: exchange execution time of the fill (seconds), None if unknown
+        """
+        position_mode = self._perpetual_trading.position_mode
+        if position_mode == PositionMode.HEDGE:
+            if position_action not in (PositionAction.OPEN, PositionAction.CLOSE):
+                return
+            is_long = (trade_type == TradeType.BUY) == (position_action == PositionAction.OPEN)
+            side = PositionSide.LONG if is_long else PositionSide.SHORT
+        else:
+            side = None
+        pos_key = self._perpetual_trading.position_key(trading_pair, side, position_mode)
+        if timestamp is not None:
+            if timestamp <= self._reconciliation_timestamps.get(pos_key, 0):
+                return
+            self._last_fill_timestamps[pos_key] = max(timestamp, self._last_fill_timestamps.get(pos_key, 0))
+
+        position = self._perpetual_trading.account_positions.get(pos_key)
+        current_amount = position.amount if position is not None else s_decimal_0
+        entry_price = position.entry_price if position is not None else price
+        fill_amount = amount if trade_type == TradeType.BUY else -amount
+        new_amount = current_amount + fill_amount
+
+        if current_amount == s_decimal_0 or (current_amount > 0) == (fill_amount > 0):
+            entry_price = (entry_price * abs(current_amount) + price * amount) / (abs(current_amount) + amount)
+        elif (new_amount > 0) != (current_amount > 0) and new_amount != s_decimal_0:
+            # The fill closed the position and opened a new one in the other direction
+            entry_price = price
+
+        if new_amount == s_decimal_0:
+            self._perpetual_trading.account_positions.pop(pos_key, None)
+            return
+        if side is None:
+            if position is not None and position.position_side == PositionSide.BOTH:
+                side = PositionSide.BOTH
+            else:
+                side = PositionSide.LONG if new_amount > 0 else PositionSide.SHORT
+        if position is None:
+            position = Position(trading_pair=trading_pair,
+                                position_side=side,
+                                unrealized_pnl=s_decimal_0,
+                                entry_price=entry_price,
+                                amount=new_amount,
+                                leverage=Decimal(str(leverage)))
+            self._perpetual_trading.account_positions[pos_key] = position
+        else:
+            position.update_position(position_side=side, entry_price=entry_price, amount=new_amount)
+        self._update_risk(position)
+
+    def _update_trading_pair_positions(self, trading_pair: str):
+        for position in self._perpetual_trading.account_positions.values():
+            if position.trading_pair == trading_pair:
+                self._update_risk(position)
+
+    def _update_risk(self, position: Position):
+        mark_price = self._mark_prices.get(position.trading_pair)
+        if mark_price is None or position.amount == s_decimal_0 or position.leverage <= s_decimal_0:
+            return
+        amount = position.amount
+        entry_price = position.entry_price
+        leverage = Decimal(str(position.leverage))
+        maintenance_rate = self.maintenance_margin_rate(position.trading_pair)
+
+        unrealized_pnl = (mark_price - entry_price) * amount
+        margin = abs(amount) * entry_price / leverage
+        margin_balance = margin + unrealized_pnl
+        maintenance_margin = abs(amount) * mark_price * maintenance_rate
+        margin_ratio = maintenance_margin / margin_balance if margin_balance > s_decimal_0 else Decimal("Infinity")
+        if amount > 0:
+            liquidation_price = entry_price * (1 - 1 / leverage) / (1 - maintenance_rate)
+        else:
+            liquidation_price = entry_price * (1 + 1 / leverage) / (1 + maintenance_rate)
+
+        position.update_position(unrealized_pnl=unrealized_pnl)
+        position.update_risk(mark_price=mark_price,
+                             margin=margin,
+                             margin_ratio=margin_ratio,
+                             liquidation_price=max(liquidation_price, s_decimal_0))
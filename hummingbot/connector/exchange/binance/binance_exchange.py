@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -510,6 +511,44 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _request_order_status_updates_in_bulk(self, orders: List[InFlightOrder]) -> Dict[str, OrderUpdate]:
+        """
+        Requests the open orders of the trading pairs with many tracked orders. The orders not found in the response
+        (because they are not open anymore) are updated individually.
+        """
+        orders_by_trading_pair: Dict[str, List[InFlightOrder]] = defaultdict(list)
+        for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+        trading_pairs = [trading_pair for trading_pair, pair_orders in orders_by_trading_pair.items()
+                         if len(pair_orders) >= CONSTANTS.OPEN_ORDERS_BULK_STATUS_MIN_ORDERS]
+
+        tasks = []
+        for trading_pair in trading_pairs:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            tasks.append(self._api_get(
+                path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+                params={"symbol": symbol},
+                is_auth_required=True))
+        results = await safe_gather(*tasks, return_exceptions=True)
+
+        order_updates = {}
+        for open_orders, trading_pair in zip(results, trading_pairs):
+            if isinstance(open_orders, Exception):
+                self.logger().debug(f"Error fetching the open orders of {trading_pair}: {open_orders}.")
+                continue
+            open_orders_by_client_id = {order_data["clientOrderId"]: order_data for order_data in open_orders}
+            for order in orders_by_trading_pair[trading_pair]:
+                order_data = open_orders_by_client_id.get(order.client_order_id)
+                if order_data is not None:
+                    order_updates[order.client_order_id] = OrderUpdate(
+                        client_order_id=order.client_order_id,
+                        exchange_order_id=str(order_data["orderId"]),
+                        trading_pair=order.trading_pair,
+                        update_timestamp=order_data["updateTime"] * 1e-3,
+                        new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+                    )
+        return order_updates
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
@@ -4,9 +4,10 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from async_timeout import timeout
+from bidict import bidict
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
@@ -16,19 +17,29 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.rate_limits_budget import (
+    HostRateLimitsBudget,
+    InProcessRateLimitsBudget,
+    RateLimitsBudget,
+)
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_data_relay_order_book_data_source import MarketDataRelayOrderBookDataSource
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.data_type.worker_order_book_tracker import WorkerOrderBookTracker
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.exchange_info_cache import ExchangeInfoCache, ExchangeInfoCacheEntry
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionPoolSettings, HostConnectionMetrics
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
@@ -45,6 +56,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of order status or trade requests sent at the same time while polling the orders updates
+    MAX_CONCURRENT_ORDER_UPDATE_REQUESTS = 10
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -53,6 +66,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._last_timestamp = 0
         self._trading_rules = {}
         self._trading_fees = {}
+        self._exchange_info_cache_entry: Optional[ExchangeInfoCacheEntry] = None
 
         self._status_polling_task: Optional[asyncio.Task] = None
         self._user_stream_tracker_task: Optional[asyncio.Task] = None
@@ -60,6 +74,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._connections_keep_alive_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -70,18 +85,18 @@ class ExchangePyBase(ExchangeBase, ABC):
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        self._web_assistants_factory.connections_factory.pool_settings = self._connection_pool_settings()
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
-        self._set_order_book_tracker(OrderBookTracker(
-            data_source=self._orderbook_ds,
-            trading_pairs=self.trading_pairs,
-            domain=self.domain))
+        self._set_order_book_tracker(self._create_order_book_tracker())
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
+        # Value of the order tracker updates counter when the last order status poll started
+        self._last_order_status_poll_updates_count: Optional[int] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -165,6 +180,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def limit_orders(self) -> List[LimitOrder]:
         return [in_flight_order.to_limit_order() for in_flight_order in self.in_flight_orders.values()]
 
+    @property
+    def connection_metrics(self) -> Dict[str, HostConnectionMetrics]:
+        """
+        Returns the HTTP connections reuse metrics of the requests sent by the connector, by host
+        """
+        return self._web_assistants_factory.connections_factory.host_metrics
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         return {
@@ -666,6 +688,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The background task to process the events received through the user stream tracker (websocket connection)
         """
         self._stop_network()
+        self._throttler.set_rate_limits_budget(self._create_rate_limits_budget())
         self.order_book_tracker.start()
         if self.is_trading_required:
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
@@ -674,6 +697,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            if self._client_config.http_connections.keepalive_warmup_enabled:
+                self._connections_keep_alive_task = safe_ensure_future(self._connections_keep_alive_loop())
 
     async def stop_network(self):
         """
@@ -719,6 +744,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._connections_keep_alive_task is not None:
+            self._connections_keep_alive_task.cancel()
+            self._connections_keep_alive_task = None
 
     # === loops and sync related methods ===
     #
@@ -826,6 +854,23 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().exception("Unexpected error while updating the time synchronizer")
                 await self._sleep(0.5)
 
+    async def _connections_keep_alive_loop(self):
+        """
+        Opens the configured number of HTTP connections with the exchange and keeps them alive sending network check
+        requests, so that orders sent after an idle period reuse a connection instead of waiting for the TCP and TLS
+        handshakes. The requests go through the throttler like any other request.
+        """
+        http_connections_config = self._client_config.http_connections
+        while True:
+            try:
+                await safe_gather(*[self._make_network_check_request()
+                                    for _ in range(http_connections_config.keepalive_warmup_connections)])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().debug("Error sending keep alive requests.", exc_info=True)
+            await self._sleep(http_connections_config.keepalive_warmup_interval)
+
     async def _iter_user_event_queue(self) -> AsyncIterable[Dict[str, any]]:
         """
         Called by _user_stream_event_listener.
@@ -851,13 +896,110 @@ class ExchangePyBase(ExchangeBase, ABC):
     # === Exchange / Trading logic methods that call the API ===
 
     async def _update_trading_rules(self):
+        exchange_info_cache = ExchangeInfoCache.shared_instance()
+        if exchange_info_cache is not None and self._exchange_info_cache_supported():
+            await self._update_trading_rules_with_cache(exchange_info_cache)
+            return
         exchange_info = await self._make_trading_rules_request()
         trading_rules_list = await self._format_trading_rules(exchange_info)
+        self._set_trading_rules(exchange_info=exchange_info, trading_rules_list=trading_rules_list)
+
+    def _set_trading_rules(self, exchange_info: Any, trading_rules_list: List[TradingRule]):
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
         self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
 
+    async def _update_trading_rules_with_cache(self, exchange_info_cache: ExchangeInfoCache):
+        """
+        Updates the trading rules using the exchange info cache:
+        - on the first update the trading rules are parsed from the cached exchange info right away, and the exchange is
+        not requested if the cache entry is younger than the trading rules update interval
+        - the exchange info is requested conditionally (ETag / If-Modified-Since) when the connector uses the default
+        trading rules request, and the response is compared with the cached one by content hash otherwise
+        - the trading rules are only parsed again if the exchange info changed
+        Reading, hashing, decoding and writing the (possibly large) cached content is done out of the event loop.
+        """
+        loop = asyncio.get_event_loop()
+        cache_key = self._name_and_domain_key()
+        entry = self._exchange_info_cache_entry
+        if entry is None:
+            entry = await loop.run_in_executor(None, exchange_info_cache.load_entry, cache_key)
+            if entry is not None:
+                # The symbol map is required to parse the trading rules
+                self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=entry.exchange_info)
+                trading_rules_list = await self._format_trading_rules(entry.exchange_info)
+                self._set_trading_rules(exchange_info=entry.exchange_info, trading_rules_list=trading_rules_list)
+                self._exchange_info_cache_entry = entry
+                if exchange_info_cache.is_entry_fresh(entry, max_age=self.TRADING_RULES_INTERVAL):
+                    return
+
+        known_content_hash = None if entry is None else entry.content_hash
+        etag = last_modified = None
+        if self._conditional_trading_rules_request_supported():
+            response = await self._make_conditional_trading_rules_request(entry)
+            not_modified = entry is not None and response.status == 304
+            if not not_modified:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                content = await response.text()
+                content_hash, exchange_info = await loop.run_in_executor(
+                    None, exchange_info_cache.parse_content, content, known_content_hash)
+        else:
+            exchange_info = await self._make_trading_rules_request()
+            content_hash = await loop.run_in_executor(None, exchange_info_cache.exchange_info_hash, exchange_info)
+            not_modified = False
+
+        if not_modified or content_hash == known_content_hash:
+            entry.etag = etag or entry.etag
+            entry.last_modified = last_modified or entry.last_modified
+        else:
+            trading_rules_list = await self._format_trading_rules(exchange_info)
+            self._set_trading_rules(exchange_info=exchange_info, trading_rules_list=trading_rules_list)
+            entry = ExchangeInfoCacheEntry(
+                exchange_info=exchange_info,
+                content_hash=content_hash,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            self._exchange_info_cache_entry = entry
+        await loop.run_in_executor(None, exchange_info_cache.save_entry, cache_key, entry)
+
+    def _exchange_info_cache_supported(self) -> bool:
+        """
+        Indicates if the trading rules can be updated with the exchange info cache. The trading rules are only parsed
+        again when the exchange info changes, so connectors whose trading rules are not parsed from the exchange info
+        don't support it.
+        """
+        return True
+
+    def _conditional_trading_rules_request_supported(self) -> bool:
+        """
+        The conditional request replaces the default trading rules request. Connectors that customize the request are
+        compared by content hash instead.
+        """
+        return type(self)._make_trading_rules_request is ExchangePyBase._make_trading_rules_request
+
+    async def _make_conditional_trading_rules_request(self, entry: Optional[ExchangeInfoCacheEntry]):
+        """
+        Requests the exchange info with the validators of the cached entry, if any.
+
+        :return: the raw response, with status 304 if the exchange info did not change
+        """
+        headers = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        rest_assistant = await self._web_assistants_factory.get_rest_assistant()
+        url = await self._api_request_url(path_url=self.trading_rules_request_path)
+        return await rest_assistant.execute_request_and_get_response(
+            url=url,
+            throttler_limit_id=self.trading_rules_request_path,
+            method=RESTMethod.GET,
+            headers=headers,
+        )
+
     async def _api_get(self, *args, **kwargs):
         kwargs["method"] = RESTMethod.GET
         return await self._api_request(*args, **kwargs)
@@ -949,7 +1091,12 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
+        bulk_trade_updates = await self._request_trade_updates_in_bulk_with_error_handling(orders=orders)
+        for trade_updates in bulk_trade_updates.values():
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+
+        async def update_order_fills(order: InFlightOrder):
             try:
                 trade_updates = await self._all_trade_updates_for_order(order=order)
                 for trade_update in trade_updates:
@@ -962,6 +1109,10 @@ class ExchangePyBase(ExchangeBase, ABC):
                     exc_info=request_error,
                 )
 
+        await self._run_order_update_requests(
+            requests=[update_order_fills(order) for order in orders
+                      if order.client_order_id not in bulk_trade_updates])
+
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
             raise error
@@ -989,7 +1140,11 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        bulk_order_updates = await self._request_order_status_updates_in_bulk_with_error_handling(orders=orders)
+        for order_update in bulk_order_updates.values():
+            self._order_tracker.process_order_update(order_update)
+
+        async def update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -998,10 +1153,63 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
-    async def _update_orders(self):
-        orders_to_update = self.in_flight_orders.copy()
+        await self._run_order_update_requests(
+            requests=[update_order(order) for order in orders
+                      if order.client_order_id not in bulk_order_updates])
+
+    async def _run_order_update_requests(self, requests: List[Awaitable]):
+        """
+        Runs the order update requests concurrently, with at most MAX_CONCURRENT_ORDER_UPDATE_REQUESTS of them in
+        flight at the same time. The requests rate is still controlled by the throttler.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_UPDATE_REQUESTS)
+
+        async def run_request(request: Awaitable):
+            async with semaphore:
+                await request
+
+        await safe_gather(*[run_request(request) for request in requests])
+
+    async def _request_order_status_updates_in_bulk_with_error_handling(
+            self, orders: List[InFlightOrder]) -> Dict[str, OrderUpdate]:
+        if len(orders) == 0:
+            return {}
+        try:
+            order_updates = await self._request_order_status_updates_in_bulk(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the orders status in bulk. The orders will be updated one by one. "
+                f"Error: {request_error}",
+                exc_info=request_error,
+            )
+            order_updates = {}
+        return order_updates
+
+    async def _request_trade_updates_in_bulk_with_error_handling(
+            self, orders: List[InFlightOrder]) -> Dict[str, List[TradeUpdate]]:
+        if len(orders) == 0:
+            return {}
+        try:
+            trade_updates = await self._request_trade_updates_in_bulk(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the orders trades in bulk. The trades will be requested for each order. "
+                f"Error: {request_error}",
+                exc_info=request_error,
+            )
+            trade_updates = {}
+        return trade_updates
+
+    async def _update_orders(self, skipped_client_order_ids: Optional[Set[str]] = None):
+        skipped_client_order_ids = skipped_client_order_ids or set()
+        orders_to_update = [order for order in self.in_flight_orders.copy().values()
+                            if order.client_order_id not in skipped_client_order_ids]
         await self._update_orders_with_error_handler(
-            orders=list(orders_to_update.values()), error_handler=self._handle_update_error_for_active_order
+            orders=orders_to_update, error_handler=self._handle_update_error_for_active_order
         )
 
     async def _update_lost_orders(self):
@@ -1011,12 +1219,45 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
-        await self._update_orders()
+        with self._order_tracker.processing_polled_updates():
+            orders_updated_since_last_poll = self._orders_with_pushed_updates_since_last_status_poll()
+            orders_filled_since_last_poll = self._orders_with_pushed_fills_since_last_status_poll()
+            self._last_order_status_poll_updates_count = self._order_tracker.order_updates_count
+            await self._update_orders_fills(
+                orders=[order for order in self._order_tracker.all_fillable_orders.values()
+                        if order.client_order_id not in orders_filled_since_last_poll])
+            await self._update_orders(skipped_client_order_ids=orders_updated_since_last_poll)
 
     async def _update_lost_orders_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
-        await self._update_lost_orders()
+        with self._order_tracker.processing_polled_updates():
+            await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
+            await self._update_lost_orders()
+
+    def _orders_with_pushed_updates_since_last_status_poll(self) -> Set[str]:
+        """
+        Returns the ids of the active orders whose status was confirmed by the user stream (or by the response of an
+        order creation or cancelation request) since the previous status poll. Their status doesn't need to be
+        requested again in the current poll. Lost orders are always updated.
+        """
+        if self._last_order_status_poll_updates_count is None:
+            return set()
+        return self._active_orders_not_lost(self._order_tracker.orders_with_pushed_updates_since(
+            self._last_order_status_poll_updates_count))
+
+    def _orders_with_pushed_fills_since_last_status_poll(self) -> Set[str]:
+        """
+        Returns the ids of the active orders whose fills were received from the user stream since the previous status
+        poll. A pushed status doesn't confirm the fills (the trades can be sent in separate messages), so only these
+        orders skip the fills request in the current poll.
+        """
+        if self._last_order_status_poll_updates_count is None:
+            return set()
+        return self._active_orders_not_lost(self._order_tracker.orders_with_pushed_fills_since(
+            self._last_order_status_poll_updates_count))
+
+    def _active_orders_not_lost(self, client_order_ids: Set[str]) -> Set[str]:
+        lost_orders = self._order_tracker.lost_orders
+        return {client_order_id for client_order_id in client_order_ids if client_order_id not in lost_orders}
 
     async def _cancel_lost_orders(self):
         for _, lost_order in self._order_tracker.lost_orders.items():
@@ -1048,6 +1289,26 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_order_status_updates_in_bulk(self, orders: List[InFlightOrder]) -> Dict[str, OrderUpdate]:
+        """
+        Connectors for exchanges able to report the status of several orders in a single request override this method.
+        The orders not included in the result are updated with one `_request_order_status` call each.
+
+        :param orders: the orders to update
+        :return: the order updates, by client order id
+        """
+        return {}
+
+    async def _request_trade_updates_in_bulk(self, orders: List[InFlightOrder]) -> Dict[str, List[TradeUpdate]]:
+        """
+        Connectors for exchanges able to report the trades of several orders in a single request override this method.
+        The orders not included in the result get their trades with one `_all_trade_updates_for_order` call each.
+
+        :param orders: the orders to update
+        :return: the trade updates, by client order id. Orders without trades have to be included with an empty list
+        """
+        return {}
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1067,13 +1328,119 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def _create_order_book_tracker(self) -> OrderBookTracker:
+        relay_config = self._client_config.market_data_relay
+        if relay_config.market_data_relay_enabled and self._market_data_worker_supported():
+            relay_data_source = MarketDataRelayOrderBookDataSource(
+                trading_pairs=self.trading_pairs,
+                connector_name=self.name,
+                exchange_data_source=self._orderbook_ds,
+                socket_path=relay_config.market_data_relay_socket)
+            return OrderBookTracker(data_source=relay_data_source, trading_pairs=self.trading_pairs, domain=self.domain)
+        workers_config = self._client_config.market_data_workers
+        if workers_config.market_data_workers_enabled and self._market_data_worker_supported():
+            return WorkerOrderBookTracker(
+                connector_name=self.name,
+                data_source=self._orderbook_ds,
+                trading_pairs=self.trading_pairs,
+                depth=workers_config.market_data_workers_depth,
+                publish_interval=workers_config.market_data_workers_interval,
+                domain=self.domain,
+                connector_settings_key=self._connector_settings_key())
+        return OrderBookTracker(
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain)
+
+    def _connection_pool_settings(self) -> ConnectionPoolSettings:
+        """
+        Returns the configuration of the HTTP connections pool of the connector. Connectors can override it to adapt
+        the pool to the exchange (for example to limit the connections per host).
+        """
+        http_connections_config = self._client_config.http_connections
+        return ConnectionPoolSettings(
+            limit=http_connections_config.connection_limit,
+            limit_per_host=http_connections_config.connection_limit_per_host,
+            dns_cache_ttl=http_connections_config.dns_cache_ttl,
+            keepalive_timeout=http_connections_config.keepalive_timeout,
+        )
+
+    def _create_rate_limits_budget(self) -> Optional[RateLimitsBudget]:
+        """
+        Returns the rate limits budget shared with the other connectors of the same scope, as configured in the client
+        configuration, or None if the throttler owns the full rate limits.
+        """
+        budget_config = self._client_config.rate_limits_budget
+        sharing_mode = budget_config.rate_limits_budget_sharing
+        if sharing_mode == "disabled":
+            return None
+        budget_kwargs = {
+            "scope": self._rate_limits_budget_scope(),
+            "high_priority_reserve_pct": budget_config.high_priority_reserve_pct,
+        }
+        if sharing_mode == "host":
+            return HostRateLimitsBudget.get_instance(budget_dir=budget_config.rate_limits_budget_dir, **budget_kwargs)
+        return InProcessRateLimitsBudget.get_instance(**budget_kwargs)
+
+    def _rate_limits_budget_scope(self) -> str:
+        """
+        Identifies the owner of the rate limits. Connectors sharing the limits of another connector (for example the
+        spot and perpetual markets of an exchange that limits the requests by IP) can override it to use the same scope.
+        """
+        return self._name_and_domain_key()
+
+    def _name_and_domain_key(self) -> str:
+        """
+        Identifies the connector and its domain in the caches shared by the connectors. The name of some connectors is
+        the same for all their domains, and each domain lists different markets.
+        """
+        return f"{self.name}-{self.domain}"
+
+    def _connector_settings_key(self) -> str:
+        """
+        Returns the key of the connector in the connectors settings. The connectors are registered with the name of
+        their package, and the other domains of the connector are resolved with the connector domain.
+        """
+        return type(self).__module__.split(".")[-2]
+
+    def _market_data_worker_supported(self) -> bool:
+        """
+        Indicates if the order books of the connector can be tracked in a market data worker process or received from
+        a market data relay. Connectors that use the order book data source for other streams than the order books
+        don't support it.
+        """
+        return True
+
     async def _initialize_trading_pair_symbol_map(self):
+        """
+        Initializes the symbol map from the shared trading pairs cache when it holds a fresh entry for this connector.
+        Otherwise the map is built from the exchange info and stored in the cache for the next initializations.
+        """
+        trading_pairs_cache = (TradingPairsCache.shared_instance()
+                               if self._trading_pair_symbol_map_cache_supported()
+                               else None)
+        cache_key = self._name_and_domain_key()
+        cached_symbol_map = None if trading_pairs_cache is None else trading_pairs_cache.get_symbol_map(cache_key)
+        if cached_symbol_map:
+            self._set_trading_pair_symbol_map(bidict(cached_symbol_map))
+            return
         try:
             exchange_info = await self._make_trading_pairs_request()
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+            if trading_pairs_cache is not None and self.trading_pair_symbol_map_ready():
+                trading_pairs_cache.set_symbol_map(cache_key, self._trading_pair_symbol_map)
+                await trading_pairs_cache.save_async()
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
 
+    def _trading_pair_symbol_map_cache_supported(self) -> bool:
+        """
+        Indicates if the symbol map can be initialized from the trading pairs cache. A cached map is used without
+        requesting the exchange info, so connectors that keep other data from the exchange info when building the symbol
+        map in `_initialize_trading_pair_symbols_from_exchange_info` don't support it.
+        """
+        return True
+
     async def _make_network_check_request(self):
         await self._api_get(path_url=self.check_network_request_path)
 
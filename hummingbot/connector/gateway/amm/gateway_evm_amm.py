@@ -4,6 +4,7 @@ import itertools as it
 import logging
 import re
 import time
+from contextlib import nullcontext
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
 
@@ -12,6 +13,7 @@ from async_timeout import timeout
 from hummingbot.client.settings import GatewayConnectionSetting
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.gateway.gateway_evm_nonce_manager import GatewayEVMNonceManager
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -115,6 +117,10 @@ class GatewayEVMAMM(ConnectorBase):
         self._network_transaction_fee: Optional[TokenAmount] = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
         self._amount_quantum_dict = {}
+        self._nonce_manager: Optional[GatewayEVMNonceManager] = None
+        if client_config_map.gateway.gateway_local_nonce_manager:
+            self._nonce_manager = GatewayEVMNonceManager.get_instance(
+                client_config_map=client_config_map, chain=chain, network=network, address=address)
         safe_ensure_future(self.load_token_data())
 
     @classmethod
@@ -304,14 +310,19 @@ class GatewayEVMAMM(ConnectorBase):
                                   trading_pair=token_symbol,
                                   is_approval=True)
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().approve_token(
-                self.chain,
-                self.network,
-                self.address,
-                token_symbol,
-                self.connector_name,
-                **request_args
-            )
+            async with self._transaction_nonce(request_args) as local_nonce:
+                if local_nonce is not None:
+                    request_args["nonce"] = local_nonce
+                resp: Dict[str, Any] = await self._get_gateway_instance().approve_token(
+                    self.chain,
+                    self.network,
+                    self.address,
+                    token_symbol,
+                    self.connector_name,
+                    **request_args
+                )
+                if local_nonce is not None and resp.get("approval", {}).get("hash") is None:
+                    raise ValueError(f"Missing approval hash from approve_token() response: {resp}.")
 
             transaction_hash: Optional[str] = resp.get("approval", {}).get("hash")
             nonce: Optional[int] = resp.get("nonce")
@@ -545,42 +556,44 @@ class GatewayEVMAMM(ConnectorBase):
                                   price=price,
                                   amount=amount)
         try:
-            order_result: Dict[str, Any] = await self._get_gateway_instance().amm_trade(
-                self.chain,
-                self.network,
-                self.connector_name,
-                self.address,
-                base,
-                quote,
-                trade_type,
-                amount,
-                price,
-                **request_args
-            )
-            transaction_hash: Optional[str] = order_result.get("txHash")
-            if transaction_hash is not None and transaction_hash != "":
-                gas_cost: Decimal = Decimal(order_result.get("gasCost"))
-                gas_price_token: str = order_result.get("gasPriceToken")
-                self.network_transaction_fee = TokenAmount(gas_price_token, gas_cost)
-
-                order_update: OrderUpdate = OrderUpdate(
-                    client_order_id=order_id,
-                    exchange_order_id=transaction_hash,
-                    trading_pair=trading_pair,
-                    update_timestamp=self.current_timestamp,
-                    new_state=OrderState.OPEN,  # Assume that the transaction has been successfully mined.
-                    misc_updates={
-                        "nonce": order_result.get("nonce"),
-                        "gas_price": Decimal(order_result.get("gasPrice")),
-                        "gas_limit": int(order_result.get("gasLimit")),
-                        "gas_cost": Decimal(order_result.get("gasCost")),
-                        "gas_price_token": order_result.get("gasPriceToken"),
-                        "fee_asset": self._native_currency
-                    }
+            async with self._transaction_nonce(request_args) as local_nonce:
+                if local_nonce is not None:
+                    request_args["nonce"] = local_nonce
+                order_result: Dict[str, Any] = await self._get_gateway_instance().amm_trade(
+                    self.chain,
+                    self.network,
+                    self.connector_name,
+                    self.address,
+                    base,
+                    quote,
+                    trade_type,
+                    amount,
+                    price,
+                    **request_args
                 )
-                self._order_tracker.process_order_update(order_update)
-            else:
-                raise ValueError
+                transaction_hash: Optional[str] = order_result.get("txHash")
+                if transaction_hash is None or transaction_hash == "":
+                    raise ValueError(f"Missing txHash from amm_trade() response: {order_result}.")
+            gas_cost: Decimal = Decimal(order_result.get("gasCost"))
+            gas_price_token: str = order_result.get("gasPriceToken")
+            self.network_transaction_fee = TokenAmount(gas_price_token, gas_cost)
+
+            order_update: OrderUpdate = OrderUpdate(
+                client_order_id=order_id,
+                exchange_order_id=transaction_hash,
+                trading_pair=trading_pair,
+                update_timestamp=self.current_timestamp,
+                new_state=OrderState.OPEN,  # Assume that the transaction has been successfully mined.
+                misc_updates={
+                    "nonce": order_result.get("nonce"),
+                    "gas_price": Decimal(order_result.get("gasPrice")),
+                    "gas_limit": int(order_result.get("gasLimit")),
+                    "gas_cost": Decimal(order_result.get("gasCost")),
+                    "gas_price_token": order_result.get("gasPriceToken"),
+                    "fee_asset": self._native_currency
+                }
+            )
+            self._order_tracker.process_order_update(order_update)
 
         except asyncio.CancelledError:
             raise
@@ -898,6 +911,15 @@ class GatewayEVMAMM(ConnectorBase):
             if self._poll_notifier is not None and not self._poll_notifier.is_set():
                 self._poll_notifier.set()
 
+    def _transaction_nonce(self, request_args: Dict[str, Any]):
+        """
+        Returns the context allocating the nonce of a new transaction when the local nonce manager is enabled and no
+        nonce has been specified. Otherwise the context returns None, and the nonce is assigned by Gateway.
+        """
+        if self._nonce_manager is None or request_args.get("nonce") is not None:
+            return nullcontext()
+        return self._nonce_manager.allocate_nonce()
+
     async def _update_nonce(self, new_nonce: Optional[int] = None):
         """
         Call the gateway API to get the current nonce for self.address
@@ -1048,17 +1070,29 @@ class GatewayEVMAMM(ConnectorBase):
 
         try:
             async with timeout(timeout_seconds):
-                for incomplete_order in incomplete_orders:
-                    try:
-                        canceling_order_id: Optional[str] = await self._execute_cancel(
-                            incomplete_order.client_order_id,
-                            cancel_age
-                        )
-                    except Exception:
-                        continue
-                    if canceling_order_id is not None:
-                        canceling_id_set.remove(canceling_order_id)
-                        sent_cancellations.append(CancellationResult(canceling_order_id, True))
+                if self._nonce_manager is not None:
+                    # Each cancellation replaces a transaction with a nonce assigned locally, so they can be sent
+                    # concurrently
+                    results = await safe_gather(
+                        *[self._execute_cancel(o.client_order_id, cancel_age) for o in incomplete_orders],
+                        return_exceptions=True
+                    )
+                    for canceling_order_id in results:
+                        if canceling_order_id is not None and not isinstance(canceling_order_id, Exception):
+                            canceling_id_set.remove(canceling_order_id)
+                            sent_cancellations.append(CancellationResult(canceling_order_id, True))
+                else:
+                    for incomplete_order in incomplete_orders:
+                        try:
+                            canceling_order_id: Optional[str] = await self._execute_cancel(
+                                incomplete_order.client_order_id,
+                                cancel_age
+                            )
+                        except Exception:
+                            continue
+                        if canceling_order_id is not None:
+                            canceling_id_set.remove(canceling_order_id)
+                            sent_cancellations.append(CancellationResult(canceling_order_id, True))
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -351,6 +351,10 @@ class GatewayCLOBPerp(PerpetualDerivativePyBase):
         trading_rules = await self._api_data_source.get_trading_rules()
         return list(trading_rules.values())
 
+    def _exchange_info_cache_supported(self) -> bool:
+        # The exchange info is the symbol map, the trading rules are requested separately to the data source
+        return False
+
     async def _place_order(
         self,
         order_id: str,
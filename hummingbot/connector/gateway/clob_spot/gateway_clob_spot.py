@@ -591,6 +591,10 @@ class GatewayCLOBSPOT(ExchangePyBase):
         trading_rules = await self._api_data_source.get_trading_rules()
         return list(trading_rules.values())
 
+    def _exchange_info_cache_supported(self) -> bool:
+        # The exchange info is the symbol map, the trading rules are requested separately to the data source
+        return False
+
     async def _request_order_status(self, tracked_order: GatewayInFlightOrder) -> OrderUpdate:
         order_update = await self._api_data_source.get_order_status_update(in_flight_order=tracked_order)
         return order_update
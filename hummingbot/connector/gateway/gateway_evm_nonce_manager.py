@@ -0,0 +1,167 @@
+import asyncio
+import heapq
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+class GatewayEVMNonceManager:
+    """
+    Hands out sequential transaction nonces for an EVM wallet, so several transactions (trades, approvals) can be sent
+    to Gateway concurrently instead of one at a time.
+
+    There is a single manager per chain, network and wallet address, shared by all the connectors using the wallet.
+    The nonces are reconciled with the next nonce reported by Gateway when the manager starts, periodically while no
+    transactions are being sent, and after a transaction fails. The nonces of the transactions sent stay in flight
+    until Gateway reports a higher nonce (the transaction was mined) or they expire (the transaction was dropped), and
+    are never handed out again while in flight. The nonces between Gateway's nonce and the next local nonce that are
+    not in flight (failed or dropped transactions) are reused by the next transactions, so the gaps are filled. The
+    local nonces not in flight are discarded when a transaction is rejected because of its nonce.
+    """
+    NONCE_SYNC_INTERVAL = 60.0
+    # Time after which a sent transaction not mined yet is considered dropped
+    SENT_NONCE_EXPIRATION = 600.0
+    # Fragments of the errors reported when a transaction is rejected because of its nonce
+    NONCE_ERROR_MESSAGES = ("nonce", "replacement transaction underpriced")
+
+    _logger: Optional[HummingbotLogger] = None
+    _instances: Dict[Tuple[str, str, str], "GatewayEVMNonceManager"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls,
+                     client_config_map: "ClientConfigAdapter",
+                     chain: str,
+                     network: str,
+                     address: str) -> "GatewayEVMNonceManager":
+        key = (chain, network, address.lower())
+        if key not in cls._instances:
+            cls._instances[key] = cls(client_config_map=client_config_map, chain=chain, network=network, address=address)
+        return cls._instances[key]
+
+    def __init__(self, client_config_map: "ClientConfigAdapter", chain: str, network: str, address: str):
+        self._client_config_map = client_config_map
+        self._chain = chain
+        self._network = network
+        self._address = address
+        self._lock = asyncio.Lock()
+        self._next_nonce: Optional[int] = None
+        self._pending_nonces: Set[int] = set()
+        self._sent_nonces: Dict[int, float] = {}
+        self._released_nonces: List[int] = []
+        self._sync_required = True
+        self._last_sync_timestamp = 0.0
+
+    @property
+    def pending_nonces(self) -> Set[int]:
+        """
+        Nonces allocated to transactions that have not been sent to Gateway yet
+        """
+        return self._pending_nonces.copy()
+
+    @property
+    def in_flight_nonces(self) -> Set[int]:
+        """
+        Nonces of the transactions being sent or sent and not mined yet
+        """
+        return self._pending_nonces | set(self._sent_nonces)
+
+    @asynccontextmanager
+    async def allocate_nonce(self) -> AsyncIterator[int]:
+        """
+        Allocates the next nonce for the transaction sent inside the context. The nonce is released to be reused if the
+        context exits with an exception, which means the transaction was not sent.
+        """
+        nonce = await self.next_nonce()
+        try:
+            yield nonce
+        except BaseException as e:
+            self.release_nonce(nonce)
+            if self.is_nonce_error(e):
+                self.reset()
+            raise
+        else:
+            self.confirm_nonce(nonce)
+
+    async def next_nonce(self) -> int:
+        async with self._lock:
+            if self._sync_required or (
+                    len(self._pending_nonces) == 0
+                    and self._time() - self._last_sync_timestamp > self.NONCE_SYNC_INTERVAL):
+                await self._sync_nonces()
+            if len(self._released_nonces) > 0:
+                nonce = heapq.heappop(self._released_nonces)
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+            self._pending_nonces.add(nonce)
+            return nonce
+
+    def confirm_nonce(self, nonce: int):
+        """
+        Registers that the transaction with the nonce was sent. The nonce stays in flight until it is mined.
+        """
+        self._pending_nonces.discard(nonce)
+        self._sent_nonces[nonce] = self._time()
+
+    def release_nonce(self, nonce: int):
+        """
+        Registers that the transaction with the nonce could not be sent, so the nonce can be reused
+        """
+        self._pending_nonces.discard(nonce)
+        if nonce not in self._released_nonces:
+            heapq.heappush(self._released_nonces, nonce)
+        self._sync_required = True
+
+    def reset(self):
+        """
+        Discards the local nonces not in flight. The next nonce will be requested to Gateway.
+        """
+        self._next_nonce = None
+        self._released_nonces.clear()
+        self._sync_required = True
+
+    @classmethod
+    def is_nonce_error(cls, error: BaseException) -> bool:
+        message = str(error).lower()
+        return any(fragment in message for fragment in cls.NONCE_ERROR_MESSAGES)
+
+    async def _sync_nonces(self):
+        gateway = GatewayHttpClient.get_instance(self._client_config_map)
+        response = await gateway.get_evm_nonce(self._chain, self._network, self._address)
+        gateway_nonce = int(response["nonce"])
+        now = self._time()
+        # The transactions with a nonce below Gateway's have been mined, and the ones not mined for too long dropped
+        self._sent_nonces = {nonce: timestamp for nonce, timestamp in self._sent_nonces.items()
+                             if nonce >= gateway_nonce and now - timestamp < self.SENT_NONCE_EXPIRATION}
+        in_flight_nonces = self.in_flight_nonces
+        if self._next_nonce is None or len(in_flight_nonces) == 0:
+            # When no transaction is in flight Gateway's nonce is used even if it is lower, to fill the gaps left by
+            # dropped or replaced transactions
+            self._next_nonce = gateway_nonce
+        else:
+            # Transactions might have been sent from outside this client
+            self._next_nonce = max(self._next_nonce, gateway_nonce)
+        if len(in_flight_nonces) > 0:
+            self._next_nonce = max(self._next_nonce, max(in_flight_nonces) + 1)
+        self._released_nonces = [nonce for nonce in range(gateway_nonce, self._next_nonce)
+                                 if nonce not in in_flight_nonces]
+        heapq.heapify(self._released_nonces)
+        self._sync_required = False
+        self._last_sync_timestamp = self._time()
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
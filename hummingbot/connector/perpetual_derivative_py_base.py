@@ -13,10 +13,12 @@ from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import (
     AccountEvent,
     FundingPaymentCompletedEvent,
     MarketEvent,
+    OrderFilledEvent,
     PositionModeChangeEvent,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
@@ -27,6 +29,8 @@ if TYPE_CHECKING:
 
 class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     VALID_POSITION_ACTIONS = [PositionAction.OPEN, PositionAction.CLOSE]
+    # Maximum number of funding payment requests waiting for a response at the same time
+    MAX_CONCURRENT_FUNDING_PAYMENT_REQUESTS = 10
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -40,6 +44,12 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
 
         self._budget_checker = PerpetualBudgetChecker(self)
 
+        self._last_positions_update_timestamp = 0
+        self._position_fill_forwarder = EventForwarder(self._process_position_fill)
+        if self.position_engine_enabled:
+            self._perpetual_trading.enable_position_engine()
+            self.add_listener(MarketEvent.OrderFilled, self._position_fill_forwarder)
+
     @property
     @abstractmethod
     def funding_fee_poll_interval(self) -> int:
@@ -69,6 +79,22 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         """Returns a dictionary of current active open positions."""
         return self._perpetual_trading.account_positions
 
+    @property
+    def position_engine_enabled(self) -> bool:
+        """
+        If True the positions unrealized PnL and margin values are updated with every mark price and the positions
+        amounts with every fill, between the positions updates from the exchange. Only valid for linear contracts.
+        """
+        return False
+
+    @property
+    def positions_polling_interval(self) -> float:
+        """
+        Minimum seconds between the positions requests of the status polling loop. Connectors updating their positions
+        from the user stream or with the position engine can request them less frequently.
+        """
+        return 0
+
     @abstractmethod
     def supported_position_modes(self) -> List[PositionMode]:
         raise NotImplementedError
@@ -163,6 +189,10 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     def _create_order_book_data_source(self) -> PerpetualAPIOrderBookDataSource:
         raise NotImplementedError
 
+    def _market_data_worker_supported(self) -> bool:
+        # The funding info updates are received through the order book data source in the main process
+        return False
+
     @abstractmethod
     async def _place_order(
         self,
@@ -209,6 +239,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             self._funding_info_listener_task.cancel()
             self._funding_info_listener_task = None
         self._last_funding_fee_payment_ts.clear()
+        self._last_positions_update_timestamp = 0
         super()._stop_network()
 
     async def _create_order(
@@ -296,11 +327,25 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         raise NotImplementedError
 
     async def _status_polling_loop_fetch_updates(self):
-        await safe_gather(
-            self._update_positions(),
-            self._update_balances(),
-            self._update_order_status(),
-        )
+        updates = [self._update_balances(), self._update_order_status()]
+        # The comparison is negated to also request the positions when the clock has not started (NaN timestamp)
+        if not self.current_timestamp - self._last_positions_update_timestamp < self.positions_polling_interval:
+            self._last_positions_update_timestamp = self.current_timestamp
+            updates.insert(0, self._update_positions())
+        await safe_gather(*updates)
+
+    def _process_position_fill(self, event: OrderFilledEvent):
+        # The event timestamp is the connector clock time, the fill is compared with the positions updates using the
+        # exchange execution time registered in the order
+        tracked_order = self._order_tracker.all_fillable_orders.get(event.order_id)
+        trade_update = tracked_order.order_fills.get(event.exchange_trade_id) if tracked_order is not None else None
+        self._perpetual_trading.process_fill(trading_pair=event.trading_pair,
+                                             trade_type=event.trade_type,
+                                             position_action=PositionAction(event.position),
+                                             price=event.price,
+                                             amount=event.amount,
+                                             leverage=Decimal(str(event.leverage)),
+                                             timestamp=trade_update.fill_timestamp if trade_update else None)
 
     async def _execute_set_position_mode(self, mode: PositionMode):
         success, successful_pairs, msg = await self._execute_set_position_mode_for_pairs(
@@ -367,8 +412,8 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         )
 
     async def _init_funding_info(self):
-        for trading_pair in self.trading_pairs:
-            funding_info = await self._orderbook_ds.get_funding_info(trading_pair)
+        funding_infos = await self._orderbook_ds.get_all_funding_info(self.trading_pairs)
+        for funding_info in funding_infos.values():
             self._perpetual_trading.initialize_funding_info(funding_info)
 
     async def _funding_payment_polling_loop(self):
@@ -378,19 +423,34 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         await self._update_all_funding_payments(fire_event_on_new=False)  # initialization of the timestamps
         while True:
             await self._funding_fee_poll_notifier.wait()
-            success = await self._update_all_funding_payments(fire_event_on_new=True)
+            success = await self._update_all_funding_payments(
+                fire_event_on_new=True, trading_pairs=self._trading_pairs_due_for_funding_payment())
             if success:
                 # Only when all tasks are successful would the event notifier be reset
                 self._funding_fee_poll_notifier = asyncio.Event()
 
-    async def _update_all_funding_payments(self, fire_event_on_new: bool) -> bool:
+    def _trading_pairs_due_for_funding_payment(self) -> List[str]:
+        """
+        Returns the trading pairs with a funding event since their last payment was received, and the ones without
+        funding information.
+        """
+        funding_schedule = self._perpetual_trading.funding_schedule
+        due_trading_pairs = set(funding_schedule.due_trading_pairs(self._time()))
+        return [
+            trading_pair for trading_pair in self.trading_pairs
+            if trading_pair in due_trading_pairs or funding_schedule.next_funding_timestamp(trading_pair) is None
+        ]
+
+    async def _update_all_funding_payments(self, fire_event_on_new: bool, trading_pairs: Optional[List[str]] = None) -> bool:
         success = False
         try:
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FUNDING_PAYMENT_REQUESTS)
             tasks = []
-            for trading_pair in self.trading_pairs:
+            for trading_pair in (self.trading_pairs if trading_pairs is None else trading_pairs):
                 tasks.append(
                     asyncio.create_task(
-                        self._update_funding_payment(trading_pair=trading_pair, fire_event_on_new=fire_event_on_new)
+                        self._update_funding_payment(
+                            trading_pair=trading_pair, fire_event_on_new=fire_event_on_new, semaphore=semaphore)
                     )
                 )
             responses: List[bool] = await safe_gather(*tasks)
@@ -407,11 +467,14 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             )
         return success
 
-    async def _update_funding_payment(self, trading_pair: str, fire_event_on_new: bool) -> bool:
+    async def _update_funding_payment(
+        self, trading_pair: str, fire_event_on_new: bool, semaphore: Optional[asyncio.Semaphore] = None
+    ) -> bool:
         fetch_success = True
         timestamp = funding_rate = payment_amount = 0
         try:
-            timestamp, funding_rate, payment_amount = await self._fetch_last_fee_payment(trading_pair=trading_pair)
+            async with (semaphore or asyncio.Semaphore()):
+                timestamp, funding_rate, payment_amount = await self._fetch_last_fee_payment(trading_pair=trading_pair)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -423,6 +486,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             fetch_success = False
         if fetch_success:
             self._emit_funding_payment_event(trading_pair, timestamp, funding_rate, payment_amount, fire_event_on_new)
+            self._perpetual_trading.funding_schedule.register_payment(trading_pair, timestamp, self._time())
         return fetch_success
 
     def _emit_funding_payment_event(
@@ -3,11 +3,14 @@ import copy
 import logging
 import warnings
 from collections import defaultdict
+from decimal import Decimal
 from typing import Dict, List, Optional
 
+from hummingbot.connector.derivative.funding_schedule import FundingSchedule
 from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.derivative.position_engine import PositionEngine
 from hummingbot.connector.utils import split_hb_trading_pair
-from hummingbot.core.data_type.common import PositionMode, PositionSide
+from hummingbot.core.data_type.common import PositionAction, PositionMode, PositionSide, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo, FundingInfoUpdate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
@@ -27,8 +30,10 @@ class PerpetualTrading:
         self._funding_info: Dict[str, FundingInfo] = {}
         self._funding_payment_span: List[int] = [0, 0]
         self._funding_info_stream = asyncio.Queue()
+        self._funding_schedule = FundingSchedule()
 
         self._funding_info_updater_task: Optional[asyncio.Task] = None
+        self._position_engine: Optional[PositionEngine] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -50,6 +55,13 @@ class PerpetualTrading:
         """
         return copy.deepcopy(self._funding_info)
 
+    @property
+    def funding_schedule(self) -> FundingSchedule:
+        """
+        The index of the funding timestamps of the trading pairs.
+        """
+        return self._funding_schedule
+
     @property
     def funding_info_stream(self) -> asyncio.Queue:
         """
@@ -57,18 +69,61 @@ class PerpetualTrading:
         """
         return self._funding_info_stream
 
-    def set_position(self, pos_key: str, position: Position):
+    @property
+    def position_engine(self) -> Optional[PositionEngine]:
+        """
+        The engine updating the positions between exchange updates, if enabled.
+        """
+        return self._position_engine
+
+    def enable_position_engine(self):
+        if self._position_engine is None:
+            self._position_engine = PositionEngine(self)
+
+    def set_position(self, pos_key: str, position: Position, timestamp: Optional[float] = None):
+        """
+        Sets a position received from the exchange.
+        :param timestamp: exchange update time of the position (seconds), if provided by the exchange
+        """
         self.logger().debug(f"Setting position {pos_key} to {Position}")
+        if self._position_engine is not None:
+            self._position_engine.reconcile(pos_key, position, timestamp)
         self._account_positions[pos_key] = position
 
-    def remove_position(self, post_key: str) -> Optional[Position]:
+    def remove_position(self, post_key: str, timestamp: Optional[float] = None) -> Optional[Position]:
+        if self._position_engine is not None:
+            self._position_engine.reconcile(post_key, None, timestamp)
         return self._account_positions.pop(post_key, None)
 
+    def process_fill(self,
+                     trading_pair: str,
+                     trade_type: TradeType,
+                     position_action: PositionAction,
+                     price: Decimal,
+                     amount: Decimal,
+                     leverage: Decimal,
+                     timestamp: Optional[float]):
+        """
+        Updates the position affected by an order fill, if the position engine is enabled.
+        :param timestamp: exchange execution time of the fill (seconds), None if unknown
+        """
+        if self._position_engine is not None:
+            self._position_engine.apply_fill(trading_pair=trading_pair,
+                                             trade_type=trade_type,
+                                             position_action=position_action,
+                                             price=price,
+                                             amount=amount,
+                                             leverage=leverage,
+                                             timestamp=timestamp)
+
     def initialize_funding_info(self, funding_info: FundingInfo):
         """
         Initializes a single trading pair funding information.
         """
         self._funding_info[funding_info.trading_pair] = funding_info
+        self._funding_schedule.update(funding_info.trading_pair, funding_info.next_funding_utc_timestamp)
+        if self._position_engine is not None:
+            self._position_engine.update_mark_price(funding_info.trading_pair, funding_info.mark_price)
 
     def is_funding_info_initialized(self) -> bool:
         """
@@ -174,6 +229,10 @@ class PerpetualTrading:
                 trading_pair = funding_info_message.trading_pair
                 funding_info = self._funding_info[trading_pair]
                 funding_info.update(funding_info_message)
+                if funding_info_message.next_funding_utc_timestamp is not None:
+                    self._funding_schedule.update(trading_pair, funding_info.next_funding_utc_timestamp)
+                if self._position_engine is not None and funding_info_message.mark_price is not None:
+                    self._position_engine.update_mark_price(trading_pair, funding_info.mark_price)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -1,3 +1,4 @@
+import asyncio
 import time
 from decimal import Decimal
 from typing import List, Tuple
@@ -7,7 +8,8 @@ from hummingbot.core.api_throttler.async_request_context_base import (
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RateLimit
+from hummingbot.core.api_throttler.rate_limits_budget import RateLimitsBudget
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -47,6 +49,63 @@ class AsyncRequestContext(AsyncRequestContextBase):
         return time.time()
 
 
+class SharedBudgetRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that waits for the capacity of a rate limits budget shared with other
+    throttlers, in this process or in other processes of the host.
+    """
+
+    def __init__(self,
+                 rate_limits_budget: RateLimitsBudget,
+                 consumer_id: str,
+                 priority: int,
+                 rate_limit: RateLimit,
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 ):
+        """
+        :param rate_limits_budget: the budget shared by the throttlers
+        :param consumer_id: identifier of the throttler in the budget
+        :param priority: priority of the request in the budget
+        """
+        super().__init__(
+            task_logs=[],
+            rate_limit=rate_limit,
+            related_limits=related_limits,
+            lock=lock,
+            safety_margin_pct=safety_margin_pct,
+            retry_interval=retry_interval,
+        )
+        self._rate_limits_budget = rate_limits_budget
+        self._consumer_id = consumer_id
+        self._priority = priority
+
+    def within_capacity(self) -> bool:
+        if self._rate_limit is None:
+            return True
+        return self._rate_limits_budget.try_acquire(
+            consumer_id=self._consumer_id,
+            limits=[(self._rate_limit, self._rate_limit.weight)] + self._related_limits,
+            priority=self._priority,
+        )
+
+    async def acquire(self):
+        # The budget logs the request when it has capacity for it
+        while not await self._try_acquire():
+            await asyncio.sleep(self._retry_interval)
+
+    async def _try_acquire(self) -> bool:
+        if self._rate_limit is None:
+            return True
+        return await self._rate_limits_budget.try_acquire_async(
+            consumer_id=self._consumer_id,
+            limits=[(self._rate_limit, self._rate_limit.weight)] + self._related_limits,
+            priority=self._priority,
+        )
+
+
 class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
@@ -59,14 +118,26 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: int = DEFAULT_PRIORITY) -> AsyncRequestContextBase:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the request, only used when the rate limits budget is shared
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        if self._rate_limits_budget is not None:
+            return SharedBudgetRequestContext(
+                rate_limits_budget=self._rate_limits_budget,
+                consumer_id=self._consumer_id,
+                priority=priority,
+                rate_limit=rate_limit,
+                related_limits=related_rate_limits,
+                lock=self._lock,
+                safety_margin_pct=self._safety_margin_pct,
+                retry_interval=self._retry_interval,
+            )
         return AsyncRequestContext(
             task_logs=self._task_logs,
             rate_limit=rate_limit,
@@ -2,12 +2,14 @@ import asyncio
 import copy
 import logging
 import math
+import os
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, RateLimit, TaskLog
+from hummingbot.core.api_throttler.rate_limits_budget import RateLimitsBudget
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -56,6 +58,21 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Budget shared with other throttlers using the same rate limits (replaces the task logs when set)
+        self._rate_limits_budget: Optional[RateLimitsBudget] = None
+        self._consumer_id: str = f"{os.getpid()}-{id(self)}"
+
+    @property
+    def rate_limits_budget(self) -> Optional[RateLimitsBudget]:
+        return self._rate_limits_budget
+
+    def set_rate_limits_budget(self, rate_limits_budget: Optional[RateLimitsBudget]):
+        """
+        Makes the throttler share its rate limits with the other consumers of the budget, instead of assuming it owns
+        the full limits.
+        """
+        self._rate_limits_budget = rate_limits_budget
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
@@ -86,5 +103,5 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: int = DEFAULT_PRIORITY) -> AsyncRequestContextBase:
         raise NotImplementedError
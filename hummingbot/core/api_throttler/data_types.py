@@ -7,6 +7,10 @@ from typing import (
 DEFAULT_PATH = ""
 DEFAULT_WEIGHT = 1
 
+# Priorities of the requests when the rate limits are shared (order creation and cancelation outrank polling)
+DEFAULT_PRIORITY = 0
+HIGH_PRIORITY = 1
+
 Limit = int             # Integer representing the no. of requests be time interval
 RequestPath = str       # String representing the request path url
 RequestWeight = int     # Integer representing the request weight of the path url
@@ -54,3 +58,4 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+    consumer_id: Optional[str] = None
@@ -0,0 +1,222 @@
+import asyncio
+import functools
+import json
+import logging
+import math
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.data_types import HIGH_PRIORITY, RateLimit, TaskLog
+from hummingbot.logger import HummingbotLogger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+DEFAULT_RATE_LIMITS_BUDGET_DIR = "/tmp/hummingbot_rate_limits"
+
+
+class RateLimitsBudget(ABC):
+    """
+    Usage of the rate limits of a scope (usually an API key or an exchange host), shared by all the throttlers
+    (consumers) that send requests in that scope.
+
+    High priority requests (order creation and cancelation) can use the full limits. The other requests leave a
+    reserved percentage of each limit free for them, and when several consumers are using a limit each consumer is
+    restricted to its fair share of the non reserved capacity.
+    """
+    _rlb_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._rlb_logger is None:
+            cls._rlb_logger = logging.getLogger(__name__)
+        return cls._rlb_logger
+
+    def __init__(self,
+                 scope: str,
+                 high_priority_reserve_pct: Decimal = Decimal("20"),
+                 safety_margin_pct: float = 0.05):
+        """
+        :param scope: identifier of the rate limits owner shared by the consumers
+        :param high_priority_reserve_pct: percentage of each limit that only high priority requests can use
+        :param safety_margin_pct: percentage of the time interval added to the logged requests lifetime
+        """
+        self._scope = scope
+        self._high_priority_reserve_pct = Decimal(str(high_priority_reserve_pct))
+        self._safety_margin_pct = safety_margin_pct
+
+    @property
+    def scope(self) -> str:
+        return self._scope
+
+    @abstractmethod
+    def try_acquire(self, consumer_id: str, limits: List[Tuple[RateLimit, int]], priority: int) -> bool:
+        """
+        Logs a request of the consumer in the budget if all its limits have capacity for it.
+
+        :param consumer_id: identifier of the throttler sending the request
+        :param limits: the rate limits used by the request, with the weight used in each of them
+        :param priority: the request priority (see `hummingbot.core.api_throttler.data_types`)
+
+        :return: True if the request was logged and can be sent, False if it has to wait
+        """
+        raise NotImplementedError
+
+    async def try_acquire_async(self, consumer_id: str, limits: List[Tuple[RateLimit, int]], priority: int) -> bool:
+        """
+        Same as `try_acquire`, for the callers running in the event loop. Budgets doing blocking operations to check
+        the capacity override it to run them out of the event loop.
+        """
+        return self.try_acquire(consumer_id=consumer_id, limits=limits, priority=priority)
+
+    def _active_task_logs(self, task_logs: List[TaskLog], now: float) -> List[TaskLog]:
+        return [
+            task for task in task_logs
+            if now - task.timestamp <= task.rate_limit.time_interval * (1 + self._safety_margin_pct)
+        ]
+
+    def _within_capacity(self,
+                         task_logs: List[TaskLog],
+                         consumer_id: str,
+                         limits: List[Tuple[RateLimit, int]],
+                         priority: int) -> bool:
+        for rate_limit, weight in limits:
+            limit_task_logs = [task for task in task_logs if task.rate_limit.limit_id == rate_limit.limit_id]
+            capacity_used = sum(task.weight for task in limit_task_logs)
+            if priority >= HIGH_PRIORITY:
+                if capacity_used + weight > rate_limit.limit:
+                    return False
+                continue
+
+            shared_capacity = max(
+                1, math.floor(Decimal(str(rate_limit.limit)) * (1 - self._high_priority_reserve_pct / 100)))
+            if capacity_used + weight > shared_capacity:
+                return False
+            active_consumers = {task.consumer_id for task in limit_task_logs} | {consumer_id}
+            if len(active_consumers) > 1:
+                consumer_capacity_used = sum(task.weight for task in limit_task_logs if task.consumer_id == consumer_id)
+                fair_share = max(weight, shared_capacity // len(active_consumers))
+                if consumer_capacity_used + weight > fair_share:
+                    return False
+        return True
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+class InProcessRateLimitsBudget(RateLimitsBudget):
+    """
+    Rate limits budget shared by the throttlers of the same process. All the throttlers run in the client event loop,
+    so the budget is checked and updated without locks.
+    """
+    _budgets: Dict[str, "InProcessRateLimitsBudget"] = {}
+
+    @classmethod
+    def get_instance(cls, scope: str, **kwargs) -> "InProcessRateLimitsBudget":
+        if scope not in cls._budgets:
+            cls._budgets[scope] = cls(scope=scope, **kwargs)
+        return cls._budgets[scope]
+
+    def __init__(self, scope: str, **kwargs):
+        super().__init__(scope=scope, **kwargs)
+        self._task_logs: List[TaskLog] = []
+
+    def try_acquire(self, consumer_id: str, limits: List[Tuple[RateLimit, int]], priority: int) -> bool:
+        now = self._time()
+        self._task_logs = self._active_task_logs(self._task_logs, now)
+        if not self._within_capacity(self._task_logs, consumer_id, limits, priority):
+            return False
+        for rate_limit, weight in limits:
+            self._task_logs.append(TaskLog(timestamp=now, rate_limit=rate_limit, weight=weight, consumer_id=consumer_id))
+        return True
+
+
+class HostRateLimitsBudget(RateLimitsBudget):
+    """
+    Rate limits budget shared by all the client processes of the host. The requests of the scope are logged in a small
+    file, read and updated under an exclusive file lock. The event loop callers access the file in a thread of the
+    budget, so waiting for the lock of other processes doesn't block the event loop.
+    """
+    _budgets: Dict[Tuple[str, str], "HostRateLimitsBudget"] = {}
+
+    @classmethod
+    def get_instance(cls, scope: str, budget_dir: str = DEFAULT_RATE_LIMITS_BUDGET_DIR,
+                     **kwargs) -> RateLimitsBudget:
+        """
+        :return: the host budget of the scope, or the process budget if file locks are not supported by the platform
+        """
+        if fcntl is None:
+            cls.logger().warning("Rate limits budgets can't be shared between processes in this platform. "
+                                 "They will only be shared by the connectors of this process.")
+            return InProcessRateLimitsBudget.get_instance(scope=scope, **kwargs)
+        key = (budget_dir, scope)
+        if key not in cls._budgets:
+            cls._budgets[key] = cls(scope=scope, budget_dir=Path(budget_dir), **kwargs)
+        return cls._budgets[key]
+
+    def __init__(self, scope: str, budget_dir: Path, **kwargs):
+        super().__init__(scope=scope, **kwargs)
+        file_name = re.sub(r"[^\w.-]", "_", scope)
+        self._budget_dir = budget_dir
+        self._file_path = budget_dir / f"{file_name}.json"
+        self._lock_path = budget_dir / f"{file_name}.lock"
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{file_name}_budget")
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    async def try_acquire_async(self, consumer_id: str, limits: List[Tuple[RateLimit, int]], priority: int) -> bool:
+        return await asyncio.get_event_loop().run_in_executor(
+            self._executor,
+            functools.partial(self.try_acquire, consumer_id=consumer_id, limits=limits, priority=priority))
+
+    def try_acquire(self, consumer_id: str, limits: List[Tuple[RateLimit, int]], priority: int) -> bool:
+        self._budget_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                now = self._time()
+                task_logs = self._active_task_logs(self._read_task_logs(), now)
+                acquired = self._within_capacity(task_logs, consumer_id, limits, priority)
+                if acquired:
+                    task_logs.extend(
+                        TaskLog(timestamp=now, rate_limit=rate_limit, weight=weight, consumer_id=consumer_id)
+                        for rate_limit, weight in limits
+                    )
+                self._write_task_logs(task_logs)
+                return acquired
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_task_logs(self) -> List[TaskLog]:
+        try:
+            with open(self._file_path, "r") as budget_file:
+                content = json.load(budget_file)
+        except (OSError, ValueError):
+            return []
+        return [
+            TaskLog(timestamp=timestamp,
+                    rate_limit=RateLimit(limit_id=limit_id, limit=0, time_interval=time_interval),
+                    weight=weight,
+                    consumer_id=consumer_id)
+            for timestamp, limit_id, time_interval, weight, consumer_id in content
+        ]
+
+    def _write_task_logs(self, task_logs: List[TaskLog]):
+        temp_path = self._file_path.with_suffix(self._file_path.suffix + ".tmp")
+        with open(temp_path, "w") as budget_file:
+            json.dump([
+                [task.timestamp, task.rate_limit.limit_id, task.rate_limit.time_interval, task.weight, task.consumer_id]
+                for task in task_logs
+            ], budget_file)
+        os.replace(temp_path, self._file_path)
@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +12,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        list _schedule_queue
+        dict _iterator_schedules
+        int64_t _schedule_sequence
+
+    cdef c_start_iterators(self, list iterators, double timestamp)
+    cdef c_schedule(self, object schedule, double timestamp)
+    cdef object c_pop_due_schedule(self, double timestamp)
+    cdef double c_next_scheduled_time(self)
+    cdef c_tick_schedule(self, object schedule, bint skip_missed_ticks)
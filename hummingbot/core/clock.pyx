@@ -1,9 +1,14 @@
 # distutils: language=c++
 
 import asyncio
+import heapq
 import logging
+import math
 import time
-from typing import List
+from typing import List, Optional
+
+from libc.math cimport isnan
+from libc.stdint cimport int64_t
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
@@ -11,6 +16,34 @@ from hummingbot.core.clock_mode import ClockMode
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+NaN = float("nan")
+
+
+class IteratorSchedule:
+    """
+    Tick interval and tick statistics of an iterator registered in the clock.
+
+    The tick times are computed as `anchor + n * tick_interval`, so delays in a tick don't accumulate in the following
+    ones.
+    """
+    __slots__ = ("iterator", "tick_interval", "sequence", "anchor", "next_tick_index", "tick_count", "skipped_ticks",
+                 "last_tick_duration", "max_tick_duration", "removed")
+
+    def __init__(self, iterator: TimeIterator, tick_interval: float, sequence: int):
+        self.iterator = iterator
+        self.tick_interval = tick_interval
+        self.sequence = sequence
+        self.anchor = 0.0
+        self.next_tick_index = 0
+        self.tick_count = 0
+        self.skipped_ticks = 0
+        self.last_tick_duration = 0.0
+        self.max_tick_duration = 0.0
+        self.removed = False
+
+    @property
+    def next_tick_time(self) -> float:
+        return self.anchor + self.next_tick_index * self.tick_interval
 
 
 cdef class Clock:
@@ -36,6 +69,9 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._schedule_queue = []
+        self._iterator_schedules = {}
+        self._schedule_sequence = 0
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -69,11 +105,22 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, tick_interval: Optional[float] = None):
+        """
+        :param iterator: the time iterator to be notified by the clock
+        :param tick_interval: seconds between the ticks of this iterator. If not specified the clock tick size is used
+        """
+        tick_interval = self._tick_size if tick_interval is None else tick_interval
+        if not tick_interval > 0:
+            raise ValueError(f"The tick interval must be positive (got {tick_interval}).")
+        schedule = IteratorSchedule(iterator, tick_interval, self._schedule_sequence)
+        self._schedule_sequence += 1
+        self._iterator_schedules[id(iterator)] = schedule
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
             (<TimeIterator>iterator).c_start(self, self._current_tick)
+            self.c_schedule(schedule, self._current_tick)
         self._child_iterators.append(iterator)
 
     def remove_iterator(self, iterator: TimeIterator):
@@ -81,24 +128,32 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        schedule = self._iterator_schedules.pop(id(iterator), None)
+        if schedule is not None:
+            # The entry is discarded from the schedule queue when it reaches the top
+            schedule.removed = True
+
+    def get_iterator_schedule(self, iterator: TimeIterator) -> Optional[IteratorSchedule]:
+        """
+        :return: the tick interval and tick statistics of the iterator, or None if it is not registered in the clock
+        """
+        return self._iterator_schedules.get(id(iterator))
 
     async def run(self):
         await self.run_til(float("nan"))
 
     async def run_til(self, timestamp: float):
         cdef:
-            TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            object schedule
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
 
         self._current_tick = (now // self._tick_size) * self._tick_size
         if not self._started:
-            for ci in self._current_context:
-                child_iterator = ci
-                child_iterator.c_start(self, self._current_tick)
+            self.c_start_iterators(self._current_context, self._current_tick)
             self._started = True
 
         try:
@@ -107,52 +162,125 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                # Sleep until the next scheduled tick. Tick times are absolute, so oversleeping doesn't cause drift.
+                next_tick_time = self.c_next_scheduled_time()
+                if isnan(next_tick_time):
+                    next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                if next_tick_time > now:
+                    await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
-                # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
+                # Run through all the child iterators due at this time.
+                schedule = self.c_pop_due_schedule(next_tick_time)
+                while schedule is not None:
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_schedule(schedule, True)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    schedule = self.c_pop_due_schedule(next_tick_time)
         finally:
             for ci in self._current_context:
-                child_iterator = ci
-                child_iterator._clock = None
+                (<TimeIterator>ci)._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            double next_tick_time
+            object schedule
 
         if not self._started:
-            for ci in self._child_iterators:
-                child_iterator = ci
-                child_iterator.c_start(self, self._start_time)
+            self.c_start_iterators(self._child_iterators, self._start_time)
             self._started = True
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
-                for ci in self._child_iterators:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        raise
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                next_tick_time = self.c_next_scheduled_time()
+                if isnan(next_tick_time):
+                    self._current_tick += self._tick_size
+                    continue
+                self._current_tick = next_tick_time
+                schedule = self.c_pop_due_schedule(next_tick_time)
+                while schedule is not None:
+                    self.c_tick_schedule(schedule, False)
+                    schedule = self.c_pop_due_schedule(next_tick_time)
         except StopIteration:
             return
         finally:
             for ci in self._child_iterators:
-                child_iterator = ci
-                child_iterator._clock = None
+                (<TimeIterator>ci)._clock = None
 
     def backtest(self):
         self.backtest_til(self._end_time)
+
+    cdef c_start_iterators(self, list iterators, double timestamp):
+        cdef TimeIterator child_iterator
+        self._schedule_queue.clear()
+        for ci in iterators:
+            child_iterator = ci
+            child_iterator.c_start(self, timestamp)
+            self.c_schedule(self._iterator_schedules[id(ci)], timestamp)
+
+    cdef c_schedule(self, object schedule, double timestamp):
+        if self._clock_mode is ClockMode.BACKTEST:
+            # Simulated ticks start at the moment the iterator is scheduled, as they do with the global tick size
+            schedule.anchor = timestamp
+            schedule.next_tick_index = 1
+        else:
+            # Real time ticks are aligned to multiples of the tick interval
+            schedule.anchor = 0.0
+            schedule.next_tick_index = int(timestamp // schedule.tick_interval) + 1
+        heapq.heappush(self._schedule_queue, (schedule.next_tick_time, schedule.sequence, schedule))
+
+    cdef object c_pop_due_schedule(self, double timestamp):
+        """
+        Returns the next iterator schedule due at or before the timestamp, or None if there is none. Iterators due at
+        the same time are returned in the order they were added to the clock.
+        """
+        if isnan(self.c_next_scheduled_time()) or self._schedule_queue[0][0] > timestamp:
+            return None
+        return heapq.heappop(self._schedule_queue)[2]
+
+    cdef double c_next_scheduled_time(self):
+        while len(self._schedule_queue) > 0 and self._schedule_queue[0][2].removed:
+            heapq.heappop(self._schedule_queue)
+        if len(self._schedule_queue) == 0:
+            return NaN
+        return self._schedule_queue[0][0]
+
+    cdef c_tick_schedule(self, object schedule, bint skip_missed_ticks):
+        cdef:
+            double start
+            double duration
+            int64_t current_index
+
+        if skip_missed_ticks:
+            # If the event loop was blocked for several intervals only the most recent tick is run
+            current_index = <int64_t>math.floor((time.time() - schedule.anchor) / schedule.tick_interval)
+            if current_index > schedule.next_tick_index:
+                schedule.skipped_ticks += current_index - schedule.next_tick_index
+                schedule.next_tick_index = current_index
+
+        self._current_tick = schedule.next_tick_time
+        start = time.perf_counter()
+        try:
+            (<TimeIterator>schedule.iterator).c_tick(self._current_tick)
+        except StopIteration:
+            raise
+        except Exception:
+            self.logger().error("Unexpected error running clock tick.", exc_info=True)
+        finally:
+            duration = time.perf_counter() - start
+            schedule.tick_count += 1
+            schedule.last_tick_duration = duration
+            schedule.max_tick_duration = max(schedule.max_tick_duration, duration)
+            schedule.next_tick_index += 1
+
+        if skip_missed_ticks:
+            # Skip the ticks that became due while the iterator was still running
+            current_index = <int64_t>math.floor((time.time() - schedule.anchor) / schedule.tick_interval)
+            if current_index >= schedule.next_tick_index:
+                schedule.skipped_ticks += current_index - schedule.next_tick_index + 1
+                schedule.next_tick_index = current_index + 1
+
+        if not schedule.removed:
+            heapq.heappush(self._schedule_queue, (schedule.next_tick_time, schedule.sequence, schedule))
@@ -0,0 +1,306 @@
+"""
+Local relay of exchange market data, shared by several client instances running in the same host.
+
+The relay maintains the order books of the configured connectors once, using the connectors order book data sources,
+and fans out the snapshots, diffs and trades to the clients connected to its Unix socket. Clients consume the relay
+with `MarketDataRelayOrderBookDataSource` instead of connecting to the exchange.
+
+The protocol uses one JSON document per line. Clients send requests with the format
+`{"action": "subscribe" | "snapshot", "connector": <connector name>, "trading_pairs": [<trading pair>, ...]}`.
+The relay answers a subscription with a snapshot of each order book (built from its local copy) and then forwards the
+order book messages of the subscribed trading pairs with the format
+`{"connector": <connector name>, "type": "SNAPSHOT" | "DIFF" | "TRADE", "timestamp": <float>, "content": {...}}`.
+
+The relay can be started with
+`python -m hummingbot.core.data_type.market_data_relay --connector binance:BTC-USDT,ETH-USDT --socket <path>`.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_MARKET_DATA_RELAY_SOCKET = "/tmp/hummingbot_market_data_relay.sock"
+# Snapshots of deep order books are sent in a single line
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+
+def encode_relay_message(connector_name: str, message: OrderBookMessage) -> bytes:
+    content = dict(message.content)
+    if message.type in [OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF]:
+        # The rows are normalized, because connectors can use their own order book message formats
+        content["bids"] = [[row.price, row.amount] for row in message.bids]
+        content["asks"] = [[row.price, row.amount] for row in message.asks]
+    relay_message = {
+        "connector": connector_name,
+        "type": message.type.name,
+        "timestamp": message.timestamp,
+        "content": content,
+    }
+    return (json.dumps(relay_message, default=str) + "\n").encode("utf-8")
+
+
+def decode_relay_message(line: bytes) -> Tuple[str, OrderBookMessage]:
+    relay_message = json.loads(line)
+    message = OrderBookMessage(
+        message_type=OrderBookMessageType[relay_message["type"]],
+        content=relay_message["content"],
+        timestamp=relay_message["timestamp"],
+    )
+    return relay_message["connector"], message
+
+
+def encode_relay_request(action: str, connector_name: str, trading_pairs: List[str]) -> bytes:
+    request = {"action": action, "connector": connector_name, "trading_pairs": trading_pairs}
+    return (json.dumps(request) + "\n").encode("utf-8")
+
+
+class MarketDataRelay:
+    """
+    Serves the market data of the order book data sources to the clients connected to a Unix socket
+    """
+    # Clients that don't read their messages fast enough are disconnected. They get a fresh snapshot when reconnecting.
+    MAX_CLIENT_BUFFER_SIZE = 16 * 1024 * 1024
+
+    _mdr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdr_logger is None:
+            cls._mdr_logger = logging.getLogger(__name__)
+        return cls._mdr_logger
+
+    def __init__(self,
+                 data_sources: Dict[str, OrderBookTrackerDataSource],
+                 trading_pairs: Dict[str, List[str]],
+                 socket_path: str = DEFAULT_MARKET_DATA_RELAY_SOCKET):
+        """
+        :param data_sources: the order book data source of each connector, by connector name
+        :param trading_pairs: the trading pairs relayed for each connector, by connector name
+        :param socket_path: path of the Unix socket the clients connect to
+        """
+        self._data_sources = data_sources
+        self._trading_pairs = trading_pairs
+        self._socket_path = socket_path
+        self._order_books: Dict[Tuple[str, str], OrderBook] = {}
+        self._saved_diffs: Dict[Tuple[str, str], List[OrderBookMessage]] = defaultdict(list)
+        self._subscribers: Dict[Tuple[str, str], Set[asyncio.StreamWriter]] = defaultdict(set)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def order_books(self) -> Dict[Tuple[str, str], OrderBook]:
+        """
+        Returns the order books maintained by the relay, by connector name and trading pair
+        """
+        return self._order_books
+
+    @property
+    def clients_count(self) -> int:
+        return len(set(writer for writers in self._subscribers.values() for writer in writers))
+
+    async def start(self):
+        if os.path.exists(self._socket_path):
+            # Socket file left by a previous relay that was not stopped cleanly
+            os.unlink(self._socket_path)
+        self._server = await asyncio.start_unix_server(
+            self._handle_client, path=self._socket_path, limit=MAX_MESSAGE_SIZE)
+        ev_loop = asyncio.get_event_loop()
+        for connector_name, data_source in self._data_sources.items():
+            self._tasks.append(safe_ensure_future(data_source.listen_for_subscriptions()))
+            for listen_function in [data_source.listen_for_order_book_diffs,
+                                    data_source.listen_for_order_book_snapshots,
+                                    data_source.listen_for_trades]:
+                messages_queue = asyncio.Queue()
+                self._tasks.append(safe_ensure_future(listen_function(ev_loop, messages_queue)))
+                self._tasks.append(safe_ensure_future(self._relay_messages_loop(connector_name, messages_queue)))
+            self._tasks.append(safe_ensure_future(self._init_order_books(connector_name)))
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        for writer in set(writer for writers in self._subscribers.values() for writer in writers):
+            writer.close()
+        self._subscribers.clear()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+
+    async def _init_order_books(self, connector_name: str):
+        data_source = self._data_sources[connector_name]
+        for trading_pair in self._trading_pairs[connector_name]:
+            key = (connector_name, trading_pair)
+            while key not in self._order_books:
+                try:
+                    order_book = await data_source.get_new_order_book(trading_pair)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().exception(f"Error getting the {connector_name} {trading_pair} order book snapshot. "
+                                            f"Retrying in 5 seconds...")
+                    await self._sleep(5.0)
+                    continue
+                for diff_message in self._saved_diffs.pop(key, []):
+                    if diff_message.update_id > order_book.snapshot_uid:
+                        order_book.apply_diffs(diff_message.bids, diff_message.asks, diff_message.update_id)
+                self._order_books[key] = order_book
+                self.logger().info(f"Initialized the {connector_name} {trading_pair} order book.")
+                for writer in list(self._subscribers[key]):
+                    self._send(writer, self._local_snapshot_message(connector_name, trading_pair))
+
+    async def _relay_messages_loop(self, connector_name: str, messages_queue: asyncio.Queue):
+        while True:
+            try:
+                message: OrderBookMessage = await messages_queue.get()
+                self._process_message(connector_name=connector_name, message=message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(f"Unexpected error relaying {connector_name} market data.")
+
+    def _process_message(self, connector_name: str, message: OrderBookMessage):
+        key = (connector_name, message.trading_pair)
+        order_book = self._order_books.get(key)
+        if message.type == OrderBookMessageType.DIFF:
+            if order_book is None:
+                self._saved_diffs[key].append(message)
+            elif message.update_id > order_book.snapshot_uid:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        elif message.type == OrderBookMessageType.SNAPSHOT and order_book is not None:
+            order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        subscribers = self._subscribers.get(key)
+        if subscribers:
+            encoded_message = encode_relay_message(connector_name, message)
+            for writer in list(subscribers):
+                self._send(writer, encoded_message)
+
+    def _local_snapshot_message(self, connector_name: str, trading_pair: str) -> bytes:
+        order_book = self._order_books[(connector_name, trading_pair)]
+        update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        message = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "trading_pair": trading_pair,
+                "update_id": update_id,
+                "bids": [[row.price, row.amount] for row in order_book.bid_entries()],
+                "asks": [[row.price, row.amount] for row in order_book.ask_entries()],
+            },
+            timestamp=self._time(),
+        )
+        return encode_relay_message(connector_name, message)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request = json.loads(line)
+                self._process_client_request(writer=writer, request=request)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().warning("Closing a market data relay client connection after an error.", exc_info=True)
+        finally:
+            self._remove_client(writer)
+
+    def _process_client_request(self, writer: asyncio.StreamWriter, request: Dict[str, Any]):
+        connector_name = request["connector"]
+        if connector_name not in self._data_sources:
+            self.logger().warning(f"A client requested {connector_name} market data, which is not relayed.")
+            return
+        for trading_pair in request["trading_pairs"]:
+            key = (connector_name, trading_pair)
+            if trading_pair not in self._trading_pairs[connector_name]:
+                self.logger().warning(f"A client requested {connector_name} {trading_pair} market data, "
+                                      f"which is not relayed.")
+                continue
+            if request["action"] == "subscribe":
+                self._subscribers[key].add(writer)
+            if key in self._order_books:
+                # Not initialized order books are sent to the subscribers when they are ready
+                self._send(writer, self._local_snapshot_message(connector_name, trading_pair))
+
+    def _send(self, writer: asyncio.StreamWriter, encoded_message: bytes):
+        if writer.is_closing():
+            self._remove_client(writer)
+        elif writer.transport.get_write_buffer_size() > self.MAX_CLIENT_BUFFER_SIZE:
+            self.logger().warning("Disconnecting a market data relay client that is not reading its messages.")
+            writer.close()
+            self._remove_client(writer)
+        else:
+            writer.write(encoded_message)
+
+    def _remove_client(self, writer: asyncio.StreamWriter):
+        for writers in self._subscribers.values():
+            writers.discard(writer)
+        if not writer.is_closing():
+            writer.close()
+
+    async def _sleep(self, delay: float):
+        """
+        Method created to enabling patching in unit tests
+        """
+        await asyncio.sleep(delay)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+def run_market_data_relay(trading_pairs: Dict[str, List[str]], socket_path: str):
+    """
+    Creates non trading instances of the connectors and relays their market data until the process is stopped
+
+    :param trading_pairs: the trading pairs to relay, by connector name
+    :param socket_path: path of the Unix socket the clients connect to
+    """
+    from hummingbot.client.settings import AllConnectorSettings
+
+    ev_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    connector_settings = AllConnectorSettings.get_connector_settings()
+    data_sources = {}
+    for connector_name, connector_trading_pairs in trading_pairs.items():
+        connector = connector_settings[connector_name].non_trading_connector_instance_with_default_configuration(
+            trading_pairs=connector_trading_pairs)
+        data_sources[connector_name] = connector.order_book_tracker.data_source
+    relay = MarketDataRelay(data_sources=data_sources, trading_pairs=trading_pairs, socket_path=socket_path)
+    ev_loop.run_until_complete(relay.start())
+    try:
+        ev_loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        relay.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relays the market data of exchange connectors to local clients.")
+    parser.add_argument("--connector", action="append", required=True, metavar="CONNECTOR:PAIR[,PAIR...]",
+                        help="connector name and the trading pairs to relay (can be repeated)")
+    parser.add_argument("--socket", default=DEFAULT_MARKET_DATA_RELAY_SOCKET,
+                        help=f"path of the Unix socket (default {DEFAULT_MARKET_DATA_RELAY_SOCKET})")
+    args = parser.parse_args()
+    trading_pairs = {}
+    for connector_argument in args.connector:
+        connector_name, _, pairs = connector_argument.partition(":")
+        trading_pairs[connector_name] = [pair for pair in pairs.split(",") if pair]
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    run_market_data_relay(trading_pairs=trading_pairs, socket_path=args.socket)
+
+
+if __name__ == "__main__":
+    main()
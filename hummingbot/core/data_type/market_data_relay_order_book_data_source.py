@@ -0,0 +1,109 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.market_data_relay import (
+    DEFAULT_MARKET_DATA_RELAY_SOCKET,
+    MAX_MESSAGE_SIZE,
+    decode_relay_message,
+    encode_relay_request,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MarketDataRelayOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source that receives the order book snapshots, diffs and trades of a connector from a local
+    `MarketDataRelay` instead of connecting to the exchange. It can be used with the order book tracker of any connector.
+
+    The last traded prices are still requested to the exchange through the connector data source, because they are
+    only required when no trades are received.
+    """
+    SNAPSHOT_TIMEOUT = 30.0
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 connector_name: str,
+                 exchange_data_source: OrderBookTrackerDataSource,
+                 socket_path: str = DEFAULT_MARKET_DATA_RELAY_SOCKET):
+        """
+        :param trading_pairs: the trading pairs to subscribe to
+        :param connector_name: the name of the connector in the relay
+        :param exchange_data_source: the order book data source of the connector
+        :param socket_path: path of the relay Unix socket
+        """
+        super().__init__(trading_pairs=trading_pairs)
+        self._connector_name = connector_name
+        self._exchange_data_source = exchange_data_source
+        self._socket_path = socket_path
+        self._order_book_create_function = exchange_data_source.order_book_create_function
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._last_snapshots: Dict[str, OrderBookMessage] = {}
+        self._snapshot_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        args = {"trading_pairs": trading_pairs}
+        if domain is not None:
+            args["domain"] = domain
+        return await self._exchange_data_source.get_last_traded_prices(**args)
+
+    async def listen_for_subscriptions(self):
+        """
+        Connects to the relay, subscribes to the trading pairs and stores each message received in its own queue.
+        The connection is restored (receiving new snapshots) if the relay closes it.
+        """
+        while True:
+            try:
+                reader, self._writer = await asyncio.open_unix_connection(self._socket_path, limit=MAX_MESSAGE_SIZE)
+                self._writer.write(encode_relay_request(
+                    action="subscribe", connector_name=self._connector_name, trading_pairs=self._trading_pairs))
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        raise ConnectionError("The market data relay closed the connection")
+                    _, message = decode_relay_message(line)
+                    self._process_relay_message(message)
+            except asyncio.CancelledError:
+                raise
+            except (ConnectionError, FileNotFoundError) as connection_exception:
+                self.logger().warning(f"The market data relay connection failed ({connection_exception}). "
+                                      f"Retrying in 5 seconds...")
+                await self._sleep(5.0)
+            except Exception:
+                self.logger().exception("Unexpected error occurred when listening to the market data relay. "
+                                        "Retrying in 5 seconds...")
+                await self._sleep(5.0)
+            finally:
+                if self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+
+    def _process_relay_message(self, message: OrderBookMessage):
+        if message.type == OrderBookMessageType.SNAPSHOT:
+            self._last_snapshots[message.trading_pair] = message
+            self._snapshot_events[message.trading_pair].set()
+            self._message_queue[self._snapshot_messages_queue_key].put_nowait(message)
+        elif message.type == OrderBookMessageType.DIFF:
+            self._message_queue[self._diff_messages_queue_key].put_nowait(message)
+        elif message.type == OrderBookMessageType.TRADE:
+            self._message_queue[self._trade_messages_queue_key].put_nowait(message)
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        snapshot_event = self._snapshot_events[trading_pair]
+        snapshot_event.clear()
+        if self._writer is not None:
+            self._writer.write(encode_relay_request(
+                action="snapshot", connector_name=self._connector_name, trading_pairs=[trading_pair]))
+        # If the connection is not established yet, the snapshot will be sent by the relay after subscribing
+        await asyncio.wait_for(snapshot_event.wait(), timeout=self.SNAPSHOT_TIMEOUT)
+        return self._last_snapshots[trading_pair]
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
@@ -19,6 +19,7 @@ from cython.operator cimport(
     dereference as deref,
     postincrement as inc,
 )
+from libc.math cimport isnan
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
@@ -27,6 +28,7 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookUpdateEvent,
     OrderBookTradeEvent
 )
 
@@ -38,6 +40,7 @@ NaN = float("nan")
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_EVENT_TAG = OrderBookEvent.TopOfBookUpdateEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -65,6 +68,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -95,6 +100,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_notify_top_of_book_update(previous_best_bid, previous_best_ask, update_id)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -104,6 +110,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
@@ -135,12 +143,31 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_notify_top_of_book_update(previous_best_bid, previous_best_ask, update_id)
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_notify_top_of_book_update(self, double previous_best_bid, double previous_best_ask, int64_t update_id):
+        # Only the best prices are compared, so depth changes below the top of the book don't generate events
+        cdef:
+            int64_t event_tag = self.ORDER_BOOK_TOP_OF_BOOK_EVENT_TAG
+            bint bid_changed
+            bint ask_changed
+        if self._events.find(event_tag) == self._events.end():
+            return
+        bid_changed = (self._best_bid != previous_best_bid
+                       and not (isnan(self._best_bid) and isnan(previous_best_bid)))
+        ask_changed = (self._best_ask != previous_best_ask
+                       and not (isnan(self._best_ask) and isnan(previous_best_ask)))
+        if bid_changed or ask_changed:
+            self.c_trigger_event(
+                event_tag,
+                OrderBookTopOfBookUpdateEvent(best_bid=self._best_bid, best_ask=self._best_ask, update_id=update_id)
+            )
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
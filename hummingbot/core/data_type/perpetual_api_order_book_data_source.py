@@ -4,9 +4,13 @@ from typing import Any, Dict, List
 
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 
 
 class PerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource, ABC):
+    # Maximum number of funding info requests waiting for a response at the same time
+    MAX_CONCURRENT_FUNDING_INFO_REQUESTS = 10
+
     def __init__(self, trading_pairs: List[str]):
         super().__init__(trading_pairs)
         self._funding_info_messages_queue_key = "funding_info"
@@ -18,6 +22,20 @@ class PerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource, ABC):
         """
         raise NotImplementedError
 
+    async def get_all_funding_info(self, trading_pairs: List[str]) -> Dict[str, FundingInfo]:
+        """
+        Returns the funding information of several trading pairs. Data sources of exchanges with an endpoint returning
+        the funding information of all their markets should override it to use a single request.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FUNDING_INFO_REQUESTS)
+
+        async def get_funding_info(trading_pair: str) -> FundingInfo:
+            async with semaphore:
+                return await self.get_funding_info(trading_pair)
+
+        funding_infos = await safe_gather(*[get_funding_info(trading_pair) for trading_pair in trading_pairs])
+        return {funding_info.trading_pair: funding_info for funding_info in funding_infos}
+
     async def listen_for_funding_info(self, output: asyncio.Queue):
         """
         Reads the funding info events queue and updates the local funding info information.
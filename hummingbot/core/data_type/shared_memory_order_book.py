@@ -0,0 +1,234 @@
+import time
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class SharedMemoryOrderBookBuffer:
+    """
+    Shared memory block with the top levels of an order book and a ring buffer of its latest public trades.
+
+    The block is an array of float64 values:
+    - a header with the sequence number, the update id, the publishing timestamp, the number of bid and ask levels,
+      the number of trades ever written, the depth and the trades capacity
+    - `depth` bid levels and `depth` ask levels, each one stored as price and amount
+    - `trades_capacity` trades, each one stored as timestamp, trade type, price and amount
+
+    There must be a single writer per buffer. Levels are protected with a sequence lock: the writer makes the sequence
+    odd while it updates the levels, and readers retry if the sequence changed while they were copying them.
+    Trades are written before the trades counter is increased, so readers only see complete entries.
+    """
+    HEADER_SIZE = 8
+    SEQUENCE_INDEX = 0
+    UPDATE_ID_INDEX = 1
+    TIMESTAMP_INDEX = 2
+    BID_COUNT_INDEX = 3
+    ASK_COUNT_INDEX = 4
+    TRADES_COUNT_INDEX = 5
+    DEPTH_INDEX = 6
+    TRADES_CAPACITY_INDEX = 7
+    TRADE_FIELDS = 4
+    MAX_READ_ATTEMPTS = 100
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        self._memory = memory
+        self._owner = owner
+        self._data: Optional[np.ndarray] = np.ndarray(
+            (memory.size // np.dtype(np.float64).itemsize,), dtype=np.float64, buffer=memory.buf)
+        self._depth = int(self._data[self.DEPTH_INDEX])
+        self._trades_capacity = int(self._data[self.TRADES_CAPACITY_INDEX])
+        self._asks_start = self.HEADER_SIZE + 2 * self._depth
+        self._trades_start = self.HEADER_SIZE + 4 * self._depth
+
+    @classmethod
+    def create(cls, depth: int, trades_capacity: int) -> "SharedMemoryOrderBookBuffer":
+        """
+        Creates a new shared memory block. The creator owns the block and is responsible for unlinking it.
+        """
+        size = cls.HEADER_SIZE + 4 * depth + cls.TRADE_FIELDS * trades_capacity
+        memory = shared_memory.SharedMemory(create=True, size=size * np.dtype(np.float64).itemsize)
+        data = np.ndarray((size,), dtype=np.float64, buffer=memory.buf)
+        data[:] = 0
+        data[cls.DEPTH_INDEX] = depth
+        data[cls.TRADES_CAPACITY_INDEX] = trades_capacity
+        del data
+        return cls(memory=memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryOrderBookBuffer":
+        """
+        Attaches to a shared memory block created by another process
+        """
+        return cls(memory=shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def trades_capacity(self) -> int:
+        return self._trades_capacity
+
+    @property
+    def sequence(self) -> int:
+        return int(self._data[self.SEQUENCE_INDEX])
+
+    @property
+    def trades_count(self) -> int:
+        return int(self._data[self.TRADES_COUNT_INDEX])
+
+    def close(self):
+        # The numpy view has to be released before closing the shared memory block
+        self._data = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def write_levels(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
+        """
+        Publishes the top levels of the order book. Levels beyond the buffer depth are ignored.
+        """
+        data = self._data
+        bids = bids[:self._depth]
+        asks = asks[:self._depth]
+        sequence = int(data[self.SEQUENCE_INDEX])
+        # An odd sequence is left if a previous writer was stopped while writing
+        sequence += sequence % 2
+        data[self.SEQUENCE_INDEX] = sequence + 1
+        for i, row in enumerate(bids):
+            data[self.HEADER_SIZE + 2 * i] = row.price
+            data[self.HEADER_SIZE + 2 * i + 1] = row.amount
+        for i, row in enumerate(asks):
+            data[self._asks_start + 2 * i] = row.price
+            data[self._asks_start + 2 * i + 1] = row.amount
+        data[self.BID_COUNT_INDEX] = len(bids)
+        data[self.ASK_COUNT_INDEX] = len(asks)
+        data[self.UPDATE_ID_INDEX] = update_id
+        data[self.TIMESTAMP_INDEX] = time.time()
+        data[self.SEQUENCE_INDEX] = sequence + 2
+
+    def write_trade(self, trade: OrderBookTradeEvent):
+        data = self._data
+        trades_count = int(data[self.TRADES_COUNT_INDEX])
+        position = self._trades_start + (trades_count % self._trades_capacity) * self.TRADE_FIELDS
+        data[position] = trade.timestamp
+        data[position + 1] = trade.type.value
+        data[position + 2] = float(trade.price)
+        data[position + 3] = float(trade.amount)
+        data[self.TRADES_COUNT_INDEX] = trades_count + 1
+
+    def read_levels(self) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """
+        :return: the bids and asks as arrays of (price, amount, update id) rows and the update id, or None if no
+        consistent copy could be read (or nothing was published yet)
+        """
+        data = self._data
+        for _ in range(self.MAX_READ_ATTEMPTS):
+            sequence = data[self.SEQUENCE_INDEX]
+            if sequence == 0:
+                return None
+            if sequence % 2 == 1:
+                continue
+            bid_count = int(data[self.BID_COUNT_INDEX])
+            ask_count = int(data[self.ASK_COUNT_INDEX])
+            update_id = data[self.UPDATE_ID_INDEX]
+            bids = data[self.HEADER_SIZE:self.HEADER_SIZE + 2 * bid_count].copy()
+            asks = data[self._asks_start:self._asks_start + 2 * ask_count].copy()
+            if data[self.SEQUENCE_INDEX] == sequence:
+                return self._levels_array(bids, update_id), self._levels_array(asks, update_id), int(update_id)
+        return None
+
+    def read_trades(self, from_count: int) -> Tuple[List[Tuple[float, TradeType, float, float]], int, int]:
+        """
+        Reads the trades written after the first `from_count` trades.
+
+        :return: the trades as (timestamp, trade type, price, amount) tuples, the new trades count to be used in the
+        next call, and the number of trades that were lost because the reader fell behind the ring buffer capacity
+        """
+        data = self._data
+        trades_count = int(data[self.TRADES_COUNT_INDEX])
+        first_available = max(from_count, trades_count - self._trades_capacity)
+        entries = []
+        for index in range(first_available, trades_count):
+            position = self._trades_start + (index % self._trades_capacity) * self.TRADE_FIELDS
+            entries.append((index, tuple(data[position:position + self.TRADE_FIELDS])))
+        # Entries overwritten by the writer while they were being copied are discarded
+        first_valid = int(data[self.TRADES_COUNT_INDEX]) - self._trades_capacity
+        trades = [(timestamp, TradeType(int(trade_type)), price, amount)
+                  for index, (timestamp, trade_type, price, amount) in entries
+                  if index >= first_valid]
+        lost_trades = trades_count - from_count - len(trades)
+        return trades, trades_count, lost_trades
+
+    @staticmethod
+    def _levels_array(levels: np.ndarray, update_id: float) -> np.ndarray:
+        levels = levels.reshape(-1, 2)
+        return np.column_stack((levels, np.full(len(levels), update_id)))
+
+
+class SharedMemoryOrderBook(OrderBook):
+    """
+    Read only order book replicating the top levels and trades published in a `SharedMemoryOrderBookBuffer` by a
+    market data worker process. It is updated by calling `sync`, and emits the same events as a regular order book.
+    """
+
+    def __init__(self, trading_pair: str, buffer: SharedMemoryOrderBookBuffer):
+        super().__init__()
+        self._trading_pair = trading_pair
+        self._buffer = buffer
+        self._last_sequence = 0
+        self._trades_count = 0
+        self._lost_trades = 0
+
+    @property
+    def buffer(self) -> SharedMemoryOrderBookBuffer:
+        return self._buffer
+
+    @property
+    def initialized(self) -> bool:
+        return self._last_sequence > 0
+
+    @property
+    def lost_trades(self) -> int:
+        """
+        Number of trades not replicated because they were overwritten before being read
+        """
+        return self._lost_trades
+
+    def sync(self) -> bool:
+        """
+        Applies the levels and trades published since the last call.
+
+        :return: True if the order book levels changed
+        """
+        levels_changed = False
+        sequence = self._buffer.sequence
+        if sequence != self._last_sequence and sequence % 2 == 0:
+            levels = self._buffer.read_levels()
+            if levels is not None:
+                bids, asks, _ = levels
+                self.apply_numpy_snapshot(bids, asks)
+                self._last_sequence = sequence
+                levels_changed = True
+        if self._buffer.trades_count != self._trades_count:
+            trades, self._trades_count, lost_trades = self._buffer.read_trades(self._trades_count)
+            self._lost_trades += lost_trades
+            for timestamp, trade_type, price, amount in trades:
+                self.apply_trade(OrderBookTradeEvent(
+                    trading_pair=self._trading_pair,
+                    timestamp=timestamp,
+                    type=trade_type,
+                    price=price,
+                    amount=amount,
+                ))
+        return levels_changed
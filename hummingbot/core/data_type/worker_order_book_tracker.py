@@ -0,0 +1,268 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import time
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_memory_order_book import SharedMemoryOrderBook, SharedMemoryOrderBookBuffer
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class WorkerOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker that runs the connector order book data source and tracker in a separate worker process.
+
+    The worker publishes the top levels and the trades of every order book in shared memory buffers, and this tracker
+    exposes them as read only `SharedMemoryOrderBook`s. Decoding the exchange market data streams doesn't use the
+    main process CPU, so it doesn't delay the strategy ticks or order placement.
+
+    The data source passed to the tracker is not started in the main process. It is kept only to provide the same
+    interface as the in-process tracker.
+
+    A worker that stops unexpectedly is restarted with an exponential backoff, and the tracker gives up after
+    `WORKER_MAX_RESTARTS` consecutive failures.
+    """
+    TRADES_CAPACITY = 1000
+    WORKER_START_METHOD = "spawn"
+    WORKER_RESTART_INITIAL_DELAY = 1.0
+    WORKER_RESTART_MAX_DELAY = 60.0
+    WORKER_MAX_RESTARTS = 5
+    _wobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wobt_logger is None:
+            cls._wobt_logger = logging.getLogger(__name__)
+        return cls._wobt_logger
+
+    def __init__(self,
+                 connector_name: str,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 depth: int = 20,
+                 publish_interval: float = 0.05,
+                 domain: Optional[str] = None,
+                 connector_settings_key: Optional[str] = None):
+        """
+        :param connector_name: the name of the connector, used in the logs
+        :param data_source: the order book data source of the connector in the main process
+        :param trading_pairs: the trading pairs to track
+        :param depth: the number of levels of each side of the order books replicated in the main process
+        :param publish_interval: the seconds between order book updates published by the worker
+        :param domain: the connector domain, used to create the connector in the worker process
+        :param connector_settings_key: the key of the connector in the connectors settings, used to create the
+            connector in the worker process (the connector name if not provided)
+        """
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs, domain=domain)
+        self._connector_name = connector_name
+        self._connector_settings_key = connector_settings_key or connector_name
+        self._depth = depth
+        self._publish_interval = publish_interval
+        self._buffers: Dict[str, SharedMemoryOrderBookBuffer] = {}
+        self._worker_process: Optional[multiprocessing.Process] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self._worker_failures = 0
+        self._worker_start_timestamp = 0.0
+        self._worker_restart_timestamp: Optional[float] = None
+
+    @property
+    def worker_process(self) -> Optional[multiprocessing.Process]:
+        return self._worker_process
+
+    def start(self):
+        self.stop()
+        for trading_pair in self._trading_pairs:
+            buffer = SharedMemoryOrderBookBuffer.create(depth=self._depth, trades_capacity=self.TRADES_CAPACITY)
+            self._buffers[trading_pair] = buffer
+            self._order_books[trading_pair] = SharedMemoryOrderBook(trading_pair=trading_pair, buffer=buffer)
+        self._worker_failures = 0
+        self._worker_restart_timestamp = None
+        self._worker_start_timestamp = self._time()
+        self._start_worker_process()
+        self._sync_task = safe_ensure_future(self._sync_order_books_loop())
+
+    def stop(self):
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        if self._worker_process is not None:
+            self._worker_process.terminate()
+            self._worker_process.join(timeout=5)
+            self._worker_process = None
+        for buffer in self._buffers.values():
+            buffer.close()
+        self._buffers.clear()
+        self._order_books_initialized.clear()
+
+    def _start_worker_process(self):
+        context = multiprocessing.get_context(self.WORKER_START_METHOD)
+        self._worker_process = context.Process(
+            target=run_market_data_worker,
+            kwargs={
+                "connector_settings_key": self._connector_settings_key,
+                "domain": self._domain,
+                "trading_pairs": self._trading_pairs,
+                "buffer_names": {trading_pair: buffer.name for trading_pair, buffer in self._buffers.items()},
+                "publish_interval": self._publish_interval,
+            },
+            name=f"{self._connector_name}_market_data_worker",
+            daemon=True,
+        )
+        self._worker_process.start()
+
+    async def _sync_order_books_loop(self):
+        while True:
+            try:
+                for order_book in self._order_books.values():
+                    order_book.sync()
+                if not self.ready and all(order_book.initialized for order_book in self._order_books.values()):
+                    self.logger().info(f"Initialized {len(self._order_books)} order books from the "
+                                       f"{self._connector_name} market data worker.")
+                    self._order_books_initialized.set()
+                if not self._worker_process.is_alive() and not self._check_worker_restart():
+                    return
+                await self._sleep(self._publish_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error synchronizing the order books with the market data worker.")
+                await self._sleep(5.0)
+
+    def _check_worker_restart(self) -> bool:
+        """
+        Schedules the restart of the stopped worker with an exponential backoff and restarts it once the delay passed.
+
+        :return: False if the tracker gave up restarting the worker
+        """
+        now = self._time()
+        if self._worker_restart_timestamp is None:
+            if now - self._worker_start_timestamp >= self.WORKER_RESTART_MAX_DELAY:
+                # The worker ran long enough to consider the previous failures recovered
+                self._worker_failures = 0
+            self._worker_failures += 1
+            if self._worker_failures > self.WORKER_MAX_RESTARTS:
+                self.logger().network(
+                    f"The {self._connector_name} market data worker stopped unexpectedly "
+                    f"{self._worker_failures} times in a row (exit code {self._worker_process.exitcode}). "
+                    f"Giving up restarting it.",
+                    app_warning_msg=f"The {self._connector_name} market data worker keeps failing. Its order books "
+                                    f"are not updated anymore. Disable the market data workers and restart the "
+                                    f"connector."
+                )
+                return False
+            delay = min(self.WORKER_RESTART_INITIAL_DELAY * 2 ** (self._worker_failures - 1),
+                        self.WORKER_RESTART_MAX_DELAY)
+            self.logger().error(f"The {self._connector_name} market data worker stopped unexpectedly "
+                                f"(exit code {self._worker_process.exitcode}). Restarting it in {delay:.0f} seconds.")
+            self._worker_restart_timestamp = now + delay
+        elif now >= self._worker_restart_timestamp:
+            self._worker_restart_timestamp = None
+            self._worker_start_timestamp = now
+            self._start_worker_process()
+        return True
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+    async def _sleep(self, delay: float):
+        """
+        Method created to enabling patching in unit tests
+        """
+        await asyncio.sleep(delay)
+
+
+class MarketDataWorker:
+    """
+    Runs in the worker process. It creates a non trading instance of the connector, starts its order book tracker and
+    publishes the order books in the shared memory buffers created by the `WorkerOrderBookTracker`.
+    """
+    _mdw_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdw_logger is None:
+            cls._mdw_logger = logging.getLogger(__name__)
+        return cls._mdw_logger
+
+    def __init__(self, order_book_tracker: OrderBookTracker, buffers: Dict[str, SharedMemoryOrderBookBuffer],
+                 publish_interval: float):
+        self._order_book_tracker = order_book_tracker
+        self._buffers = buffers
+        self._publish_interval = publish_interval
+        self._published_update_ids: Dict[str, Tuple[int, int]] = {}
+        self._trade_forwarders: Dict[str, EventForwarder] = {}
+
+    async def run(self):
+        parent_process = multiprocessing.parent_process()
+        self._order_book_tracker.start()
+        try:
+            while parent_process is None or parent_process.is_alive():
+                self.publish_order_books()
+                await asyncio.sleep(self._publish_interval)
+        finally:
+            self._order_book_tracker.stop()
+            for buffer in self._buffers.values():
+                buffer.close()
+
+    def publish_order_books(self):
+        for trading_pair, order_book in self._order_book_tracker.order_books.items():
+            buffer = self._buffers.get(trading_pair)
+            if buffer is None:
+                continue
+            if trading_pair not in self._trade_forwarders:
+                forwarder = EventForwarder(to_function=buffer.write_trade)
+                order_book.add_listener(OrderBookEvent.TradeEvent, forwarder)
+                self._trade_forwarders[trading_pair] = forwarder
+            self._publish_order_book_levels(trading_pair=trading_pair, order_book=order_book, buffer=buffer)
+
+    def _publish_order_book_levels(self, trading_pair: str, order_book: OrderBook,
+                                   buffer: SharedMemoryOrderBookBuffer):
+        update_ids = (order_book.snapshot_uid, order_book.last_diff_uid)
+        if update_ids == self._published_update_ids.get(trading_pair) or order_book.snapshot_uid == 0:
+            return
+        buffer.write_levels(
+            bids=list(itertools.islice(order_book.bid_entries(), buffer.depth)),
+            asks=list(itertools.islice(order_book.ask_entries(), buffer.depth)),
+            update_id=max(update_ids),
+        )
+        self._published_update_ids[trading_pair] = update_ids
+
+
+def run_market_data_worker(connector_settings_key: str, domain: Optional[str], trading_pairs: List[str],
+                           buffer_names: Dict[str, str], publish_interval: float):
+    """
+    Entry point of the market data worker processes
+    """
+    from hummingbot.client.config.client_config_map import ClientConfigMap
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+    from hummingbot.client.settings import AllConnectorSettings
+
+    ev_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    all_connector_settings = AllConnectorSettings.get_connector_settings()
+    # The other domains of a connector (for example the testnets) are registered as separate settings
+    connector_setting = next(
+        (setting for setting in all_connector_settings.values()
+         if setting.parent_name == connector_settings_key and setting.domain_parameter == domain),
+        all_connector_settings[connector_settings_key])
+    # The default client configuration has the market data workers disabled, so the connector tracks the order books
+    # in this process
+    connector = connector_setting.non_trading_connector_instance_with_default_configuration(
+        trading_pairs=trading_pairs,
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+    )
+    buffers = {trading_pair: SharedMemoryOrderBookBuffer.attach(name) for trading_pair, name in buffer_names.items()}
+    worker = MarketDataWorker(
+        order_book_tracker=connector.order_book_tracker,
+        buffers=buffers,
+        publish_interval=publish_interval,
+    )
+    ev_loop.run_until_complete(worker.run())
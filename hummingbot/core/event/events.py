@@ -37,6 +37,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookUpdateEvent = 902
     OrderBookDataSourceUpdateEvent = 904
 
 
@@ -152,6 +153,12 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookTopOfBookUpdateEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+    update_id: int
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
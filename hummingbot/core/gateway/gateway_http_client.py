@@ -1,9 +1,12 @@
+import asyncio
 import logging
 import re
 import ssl
+import time
+from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 
@@ -38,10 +41,45 @@ class GatewayError(Enum):
     UnknownError = 1099
 
 
+# Approximate block times (seconds) of the chains supported by Gateway. AMM quotes don't change within a block, so the
+# block time is used as quotes cache TTL when no TTL is configured.
+CHAIN_BLOCK_TIMES = {
+    "algorand": 3.7,
+    "avalanche": 2.0,
+    "binance-smart-chain": 3.0,
+    "cronos": 6.0,
+    "ethereum": 12.0,
+    "harmony": 2.0,
+    "injective": 1.0,
+    "near": 1.2,
+    "polygon": 2.0,
+    "tezos": 15.0,
+    "xdc": 2.0,
+}
+DEFAULT_QUOTE_CACHE_TTL = 1.0
+
+
+@dataclass
+class QuoteCacheMetrics:
+    """
+    Usage of the price quotes cache. Hits are served from the cache, coalesced requests wait for an identical request
+    already sent to Gateway, and misses send a new request.
+    """
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total > 0 else 0.0
+
+
 class GatewayHttpClient:
     """
     An HTTP client for making requests to the gateway API.
     """
+    MAX_QUOTE_CACHE_SIZE = 1000
 
     _ghc_logger: Optional[HummingbotLogger] = None
     _shared_client: Optional[aiohttp.ClientSession] = None
@@ -64,6 +102,9 @@ class GatewayHttpClient:
         if GatewayHttpClient.__instance is None:
             self._base_url = f"https://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        self._quote_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._in_flight_quotes: Dict[Tuple, asyncio.Future] = {}
+        self._quote_cache_metrics = QuoteCacheMetrics()
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -103,6 +144,13 @@ class GatewayHttpClient:
     def base_url(self, url: str):
         self._base_url = url
 
+    @property
+    def quote_cache_metrics(self) -> QuoteCacheMetrics:
+        return self._quote_cache_metrics
+
+    def clear_quote_cache(self):
+        self._quote_cache.clear()
+
     def log_error_codes(self, resp: Dict[str, Any]):
         """
         If the API returns an error code, interpret the code, log a useful
@@ -386,20 +434,74 @@ class GatewayHttpClient:
             side: TradeType,
             fail_silently: bool = False
     ) -> Dict[str, Any]:
+        """
+        Requests a price quote. Quotes are cached for a short time (see `_quote_cache_ttl`), and concurrent calls with
+        the same parameters share a single request to Gateway.
+        """
         if side not in [TradeType.BUY, TradeType.SELL]:
             raise ValueError("Only BUY and SELL prices are supported.")
 
         # XXX(martin_kou): The amount is always output with 18 decimal places.
-        return await self.api_request("post", "amm/price", {
+        formatted_amount = f"{amount:.18f}"
+        cache_key = (connector, chain, network, base_asset, quote_asset, side, formatted_amount)
+        cached_quote = self._quote_cache.get(cache_key)
+        if cached_quote is not None and cached_quote[0] > self._time():
+            self._quote_cache_metrics.hits += 1
+            return dict(cached_quote[1])
+
+        in_flight_key = cache_key + (fail_silently,)
+        in_flight_quote = self._in_flight_quotes.get(in_flight_key)
+        if in_flight_quote is not None:
+            self._quote_cache_metrics.coalesced += 1
+            return dict(await asyncio.shield(in_flight_quote))
+
+        self._quote_cache_metrics.misses += 1
+        in_flight_quote = asyncio.ensure_future(self.api_request("post", "amm/price", {
             "chain": chain,
             "network": network,
             "connector": connector,
             "base": base_asset,
             "quote": quote_asset,
-            "amount": f"{amount:.18f}",
+            "amount": formatted_amount,
             "side": side.name,
             "allowedSlippage": "0/1",  # hummingbot applies slippage itself
-        }, fail_silently=fail_silently)
+        }, fail_silently=fail_silently))
+        self._in_flight_quotes[in_flight_key] = in_flight_quote
+        try:
+            quote = await asyncio.shield(in_flight_quote)
+        finally:
+            if in_flight_quote.done():
+                del self._in_flight_quotes[in_flight_key]
+            else:
+                # The caller was cancelled, the coalesced callers still wait for the request
+                in_flight_quote.add_done_callback(lambda _: self._in_flight_quotes.pop(in_flight_key, None))
+
+        ttl = self._quote_cache_ttl(chain=chain)
+        if ttl > 0 and "price" in quote:
+            self._store_quote(cache_key=cache_key, quote=quote, expiration=self._time() + ttl)
+        return dict(quote)
+
+    def _quote_cache_ttl(self, chain: str) -> float:
+        """
+        Returns the configured quotes cache TTL, or the chain block time if no TTL is configured.
+        A TTL of 0 disables the cache (concurrent identical requests are still coalesced).
+        """
+        configured_ttl = self._client_config_map.gateway.gateway_quote_cache_ttl
+        if configured_ttl is not None:
+            return configured_ttl
+        return CHAIN_BLOCK_TIMES.get(chain, DEFAULT_QUOTE_CACHE_TTL)
+
+    def _store_quote(self, cache_key: Tuple, quote: Dict[str, Any], expiration: float):
+        if len(self._quote_cache) >= self.MAX_QUOTE_CACHE_SIZE:
+            now = self._time()
+            self._quote_cache = {key: value for key, value in self._quote_cache.items() if value[0] > now}
+            if len(self._quote_cache) >= self.MAX_QUOTE_CACHE_SIZE:
+                self._quote_cache.pop(next(iter(self._quote_cache)))
+        self._quote_cache[cache_key] = (expiration, quote)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
 
     async def get_transaction_status(
             self,
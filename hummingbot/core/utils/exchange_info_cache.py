@@ -0,0 +1,153 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+EXCHANGE_INFO_CACHE_DIR_NAME = "exchange_info_cache"
+
+
+@dataclass
+class ExchangeInfoCacheEntry:
+    """
+    Exchange info response of a connector, with the validators used to check if it changed in the exchange.
+    The trading rules are not stored, they are parsed from the exchange info by the connector because some connectors
+    initialize other state while parsing them.
+    """
+    exchange_info: Any
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    timestamp: float = 0
+
+
+class ExchangeInfoCache:
+    """
+    Disk backed cache of the exchange info responses of the connectors, with one file per connector
+    and domain.
+
+    The files can be several MB for some exchanges, so the methods reading and writing them are synchronous and meant
+    to be run out of the event loop.
+    """
+    _eic_logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["ExchangeInfoCache"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._eic_logger is None:
+            cls._eic_logger = logging.getLogger(__name__)
+        return cls._eic_logger
+
+    @classmethod
+    def shared_instance(cls) -> Optional["ExchangeInfoCache"]:
+        """
+        Returns the cache registered by the client, or None if caching is not enabled in this process
+        """
+        return cls._shared_instance
+
+    @classmethod
+    def set_shared_instance(cls, cache: Optional["ExchangeInfoCache"]):
+        cls._shared_instance = cache
+
+    def __init__(self, cache_dir: Path):
+        """
+        :param cache_dir: directory where the cache files are stored
+        """
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def load_entry(self, cache_key: str) -> Optional[ExchangeInfoCacheEntry]:
+        """
+        Reads the entry of a connector. A missing or corrupted file results in no entry.
+        """
+        file_path = self._entry_path(cache_key)
+        if not file_path.exists():
+            return None
+        try:
+            with open(file_path, "r") as cache_file:
+                content = json.load(cache_file)
+            return ExchangeInfoCacheEntry(
+                exchange_info=content["exchange_info"],
+                content_hash=content["content_hash"],
+                etag=content.get("etag"),
+                last_modified=content.get("last_modified"),
+                timestamp=content["timestamp"],
+            )
+        except Exception:
+            self.logger().warning(f"Could not read the exchange info cache file {file_path}. "
+                                  f"The exchange info will be requested again.", exc_info=True)
+            return None
+
+    def save_entry(self, cache_key: str, entry: ExchangeInfoCacheEntry):
+        """
+        Writes the entry of a connector, setting its timestamp to the current time.
+        The file is replaced atomically to avoid leaving a truncated cache if the client is stopped while writing.
+        """
+        entry.timestamp = self._time()
+        file_path = self._entry_path(cache_key)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+            with open(temp_path, "w") as cache_file:
+                json.dump({
+                    "timestamp": entry.timestamp,
+                    "content_hash": entry.content_hash,
+                    "etag": entry.etag,
+                    "last_modified": entry.last_modified,
+                    "exchange_info": entry.exchange_info,
+                }, cache_file)
+            os.replace(temp_path, file_path)
+        except Exception:
+            self.logger().warning(f"Could not write the exchange info cache file {file_path}.", exc_info=True)
+
+    def is_entry_fresh(self, entry: ExchangeInfoCacheEntry, max_age: float) -> bool:
+        return self._time() - entry.timestamp < max_age
+
+    @staticmethod
+    def parse_content(content: str, known_content_hash: Optional[str] = None) -> Tuple[str, Optional[Any]]:
+        """
+        Hashes a raw exchange info response, and decodes it only if its hash is not the known one.
+
+        :return: the content hash, and the decoded exchange info or None if the content did not change
+        """
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        if content_hash == known_content_hash:
+            return content_hash, None
+        return content_hash, json.loads(content)
+
+    @staticmethod
+    def exchange_info_hash(exchange_info: Any) -> str:
+        """
+        Hash of an already decoded exchange info, for the connectors that do not give access to the raw response.
+        """
+        return hashlib.sha256(json.dumps(exchange_info, sort_keys=True).encode()).hexdigest()
+
+    def _entry_path(self, cache_key: str) -> Path:
+        return self._cache_dir / f"{cache_key}.json"
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+def init_exchange_info_cache(client_config_map: "ClientConfigAdapter") -> Optional[ExchangeInfoCache]:
+    """
+    Registers the shared exchange info cache of the client, if enabled in the client configuration.
+    """
+    if not client_config_map.trading_pairs_cache.exchange_info_cache_enabled:
+        return None
+    exchange_info_cache = ExchangeInfoCache(cache_dir=Path(data_path()) / EXCHANGE_INFO_CACHE_DIR_NAME)
+    ExchangeInfoCache.set_shared_instance(exchange_info_cache)
+    return exchange_info_cache
@@ -1,11 +1,21 @@
+import asyncio
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
-from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot import data_path
+from hummingbot.client.config.config_helpers import (
+    ClientConfigAdapter,
+    connector_name_from_file,
+    list_connector_configs,
+)
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
+from .trading_pairs_cache import TradingPairsCache
+
+TRADING_PAIRS_CACHE_FILE_NAME = "trading_pairs_cache.json"
 
 
 class TradingPairFetcher:
@@ -28,29 +38,39 @@ class TradingPairFetcher:
     def __init__(self, client_config_map: ClientConfigAdapter):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
+        self._trading_pairs_cache: Optional[TradingPairsCache] = None
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
+            connector_name: Optional[str] = None) -> asyncio.Future:
         connector_name = connector_name or connector_setting.name
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        return safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
+        """
+        Serves the cached trading pairs right away and fetches from the exchanges only the connectors without a cache
+        entry, plus the connectors configured by the user whose cache entry has expired.
+        """
+        self._trading_pairs_cache = self._load_trading_pairs_cache(client_config_map)
+        configured_connectors = self._configured_connector_names() if self._trading_pairs_cache is not None else set()
         connector_settings = self._all_connector_settings()
+        fetch_tasks = []
         for conn_setting in connector_settings.values():
+            if self._serve_from_cache(conn_setting, configured_connectors):
+                continue
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
             # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
+                    fetch_tasks.append(self._fetch_pairs_from_connector_setting(
                         connector_setting=connector_settings[conn_setting.parent_name],
                         connector_name=conn_setting.name
-                    )
+                    ))
                 else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                    fetch_tasks.append(self._fetch_pairs_from_connector_setting(connector_setting=conn_setting))
             except ModuleNotFoundError:
                 continue
             except Exception:
@@ -59,20 +79,81 @@ class TradingPairFetcher:
 
         self.ready = True
 
+        if self._trading_pairs_cache is not None and len(fetch_tasks) > 0:
+            await safe_gather(*fetch_tasks, return_exceptions=True)
+            await self._trading_pairs_cache.save_async()
+
+    async def refresh_connector_trading_pairs(self, connector_name: str):
+        """
+        Fetches the trading pairs of a single connector from the exchange, bypassing the cache.
+        Used when the user configures a new connector.
+        """
+        connector_settings = self._all_connector_settings()
+        conn_setting = connector_settings.get(connector_name)
+        if conn_setting is None:
+            return
+        try:
+            await self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+        except Exception:
+            self.logger().exception(f"An error occurred when fetching trading pairs for {connector_name}."
+                                    "Please check the logs")
+            return
+        if self._trading_pairs_cache is not None:
+            await self._trading_pairs_cache.save_async()
+
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            if self._trading_pairs_cache is not None and len(pairs) > 0:
+                self._trading_pairs_cache.set_trading_pairs(exchange_name, pairs)
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
             # In case of error just assign empty list, this is st. the bot won't stop working
             self.trading_pairs[exchange_name] = []
 
+    def _serve_from_cache(self, connector_setting: ConnectorSetting, configured_connectors: Set[str]) -> bool:
+        """
+        Loads the cached trading pairs of the connector, if any.
+
+        :return: True if the cached trading pairs can be used as they are, False if they should be fetched
+        """
+        if self._trading_pairs_cache is None:
+            return False
+        cached_pairs = self._trading_pairs_cache.get_trading_pairs(connector_setting.name)
+        if cached_pairs is None:
+            return False
+        self.trading_pairs[connector_setting.name] = cached_pairs
+        is_configured = (connector_setting.name in configured_connectors
+                         or connector_setting.parent_name in configured_connectors)
+        return not is_configured or self._trading_pairs_cache.is_trading_pairs_entry_fresh(connector_setting.name)
+
+    def _load_trading_pairs_cache(self, client_config_map: ClientConfigAdapter) -> Optional[TradingPairsCache]:
+        cache_config = client_config_map.trading_pairs_cache
+        if not cache_config.trading_pairs_cache_enabled:
+            return None
+        trading_pairs_cache = TradingPairsCache(
+            file_path=self._trading_pairs_cache_path(),
+            ttl=cache_config.trading_pairs_cache_ttl)
+        trading_pairs_cache.load()
+        TradingPairsCache.set_shared_instance(trading_pairs_cache)
+        return trading_pairs_cache
+
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
         return AllConnectorSettings.get_connector_settings()
 
+    @staticmethod
+    def _configured_connector_names() -> Set[str]:
+        # Method created to enabling patching in unit tests
+        return {connector_name_from_file(file_path) for file_path in list_connector_configs()}
+
+    @staticmethod
+    def _trading_pairs_cache_path() -> Path:
+        # Method created to enabling patching in unit tests
+        return Path(data_path()) / TRADING_PAIRS_CACHE_FILE_NAME
+
     @staticmethod
     def _get_client_config_map() -> "ClientConfigAdapter":
         from hummingbot.client.hummingbot_application import HummingbotApplication
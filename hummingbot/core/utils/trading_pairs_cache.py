@@ -0,0 +1,147 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from hummingbot.logger import HummingbotLogger
+
+
+class TradingPairsCache:
+    """
+    Disk backed cache of the trading pairs and the exchange symbol maps of the connectors.
+
+    The client loads the cache at startup to serve trading pairs autocompletion immediately, and connectors use the
+    cached symbol maps to skip the exchange info request while the cache entries are fresh.
+    """
+    _tpc_logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["TradingPairsCache"] = None
+
+    TRADING_PAIRS_KEY = "trading_pairs"
+    SYMBOL_MAPS_KEY = "symbol_maps"
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._tpc_logger is None:
+            cls._tpc_logger = logging.getLogger(__name__)
+        return cls._tpc_logger
+
+    @classmethod
+    def shared_instance(cls) -> Optional["TradingPairsCache"]:
+        """
+        Returns the cache registered by the client, or None if caching is not enabled in this process
+        """
+        return cls._shared_instance
+
+    @classmethod
+    def set_shared_instance(cls, cache: Optional["TradingPairsCache"]):
+        cls._shared_instance = cache
+
+    def __init__(self, file_path: Path, ttl: float):
+        """
+        :param file_path: path of the JSON file where the cache is persisted
+        :param ttl: number of seconds an entry is considered fresh after being stored
+        """
+        self._file_path = file_path
+        self._ttl = ttl
+        self._entries: Dict[str, Dict[str, Dict[str, Any]]] = {
+            self.TRADING_PAIRS_KEY: {},
+            self.SYMBOL_MAPS_KEY: {},
+        }
+        self._dirty = False
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def load(self):
+        """
+        Loads the cache content from disk. A missing or corrupted file results in an empty cache.
+        """
+        if not self._file_path.exists():
+            return
+        try:
+            with open(self._file_path, "r") as cache_file:
+                content = json.load(cache_file)
+            for section in (self.TRADING_PAIRS_KEY, self.SYMBOL_MAPS_KEY):
+                self._entries[section] = dict(content.get(section, {}))
+            self._dirty = False
+        except Exception:
+            self.logger().warning(f"Could not read the trading pairs cache file {self._file_path}. "
+                                  f"The cache will be rebuilt.", exc_info=True)
+
+    def save(self):
+        """
+        Writes the cache content to disk if it changed since the last load or save.
+        The file is replaced atomically to avoid leaving a truncated cache if the client is stopped while writing.
+        """
+        if self._dirty:
+            self._dirty = not self._write_entries(self._entries_snapshot())
+
+    async def save_async(self):
+        """
+        Same as `save`, but writing the file out of the event loop.
+        """
+        if self._dirty:
+            self._dirty = False
+            saved = await asyncio.get_event_loop().run_in_executor(None, self._write_entries, self._entries_snapshot())
+            self._dirty = self._dirty or not saved
+
+    def get_trading_pairs(self, connector_name: str) -> Optional[List[str]]:
+        entry = self._entries[self.TRADING_PAIRS_KEY].get(connector_name)
+        return None if entry is None else list(entry["data"])
+
+    def set_trading_pairs(self, connector_name: str, trading_pairs: List[str]):
+        self._set_entry(self.TRADING_PAIRS_KEY, connector_name, list(trading_pairs))
+
+    def is_trading_pairs_entry_fresh(self, connector_name: str) -> bool:
+        return self._is_entry_fresh(self.TRADING_PAIRS_KEY, connector_name)
+
+    def get_symbol_map(self, connector_name: str, only_fresh: bool = True) -> Optional[Dict[str, str]]:
+        """
+        :param connector_name: the name of the connector owning the symbol map
+        :param only_fresh: if True the symbol map is returned only if it has not expired
+
+        :return: a copy of the mapping from exchange symbols to trading pairs, or None if there is no suitable entry
+        """
+        if only_fresh and not self._is_entry_fresh(self.SYMBOL_MAPS_KEY, connector_name):
+            return None
+        entry = self._entries[self.SYMBOL_MAPS_KEY].get(connector_name)
+        return None if entry is None else dict(entry["data"])
+
+    def set_symbol_map(self, connector_name: str, symbol_map: Mapping[str, str]):
+        self._set_entry(self.SYMBOL_MAPS_KEY, connector_name, dict(symbol_map))
+
+    def _set_entry(self, section: str, connector_name: str, data: Any):
+        self._entries[section][connector_name] = {"timestamp": self._time(), "data": data}
+        self._dirty = True
+
+    def _is_entry_fresh(self, section: str, connector_name: str) -> bool:
+        entry = self._entries[section].get(connector_name)
+        return entry is not None and self._time() - entry["timestamp"] < self._ttl
+
+    def _entries_snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        # The entries are replaced, not modified, so copying the sections is enough to write them from another thread
+        return {section: dict(entries) for section, entries in self._entries.items()}
+
+    def _write_entries(self, entries: Dict[str, Dict[str, Dict[str, Any]]]) -> bool:
+        try:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._file_path.with_suffix(self._file_path.suffix + ".tmp")
+            with open(temp_path, "w") as cache_file:
+                json.dump(entries, cache_file)
+            os.replace(temp_path, self._file_path)
+            return True
+        except Exception:
+            self.logger().warning(f"Could not write the trading pairs cache file {self._file_path}.", exc_info=True)
+            return False
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
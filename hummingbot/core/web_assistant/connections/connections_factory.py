@@ -1,4 +1,6 @@
-from typing import Optional
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, Optional
 
 import aiohttp
 
@@ -6,6 +8,38 @@ from hummingbot.core.web_assistant.connections.rest_connection import RESTConnec
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
+@dataclass
+class ConnectionPoolSettings:
+    """
+    Configuration of the `aiohttp.TCPConnector` used by the shared client session.
+
+    :param limit: maximum number of simultaneous connections (0 means no limit)
+    :param limit_per_host: maximum number of simultaneous connections to the same host (0 means no limit)
+    :param dns_cache_ttl: seconds the resolved addresses are cached (None caches them forever)
+    :param keepalive_timeout: seconds an idle connection is kept open in the pool to be reused
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    dns_cache_ttl: Optional[int] = 10
+    keepalive_timeout: float = 15.0
+
+
+@dataclass
+class HostConnectionMetrics:
+    """
+    Connection usage of the requests sent to a host. A request either reuses a pooled connection or opens a new one
+    (paying the TCP and TLS handshakes).
+    """
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        connections = self.new_connections + self.reused_connections
+        return self.reused_connections / connections if connections > 0 else 0.0
+
+
 class ConnectionsFactory:
     """This class is a thin wrapper around the underlying REST and WebSocket third-party library.
 
@@ -18,11 +52,32 @@ class ConnectionsFactory:
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
 
-    def __init__(self):
+    def __init__(self, pool_settings: Optional[ConnectionPoolSettings] = None):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._pool_settings = pool_settings or ConnectionPoolSettings()
+        self._host_metrics: Dict[str, HostConnectionMetrics] = {}
+
+    @property
+    def pool_settings(self) -> ConnectionPoolSettings:
+        return self._pool_settings
+
+    @pool_settings.setter
+    def pool_settings(self, pool_settings: ConnectionPoolSettings):
+        """
+        The settings are applied when the shared client session is created, so they have to be set before requesting
+        the first connection
+        """
+        self._pool_settings = pool_settings
+
+    @property
+    def host_metrics(self) -> Dict[str, HostConnectionMetrics]:
+        """
+        Returns the connection usage metrics of the requests sent through the shared client session, by host
+        """
+        return self._host_metrics.copy()
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
@@ -35,5 +90,44 @@ class ConnectionsFactory:
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        if self._shared_client is None:
+            self._shared_client = aiohttp.ClientSession(
+                connector=self._create_tcp_connector(),
+                trace_configs=[self._create_trace_config()],
+            )
         return self._shared_client
+
+    def _create_tcp_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self._pool_settings.limit,
+            limit_per_host=self._pool_settings.limit_per_host,
+            use_dns_cache=self._pool_settings.dns_cache_ttl != 0,
+            ttl_dns_cache=self._pool_settings.dns_cache_ttl,
+            keepalive_timeout=self._pool_settings.keepalive_timeout,
+        )
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return trace_config
+
+    def _metrics_for_request(self, trace_config_ctx: SimpleNamespace) -> HostConnectionMetrics:
+        host = getattr(trace_config_ctx, "host", None) or "unknown"
+        if host not in self._host_metrics:
+            self._host_metrics[host] = HostConnectionMetrics()
+        return self._host_metrics[host]
+
+    async def _on_request_start(self, session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace,
+                                params: aiohttp.TraceRequestStartParams):
+        trace_config_ctx.host = params.url.host
+        self._metrics_for_request(trace_config_ctx).requests += 1
+
+    async def _on_connection_create_end(self, session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace,
+                                        params: aiohttp.TraceConnectionCreateEndParams):
+        self._metrics_for_request(trace_config_ctx).new_connections += 1
+
+    async def _on_connection_reuseconn(self, session: aiohttp.ClientSession, trace_config_ctx: SimpleNamespace,
+                                       params: aiohttp.TraceConnectionReuseconnParams):
+        self._metrics_for_request(trace_config_ctx).reused_connections += 1
@@ -4,6 +4,7 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, HIGH_PRIORITY
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -89,7 +90,10 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+        # Requests changing the account state (orders creation and cancelation) outrank the polling requests when the
+        # rate limits are shared with other connectors
+        priority = DEFAULT_PRIORITY if method == RESTMethod.GET else HIGH_PRIORITY
+        async with self._throttler.execute_task(limit_id=throttler_limit_id, priority=priority):
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -75,7 +75,12 @@ class BinanceSpotCandles(CandlesBase):
                                                        throttler_limit_id=CONSTANTS.CANDLES_ENDPOINT,
                                                        params=params)
 
-        return np.array(candles)[:, [0, 1, 2, 3, 4, 5, 7, 8, 9, 10]].astype(float)
+        # The reshape keeps the columns when there are no candles in the requested range
+        return np.array(candles).reshape(-1, 12)[:, [0, 1, 2, 3, 4, 5, 7, 8, 9, 10]].astype(float)
+
+    @property
+    def max_records_per_request(self) -> int:
+        return CONSTANTS.MAX_RECORDS_PER_REQUEST
 
     async def fill_historical_candles(self):
         max_request_needed = (self._candles.maxlen // 1000) + 1
@@ -110,13 +115,7 @@ class BinanceSpotCandles(CandlesBase):
         :param ws: the websocket assistant used to connect to the exchange
         """
         try:
-            candle_params = []
-            candle_params.append(f"{self._ex_trading_pair.lower()}@kline_{self.interval}")
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": candle_params,
-                "id": 1
-            }
+            payload = self.multiplexed_subscription_payload([self.stream_name])
             subscribe_candles_request: WSJSONRequest = WSJSONRequest(payload=payload)
 
             await ws.send(subscribe_candles_request)
@@ -133,29 +132,60 @@ class BinanceSpotCandles(CandlesBase):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
-            if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
-                timestamp = data["k"]["t"]
-                open = data["k"]["o"]
-                high = data["k"]["h"]
-                low = data["k"]["l"]
-                close = data["k"]["c"]
-                volume = data["k"]["v"]
-                quote_asset_volume = data["k"]["q"]
-                n_trades = data["k"]["n"]
-                taker_buy_base_volume = data["k"]["V"]
-                taker_buy_quote_volume = data["k"]["Q"]
-                if len(self._candles) == 0:
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                    safe_ensure_future(self.fill_historical_candles())
-                elif timestamp > int(self._candles[-1][0]):
-                    # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+            if data is not None:  # data will be None when the websocket is disconnected
+                self.process_candle_message(data)
+
+    @property
+    def max_streams_per_connection(self) -> int:
+        return CONSTANTS.MAX_STREAMS_PER_CONNECTION
+
+    @property
+    def stream_name(self) -> str:
+        return f"{self._ex_trading_pair.lower()}@kline_{self.interval}"
+
+    def multiplexed_subscription_payload(self, stream_names: List[str]) -> Dict[str, Any]:
+        return {
+            "method": "SUBSCRIBE",
+            "params": stream_names,
+            "id": 1
+        }
+
+    def multiplexed_unsubscription_payload(self, stream_names: List[str]) -> Dict[str, Any]:
+        return {
+            "method": "UNSUBSCRIBE",
+            "params": stream_names,
+            "id": 2
+        }
+
+    def multiplexed_stream_name(self, data: Dict[str, Any]) -> Optional[str]:
+        if data.get("e") == "kline":
+            return f"{data['k']['s'].lower()}@kline_{data['k']['i']}"
+        return None
+
+    def process_candle_message(self, data: Dict[str, Any]):
+        if data.get("e") == "kline":
+            timestamp = data["k"]["t"]
+            open = data["k"]["o"]
+            high = data["k"]["h"]
+            low = data["k"]["l"]
+            close = data["k"]["c"]
+            volume = data["k"]["v"]
+            quote_asset_volume = data["k"]["q"]
+            n_trades = data["k"]["n"]
+            taker_buy_base_volume = data["k"]["V"]
+            taker_buy_quote_volume = data["k"]["Q"]
+            if len(self._candles) == 0:
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
+                safe_ensure_future(self.fill_historical_candles())
+            elif timestamp > int(self._candles[-1][0]):
+                # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
+            elif timestamp == int(self._candles[-1][0]):
+                self._candles.pop()
+                self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                               quote_asset_volume, n_trades, taker_buy_base_volume,
+                                               taker_buy_quote_volume]))
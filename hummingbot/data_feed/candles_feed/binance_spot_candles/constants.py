@@ -5,8 +5,11 @@ from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, Rate
 REST_URL = "https://api.binance.com"
 HEALTH_CHECK_ENDPOINT = "/api/v3/ping"
 CANDLES_ENDPOINT = "/api/v3/klines"
+MAX_RECORDS_PER_REQUEST = 1000
 
 WSS_URL = "wss://stream.binance.com:9443/ws"
+# Maximum number of streams that can be subscribed through a single websocket connection
+MAX_STREAMS_PER_CONNECTION = 1024
 
 INTERVALS = bidict({
     "1s": "1s",
@@ -1,8 +1,9 @@
 import asyncio
 import os
 from collections import deque
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 
@@ -79,6 +80,17 @@ class CandlesBase(NetworkBase):
         """
         return len(self._candles) == self._candles.maxlen
 
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def last_candle(self) -> Optional[List[float]]:
+        """
+        This property returns the most recent candle, or None if no candle was received yet.
+        """
+        return list(self._candles[-1]) if len(self._candles) > 0 else None
+
     @property
     def name(self):
         raise NotImplementedError
@@ -146,6 +158,31 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    @property
+    def max_records_per_request(self) -> int:
+        """
+        This property returns the maximum number of candles the exchange returns in a single REST request.
+        """
+        return 500
+
+    async def fetch_candles_range(self, start_time_ms: int, end_time_ms: int) -> np.ndarray:
+        """
+        This method fetches the candles opened between two timestamps (both included). The range should not hold more
+        than max_records_per_request candles. Connectors expecting the timestamps in another unit override it.
+        :param start_time_ms: start time in milliseconds
+        :param end_time_ms: end time in milliseconds
+        :return: numpy array with the candlesticks
+        """
+        return await self.fetch_candles(start_time=start_time_ms, end_time=end_time_ms,
+                                        limit=self.max_records_per_request)
+
+    def share_throttler(self, throttler: AsyncThrottler):
+        """
+        This method makes the requests of this instance use the rate limits of a throttler shared with other instances.
+        :param throttler: the shared throttler
+        """
+        self._api_factory = WebAssistantsFactory(throttler=throttler)
+
     async def fill_historical_candles(self):
         """
         This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
@@ -191,6 +228,50 @@ class CandlesBase(NetworkBase):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         raise NotImplementedError
 
+    @property
+    def max_streams_per_connection(self) -> int:
+        """
+        This property returns the number of candles streams (trading pair and interval) the exchange allows to
+        subscribe through a single websocket connection. Connectors returning 1 use a connection per candles instance.
+        """
+        return 1
+
+    @property
+    def stream_name(self) -> str:
+        """
+        This property returns the name of the candles stream of this instance in multiplexed connections.
+        """
+        raise NotImplementedError
+
+    def multiplexed_subscription_payload(self, stream_names: List[str]) -> Dict[str, Any]:
+        """
+        This method returns the payload to subscribe to several candles streams through the same websocket connection.
+        :param stream_names: the names of the streams to subscribe to
+        """
+        raise NotImplementedError
+
+    def multiplexed_unsubscription_payload(self, stream_names: List[str]) -> Dict[str, Any]:
+        """
+        This method returns the payload to unsubscribe from candles streams of a multiplexed websocket connection.
+        :param stream_names: the names of the streams to unsubscribe from
+        """
+        raise NotImplementedError
+
+    def multiplexed_stream_name(self, data: Dict[str, Any]) -> Optional[str]:
+        """
+        This method returns the name of the candles stream a message of a multiplexed connection belongs to.
+        :param data: the websocket message
+        :return: the stream name, or None if the message is not a candle update
+        """
+        raise NotImplementedError
+
+    def process_candle_message(self, data: Dict[str, Any]):
+        """
+        This method updates the candles with a candle update message of the stream of this instance.
+        :param data: the websocket message
+        """
+        raise NotImplementedError
+
     async def _sleep(self, delay):
         """
         Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
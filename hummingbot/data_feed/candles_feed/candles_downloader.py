@@ -0,0 +1,255 @@
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
+from hummingbot.logger import HummingbotLogger
+
+CHUNKS_DIR_NAME = "candles_chunks"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+MAX_REQUEST_RETRIES = 3
+# Intervals without a fixed duration can't be checked for gaps
+VARIABLE_DURATION_INTERVALS = ("1M",)
+
+
+class CandlesChunk(NamedTuple):
+    trading_pair: str
+    interval: str
+    start_time_ms: int
+    end_time_ms: int
+
+
+class CandlesDownloadResult(NamedTuple):
+    file_path: Path
+    records: int
+    gaps: List[Tuple[int, int]]
+
+
+class CandlesDownloader:
+    """
+    Downloads the historical candles of several trading pairs and intervals of a connector.
+
+    The time range of each series is split in chunks of one REST request. The chunks are requested concurrently,
+    sharing the rate limits of the connector, and each closed chunk is stored in its own file as soon as it is received,
+    so that an interrupted download resumes from the chunks already stored. The chunk grid is aligned to the epoch,
+    which allows reusing the stored chunks in downloads of overlapping ranges.
+
+    When all the chunks of a series are available they are merged in a CSV file that can be loaded with
+    `CandlesBase.load_candles_from_csv`, and the series is checked for missing candles.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 connector: str,
+                 trading_pairs: List[str],
+                 intervals: List[str],
+                 start_time: int,
+                 end_time: Optional[int] = None,
+                 data_dir: Optional[str] = None,
+                 max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS):
+        """
+        :param connector: the candles feed connector name (see `CandlesFactory`)
+        :param trading_pairs: the trading pairs to download
+        :param intervals: the candles intervals to download
+        :param start_time: start of the range in seconds
+        :param end_time: end of the range in seconds (defaults to the current time)
+        :param data_dir: directory for the chunks and the merged files (defaults to the client data directory)
+        :param max_concurrent_requests: maximum number of requests waiting for a response at the same time
+        """
+        self._connector = connector
+        self._start_time_ms = int(start_time * 1000)
+        self._end_time_ms = int((end_time or self._time()) * 1000)
+        self._data_dir = Path(data_dir or data_path())
+        self._max_concurrent_requests = max_concurrent_requests
+        self._feeds: Dict[Tuple[str, str], CandlesBase] = {}
+        throttler: Optional[AsyncThrottler] = None
+        for trading_pair in trading_pairs:
+            for interval in intervals:
+                feed = CandlesFactory.get_candle(CandlesConfig(connector=connector,
+                                                               trading_pair=trading_pair,
+                                                               interval=interval))
+                # All the series are downloaded within the rate limits of a single connector instance
+                throttler = throttler or AsyncThrottler(rate_limits=feed.rate_limits)
+                feed.share_throttler(throttler)
+                self._feeds[(trading_pair, interval)] = feed
+
+    @property
+    def data_dir(self) -> Path:
+        return self._data_dir
+
+    def chunks_dir(self, trading_pair: str, interval: str) -> Path:
+        return self._data_dir / CHUNKS_DIR_NAME / self._connector / trading_pair / interval
+
+    def file_path(self, trading_pair: str, interval: str) -> Path:
+        # Same name used by CandlesBase.load_candles_from_csv
+        return self._data_dir / f"candles_{self._connector}_{trading_pair}_{interval}.csv"
+
+    def chunks(self, trading_pair: str, interval: str) -> List[CandlesChunk]:
+        """
+        Returns the chunks covering the download range for the series.
+        """
+        feed = self._feeds[(trading_pair, interval)]
+        interval_ms = feed.get_seconds_from_interval(interval) * 1000
+        chunk_ms = interval_ms * feed.max_records_per_request
+        first_chunk_start = self._start_time_ms - self._start_time_ms % chunk_ms
+        return [
+            CandlesChunk(trading_pair, interval, chunk_start, chunk_start + chunk_ms)
+            for chunk_start in range(first_chunk_start, self._end_time_ms, chunk_ms)
+        ]
+
+    def pending_chunks(self) -> List[CandlesChunk]:
+        """
+        Returns the chunks of all the series not stored yet. The chunks still open (including candles not closed yet)
+        are never stored, so they are always requested.
+        """
+        return [
+            chunk
+            for trading_pair, interval in self._feeds
+            for chunk in self.chunks(trading_pair, interval)
+            if not self._chunk_path(chunk).exists()
+        ]
+
+    async def download(self) -> Dict[Tuple[str, str], CandlesDownloadResult]:
+        """
+        Downloads the missing chunks of all the series and merges them.
+
+        :return: the merged file, number of candles and missing candles ranges (in milliseconds) of each series
+        """
+        pending_chunks = self.pending_chunks()
+        self.logger().info(f"Downloading {len(pending_chunks)} chunks of {self._connector} candles "
+                           f"({len(self._feeds)} series)...")
+        queue: asyncio.Queue = asyncio.Queue()
+        for chunk in pending_chunks:
+            queue.put_nowait(chunk)
+        open_chunks: Dict[CandlesChunk, np.ndarray] = {}
+        workers = [asyncio.ensure_future(self._download_chunks(queue, open_chunks))
+                   for _ in range(min(self._max_concurrent_requests, len(pending_chunks)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        results = {}
+        for trading_pair, interval in self._feeds:
+            results[(trading_pair, interval)] = self._merge_series(trading_pair, interval, open_chunks)
+        return results
+
+    async def _download_chunks(self, queue: asyncio.Queue, open_chunks: Dict[CandlesChunk, np.ndarray]):
+        while not queue.empty():
+            chunk = queue.get_nowait()
+            candles = await self._fetch_chunk(chunk)
+            if chunk.end_time_ms > self._time() * 1000:
+                open_chunks[chunk] = candles
+            elif len(candles) == 0:
+                # Empty chunks are not stored, so they are requested again in the next download
+                self.logger().warning(f"No {chunk.interval} candles of {chunk.trading_pair} received from "
+                                      f"{chunk.start_time_ms} to {chunk.end_time_ms}.")
+                open_chunks[chunk] = candles
+            else:
+                self._write_chunk(chunk, candles)
+
+    async def _fetch_chunk(self, chunk: CandlesChunk) -> np.ndarray:
+        feed = self._feeds[(chunk.trading_pair, chunk.interval)]
+        for attempt in range(1, MAX_REQUEST_RETRIES + 1):
+            try:
+                candles = await feed.fetch_candles_range(chunk.start_time_ms, chunk.end_time_ms - 1)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if attempt == MAX_REQUEST_RETRIES:
+                    raise
+                self.logger().warning(
+                    f"Error requesting the {chunk.interval} candles of {chunk.trading_pair} from "
+                    f"{chunk.start_time_ms}. Retrying in {attempt} seconds...", exc_info=True)
+                await self._sleep(attempt)
+        return self._chunk_candles(chunk, candles)
+
+    def _chunk_candles(self, chunk: CandlesChunk, candles: np.ndarray) -> np.ndarray:
+        """
+        Returns the candles opened in the chunk, after checking they have the `CandlesBase` columns and the timestamps
+        in milliseconds.
+        """
+        candles = np.array(candles, dtype=float)
+        if len(candles) == 0:
+            return candles.reshape(-1, len(CandlesBase.columns))
+        if candles.ndim != 2 or candles.shape[1] != len(CandlesBase.columns):
+            raise ValueError(f"The {self._connector} candles have the shape {candles.shape}, expected "
+                             f"{len(CandlesBase.columns)} columns ({', '.join(CandlesBase.columns)}).")
+        in_chunk = (candles[:, 0] >= chunk.start_time_ms) & (candles[:, 0] < chunk.end_time_ms)
+        if not in_chunk.any():
+            raise ValueError(f"None of the {len(candles)} {self._connector} candles received is in the requested "
+                             f"range ({chunk.start_time_ms} to {chunk.end_time_ms}). The timestamps must be in "
+                             f"milliseconds.")
+        return candles[in_chunk]
+
+    def _chunk_path(self, chunk: CandlesChunk) -> Path:
+        return self.chunks_dir(chunk.trading_pair, chunk.interval) / f"{chunk.start_time_ms}.csv"
+
+    def _write_chunk(self, chunk: CandlesChunk, candles: np.ndarray):
+        # Chunks are written atomically, so that the chunk files found when resuming are always complete
+        chunk_path = self._chunk_path(chunk)
+        chunk_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = chunk_path.with_suffix(".tmp")
+        pd.DataFrame(candles, columns=CandlesBase.columns).to_csv(temp_path, index=False)
+        os.replace(temp_path, chunk_path)
+
+    def _merge_series(self,
+                      trading_pair: str,
+                      interval: str,
+                      open_chunks: Dict[CandlesChunk, np.ndarray]) -> CandlesDownloadResult:
+        frames = []
+        for chunk in self.chunks(trading_pair, interval):
+            if chunk in open_chunks:
+                frames.append(pd.DataFrame(open_chunks[chunk], columns=CandlesBase.columns))
+            elif self._chunk_path(chunk).exists():
+                frames.append(pd.read_csv(self._chunk_path(chunk)))
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=CandlesBase.columns)
+        df = df[(df["timestamp"] >= self._start_time_ms) & (df["timestamp"] <= self._end_time_ms)]
+        df = df.drop_duplicates(subset="timestamp").sort_values(by="timestamp")
+
+        file_path = self.file_path(trading_pair, interval)
+        temp_path = file_path.with_suffix(".tmp")
+        df.to_csv(temp_path, index=False)
+        os.replace(temp_path, file_path)
+
+        gaps = self._find_gaps(df["timestamp"].to_numpy(dtype=float), interval)
+        if len(gaps) > 0:
+            self.logger().warning(f"{len(gaps)} gaps found in the {interval} {trading_pair} candles. The exchange may "
+                                  f"not have candles for those periods.")
+        return CandlesDownloadResult(file_path=file_path, records=len(df), gaps=gaps)
+
+    @staticmethod
+    def _find_gaps(timestamps: np.ndarray, interval: str) -> List[Tuple[int, int]]:
+        """
+        Returns the ranges without candles between the first and the last candle, as tuples of the timestamps of the
+        candles before and after the gap.
+        """
+        if interval in VARIABLE_DURATION_INTERVALS or len(timestamps) < 2:
+            return []
+        interval_ms = CandlesBase.interval_to_seconds[interval] * 1000
+        gap_indexes = np.nonzero(np.diff(timestamps) > interval_ms)[0]
+        return [(int(timestamps[i]), int(timestamps[i + 1])) for i in gap_indexes]
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
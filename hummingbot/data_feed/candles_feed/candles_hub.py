@@ -0,0 +1,508 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
+from hummingbot.logger import HummingbotLogger
+
+BASE_INTERVAL = "1m"
+DERIVED_CANDLES_REFRESH_INTERVAL = 5.0
+# Time the changes of the streams of an open connection are collected before sending them in a single message, so the
+# subscription messages are below the messages rate limit of the exchanges (5 per second in Binance)
+SUBSCRIPTIONS_UPDATE_DELAY = 0.5
+
+# Columns aggregated by sum when building a candle from the base interval candles
+SUM_COLUMNS = slice(5, 10)
+
+
+class CandlesView:
+    """
+    Read only candles series shared by all the consumers subscribed to the same trading pair and interval of a
+    candles hub. It keeps the largest history requested by its consumers.
+    """
+
+    def __init__(self, connector: str, trading_pair: str, interval: str, max_records: int):
+        self._connector = connector
+        self._trading_pair = trading_pair
+        self._interval = interval
+        self._max_records = max_records
+
+    @property
+    def columns(self) -> List[str]:
+        return CandlesBase.columns
+
+    @property
+    def name(self) -> str:
+        return f"{self._connector}_{self._trading_pair}"
+
+    @property
+    def connector(self) -> str:
+        return self._connector
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def interval(self) -> str:
+        return self._interval
+
+    @property
+    def max_records(self) -> int:
+        return self._max_records
+
+    @property
+    def is_ready(self) -> bool:
+        return len(self._rows()) >= self._max_records
+
+    def set_max_records(self, max_records: int):
+        self._max_records = max_records
+
+    @property
+    def last_candle(self) -> Optional[List[float]]:
+        rows = self._rows()
+        return [float(value) for value in rows[-1]] if len(rows) > 0 else None
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        rows = list(self._rows())[-self._max_records:]
+        return pd.DataFrame(rows, columns=self.columns, dtype=float)
+
+    def _rows(self) -> Deque:
+        raise NotImplementedError
+
+
+class StreamCandlesView(CandlesView):
+    """
+    View of a candles series streamed by the exchange.
+    """
+
+    def __init__(self, feed: CandlesBase, connector: str, max_records: int):
+        super().__init__(connector=connector, trading_pair=feed.trading_pair, interval=feed.interval,
+                         max_records=max_records)
+        self._feed = feed
+
+    def _rows(self) -> Deque:
+        return self._feed._candles
+
+
+class DerivedCandlesView(CandlesView):
+    """
+    View of a candles series resampled locally from the base interval candles of the trading pair. The history
+    available when subscribing is requested once to the exchange, and the candles of the following intervals are
+    aggregated from the base interval stream.
+    """
+
+    def __init__(self, base_feed: CandlesBase, connector: str, interval: str, max_records: int):
+        super().__init__(connector=connector, trading_pair=base_feed.trading_pair, interval=interval,
+                         max_records=max_records)
+        self._base_feed = base_feed
+        self._interval_ms = CandlesBase.interval_to_seconds[interval] * 1000
+        self._candles: Deque = deque(maxlen=max_records)
+
+    def set_history(self, candles: np.ndarray):
+        """
+        Sets the candles received from the exchange before the candles aggregated locally.
+        """
+        aggregated_candles = [candle for candle in self._candles if len(candles) == 0 or candle[0] > candles[-1][0]]
+        self._candles.clear()
+        self._candles.extend(candles)
+        self._candles.extend(aggregated_candles)
+
+    @property
+    def base_feed(self) -> CandlesBase:
+        return self._base_feed
+
+    def set_max_records(self, max_records: int):
+        super().set_max_records(max_records)
+        self._candles = deque(self._candles, maxlen=max_records)
+
+    def refresh(self):
+        """
+        Updates the candles with the base interval candles received since the last update. The candle of an interval
+        is only aggregated if all its base interval candles are available; otherwise the candle sent by the exchange
+        is kept.
+        """
+        base_candles = self._base_feed._candles
+        if len(base_candles) == 0:
+            return
+        first_base_timestamp = float(base_candles[0][0])
+        start_timestamp = float(self._candles[-1][0]) if len(self._candles) > 0 else float(base_candles[-1][0])
+        start_timestamp -= start_timestamp % self._interval_ms
+
+        recent_candles = []
+        for base_candle in reversed(base_candles):
+            if float(base_candle[0]) < start_timestamp:
+                break
+            recent_candles.append(base_candle)
+        buckets: Dict[float, List[np.ndarray]] = {}
+        for base_candle in reversed(recent_candles):
+            timestamp = float(base_candle[0])
+            buckets.setdefault(timestamp - timestamp % self._interval_ms, []).append(base_candle)
+
+        for bucket_timestamp in sorted(buckets):
+            if bucket_timestamp < first_base_timestamp:
+                continue
+            candle = self._aggregate(bucket_timestamp, buckets[bucket_timestamp])
+            if len(self._candles) > 0 and float(self._candles[-1][0]) == bucket_timestamp:
+                self._candles.pop()
+            self._candles.append(candle)
+
+    @staticmethod
+    def _aggregate(timestamp: float, base_candles: List[np.ndarray]) -> np.ndarray:
+        values = np.array(base_candles, dtype=float)
+        return np.concatenate((
+            [timestamp, values[0, 1], values[:, 2].max(), values[:, 3].min(), values[-1, 4]],
+            values[:, SUM_COLUMNS].sum(axis=0),
+        ))
+
+    def _rows(self) -> Deque:
+        self.refresh()
+        return self._candles
+
+
+class MultiplexedCandlesConnection:
+    """
+    Websocket connection of a candles hub streaming several candles series.
+    """
+
+    def __init__(self):
+        self.streams: Dict[str, CandlesBase] = {}
+        self.ws: Optional[WSAssistant] = None
+        self.task: Optional[asyncio.Task] = None
+        # The streams to subscribe and unsubscribe in the next update of the open connection (dicts keep the order)
+        self.pending_subscriptions: Dict[str, None] = {}
+        self.pending_unsubscriptions: Dict[str, None] = {}
+        self.update_task: Optional[asyncio.Task] = None
+
+
+class CandlesHub:
+    """
+    Single source of candles for all the consumers of a connector (strategies, controllers, the MQTT bridge).
+
+    All the subscriptions of the connector are streamed through as few websocket connections as the exchange allows,
+    the intervals that are a multiple of the base interval (1m) are resampled locally from the base interval stream of
+    the trading pair instead of being streamed again, and the consumers of the same series share a read only view.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _hubs: Dict[str, "CandlesHub"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls, connector: str) -> "CandlesHub":
+        if connector not in cls._hubs:
+            cls._hubs[connector] = cls(connector=connector)
+        return cls._hubs[connector]
+
+    def __init__(self, connector: str):
+        self._connector = connector
+        self._feeds: Dict[Tuple[str, str], CandlesBase] = {}
+        self._views: Dict[Tuple[str, str], CandlesView] = {}
+        self._subscriptions_count: Dict[Tuple[str, str], int] = {}
+        self._connections: List[MultiplexedCandlesConnection] = []
+        self._history_tasks: List[asyncio.Task] = []
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._started = False
+
+    @property
+    def connector(self) -> str:
+        return self._connector
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    @property
+    def streams(self) -> List[Tuple[str, str]]:
+        """
+        The trading pairs and intervals streamed from the exchange.
+        """
+        return list(self._feeds)
+
+    @property
+    def connections_count(self) -> int:
+        return len(self._connections)
+
+    @property
+    def has_subscriptions(self) -> bool:
+        return len(self._subscriptions_count) > 0
+
+    def subscribe(self, trading_pair: str, interval: str = BASE_INTERVAL, max_records: int = 150) -> CandlesView:
+        """
+        Returns the view of the candles series, creating it if this is its first consumer.
+        :param trading_pair: the trading pair of the candles
+        :param interval: the candles interval
+        :param max_records: the number of candles the consumer needs
+        """
+        key = (trading_pair, interval)
+        self._subscriptions_count[key] = self._subscriptions_count.get(key, 0) + 1
+        view = self._views.get(key)
+
+        if self._is_derived(interval):
+            base_feed = self._get_or_create_feed(
+                trading_pair, BASE_INTERVAL,
+                max_records=2 * CandlesBase.interval_to_seconds[interval] // CandlesBase.interval_to_seconds[BASE_INTERVAL])
+            if view is None:
+                view = DerivedCandlesView(base_feed=base_feed, connector=self._connector, interval=interval,
+                                          max_records=max_records)
+                self._views[key] = view
+                self._load_history_if_started(view)
+            elif max_records > view.max_records:
+                view.set_max_records(max_records)
+                self._load_history_if_started(view)
+        else:
+            feed = self._get_or_create_feed(trading_pair, interval, max_records=max_records)
+            if view is None:
+                view = StreamCandlesView(feed=feed, connector=self._connector, max_records=max_records)
+                self._views[key] = view
+            elif max_records > view.max_records:
+                view.set_max_records(max_records)
+        return view
+
+    def unsubscribe(self, view: CandlesView):
+        """
+        Releases a view returned by `subscribe`. The streams only used by views without consumers are closed.
+        """
+        key = (view.trading_pair, view.interval)
+        if key not in self._subscriptions_count:
+            return
+        self._subscriptions_count[key] -= 1
+        if self._subscriptions_count[key] > 0:
+            return
+        del self._subscriptions_count[key]
+        del self._views[key]
+
+        used_feeds = {(view.trading_pair, BASE_INTERVAL if self._is_derived(view.interval) else view.interval)
+                      for view in self._views.values()}
+        unused_feeds = [feed_key for feed_key in self._feeds if feed_key not in used_feeds]
+        for feed_key in unused_feeds:
+            feed = self._feeds.pop(feed_key)
+            if self._started:
+                if feed.max_streams_per_connection == 1:
+                    safe_ensure_future(feed.stop_network())
+                else:
+                    self._remove_multiplexed_stream(feed)
+
+    async def start(self):
+        if self._started:
+            return
+        self._started = True
+        for feed in self._feeds.values():
+            if feed.max_streams_per_connection == 1:
+                await feed.start_network()
+            else:
+                self._add_multiplexed_stream(feed)
+        for view in self._views.values():
+            self._load_history_if_started(view)
+        self._refresh_task = safe_ensure_future(self._refresh_derived_views_loop())
+
+    async def stop(self):
+        self._started = False
+        for connection in self._connections:
+            self._cancel_connection(connection)
+        for task in self._history_tasks:
+            task.cancel()
+        self._connections = []
+        self._history_tasks = []
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        for feed in self._feeds.values():
+            if feed.max_streams_per_connection == 1:
+                await feed.stop_network()
+
+    def _is_derived(self, interval: str) -> bool:
+        seconds = CandlesBase.interval_to_seconds.get(interval)
+        base_seconds = CandlesBase.interval_to_seconds[BASE_INTERVAL]
+        # Only the intervals aligned to the start of the day can be resampled (not the weekly and monthly ones)
+        return (seconds is not None
+                and seconds > base_seconds
+                and seconds % base_seconds == 0
+                and CandlesBase.interval_to_seconds["1d"] % seconds == 0)
+
+    def _get_or_create_feed(self, trading_pair: str, interval: str, max_records: int) -> CandlesBase:
+        key = (trading_pair, interval)
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = CandlesFactory.get_candle(CandlesConfig(connector=self._connector,
+                                                           trading_pair=trading_pair,
+                                                           interval=interval,
+                                                           max_records=max_records))
+            self._feeds[key] = feed
+            if self._started:
+                if feed.max_streams_per_connection == 1:
+                    safe_ensure_future(feed.start_network())
+                else:
+                    self._add_multiplexed_stream(feed)
+        elif max_records > feed._candles.maxlen:
+            # The history is requested again with the new size when the next candle is received
+            feed._candles = deque(maxlen=max_records)
+        return feed
+
+    def _load_history_if_started(self, view: CandlesView):
+        if self._started and isinstance(view, DerivedCandlesView):
+            self._history_tasks.append(safe_ensure_future(self._load_history(view)))
+
+    async def _load_history(self, view: DerivedCandlesView):
+        if view.interval not in view.base_feed.intervals:
+            self.logger().info(f"The {self._connector} candles history is not available for the {view.interval} "
+                               f"interval. The {view.trading_pair} candles will be built from the live candles.")
+            return
+        history_feed = CandlesFactory.get_candle(CandlesConfig(connector=self._connector,
+                                                               trading_pair=view.trading_pair,
+                                                               interval=view.interval,
+                                                               max_records=view.max_records))
+        while True:
+            try:
+                candles = await history_feed.fetch_candles(limit=view.max_records)
+                view.set_history(candles)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error requesting the {view.interval} candles of {view.trading_pair}. "
+                    f"Retrying in 1 seconds...")
+                await history_feed._sleep(1.0)
+
+    def _add_multiplexed_stream(self, feed: CandlesBase):
+        """
+        Adds the stream of the feed to a connection with room for it, subscribing to it through the connection if it
+        is already open. A new connection is only opened when all the others are full.
+        """
+        connection = next((connection for connection in self._connections
+                           if len(connection.streams) < feed.max_streams_per_connection), None)
+        if connection is None:
+            connection = MultiplexedCandlesConnection()
+            connection.streams[feed.stream_name] = feed
+            connection.task = safe_ensure_future(self._listen_multiplexed_streams(connection))
+            self._connections.append(connection)
+        else:
+            connection.streams[feed.stream_name] = feed
+            if connection.ws is not None:
+                if feed.stream_name in connection.pending_unsubscriptions:
+                    del connection.pending_unsubscriptions[feed.stream_name]
+                else:
+                    connection.pending_subscriptions[feed.stream_name] = None
+                self._schedule_connection_update(connection)
+
+    def _remove_multiplexed_stream(self, feed: CandlesBase):
+        """
+        Unsubscribes from the stream of the feed in its connection. The connections left without streams are closed.
+        """
+        connection = next((connection for connection in self._connections if feed.stream_name in connection.streams),
+                          None)
+        if connection is None:
+            return
+        del connection.streams[feed.stream_name]
+        if len(connection.streams) == 0:
+            self._cancel_connection(connection)
+            self._connections.remove(connection)
+        elif connection.ws is not None:
+            if feed.stream_name in connection.pending_subscriptions:
+                del connection.pending_subscriptions[feed.stream_name]
+            else:
+                connection.pending_unsubscriptions[feed.stream_name] = None
+            self._schedule_connection_update(connection)
+
+    @staticmethod
+    def _cancel_connection(connection: MultiplexedCandlesConnection):
+        connection.task.cancel()
+        if connection.update_task is not None:
+            connection.update_task.cancel()
+            connection.update_task = None
+
+    def _schedule_connection_update(self, connection: MultiplexedCandlesConnection):
+        if connection.update_task is None:
+            connection.update_task = safe_ensure_future(self._update_connection_streams(connection))
+
+    async def _update_connection_streams(self, connection: MultiplexedCandlesConnection):
+        """
+        Sends the streams subscribed and unsubscribed since the last update of the connection, each group in a single
+        message.
+        """
+        try:
+            await asyncio.sleep(SUBSCRIPTIONS_UPDATE_DELAY)
+            connection.update_task = None
+            subscriptions = list(connection.pending_subscriptions)
+            unsubscriptions = list(connection.pending_unsubscriptions)
+            connection.pending_subscriptions.clear()
+            connection.pending_unsubscriptions.clear()
+            if connection.ws is None or len(connection.streams) == 0:
+                # The streams of the connection are subscribed when it is reopened
+                return
+            connection_feed = next(iter(connection.streams.values()))
+            if len(unsubscriptions) > 0:
+                payload = connection_feed.multiplexed_unsubscription_payload(unsubscriptions)
+                await connection.ws.send(WSJSONRequest(payload=payload))
+            if len(subscriptions) > 0:
+                payload = connection_feed.multiplexed_subscription_payload(subscriptions)
+                await connection.ws.send(WSJSONRequest(payload=payload))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The streams of the connection are subscribed again when it is reopened
+            self.logger().warning(f"Error updating the subscriptions of a {self._connector} candles connection.",
+                                  exc_info=True)
+
+    async def _listen_multiplexed_streams(self, connection: MultiplexedCandlesConnection):
+        """
+        Subscribes to the streams of several candles instances through a single websocket connection, and routes
+        each message to the instance of its stream. The streams added or removed while the connection is open are
+        subscribed or unsubscribed through it by the hub.
+        """
+        while True:
+            connection_feed = next(iter(connection.streams.values()))
+            try:
+                ws = await connection_feed._connected_websocket_assistant()
+                # The connection is published before taking the streams to subscribe, so that the streams added later
+                # are subscribed by the hub
+                connection.ws = ws
+                connection.pending_subscriptions.clear()
+                connection.pending_unsubscriptions.clear()
+                payload = connection_feed.multiplexed_subscription_payload(list(connection.streams))
+                await ws.send(WSJSONRequest(payload=payload))
+                self.logger().info(f"Subscribed to {len(connection.streams)} {self._connector} candles streams...")
+                async for ws_response in ws.iter_messages():
+                    data = ws_response.data
+                    if data is None:
+                        continue
+                    feed = connection.streams.get(connection_feed.multiplexed_stream_name(data))
+                    if feed is not None:
+                        feed.process_candle_message(data)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await connection_feed._sleep(1.0)
+            finally:
+                ws, connection.ws = connection.ws, None
+                ws and await ws.disconnect()
+                # Only the candles of the streams of this connection can have gaps
+                for feed in connection.streams.values():
+                    feed._candles.clear()
+
+    async def _refresh_derived_views_loop(self):
+        # The views are also updated when read; this keeps the series continuous when they are read infrequently
+        while True:
+            for view in list(self._views.values()):
+                if isinstance(view, DerivedCandlesView):
+                    view.refresh()
+            await asyncio.sleep(DERIVED_CANDLES_REFRESH_INTERVAL)
@@ -115,6 +115,13 @@ class GateioPerpetualCandles(CandlesBase):
                                    taker_buy_quote_volume])
         return np.array(new_hb_candles).astype(float)
 
+    async def fetch_candles_range(self, start_time_ms: int, end_time_ms: int) -> np.ndarray:
+        if self.quanto_multiplier is None:
+            # The volumes are in contracts, and the network (that fetches the multiplier) might not be started
+            await self.get_exchange_trading_pair_quanto_multiplier()
+        # The exchange expects the timestamps in seconds
+        return await self.fetch_candles(start_time=start_time_ms // 1000, end_time=end_time_ms // 1000)
+
     async def fill_historical_candles(self):
         max_request_needed = (self._candles.maxlen // 1000) + 1
         requests_executed = 0
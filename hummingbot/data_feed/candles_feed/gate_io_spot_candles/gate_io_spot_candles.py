@@ -67,7 +67,9 @@ class GateioSpotCandles(CandlesBase):
                             end_time: Optional[int] = None,
                             limit: Optional[int] = 500):
         rest_assistant = await self._api_factory.get_rest_assistant()
-        params = {"currency_pair": self._ex_trading_pair, "interval": self.interval, "limit": limit}
+        params = {"currency_pair": self._ex_trading_pair, "interval": self.interval}
+        if limit:
+            params["limit"] = limit
         if start_time:
             params["from"] = start_time
         if end_time:
@@ -93,6 +95,14 @@ class GateioSpotCandles(CandlesBase):
                                    taker_buy_quote_volume])
         return np.array(new_hb_candles).astype(float)
 
+    @property
+    def max_records_per_request(self) -> int:
+        return CONSTANTS.MAX_RECORDS_PER_REQUEST
+
+    async def fetch_candles_range(self, start_time_ms: int, end_time_ms: int) -> np.ndarray:
+        # The exchange expects the timestamps in seconds
+        return await self.fetch_candles(start_time=start_time_ms // 1000, end_time=end_time_ms // 1000, limit=None)
+
     async def fill_historical_candles(self):
         max_request_needed = (self._candles.maxlen // 1000) + 1
         requests_executed = 0
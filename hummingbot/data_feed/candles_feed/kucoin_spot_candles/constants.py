@@ -7,6 +7,7 @@ from hummingbot.core.api_throttler.data_types import RateLimit
 REST_URL = "https://api.kucoin.com"
 HEALTH_CHECK_ENDPOINT = "/api/v1/timestamp"
 CANDLES_ENDPOINT = "/api/v1/market/candles"
+MAX_RECORDS_PER_REQUEST = 1500
 
 PUBLIC_WS_DATA_PATH_URL = "/api/v1/bullet-public"
 
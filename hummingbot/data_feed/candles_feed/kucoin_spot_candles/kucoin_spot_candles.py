@@ -92,6 +92,20 @@ class KucoinSpotCandles(CandlesBase):
         arr = [[row[0], row[1], row[3], row[4], row[2], row[5], row[6]] for row in candles['data']]
         return np.array(arr).astype(float)
 
+    @property
+    def max_records_per_request(self) -> int:
+        return CONSTANTS.MAX_RECORDS_PER_REQUEST
+
+    async def fetch_candles_range(self, start_time_ms: int, end_time_ms: int) -> np.ndarray:
+        # The exchange expects the timestamps in seconds
+        candles = await self.fetch_candles(start_time=start_time_ms // 1000, end_time=end_time_ms // 1000)
+        # The candles have the timestamps in seconds and no trades columns, they are returned like the other connectors
+        candles = candles.reshape(-1, 7)
+        hb_candles = np.zeros((len(candles), len(self.columns)))
+        hb_candles[:, :7] = candles
+        hb_candles[:, 0] *= 1000
+        return hb_candles
+
     async def fill_historical_candles(self):
         max_request_needed = (self._candles.maxlen // 1500) + 1
         requests_executed = 0
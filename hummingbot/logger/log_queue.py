@@ -0,0 +1,284 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_LOG_QUEUE_MAX_SIZE = 10000
+DEFAULT_DEBUG_SAMPLING_THRESHOLD_PCT = 50
+DEFAULT_DEBUG_SAMPLING_RATE = 10
+DROPPED_RECORDS_REPORT_INTERVAL = 60.0
+
+# Record attributes that require the caller information of the log calls
+CALLER_INFO_FORMAT_FIELDS = ("%(pathname)", "%(filename)", "%(module)", "%(lineno)", "%(funcName)")
+
+
+class LogQueue:
+    """
+    Bounded queue between the loggers of the client and the thread formatting and writing their records, so that log
+    calls in the event loop never wait for a disk, stdout or network write.
+
+    When the queue is filled above the sampling threshold, only one of every `debug_sampling_rate` DEBUG records is
+    kept. When it is full, new records are dropped. The dropped records are counted and reported periodically by the
+    listener thread.
+    """
+    _shared_instance: Optional["LogQueue"] = None
+
+    @classmethod
+    def shared_instance(cls) -> Optional["LogQueue"]:
+        """
+        Returns the log queue installed by `init_logging`, or None if the logs are written synchronously
+        """
+        return cls._shared_instance
+
+    @classmethod
+    def set_shared_instance(cls, log_queue: Optional["LogQueue"]):
+        cls._shared_instance = log_queue
+
+    def __init__(self,
+                 max_size: int = DEFAULT_LOG_QUEUE_MAX_SIZE,
+                 debug_sampling_threshold_pct: float = DEFAULT_DEBUG_SAMPLING_THRESHOLD_PCT,
+                 debug_sampling_rate: int = DEFAULT_DEBUG_SAMPLING_RATE):
+        """
+        :param max_size: maximum number of records waiting to be written
+        :param debug_sampling_threshold_pct: queue usage percentage from which the DEBUG records are sampled
+        :param debug_sampling_rate: one of every `debug_sampling_rate` DEBUG records is kept while sampling
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._max_size = max_size
+        self._debug_sampling_threshold = max_size * debug_sampling_threshold_pct / 100
+        self._debug_sampling_rate = max(1, int(debug_sampling_rate))
+        self._lock = threading.Lock()
+        self._debug_records_count = 0
+        self._sampled_out_records = 0
+        self._dropped_records: Dict[str, int] = defaultdict(int)
+        self._max_queue_depth = 0
+        self._listener: Optional[LogQueueListener] = None
+
+    @property
+    def queue(self) -> queue.Queue:
+        return self._queue
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def max_queue_depth(self) -> int:
+        return self._max_queue_depth
+
+    @property
+    def sampled_out_records(self) -> int:
+        return self._sampled_out_records
+
+    @property
+    def dropped_records(self) -> Dict[str, int]:
+        """
+        Number of records dropped because the queue was full, by level name
+        """
+        with self._lock:
+            return dict(self._dropped_records)
+
+    @property
+    def started(self) -> bool:
+        return self._listener is not None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "max_size": self._max_size,
+            "sampled_out_records": self.sampled_out_records,
+            "dropped_records": self.dropped_records,
+        }
+
+    def put(self, handlers: List[logging.Handler], record: logging.LogRecord) -> bool:
+        """
+        Queues a record to be handled by the handlers in the listener thread. Never blocks.
+
+        :return: True if the record was queued, False if it was sampled out or dropped
+        """
+        queue_depth = self._queue.qsize()
+        if record.levelno <= logging.DEBUG and queue_depth >= self._debug_sampling_threshold:
+            with self._lock:
+                self._debug_records_count += 1
+                if self._debug_records_count % self._debug_sampling_rate != 0:
+                    self._sampled_out_records += 1
+                    return False
+        try:
+            self._queue.put_nowait((handlers, record))
+        except queue.Full:
+            with self._lock:
+                self._dropped_records[record.levelname] += 1
+            return False
+        if queue_depth >= self._max_queue_depth:
+            self._max_queue_depth = queue_depth + 1
+        return True
+
+    def start(self):
+        if self._listener is None:
+            self._listener = LogQueueListener(self)
+            self._listener.start()
+
+    def stop(self):
+        """
+        Stops the listener thread after all the queued records are written.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    Handler replacing all the handlers of a logger. The records are queued in the log queue with the original handlers,
+    which format and write them in the listener thread.
+    """
+
+    def __init__(self, log_queue: LogQueue, target_handlers: List[logging.Handler]):
+        super().__init__(log_queue.queue)
+        self._log_queue = log_queue
+        self._target_handlers: List[logging.Handler] = []
+        self.set_target_handlers(target_handlers)
+
+    @property
+    def target_handlers(self) -> List[logging.Handler]:
+        return self._target_handlers
+
+    def set_target_handlers(self, target_handlers: List[logging.Handler]):
+        # The list is replaced instead of modified, since the listener thread can be iterating the current one
+        self._target_handlers = list(target_handlers)
+        self.setLevel(min((handler.level for handler in target_handlers), default=logging.NOTSET))
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only the arguments are merged here, in case they are modified by the caller after logging. The formatting
+        # (including the exception traceback) is done by the target handlers.
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        self._log_queue.put(self._target_handlers, record)
+
+
+class LogQueueListener(QueueListener):
+    """
+    Thread handling the queued records with the handlers they were queued with.
+    """
+
+    def __init__(self, log_queue: LogQueue):
+        super().__init__(log_queue.queue, respect_handler_level=True)
+        self._log_queue = log_queue
+        self._reported_lost_records = 0
+        self._last_report_timestamp = 0.0
+
+    def handle(self, item: Tuple[List[logging.Handler], logging.LogRecord]):
+        handlers, record = item
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        self._report_lost_records(handlers)
+
+    def enqueue_sentinel(self):
+        # Waits for the listener to make room, instead of failing when the queue is full
+        self.queue.put(self._sentinel)
+
+    def _report_lost_records(self, handlers: List[logging.Handler]):
+        now = time.time()
+        if now - self._last_report_timestamp < DROPPED_RECORDS_REPORT_INTERVAL:
+            return
+        lost_records = sum(self._log_queue.dropped_records.values()) + self._log_queue.sampled_out_records
+        if lost_records > self._reported_lost_records:
+            metrics = self._log_queue.metrics()
+            record = logging.LogRecord(
+                name=__name__,
+                level=logging.WARNING,
+                pathname=__file__,
+                lineno=0,
+                msg=f"{lost_records - self._reported_lost_records} log records were not written to avoid blocking "
+                    f"the client (log queue metrics: {metrics}).",
+                args=None,
+                exc_info=None)
+            for handler in handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            self._reported_lost_records = lost_records
+        self._last_report_timestamp = now
+
+
+_original_srcfile = logging._srcfile
+
+
+def install_log_queue(config_dict: Dict[str, Any], queue_config: Dict[str, Any]) -> LogQueue:
+    """
+    Moves the handlers of the loggers configured in the logging configuration to a new log queue, and starts its
+    listener thread.
+
+    :param config_dict: the logging configuration already applied with `logging.config.dictConfig`
+    :param queue_config: the `queue` section of the logging configuration
+    """
+    log_queue = LogQueue(
+        max_size=int(queue_config.get("max_size", DEFAULT_LOG_QUEUE_MAX_SIZE)),
+        debug_sampling_threshold_pct=float(queue_config.get("debug_sampling_threshold_pct",
+                                                            DEFAULT_DEBUG_SAMPLING_THRESHOLD_PCT)),
+        debug_sampling_rate=int(queue_config.get("debug_sampling_rate", DEFAULT_DEBUG_SAMPLING_RATE)),
+    )
+    loggers = [logging.getLogger(name) for name in config_dict.get("loggers", {})]
+    if "root" in config_dict:
+        loggers.append(logging.getLogger())
+    for logger in loggers:
+        handlers = list(logger.handlers)
+        if len(handlers) == 0:
+            continue
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(QueueLogHandler(log_queue, handlers))
+
+    # Finding the caller of each log call walks the stack frames. It is skipped when no formatter uses it.
+    formats = [formatter.get("format", "") for formatter in config_dict.get("formatters", {}).values()]
+    if not any(field in log_format for log_format in formats for field in CALLER_INFO_FORMAT_FIELDS):
+        logging._srcfile = None
+
+    log_queue.start()
+    LogQueue.set_shared_instance(log_queue)
+    return log_queue
+
+
+def uninstall_log_queue():
+    """
+    Writes all the queued records and stops the listener thread of the current log queue.
+    """
+    log_queue = LogQueue.shared_instance()
+    if log_queue is not None:
+        log_queue.stop()
+        LogQueue.set_shared_instance(None)
+    logging._srcfile = _original_srcfile
+
+
+def add_log_handler(logger: logging.Logger, handler: logging.Handler):
+    """
+    Adds a handler to a logger, behind its log queue handler if the logger has one.
+    """
+    queue_handler = _queue_log_handler(logger)
+    if queue_handler is None:
+        logger.addHandler(handler)
+    elif handler not in queue_handler.target_handlers:
+        queue_handler.set_target_handlers(queue_handler.target_handlers + [handler])
+
+
+def remove_log_handler(logger: logging.Logger, handler: logging.Handler):
+    queue_handler = _queue_log_handler(logger)
+    if queue_handler is not None and handler in queue_handler.target_handlers:
+        queue_handler.set_target_handlers([h for h in queue_handler.target_handlers if h is not handler])
+    logger.removeHandler(handler)
+
+
+def _queue_log_handler(logger: logging.Logger) -> Optional[QueueLogHandler]:
+    return next((handler for handler in logger.handlers if isinstance(handler, QueueLogHandler)), None)
+
+
+atexit.register(uninstall_log_queue)
@@ -1,14 +1,23 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
 
 import numpy
 import pandas as pd
-from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text
+from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text, func
 from sqlalchemy.orm import Session, relationship
 
 from hummingbot.core.event.events import PositionAction
 from hummingbot.model import HummingbotBase
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.order import Order
+
+
+class MarketTradesSummary(NamedTuple):
+    market: str
+    symbol: str
+    num_trades: int
+    first_timestamp: int
+    last_timestamp: int
 
 
 class TradeFill(HummingbotBase):
@@ -89,45 +98,105 @@ class TradeFill(HummingbotBase):
                                              .all())
         return trades
 
+    @staticmethod
+    def get_markets_summary(sql_session: Session, filters: List[Any]) -> List[MarketTradesSummary]:
+        """
+        Aggregates the trades matching the filters by market and trading pair in the database, without loading them.
+        """
+        rows = (sql_session
+                .query(TradeFill.market,
+                       TradeFill.symbol,
+                       func.count(),
+                       func.min(TradeFill.timestamp),
+                       func.max(TradeFill.timestamp))
+                .filter(*filters)
+                .group_by(TradeFill.market, TradeFill.symbol)
+                .order_by(TradeFill.market, TradeFill.symbol)
+                .all())
+        return [MarketTradesSummary(*row) for row in rows]
+
+    @classmethod
+    def pandas_columns(cls) -> List[str]:
+        return ["Id",
+                "Timestamp",
+                "Exchange",
+                "Market",
+                "Order_type",
+                "Side",
+                "Price",
+                "Amount",
+                "Leverage",
+                "Position",
+                "Age"]
+
     @classmethod
     def to_pandas(cls, trades: List):
-        columns: List[str] = ["Id",
-                              "Timestamp",
-                              "Exchange",
-                              "Market",
-                              "Order_type",
-                              "Side",
-                              "Price",
-                              "Amount",
-                              "Leverage",
-                              "Position",
-                              "Age"]
         data = []
         for trade in trades:
-
-            if trade.order is None:  # order creation update has not arrived yet
-                age = pd.Timestamp(0, unit='s').strftime('%H:%M:%S')
-            else:
-                age = pd.Timestamp(int(trade.timestamp / 1e3 - trade.order.creation_timestamp / 1e3),
-                                   unit='s').strftime('%H:%M:%S')
-            data.append([
-                trade.exchange_trade_id,
-                datetime.fromtimestamp(int(trade.timestamp / 1e3)).strftime("%Y-%m-%d %H:%M:%S"),
-                trade.market,
-                trade.symbol,
-                trade.order_type.lower(),
-                trade.trade_type.lower(),
-                trade.price,
-                trade.amount,
-                trade.leverage,
-                trade.position,
-                age,
-            ])
-        df = pd.DataFrame(data=data, columns=columns)
+            # order creation update has not arrived yet when there is no order
+            order_creation_timestamp = trade.order.creation_timestamp if trade.order is not None else None
+            data.append(cls._pandas_row(trade, order_creation_timestamp))
+        df = pd.DataFrame(data=data, columns=cls.pandas_columns())
         df.set_index('Id', inplace=True)
 
         return df
 
+    @classmethod
+    def iter_pandas_chunks(cls,
+                           sql_session: Session,
+                           filters: List[Any],
+                           chunk_size: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Streams the trades matching the filters from the most recent as data frames with the columns of `to_pandas`.
+        Only the columns required are queried, with the creation timestamp of the orders joined in the same query,
+        and the rows are fetched in chunks instead of loading all the trades.
+        """
+        query = (sql_session
+                 .query(TradeFill.exchange_trade_id,
+                        TradeFill.timestamp,
+                        TradeFill.market,
+                        TradeFill.symbol,
+                        TradeFill.order_type,
+                        TradeFill.trade_type,
+                        TradeFill.price,
+                        TradeFill.amount,
+                        TradeFill.leverage,
+                        TradeFill.position,
+                        Order.creation_timestamp)
+                 .outerjoin(Order, TradeFill.order_id == Order.id)
+                 .filter(*filters)
+                 .order_by(TradeFill.timestamp.desc())
+                 .yield_per(chunk_size))
+        data = []
+        for row in query:
+            data.append(cls._pandas_row(row, row.creation_timestamp))
+            if len(data) == chunk_size:
+                yield pd.DataFrame(data=data, columns=cls.pandas_columns()).set_index('Id')
+                data = []
+        if len(data) > 0:
+            yield pd.DataFrame(data=data, columns=cls.pandas_columns()).set_index('Id')
+
+    @staticmethod
+    def _pandas_row(trade: Any, order_creation_timestamp: Optional[int]) -> List[Any]:
+        if order_creation_timestamp is None:
+            age = pd.Timestamp(0, unit='s').strftime('%H:%M:%S')
+        else:
+            age = pd.Timestamp(int(trade.timestamp / 1e3 - order_creation_timestamp / 1e3),
+                               unit='s').strftime('%H:%M:%S')
+        return [
+            trade.exchange_trade_id,
+            datetime.fromtimestamp(int(trade.timestamp / 1e3)).strftime("%Y-%m-%d %H:%M:%S"),
+            trade.market,
+            trade.symbol,
+            trade.order_type.lower(),
+            trade.trade_type.lower(),
+            trade.price,
+            trade.amount,
+            trade.leverage,
+            trade.position,
+            age,
+        ]
+
     @staticmethod
     def to_bounty_api_json(trade_fill: "TradeFill") -> Dict[str, Any]:
         return {
@@ -1,24 +1,23 @@
 import asyncio
 import traceback
 from decimal import Decimal
-from multiprocessing import Queue
 from operator import itemgetter
 from statistics import mean, median
 from typing import Any, Callable, Dict, List, Optional
 
-from hummingbot.core.event.events import (
-    BuyOrderCompletedEvent,
-    SellOrderCompletedEvent
-)
+from hummingbot.core.event.events import BuyOrderCompletedEvent, SellOrderCompletedEvent
+
+from .pmm_script_channel import PMMScriptChannel
 from .pmm_script_interface import (
     CallLog,
     CallNotify,
     OnCommand,
     OnStatus,
     OnTick,
-    PMMParameters,
+    OnTickProcessed,
     PMMMarketInfo,
-    ScriptError
+    PMMParameters,
+    ScriptError,
 )
 
 
@@ -28,9 +27,8 @@ class PMMScriptBase:
     A user defined script should derive from this base class to get all its functionality.
     """
     def __init__(self):
-        self._parent_queue: Queue = None
-        self._child_queue: Queue = None
-        self._queue_check_interval: float = 0.0
+        self._parent_queue: PMMScriptChannel = None
+        self._child_queue: PMMScriptChannel = None
         self.mid_prices: List[Decimal] = []
         self.max_mid_prices_length: int = 86400  # 60 * 60 * 24 = 1 day of prices
         self.pmm_parameters: PMMParameters = None
@@ -41,10 +39,9 @@ class PMMScriptBase:
         # all_available_balances has the same data structure as all_total_balances
         self.all_available_balances: Dict[str, Dict[str, Decimal]] = None
 
-    def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+    def assign_init(self, parent_queue: PMMScriptChannel, child_queue: PMMScriptChannel):
         self._parent_queue = parent_queue
         self._child_queue = child_queue
-        self._queue_check_interval = queue_check_interval
 
     @property
     def mid_price(self):
@@ -54,47 +51,45 @@ class PMMScriptBase:
         return self.mid_prices[-1]
 
     async def run(self):
-        asyncio.ensure_future(self.listen_to_parent())
-
-    async def listen_to_parent(self):
-        while True:
-            try:
-                if self._parent_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._parent_queue.get()
-                # print(f"child gets {str(item)}")
-                if item is None:
-                    # print("child exiting..")
-                    asyncio.get_event_loop().stop()
-                    break
-                if isinstance(item, OnTick):
-                    self.mid_prices.append(item.mid_price)
-                    if len(self.mid_prices) > self.max_mid_prices_length:
-                        self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
-                    self.pmm_parameters = item.pmm_parameters
-                    self.all_total_balances = item.all_total_balances
-                    self.all_available_balances = item.all_available_balances
+        self._parent_queue.add_reader(asyncio.get_event_loop(), self.process_parent_message)
+
+    def process_parent_message(self, item: Any):
+        try:
+            # print(f"child gets {str(item)}")
+            if item is None:
+                # print("child exiting..")
+                self._parent_queue.remove_reader()
+                asyncio.get_event_loop().stop()
+                return
+            if isinstance(item, OnTick):
+                self.mid_prices.append(item.mid_price)
+                if len(self.mid_prices) > self.max_mid_prices_length:
+                    self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
+                self.pmm_parameters = item.pmm_parameters
+                self.all_total_balances = item.all_total_balances
+                self.all_available_balances = item.all_available_balances
+                try:
                     self.on_tick()
-                elif isinstance(item, BuyOrderCompletedEvent):
-                    self.on_buy_order_completed(item)
-                elif isinstance(item, SellOrderCompletedEvent):
-                    self.on_sell_order_completed(item)
-                elif isinstance(item, OnStatus):
-                    status_msg = self.on_status()
-                    if status_msg:
-                        self.notify(f"Script status: {status_msg}")
-                elif isinstance(item, OnCommand):
-                    self.on_command(item.cmd, item.args)
-                elif isinstance(item, PMMMarketInfo):
-                    self.pmm_market_info = item
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                # Capturing traceback here and put it as part of ScriptError, which can then be reported in the parent
-                # process.
-                tb = "".join(traceback.TracebackException.from_exception(e).format())
-                self._child_queue.put(ScriptError(e, tb))
+                finally:
+                    # The client waits for the parameter changes of the tick until it receives this message
+                    self._child_queue.put(OnTickProcessed(item.sequence_number))
+            elif isinstance(item, BuyOrderCompletedEvent):
+                self.on_buy_order_completed(item)
+            elif isinstance(item, SellOrderCompletedEvent):
+                self.on_sell_order_completed(item)
+            elif isinstance(item, OnStatus):
+                status_msg = self.on_status()
+                if status_msg:
+                    self.notify(f"Script status: {status_msg}")
+            elif isinstance(item, OnCommand):
+                self.on_command(item.cmd, item.args)
+            elif isinstance(item, PMMMarketInfo):
+                self.pmm_market_info = item
+        except Exception as e:
+            # Capturing traceback here and put it as part of ScriptError, which can then be reported in the parent
+            # process.
+            tb = "".join(traceback.TracebackException.from_exception(e).format())
+            self._child_queue.put(ScriptError(e, tb))
 
     def notify(self, msg: str):
         """
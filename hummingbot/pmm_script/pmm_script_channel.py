@@ -0,0 +1,242 @@
+import asyncio
+import pickle
+import struct
+import threading
+from collections import deque
+from decimal import Decimal
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from hummingbot.pmm_script.pmm_script_interface import OnTick, OnTickProcessed, PMMParameters, StrategyParameter
+
+TICK_MESSAGE = 1
+TICK_PROCESSED_MESSAGE = 2
+PARAMETER_MESSAGE = 3
+OBJECT_MESSAGE = 4
+
+_kind_struct = struct.Struct("!B")
+_length_struct = struct.Struct("!I")
+
+
+def pmm_script_channel() -> Tuple["PMMScriptChannel", "PMMScriptChannel"]:
+    """
+    Creates a one-way channel between the client and the PMM script process.
+    :returns the receiving and the sending ends of the channel.
+    """
+    receiver_connection, sender_connection = Pipe(duplex=False)
+    return PMMScriptChannel(receiver_connection), PMMScriptChannel(sender_connection)
+
+
+def encode_value(value: Any) -> bytes:
+    if value is None:
+        return b"N"
+    if isinstance(value, bool):
+        return b"B1" if value else b"B0"
+    if isinstance(value, int):
+        return b"I" + str(value).encode()
+    if isinstance(value, Decimal):
+        return b"D" + str(value).encode()
+    return b"P" + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_value(data: bytes) -> Any:
+    value_type, value = data[:1], data[1:]
+    if value_type == b"N":
+        return None
+    if value_type == b"B":
+        return value == b"1"
+    if value_type == b"I":
+        return int(value)
+    if value_type == b"D":
+        return Decimal(value.decode())
+    return pickle.loads(value)
+
+
+def encode_message(kind: int, fields: List[bytes]) -> bytes:
+    return _kind_struct.pack(kind) + b"".join(_length_struct.pack(len(field)) + field for field in fields)
+
+
+def decode_message(data: bytes) -> Tuple[int, List[bytes]]:
+    kind = _kind_struct.unpack_from(data)[0]
+    fields = []
+    offset = _kind_struct.size
+    while offset < len(data):
+        length = _length_struct.unpack_from(data, offset)[0]
+        offset += _length_struct.size
+        fields.append(data[offset:offset + length])
+        offset += length
+    return kind, fields
+
+
+class PMMScriptChannel:
+    """
+    One end of a one-way channel between the client and the PMM script process, built on a pipe.
+
+    The receiving end is registered as a reader in the event loop, so the messages are processed as soon as they
+    arrive instead of polling a queue. Ticks and strategy parameter changes, the messages sent every tick, are encoded
+    in compact binary messages: a tick carries the mid price and only the parameters and balances that changed since
+    the previous tick, and the receiving end keeps the complete values. The other messages are pickled.
+
+    Sending blocks while the pipe is full. The end used from the event loop starts a writer thread, so a stalled
+    script never blocks the loop: the messages are sent by the thread, and a tick waiting to be sent is replaced by
+    the next one (ticks are encoded when sent, so the values skipped are still sent as changes).
+    """
+
+    def __init__(self, connection: Connection):
+        self._connection = connection
+        self._pmm_parameters: Dict[str, Any] = {}
+        self._all_total_balances: Optional[Dict[str, Dict[str, Decimal]]] = None
+        self._all_available_balances: Optional[Dict[str, Dict[str, Decimal]]] = None
+        self._reader_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_condition = threading.Condition()
+        self._pending_items: deque = deque()
+        self._writer_stopped = False
+
+    def put(self, item: Any):
+        """
+        Sends a message. The messages sent after the other end is closed are discarded.
+        """
+        if self._writer_thread is None:
+            self._send(item)
+            return
+        with self._writer_condition:
+            if isinstance(item, OnTick):
+                self._remove_pending_ticks()
+            self._pending_items.append(item)
+            self._writer_condition.notify()
+
+    def start_writer(self):
+        """
+        Sends the messages from a writer thread, so put never blocks.
+        """
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_messages, name="pmm-script-channel-writer",
+                                                   daemon=True)
+            self._writer_thread.start()
+
+    def get(self) -> Any:
+        """
+        Receives the next message, blocking until there is one. Returns None when the other end is closed.
+        """
+        try:
+            data = self._connection.recv_bytes()
+        except (EOFError, OSError):
+            return None
+        kind, fields = decode_message(data)
+        if kind == TICK_MESSAGE:
+            return self._decode_tick(fields)
+        if kind == TICK_PROCESSED_MESSAGE:
+            return OnTickProcessed(decode_value(fields[0]))
+        if kind == PARAMETER_MESSAGE:
+            parameter = StrategyParameter(fields[0].decode())
+            parameter.updated_value = decode_value(fields[1])
+            return parameter
+        return pickle.loads(fields[0])
+
+    def poll(self, timeout: float = 0.0) -> bool:
+        try:
+            return self._connection.poll(timeout)
+        except (EOFError, OSError):
+            return False
+
+    def add_reader(self, ev_loop: asyncio.AbstractEventLoop, callback: Callable[[Any], None]):
+        """
+        Calls the callback with every message received, from the event loop.
+        """
+        self._reader_loop = ev_loop
+        ev_loop.add_reader(self._connection.fileno(), self._read_messages, callback)
+
+    def remove_reader(self):
+        if self._reader_loop is not None and not self._connection.closed:
+            self._reader_loop.remove_reader(self._connection.fileno())
+        self._reader_loop = None
+
+    def close(self):
+        self.remove_reader()
+        self._stop_writer()
+        self._connection.close()
+
+    def _read_messages(self, callback: Callable[[Any], None]):
+        while self._reader_loop is not None and self.poll():
+            item = self.get()
+            if item is None:
+                self.remove_reader()
+            callback(item)
+
+    def _send(self, item: Any):
+        if isinstance(item, OnTick):
+            data = self._encode_tick(item)
+        elif isinstance(item, OnTickProcessed):
+            data = encode_message(TICK_PROCESSED_MESSAGE, [encode_value(item.sequence_number)])
+        elif isinstance(item, StrategyParameter):
+            data = encode_message(PARAMETER_MESSAGE, [item.name.encode(), encode_value(item.updated_value)])
+        else:
+            data = encode_message(OBJECT_MESSAGE, [pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)])
+        try:
+            self._connection.send_bytes(data)
+        except (BrokenPipeError, OSError):
+            pass
+
+    def _remove_pending_ticks(self):
+        pending_items = [item for item in self._pending_items if not isinstance(item, OnTick)]
+        if len(pending_items) < len(self._pending_items):
+            self._pending_items = deque(pending_items)
+
+    def _write_messages(self):
+        while True:
+            with self._writer_condition:
+                while len(self._pending_items) == 0 and not self._writer_stopped:
+                    self._writer_condition.wait()
+                if len(self._pending_items) == 0:
+                    return
+                item = self._pending_items.popleft()
+            self._send(item)
+
+    def _stop_writer(self):
+        """
+        Stops the writer thread once it sends the pending messages.
+        """
+        if self._writer_thread is not None:
+            with self._writer_condition:
+                self._writer_stopped = True
+                self._writer_condition.notify()
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def _encode_tick(self, on_tick: OnTick) -> bytes:
+        pmm_parameters = {attr: getattr(on_tick.pmm_parameters, attr)
+                          for attr in PMMParameters.__dict__.keys() if attr[:1] != "_"}
+        changed_parameters = {attr: value for attr, value in pmm_parameters.items()
+                              if attr not in self._pmm_parameters or self._pmm_parameters[attr] != value}
+        self._pmm_parameters = pmm_parameters
+        fields = [
+            encode_value(on_tick.mid_price),
+            encode_value(on_tick.sequence_number),
+            encode_value(changed_parameters) if len(changed_parameters) > 0 else b"",
+            self._encode_changed_balances(on_tick.all_total_balances, self._all_total_balances),
+            self._encode_changed_balances(on_tick.all_available_balances, self._all_available_balances),
+        ]
+        self._all_total_balances = on_tick.all_total_balances
+        self._all_available_balances = on_tick.all_available_balances
+        return encode_message(TICK_MESSAGE, fields)
+
+    def _decode_tick(self, fields: List[bytes]) -> OnTick:
+        if len(fields[2]) > 0:
+            self._pmm_parameters.update(decode_value(fields[2]))
+        if len(fields[3]) > 0:
+            self._all_total_balances = decode_value(fields[3])
+        if len(fields[4]) > 0:
+            self._all_available_balances = decode_value(fields[4])
+        pmm_parameters = PMMParameters()
+        for attr, value in self._pmm_parameters.items():
+            # The private attributes are set to not report the values received as changes made by the script
+            setattr(pmm_parameters, f"_{attr}", value)
+        return OnTick(decode_value(fields[0]), pmm_parameters, self._all_total_balances, self._all_available_balances,
+                      sequence_number=decode_value(fields[1]))
+
+    @staticmethod
+    def _encode_changed_balances(balances: Optional[Dict[str, Dict[str, Decimal]]],
+                                 previous_balances: Optional[Dict[str, Dict[str, Decimal]]]) -> bytes:
+        return encode_value(balances) if balances != previous_balances else b""
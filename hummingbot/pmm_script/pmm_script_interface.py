@@ -12,7 +12,7 @@ def set_child_queue(queue):
 class StrategyParameter(object):
     """
     A strategy parameter class that is used as a property for the collection class with its get and set method.
-    The set method detects if there is a value change it will put itself into the child queue.
+    The set method detects if there is a value change it will put itself into the child channel.
     """
     def __init__(self, attr):
         self.name = attr
@@ -117,11 +117,25 @@ class OnTick:
                  pmm_parameters: PMMParameters,
                  all_total_balances: Dict[str, Dict[str, Decimal]],
                  all_available_balances: Dict[str, Dict[str, Decimal]],
+                 sequence_number: int = 0,
                  ):
         self.mid_price = mid_price
         self.pmm_parameters = pmm_parameters
         self.all_total_balances = all_total_balances
         self.all_available_balances = all_available_balances
+        self.sequence_number = sequence_number
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} {str(self.__dict__)}"
+
+
+class OnTickProcessed:
+    """
+    Sent by the script after processing a tick, once the strategy parameter changes made in the tick are sent.
+    """
+    def __init__(self, sequence_number: int = 0):
+        # The sequence number of the tick processed
+        self.sequence_number = sequence_number
 
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
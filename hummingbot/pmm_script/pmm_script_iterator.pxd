@@ -8,7 +8,8 @@ cdef class PMMScriptIterator(TimeIterator):
         str _script_file_path
         object _strategy
         object _markets
-        double _queue_check_interval
+        double _tick_response_timeout
+        int _tick_sequence_number
         object _event_pairs
         object _did_complete_buy_order_forwarder
         object _did_complete_sell_order_forwarder
@@ -17,5 +18,4 @@ cdef class PMMScriptIterator(TimeIterator):
         object _child_queue
         object _ev_loop
         object _script_process
-        object _listen_to_child_task
         bint _is_unit_testing_mode
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from multiprocessing import Process, Queue
+import time
+from multiprocessing import Process
 from pathlib import Path
 from typing import List
 
@@ -15,11 +16,12 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.pmm_script.pmm_script_channel import pmm_script_channel
 from hummingbot.pmm_script.pmm_script_interface import (
     CallLog,
     CallNotify,
     OnTick,
+    OnTickProcessed,
     OnCommand,
     OnStatus,
     PMMParameters,
@@ -45,13 +47,18 @@ cdef class PMMScriptIterator(TimeIterator):
                  script_file_path: Path,
                  markets: List[ExchangeBase],
                  strategy: PureMarketMakingStrategy,
-                 queue_check_interval: float = 0.01,
+                 tick_response_timeout: float = 0.05,
                  is_unit_testing_mode: bool = False):
+        """
+        :param tick_response_timeout: maximum time (in seconds) the tick waits for the script to process it, so the
+        strategy parameters changed by the script are applied in the same tick
+        """
         super().__init__()
         self._markets = markets
         self._strategy = strategy
         self._is_unit_testing_mode = is_unit_testing_mode
-        self._queue_check_interval = queue_check_interval
+        self._tick_response_timeout = tick_response_timeout
+        self._tick_sequence_number = 0
         self._did_complete_buy_order_forwarder = SourceInfoEventForwarder(self._did_complete_buy_order)
         self._did_complete_sell_order_forwarder = SourceInfoEventForwarder(self._did_complete_sell_order)
         self._event_pairs = [
@@ -59,16 +66,22 @@ cdef class PMMScriptIterator(TimeIterator):
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
         self._ev_loop = asyncio.get_event_loop()
-        self._parent_queue = Queue()
-        self._child_queue = Queue()
-        self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
+        script_parent_queue, self._parent_queue = pmm_script_channel()
+        self._child_queue, script_child_queue = pmm_script_channel()
+        self._child_queue.add_reader(self._ev_loop, self.process_child_message)
 
         self._script_process = Process(
             target=run_pmm_script,
-            args=(str(script_file_path), self._parent_queue, self._child_queue, queue_check_interval,)
+            args=(str(script_file_path), script_parent_queue, script_child_queue,)
         )
         self.logger().info(f"starting PMM script in {script_file_path}")
         self._script_process.start()
+        # The script ends are only used by the script process. Closing them here lets each process detect when the
+        # other one closes its ends.
+        script_parent_queue.close()
+        script_child_queue.close()
+        # Sends the messages from a thread, so a stalled script doesn't block the event loop when the pipe is full
+        self._parent_queue.start_writer()
 
     @property
     def strategy(self):
@@ -85,10 +98,9 @@ cdef class PMMScriptIterator(TimeIterator):
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._parent_queue.put(None)
-        self._child_queue.put(None)
         self._script_process.join()
-        if self._listen_to_child_task is not None:
-            self._listen_to_child_task.cancel()
+        self._child_queue.close()
+        self._parent_queue.close()
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
@@ -99,9 +111,12 @@ cdef class PMMScriptIterator(TimeIterator):
             if attr[:1] != '_':
                 param_value = getattr(self._strategy, attr)
                 setattr(pmm_strategy, attr, param_value)
+        self._tick_sequence_number += 1
         cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
+                                     self.all_total_balances(), self.all_available_balances(),
+                                     sequence_number=self._tick_sequence_number)
         self._parent_queue.put(on_tick)
+        self.wait_for_tick_processed()
 
     def _did_complete_buy_order(self,
                                 event_tag: int,
@@ -115,30 +130,38 @@ cdef class PMMScriptIterator(TimeIterator):
                                  event: SellOrderCompletedEvent):
         self._parent_queue.put(event)
 
-    async def listen_to_child_queue(self):
-        while True:
-            try:
-                if self._child_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._child_queue.get()
-                if item is None:
-                    break
-                if isinstance(item, StrategyParameter):
-                    self.logger().info(f"received: {str(item)}")
-                    setattr(self._strategy, item.name, item.updated_value)
-                elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
-                    # ignore this on unit testing as the below import will mess up unit testing.
-                    from hummingbot.client.hummingbot_application import HummingbotApplication
-                    HummingbotApplication.main_application().notify(item.msg)
-                elif isinstance(item, CallLog):
-                    self.logger().info(f"script - {item.msg}")
-                elif isinstance(item, ScriptError):
-                    self.logger().info(f"{item}")
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().info("Unexpected error listening to child queue.", exc_info=True)
+    def wait_for_tick_processed(self):
+        """
+        Processes the messages of the script until it finishes processing the last tick, or the timeout expires.
+        The acknowledgements of previous ticks (received late, after their wait timed out) are ignored.
+        """
+        timeout = self._tick_response_timeout
+        end_time = time.perf_counter() + timeout
+        while timeout > 0 and self._child_queue.poll(timeout):
+            item = self._child_queue.get()
+            self.process_child_message(item)
+            if item is None or (isinstance(item, OnTickProcessed)
+                                and item.sequence_number == self._tick_sequence_number):
+                break
+            timeout = end_time - time.perf_counter()
+
+    def process_child_message(self, item):
+        try:
+            if item is None:
+                self._child_queue.remove_reader()
+            elif isinstance(item, StrategyParameter):
+                self.logger().info(f"received: {str(item)}")
+                setattr(self._strategy, item.name, item.updated_value)
+            elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
+                # ignore this on unit testing as the below import will mess up unit testing.
+                from hummingbot.client.hummingbot_application import HummingbotApplication
+                HummingbotApplication.main_application().notify(item.msg)
+            elif isinstance(item, CallLog):
+                self.logger().info(f"script - {item.msg}")
+            elif isinstance(item, ScriptError):
+                self.logger().info(f"{item}")
+        except Exception:
+            self.logger().info("Unexpected error processing child message.", exc_info=True)
 
     def request_status(self):
         self._parent_queue.put(OnStatus())
@@ -3,16 +3,16 @@ import importlib
 import inspect
 import os
 
-from multiprocessing import Queue
 from hummingbot.pmm_script.pmm_script_base import PMMScriptBase
+from hummingbot.pmm_script.pmm_script_channel import PMMScriptChannel
 from hummingbot.pmm_script.pmm_script_interface import CallNotify, set_child_queue
 
 
-def run_pmm_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+def run_pmm_script(script_file_name: str, parent_queue: PMMScriptChannel, child_queue: PMMScriptChannel):
     try:
         script_class = import_pmm_script_sub_class(script_file_name)
         script = script_class()
-        script.assign_init(parent_queue, child_queue, queue_check_interval)
+        script.assign_init(parent_queue, child_queue)
         set_child_queue(child_queue)
         policy = asyncio.get_event_loop_policy()
         policy.set_event_loop(policy.new_event_loop())
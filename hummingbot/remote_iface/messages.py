@@ -26,6 +26,36 @@ class InternalEventMessage(PubSubMessage):
     data: Optional[dict] = {}
 
 
+class InternalEventBatchMessage(PubSubMessage):
+    timestamp: Optional[int] = -1
+    type: Optional[str] = 'ievents'
+    events: Optional[List[Dict[str, Any]]] = []
+
+
+class MarketDataMessage(PubSubMessage):
+    timestamp: float = 0.0
+    connector: str = ''
+    trading_pair: str = ''
+    bids: List[Tuple[float, float]] = []
+    asks: List[Tuple[float, float]] = []
+    mid_price: Optional[float] = None
+    micro_price: Optional[float] = None
+
+
+class CandlesMessage(PubSubMessage):
+    timestamp: float = 0.0
+    name: str = ''
+    trading_pair: str = ''
+    interval: str = ''
+    columns: List[str] = []
+    candle: List[float] = []
+
+
+class IndicatorsMessage(PubSubMessage):
+    timestamp: float = 0.0
+    data: Dict[str, Any] = {}
+
+
 class LogMessage(PubSubMessage):
     timestamp: float = 0.0
     msg: str = ''
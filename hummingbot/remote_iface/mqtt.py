@@ -1,14 +1,17 @@
 #!/usr/bin/env python
 
 import asyncio
+import copy
 import functools
 import logging
+import queue
 import threading
 import time
 from collections import deque
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from decimal import Decimal
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from hummingbot import get_logging_conf
@@ -16,14 +19,17 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.logger import HummingbotLogger
+from hummingbot.logger.log_queue import add_log_handler, remove_log_handler
 
 if TYPE_CHECKING:  # pragma: no cover
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
     from hummingbot.core.event.event_listener import EventListener  # noqa: F401
 
+from commlib.compression import CompressionType
 from commlib.node import Node, NodeState
-from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters
+from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters, Publisher as MQTTPublisher
 
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee
 from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -34,13 +40,17 @@ from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
     BalanceLimitCommandMessage,
     BalancePaperCommandMessage,
+    CandlesMessage,
     CommandShortcutMessage,
     ConfigCommandMessage,
     ExternalEventMessage,
     HistoryCommandMessage,
     ImportCommandMessage,
+    IndicatorsMessage,
+    InternalEventBatchMessage,
     InternalEventMessage,
     LogMessage,
+    MarketDataMessage,
     NotifyMessage,
     StartCommandMessage,
     StatusCommandMessage,
@@ -68,6 +78,8 @@ class TopicSpecs:
     COMMANDS: CommandTopicSpecs = CommandTopicSpecs()
     LOGS: str = '/log'
     INTERNAL_EVENTS: str = '/events'
+    INTERNAL_EVENTS_BATCH: str = '/events/batch'
+    MARKET_DATA: str = '/market_data'
     NOTIFICATIONS: str = '/notify'
     STATUS_UPDATES: str = '/status_updates'
     HEARTBEATS: str = '/hb'
@@ -359,6 +371,36 @@ class MQTTCommands:
 
 
 class MQTTMarketEventForwarder:
+    """
+    Forwards the market events of the connectors to the MQTT broker.
+
+    The event listeners only queue the events. They are serialized and published by a worker thread, one message per
+    event, or one message per batch window if `mqtt_events_batch_window` is set. If the broker is slower than the
+    events, the queue fills up to `mqtt_events_queue_size` and the new events are dropped.
+    """
+    EVENT_TYPES: Dict[int, str] = {
+        event_tag.value: event_tag.name
+        for event_tag in (
+            events.MarketEvent.BuyOrderCreated,
+            events.MarketEvent.BuyOrderCompleted,
+            events.MarketEvent.SellOrderCreated,
+            events.MarketEvent.SellOrderCompleted,
+            events.MarketEvent.OrderFilled,
+            events.MarketEvent.OrderCancelled,
+            events.MarketEvent.OrderExpired,
+            events.MarketEvent.OrderFailure,
+            events.MarketEvent.FundingPaymentCompleted,
+            events.MarketEvent.RangePositionLiquidityAdded,
+            events.MarketEvent.RangePositionLiquidityRemoved,
+            events.MarketEvent.RangePositionUpdate,
+            events.MarketEvent.RangePositionUpdateFailure,
+            events.MarketEvent.RangePositionFeeCollected,
+            events.MarketEvent.RangePositionClosed,
+        )
+    }
+    MAX_BATCH_SIZE = 500
+    DROPPED_EVENTS_REPORT_INTERVAL = 60.0
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -378,11 +420,23 @@ class MQTTMarketEventForwarder:
         self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
         self._markets: List[ConnectorBase] = list(self._hb_app.markets.values())
 
+        bridge_config = self._hb_app.client_config_map.mqtt_bridge
+        self._batch_window: float = float(bridge_config.mqtt_events_batch_window)
+        self._events_queue: queue.Queue = queue.Queue(maxsize=bridge_config.mqtt_events_queue_size)
+        self._dropped_events = 0
+        self._last_dropped_events_report = 0.0
+        self._stopped = False
+
         topic_prefix = TopicSpecs.PREFIX.format(
             namespace=self._node.namespace,
             instance_id=self._hb_app.instance_id
         )
-        self._topic = f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS}'
+        if self._batch_window > 0:
+            self._topic = f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS_BATCH}'
+            msg_type = InternalEventBatchMessage
+        else:
+            self._topic = f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS}'
+            msg_type = InternalEventMessage
 
         self._mqtt_fowarder: SourceInfoEventForwarder = \
             SourceInfoEventForwarder(self._send_mqtt_event)
@@ -404,41 +458,83 @@ class MQTTMarketEventForwarder:
             (events.MarketEvent.RangePositionClosed, self._mqtt_fowarder),
         ]
 
-        self.event_fw_pub = self._node.create_publisher(
-            topic=self._topic, msg_type=InternalEventMessage
-        )
+        if bridge_config.mqtt_events_compression:
+            self.event_fw_pub = self._node.create_compressed_publisher(topic=self._topic, msg_type=msg_type)
+        else:
+            self.event_fw_pub = self._node.create_publisher(topic=self._topic, msg_type=msg_type)
+        self._worker_thread = threading.Thread(target=self._forward_events_loop,
+                                               name="MQTTMarketEventForwarder",
+                                               daemon=True)
+        self._worker_thread.start()
         self._start_event_listeners()
 
+    @property
+    def dropped_events(self) -> int:
+        return self._dropped_events
+
+    def stop(self):
+        self._stop_event_listeners()
+        self._stopped = True
+        try:
+            self._events_queue.put_nowait(None)
+        except queue.Full:
+            # The worker checks the stopped flag after publishing the current batch
+            pass
+
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(
-                self._send_mqtt_event,
-                event_tag,
-                pubsub,
-                event
-            )
-            return
         try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-                events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
-                events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
+            self._events_queue.put_nowait((event_tag, event, datetime.now().timestamp()))
+        except queue.Full:
+            self._dropped_events += 1
+            now = time.time()
+            if now - self._last_dropped_events_report >= self.DROPPED_EVENTS_REPORT_INTERVAL:
+                self._last_dropped_events_report = now
+                self.logger().warning(
+                    f"The MQTT broker is not keeping up with the market events. "
+                    f"{self._dropped_events} events have not been forwarded."
+                )
+
+    def _forward_events_loop(self):
+        while not self._stopped:
+            item = self._events_queue.get()
+            if item is None:
+                break
+            batch = [item]
+            if self._batch_window > 0:
+                deadline = time.monotonic() + self._batch_window
+                while len(batch) < self.MAX_BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._events_queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        self._stopped = True
+                        break
+                    batch.append(item)
+            try:
+                self._publish_events(batch)
+            except Exception:
+                self.logger().error("Error forwarding market events to the MQTT broker.", exc_info=True)
+
+    def _publish_events(self, batch: List[Tuple[int, Any, float]]):
+        messages = [self._make_event_message(event_tag, event, queued_timestamp)
+                    for event_tag, event, queued_timestamp in batch]
+        if self._batch_window > 0:
+            self.event_fw_pub.publish(
+                InternalEventBatchMessage(
+                    timestamp=int(time.time()),
+                    events=[message.dict() for message in messages]
+                )
+            )
+        else:
+            for message in messages:
+                self.event_fw_pub.publish(message)
+
+    def _make_event_message(self, event_tag: int, event: Any, queued_timestamp: float) -> InternalEventMessage:
+        event_type = self.EVENT_TYPES.get(event_tag, "Unknown")
 
         if is_dataclass(event):
             event_data = asdict(event)
@@ -450,19 +546,14 @@ class MQTTMarketEventForwarder:
             except (TypeError, ValueError):
                 event_data = {}
 
-        try:
-            timestamp = event_data.pop('timestamp')
-        except KeyError:
-            timestamp = datetime.now().timestamp()
+        timestamp = event_data.pop('timestamp', queued_timestamp)
 
         event_data = self._make_event_payload(event_data)
 
-        self.event_fw_pub.publish(
-            InternalEventMessage(
-                timestamp=int(timestamp),
-                type=event_type,
-                data=event_data
-            )
+        return InternalEventMessage(
+            timestamp=int(timestamp),
+            type=event_type,
+            data=event_data
         )
 
     def _make_event_payload(self, event_data):
@@ -500,6 +591,120 @@ class MQTTMarketEventForwarder:
                 market.remove_listener(event_pair[0], event_pair[1])
 
 
+class MQTTMarketDataPublisher:
+    """
+    Streams the market data of the running strategy, so that external monitoring does not need to poll the `status`
+    command:
+
+    - the top order book levels, mid price and micro price of each trading pair of the strategy connectors
+    - the last candle of each candles feed returned by the strategy `market_data_candles`
+    - the indicators returned by the strategy `market_data_indicators`
+
+    Each topic is published at most once per `mqtt_market_data_interval`, and only when its data changed.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global mqtts_logger
+        if mqtts_logger is None:  # pragma: no cover
+            mqtts_logger = HummingbotLogger(__name__)
+        return mqtts_logger
+
+    def __init__(self,
+                 hb_app: "HummingbotApplication",
+                 node: Node):
+        self._hb_app = hb_app
+        self._node = node
+        bridge_config = self._hb_app.client_config_map.mqtt_bridge
+        self._depth: int = bridge_config.mqtt_market_data_depth
+        self._interval: float = float(bridge_config.mqtt_market_data_interval)
+
+        topic_prefix = TopicSpecs.PREFIX.format(
+            namespace=self._node.namespace,
+            instance_id=self._hb_app.instance_id
+        )
+        self._topic_prefix = f'{topic_prefix}{TopicSpecs.MARKET_DATA}'
+        self._last_published_data: Dict[str, Any] = {}
+        self._publish_task: Optional[asyncio.Task] = None
+
+        self.market_data_pub = self._node.create_mpublisher()
+
+    def start(self):
+        if self._publish_task is None:
+            self._publish_task = safe_ensure_future(self._publish_loop())
+
+    def stop(self):
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            self._publish_task = None
+
+    def publish_market_data(self):
+        timestamp = time.time()
+        for connector_name, connector in self._hb_app.markets.items():
+            for trading_pair, order_book in getattr(connector, "order_books", {}).items():
+                data = self._order_book_data(order_book)
+                self._publish_if_changed(
+                    f"{self._topic_prefix}/{connector_name}/{trading_pair}",
+                    data,
+                    lambda: MarketDataMessage(timestamp=timestamp,
+                                              connector=connector_name,
+                                              trading_pair=trading_pair,
+                                              **data))
+
+        strategy = self._hb_app.strategy
+        if strategy is None:
+            return
+        market_data_candles = getattr(strategy, "market_data_candles", None)
+        for candles in (market_data_candles() if market_data_candles is not None else []):
+            candle = candles.last_candle
+            if candle is None:
+                continue
+            self._publish_if_changed(
+                f"{self._topic_prefix}/candles/{candles.name}/{candles.trading_pair}/{candles.interval}",
+                candle,
+                lambda: CandlesMessage(timestamp=timestamp,
+                                       name=candles.name,
+                                       trading_pair=candles.trading_pair,
+                                       interval=candles.interval,
+                                       columns=candles.columns,
+                                       candle=candle))
+        market_data_indicators = getattr(strategy, "market_data_indicators", None)
+        indicators = market_data_indicators() if market_data_indicators is not None else {}
+        if len(indicators) > 0:
+            self._publish_if_changed(
+                f"{self._topic_prefix}/indicators",
+                indicators,
+                lambda: IndicatorsMessage(timestamp=timestamp, data=indicators))
+
+    def _order_book_data(self, order_book: OrderBook) -> Dict[str, Any]:
+        bids = [(row.price, row.amount) for row in islice(order_book.bid_entries(), self._depth)]
+        asks = [(row.price, row.amount) for row in islice(order_book.ask_entries(), self._depth)]
+        mid_price = micro_price = None
+        if len(bids) > 0 and len(asks) > 0:
+            (bid_price, bid_amount), (ask_price, ask_amount) = bids[0], asks[0]
+            mid_price = (bid_price + ask_price) / 2
+            if bid_amount + ask_amount > 0:
+                micro_price = (bid_price * ask_amount + ask_price * bid_amount) / (bid_amount + ask_amount)
+        return {"bids": bids, "asks": asks, "mid_price": mid_price, "micro_price": micro_price}
+
+    def _publish_if_changed(self, topic: str, data: Any, create_message: Callable[[], Any]):
+        if self._last_published_data.get(topic) == data:
+            return
+        self.market_data_pub.publish(create_message(), topic)
+        # The data is copied because the strategies may update their indicators in place
+        self._last_published_data[topic] = copy.deepcopy(data)
+
+    async def _publish_loop(self):
+        while True:
+            try:
+                self.publish_market_data()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error publishing market data to the MQTT broker.", exc_info=True)
+            await asyncio.sleep(self._interval)
+
+
 class MQTTNotifier(NotifierBase):
     def __init__(self,
                  hb_app: "HummingbotApplication",
@@ -599,6 +804,7 @@ class MQTTGateway(Node):
         self._notifier: MQTTNotifier = None
         self._status_updates: MQTTStatusUpdates = None
         self._market_events: MQTTMarketEventForwarder = None
+        self._market_data: MQTTMarketDataPublisher = None
         self._commands: MQTTCommands = None
         self._logh: MQTTLogHandler = None
         self._external_events: MQTTExternalEvents = None
@@ -686,10 +892,10 @@ class MQTTGateway(Node):
         return logging.getLogger()
 
     def remove_log_handler(self, logger: HummingbotLogger):
-        logger.removeHandler(self._logh)
+        remove_log_handler(logger, self._logh)
 
     def add_log_handler(self, logger: HummingbotLogger):
-        logger.addHandler(self._logh)
+        add_log_handler(logger, self._logh)
 
     def _init_notifier(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_notifier:
@@ -723,10 +929,30 @@ class MQTTGateway(Node):
             self._market_events = MQTTMarketEventForwarder(self._hb_app, self)
             if self.state == NodeState.RUNNING:
                 self._market_events.event_fw_pub.run()
+        if self._hb_app.client_config_map.mqtt_bridge.mqtt_market_data:
+            self._market_data = MQTTMarketDataPublisher(self._hb_app, self)
+            if self.state == NodeState.RUNNING:
+                self._market_data.market_data_pub.run()
+            self._market_data.start()
 
     def _remove_market_event_listeners(self):
         if self._market_events is not None:
-            self._market_events._stop_event_listeners()
+            self._market_events.stop()
+        if self._market_data is not None:
+            self._market_data.stop()
+            self._market_data = None
+
+    def create_compressed_publisher(self, *args, **kwargs) -> MQTTPublisher:
+        """
+        Creates a publisher of zlib compressed messages, for the topics with large or frequent messages
+        """
+        pub = MQTTPublisher(
+            conn_params=self._conn_params,
+            compression=CompressionType.BEST_SPEED,
+            *args, **kwargs
+        )
+        self._publishers.append(pub)
+        return pub
 
     def _init_external_events(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_external_events:
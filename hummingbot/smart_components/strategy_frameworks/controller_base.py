@@ -4,7 +4,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub, CandlesView
 from hummingbot.smart_components.strategy_frameworks.data_types import OrderLevel
 
 
@@ -85,10 +87,15 @@ class ControllerBase(ABC):
 
     def start(self) -> None:
         """
-        Start the controller.
+        Start the controller. The live candles are read from the candles hubs of their connectors, so the candles
+        used by several controllers are streamed once.
         """
-        for candle in self.candles:
-            candle.start()
+        self.candles = [CandlesHub.get_instance(candles_config.connector).subscribe(
+            trading_pair=candles_config.trading_pair,
+            interval=candles_config.interval,
+            max_records=candles_config.max_records) for candles_config in self.config.candles_config]
+        for connector in {candles_config.connector for candles_config in self.config.candles_config}:
+            safe_ensure_future(CandlesHub.get_instance(connector).start())
 
     def load_historical_data(self, data_path: str):
         for candle in self.candles:
@@ -96,10 +103,14 @@ class ControllerBase(ABC):
 
     def stop(self) -> None:
         """
-        Stop the controller.
+        Stop the controller. The candles hubs are stopped when no controller uses them.
         """
         for candle in self.candles:
-            candle.stop()
+            if isinstance(candle, CandlesView):
+                hub = CandlesHub.get_instance(candle.connector)
+                hub.unsubscribe(candle)
+                if not hub.has_subscriptions:
+                    safe_ensure_future(hub.stop())
 
     def get_csv_prefix(self) -> str:
         """
@@ -236,7 +236,8 @@ class AmmArbStrategy(StrategyPyBase):
         await self.execute_arb_proposals(profitable_arb_proposals)
 
     async def apply_gateway_transaction_cancel_interval(self):
-        # XXX (martin_kou): Concurrent cancellations are not supported before the nonce architecture is fixed.
+        # XXX (martin_kou): Concurrent cancellations are only supported when the nonces are assigned locally (see
+        # gateway_local_nonce_manager). Otherwise the connectors send the cancellations one at a time.
         # See: https://app.shortcut.com/coinalpha/story/24553/nonce-architecture-in-current-amm-trade-and-evm-approve-apis-is-incorrect-and-causes-trouble-with-concurrent-requests
         gateway_connectors = []
         if self.is_gateway_market(self._market_info_1) and self.is_gateway_market_evm_compatible(self._market_info_1):
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass
+class EventCallbackMetrics:
+    """
+    Latency metrics of an event callback. The latency is the time between the reception of the first event of a
+    coalesced group and the moment the callback starts processing it. The duration is the time spent in the callback.
+    """
+    calls: int = 0
+    events: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.calls if self.calls > 0 else 0.0
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.calls if self.calls > 0 else 0.0
+
+    def register_call(self, latency: float, duration: float, events: int):
+        self.calls += 1
+        self.events += events
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.total_latency += latency
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+
+class CoalescingEventDispatcher:
+    """
+    Forwards events to an async callback, grouping them by key. All the events received for a key while a call for
+    that key is scheduled or running are coalesced and delivered together in the next call, so a burst of events
+    results in a single call and calls for the same key never overlap.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, callback: Callable[[Hashable, List[Any]], Awaitable[None]]):
+        """
+        :param callback: coroutine function receiving the key and the list of events coalesced since the last call
+        """
+        self._callback = callback
+        self._pending_events: Dict[Hashable, List[Any]] = {}
+        self._first_pending_event_time: Dict[Hashable, float] = {}
+        self._running_tasks: Dict[Hashable, asyncio.Task] = {}
+        self._metrics = EventCallbackMetrics()
+
+    @property
+    def metrics(self) -> EventCallbackMetrics:
+        return self._metrics
+
+    @property
+    def keys_with_pending_events(self) -> Set[Hashable]:
+        return set(self._pending_events.keys())
+
+    def dispatch(self, key: Hashable, event: Any):
+        if key not in self._pending_events:
+            self._pending_events[key] = []
+            self._first_pending_event_time[key] = self._time()
+        self._pending_events[key].append(event)
+        if key not in self._running_tasks:
+            self._running_tasks[key] = safe_ensure_future(self._process_events(key))
+
+    def stop(self):
+        for task in self._running_tasks.values():
+            task.cancel()
+        self._running_tasks.clear()
+        self._pending_events.clear()
+        self._first_pending_event_time.clear()
+
+    async def _process_events(self, key: Hashable):
+        try:
+            while key in self._pending_events:
+                events = self._pending_events.pop(key)
+                start = self._time()
+                latency = start - self._first_pending_event_time.pop(key)
+                try:
+                    await self._callback(key, events)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().error(f"Unexpected error processing events for {key}.", exc_info=True)
+                self._metrics.register_call(latency=latency, duration=self._time() - start, events=len(events))
+        finally:
+            if self._running_tasks.get(key) is asyncio.current_task():
+                del self._running_tasks[key]
+
+    @staticmethod
+    def _time() -> float:
+        return time.perf_counter()
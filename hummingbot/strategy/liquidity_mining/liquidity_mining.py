@@ -1,7 +1,6 @@
 import asyncio
 import logging
 from decimal import Decimal
-from statistics import mean
 from typing import Dict, List, Set, Union
 
 import numpy as np
@@ -17,7 +16,7 @@ from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
-    calculate_bid_ask_ratios_from_base_asset_ratio,
+    calculate_bid_ask_ratios_from_base_asset_ratios,
 )
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.strategy.utils import order_age
@@ -25,6 +24,7 @@ from hummingbot.strategy.utils import order_age
 from ...client.config.client_config_map import ClientConfigMap
 from ...client.config.config_helpers import ClientConfigAdapter
 from .data_types import PriceSize, Proposal
+from .mid_price_history import MidPriceHistory
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
@@ -85,7 +85,9 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
+        # To avoid memory leak, we store only the last part of the prices needed for volatility calculation
+        self._mid_prices = MidPriceHistory(markets=list(market_infos),
+                                           max_length=volatility_interval * avg_volatility_period)
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
@@ -518,22 +520,25 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
     def apply_inventory_skew(self, proposals: List[Proposal]):
         """
-        Apply an inventory split between the quote and base asset
-        """
-        for proposal in proposals:
-            buy_budget = self._buy_budgets[proposal.market]
-            sell_budget = self._sell_budgets[proposal.market]
-            mid_price = self._market_infos[proposal.market].get_mid_price()
-            total_order_size = proposal.sell.size + proposal.buy.size
-            bid_ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
-                float(sell_budget),
-                float(buy_budget),
-                float(mid_price),
-                float(self._target_base_pct),
-                float(total_order_size * self._inventory_range_multiplier)
-            )
-            proposal.buy.size *= Decimal(bid_ask_ratios.bid_ratio)
-            proposal.sell.size *= Decimal(bid_ask_ratios.ask_ratio)
+        Apply an inventory split between the quote and base asset. The ratios of all the markets are calculated at once.
+        """
+        if len(proposals) == 0:
+            return
+        sell_budgets = np.array([float(self._sell_budgets[proposal.market]) for proposal in proposals])
+        buy_budgets = np.array([float(self._buy_budgets[proposal.market]) for proposal in proposals])
+        mid_prices = np.array([float(self._market_infos[proposal.market].get_mid_price()) for proposal in proposals])
+        total_order_sizes = np.array([float((proposal.sell.size + proposal.buy.size) * self._inventory_range_multiplier)
+                                      for proposal in proposals])
+        bid_ratios, ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratios(
+            sell_budgets,
+            buy_budgets,
+            mid_prices,
+            float(self._target_base_pct),
+            total_order_sizes
+        )
+        for proposal, bid_ratio, ask_ratio in zip(proposals, bid_ratios.tolist(), ask_ratios.tolist()):
+            proposal.buy.size *= Decimal(bid_ratio)
+            proposal.sell.size *= Decimal(ask_ratio)
 
     def did_fill_order(self, event):
         """
@@ -561,30 +566,19 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Query asset markets for mid price
         """
-        for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+        self._mid_prices.add_prices({market: float(market_info.get_mid_price())
+                                     for market, market_info in self._market_infos.items()})
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        volatilities = self._mid_prices.volatility(interval=self._volatility_interval,
+                                                   periods=self._avg_volatility_period)
+        for market, volatility in zip(self._mid_prices.markets, volatilities.tolist()):
+            if not np.isnan(volatility):
+                self._volatility[market] = Decimal(str(volatility))
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
             for market, vol in self._volatility.items():
                 if not vol.is_nan():
@@ -0,0 +1,79 @@
+import warnings
+from typing import Dict, List
+
+import numpy as np
+
+
+class MidPriceHistory:
+    """
+    Last mid prices of several markets, stored in a markets x samples ring buffer so the volatility of all the markets
+    can be calculated at once.
+    """
+
+    def __init__(self, markets: List[str], max_length: int):
+        """
+        :param markets: the markets (trading pairs) of the prices
+        :param max_length: number of samples kept for each market
+        """
+        self._markets = list(markets)
+        self._market_rows = {market: row for row, market in enumerate(self._markets)}
+        self._max_length = max(int(max_length), 1)
+        self._prices = np.full((len(self._markets), self._max_length), np.nan)
+        self._next_column = 0
+        self._length = 0
+
+    @property
+    def markets(self) -> List[str]:
+        return list(self._markets)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def add_prices(self, mid_prices: Dict[str, float]):
+        """
+        Adds a sample with the mid price of each market. The markets without price get NaN for the sample.
+        """
+        column = np.full(len(self._markets), np.nan)
+        for market, mid_price in mid_prices.items():
+            row = self._market_rows.get(market)
+            if row is not None:
+                column[row] = mid_price
+        self._prices[:, self._next_column] = column
+        self._next_column = (self._next_column + 1) % self._max_length
+        self._length = min(self._length + 1, self._max_length)
+
+    def prices(self) -> np.ndarray:
+        """
+        :return: the stored prices (markets x samples), from the oldest to the newest sample
+        """
+        if self._length < self._max_length:
+            return self._prices[:, :self._length]
+        return np.roll(self._prices, -self._next_column, axis=1)
+
+    def market_prices(self, market: str) -> np.ndarray:
+        return self.prices()[self._market_rows[market]]
+
+    def volatility(self, interval: int, periods: int) -> np.ndarray:
+        """
+        Calculates the volatility of every market as the average relative price range ((max - min) / min) of the
+        last `periods` intervals of `interval` samples. If there are not enough samples for a complete interval, the
+        range of all the samples is used.
+        :return: the volatility of each market (in the order of `markets`), NaN for the markets without prices
+        """
+        interval = max(int(interval), 1)
+        prices = self.prices()
+        intervals_count = min(prices.shape[1] // interval, periods)
+        if intervals_count > 0:
+            windows = prices[:, prices.shape[1] - intervals_count * interval:]
+            windows = windows.reshape(len(self._markets), intervals_count, interval)
+        else:
+            windows = prices.reshape(len(self._markets), 1, prices.shape[1])
+        if windows.shape[2] == 0:
+            return np.full(len(self._markets), np.nan)
+        with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+            # The markets without prices produce all NaN windows
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            max_prices = np.nanmax(windows, axis=2)
+            min_prices = np.nanmin(windows, axis=2)
+            ranges = (max_prices - min_prices) / min_prices
+            return np.nanmean(ranges, axis=1)
@@ -0,0 +1,30 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+
+cdef class FixedPointProposal:
+    cdef:
+        object _price_quantum
+        object _size_quantum
+        double _price_quantum_value
+        double _size_quantum_value
+        vector[int64_t] _buy_prices
+        vector[int64_t] _buy_sizes
+        vector[int64_t] _sell_prices
+        vector[int64_t] _sell_sizes
+
+    cdef int64_t c_price_to_ticks(self, double price)
+    cdef int64_t c_size_to_lots(self, double size)
+    cdef c_add_level(self, bint is_buy, int64_t price_ticks, int64_t size_lots)
+    cdef int c_levels_count(self, bint is_buy)
+    cdef double c_first_price(self, bint is_buy)
+    cdef double c_first_size(self, bint is_buy)
+    cdef c_clear(self, bint is_buy)
+    cdef c_remove_first_levels(self, bint is_buy, int count)
+    cdef c_scale_prices(self, bint is_buy, double ratio)
+    cdef c_scale_sizes(self, bint is_buy, double ratio)
+    cdef c_apply_budget_constraint(self, double base_balance, double quote_balance, double buy_fee_percent)
+    cdef c_filter_out_takers(self, double top_ask, double top_bid)
+    cdef c_remove_empty_levels(self, bint is_buy)
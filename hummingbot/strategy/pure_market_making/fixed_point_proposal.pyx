@@ -0,0 +1,217 @@
+# distutils: language=c++
+
+from decimal import Decimal
+from math import isnan
+from typing import List, Tuple
+
+from libc.math cimport floor
+from libc.stdint cimport int64_t
+
+from .data_types import PriceSize, Proposal
+
+# Tolerance applied before truncating to ticks or lots, to avoid losing a quantum when the float division of a
+# quantized value is slightly lower than the exact result
+cdef double QUANTUM_EPSILON = 1e-9
+
+
+cdef class FixedPointProposal:
+    """
+    Compact representation of a PMM proposal, used by the fixed point proposal pipeline. The price of each level is
+    stored as a number of ticks (price quantum) and its size as a number of lots (size quantum), both taken from the
+    connector trading rules. The proposal is converted to a Decimal `Proposal` only once the modifiers are applied.
+    """
+
+    def __init__(self, price_quantum: Decimal, size_quantum: Decimal):
+        if price_quantum <= 0 or size_quantum <= 0:
+            raise ValueError("The price and size quantums of a fixed point proposal must be positive.")
+        self._price_quantum = price_quantum
+        self._size_quantum = size_quantum
+        self._price_quantum_value = float(price_quantum)
+        self._size_quantum_value = float(size_quantum)
+
+    @property
+    def price_quantum(self) -> Decimal:
+        return self._price_quantum
+
+    @property
+    def size_quantum(self) -> Decimal:
+        return self._size_quantum
+
+    @property
+    def buys(self) -> List[Tuple[int, int]]:
+        """
+        :return: (price ticks, size lots) of each buy level
+        """
+        return [(self._buy_prices[i], self._buy_sizes[i]) for i in range(self._buy_prices.size())]
+
+    @property
+    def sells(self) -> List[Tuple[int, int]]:
+        """
+        :return: (price ticks, size lots) of each sell level
+        """
+        return [(self._sell_prices[i], self._sell_sizes[i]) for i in range(self._sell_prices.size())]
+
+    def add_level(self, is_buy: bool, price_ticks: int, size_lots: int):
+        self.c_add_level(is_buy, price_ticks, size_lots)
+
+    def apply_budget_constraint(self, base_balance: float, quote_balance: float, buy_fee_percent: float):
+        self.c_apply_budget_constraint(base_balance, quote_balance, buy_fee_percent)
+
+    def filter_out_takers(self, top_ask: float, top_bid: float):
+        self.c_filter_out_takers(top_ask, top_bid)
+
+    def to_proposal(self, market, trading_pair: str) -> Proposal:
+        """
+        Converts the levels to Decimal prices and sizes, quantized again with the connector rules because the quantums
+        of some connectors depend on the price or size.
+        """
+        cdef:
+            list buys = []
+            list sells = []
+            int i
+        for i in range(self._buy_prices.size()):
+            buys.append(PriceSize(
+                market.quantize_order_price(trading_pair, Decimal(self._buy_prices[i]) * self._price_quantum),
+                market.quantize_order_amount(trading_pair, Decimal(self._buy_sizes[i]) * self._size_quantum)))
+        for i in range(self._sell_prices.size()):
+            sells.append(PriceSize(
+                market.quantize_order_price(trading_pair, Decimal(self._sell_prices[i]) * self._price_quantum),
+                market.quantize_order_amount(trading_pair, Decimal(self._sell_sizes[i]) * self._size_quantum)))
+        return Proposal([buy for buy in buys if buy.size > 0], [sell for sell in sells if sell.size > 0])
+
+    cdef int64_t c_price_to_ticks(self, double price):
+        if isnan(price) or price <= 0:
+            return 0
+        return <int64_t>floor(price / self._price_quantum_value + QUANTUM_EPSILON)
+
+    cdef int64_t c_size_to_lots(self, double size):
+        if isnan(size) or size <= 0:
+            return 0
+        return <int64_t>floor(size / self._size_quantum_value + QUANTUM_EPSILON)
+
+    cdef c_add_level(self, bint is_buy, int64_t price_ticks, int64_t size_lots):
+        if is_buy:
+            self._buy_prices.push_back(price_ticks)
+            self._buy_sizes.push_back(size_lots)
+        else:
+            self._sell_prices.push_back(price_ticks)
+            self._sell_sizes.push_back(size_lots)
+
+    cdef int c_levels_count(self, bint is_buy):
+        return self._buy_prices.size() if is_buy else self._sell_prices.size()
+
+    cdef double c_first_price(self, bint is_buy):
+        if self.c_levels_count(is_buy) == 0:
+            return 0.0
+        return (self._buy_prices[0] if is_buy else self._sell_prices[0]) * self._price_quantum_value
+
+    cdef double c_first_size(self, bint is_buy):
+        if self.c_levels_count(is_buy) == 0:
+            return 0.0
+        return (self._buy_sizes[0] if is_buy else self._sell_sizes[0]) * self._size_quantum_value
+
+    cdef c_clear(self, bint is_buy):
+        if is_buy:
+            self._buy_prices.clear()
+            self._buy_sizes.clear()
+        else:
+            self._sell_prices.clear()
+            self._sell_sizes.clear()
+
+    cdef c_remove_first_levels(self, bint is_buy, int count):
+        if count >= self.c_levels_count(is_buy):
+            self.c_clear(is_buy)
+        elif count > 0:
+            if is_buy:
+                self._buy_prices.erase(self._buy_prices.begin(), self._buy_prices.begin() + count)
+                self._buy_sizes.erase(self._buy_sizes.begin(), self._buy_sizes.begin() + count)
+            else:
+                self._sell_prices.erase(self._sell_prices.begin(), self._sell_prices.begin() + count)
+                self._sell_sizes.erase(self._sell_sizes.begin(), self._sell_sizes.begin() + count)
+
+    cdef c_scale_prices(self, bint is_buy, double ratio):
+        cdef int i
+        if is_buy:
+            for i in range(self._buy_prices.size()):
+                self._buy_prices[i] = <int64_t>floor(self._buy_prices[i] * ratio + QUANTUM_EPSILON)
+        else:
+            for i in range(self._sell_prices.size()):
+                self._sell_prices[i] = <int64_t>floor(self._sell_prices[i] * ratio + QUANTUM_EPSILON)
+
+    cdef c_scale_sizes(self, bint is_buy, double ratio):
+        cdef int i
+        if is_buy:
+            for i in range(self._buy_sizes.size()):
+                self._buy_sizes[i] = <int64_t>floor(self._buy_sizes[i] * ratio + QUANTUM_EPSILON)
+        else:
+            for i in range(self._sell_sizes.size()):
+                self._sell_sizes[i] = <int64_t>floor(self._sell_sizes[i] * ratio + QUANTUM_EPSILON)
+
+    cdef c_apply_budget_constraint(self, double base_balance, double quote_balance, double buy_fee_percent):
+        """
+        Reduces the sizes of the levels to the available balances, in order. The levels without size are removed.
+        """
+        cdef:
+            int i
+            double level_price
+            double quote_size
+            int64_t base_balance_lots = self.c_size_to_lots(base_balance)
+
+        for i in range(self._buy_prices.size()):
+            level_price = self._buy_prices[i] * self._price_quantum_value * (1.0 + buy_fee_percent)
+            quote_size = self._buy_sizes[i] * self._size_quantum_value * level_price
+            if quote_balance < quote_size:
+                self._buy_sizes[i] = self.c_size_to_lots(quote_balance / level_price) if level_price > 0 else 0
+                quote_balance = 0.0
+            elif quote_balance == 0.0:
+                self._buy_sizes[i] = 0
+            else:
+                quote_balance -= quote_size
+        self.c_remove_empty_levels(True)
+
+        for i in range(self._sell_sizes.size()):
+            if base_balance_lots < self._sell_sizes[i]:
+                self._sell_sizes[i] = base_balance_lots
+                base_balance_lots = 0
+            elif base_balance_lots == 0:
+                self._sell_sizes[i] = 0
+            else:
+                base_balance_lots -= self._sell_sizes[i]
+        self.c_remove_empty_levels(False)
+
+    cdef c_filter_out_takers(self, double top_ask, double top_bid):
+        """
+        Removes the buy levels priced at or above the top ask, and the sell levels priced at or below the top bid.
+        """
+        cdef int i
+        if not isnan(top_ask):
+            for i in range(self._buy_prices.size()):
+                if self._buy_prices[i] * self._price_quantum_value >= top_ask:
+                    self._buy_sizes[i] = 0
+            self.c_remove_empty_levels(True)
+        if not isnan(top_bid):
+            for i in range(self._sell_prices.size()):
+                if self._sell_prices[i] * self._price_quantum_value <= top_bid:
+                    self._sell_sizes[i] = 0
+            self.c_remove_empty_levels(False)
+
+    cdef c_remove_empty_levels(self, bint is_buy):
+        cdef:
+            int i
+            int kept = 0
+        if is_buy:
+            for i in range(self._buy_sizes.size()):
+                if self._buy_sizes[i] > 0:
+                    self._buy_prices[kept] = self._buy_prices[i]
+                    self._buy_sizes[kept] = self._buy_sizes[i]
+                    kept += 1
+            self._buy_prices.resize(kept)
+            self._buy_sizes.resize(kept)
+        else:
+            for i in range(self._sell_sizes.size()):
+                if self._sell_sizes[i] > 0:
+                    self._sell_prices[kept] = self._sell_prices[i]
+                    self._sell_sizes[kept] = self._sell_sizes[i]
+                    kept += 1
+            self._sell_prices.resize(kept)
+            self._sell_sizes.resize(kept)
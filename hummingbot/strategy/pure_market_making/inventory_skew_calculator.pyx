@@ -1,4 +1,6 @@
 from decimal import Decimal
+from typing import Tuple
+
 import numpy as np
 
 from .data_types import InventorySkewBidAskRatios
@@ -55,3 +57,46 @@ cdef object c_calculate_bid_ask_ratios_from_base_asset_ratio(
         double ask_adjustment = 2.0 - bid_adjustment
 
     return InventorySkewBidAskRatios(bid_adjustment, ask_adjustment)
+
+
+def calculate_bid_ask_ratios_from_base_asset_ratios(
+        base_asset_amounts: np.ndarray, quote_asset_amounts: np.ndarray, prices: np.ndarray,
+        target_base_asset_ratio: float, base_asset_ranges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of calculate_bid_ask_ratios_from_base_asset_ratio, calculating the bid and ask ratios of several
+    markets at once.
+    :return: the bid ratios and the ask ratios arrays
+    """
+    base_asset_amounts = np.asarray(base_asset_amounts, dtype=np.float64)
+    quote_asset_amounts = np.asarray(quote_asset_amounts, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    base_asset_ranges = np.asarray(base_asset_ranges, dtype=np.float64)
+
+    total_portfolio_values = base_asset_amounts * prices + quote_asset_amounts
+    base_asset_values = base_asset_amounts * prices
+    base_asset_range_values = np.minimum(base_asset_ranges * prices, total_portfolio_values * 0.5)
+    target_base_asset_values = total_portfolio_values * target_base_asset_ratio
+    left_base_asset_value_limits = np.maximum(target_base_asset_values - base_asset_range_values, 0.0)
+    right_base_asset_value_limits = target_base_asset_values + base_asset_range_values
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        left_inventory_ratios = np.where(
+            base_asset_values <= left_base_asset_value_limits,
+            0.0,
+            0.5 * (base_asset_values - left_base_asset_value_limits)
+            / (target_base_asset_values - left_base_asset_value_limits))
+        right_inventory_ratios = np.where(
+            base_asset_values >= right_base_asset_value_limits,
+            1.0,
+            0.5 + 0.5 * (base_asset_values - target_base_asset_values)
+            / (right_base_asset_value_limits - target_base_asset_values))
+    left_inventory_ratios = np.clip(left_inventory_ratios, 0.0, 0.5)
+    right_inventory_ratios = np.clip(right_inventory_ratios, 0.5, 1.0)
+
+    bid_adjustments = np.where(base_asset_values < target_base_asset_values,
+                               2.0 - 2.0 * left_inventory_ratios,
+                               2.0 - 2.0 * right_inventory_ratios)
+    valid = (total_portfolio_values > 0.0) & (base_asset_ranges > 0.0)
+    bid_adjustments = np.where(valid, bid_adjustments, 0.0)
+    ask_adjustments = np.where(valid, 2.0 - bid_adjustments, 0.0)
+    return bid_adjustments, ask_adjustments
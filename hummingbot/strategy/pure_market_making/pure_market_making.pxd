@@ -58,9 +58,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
         object _moving_price_band
+        bint _fixed_point_proposals_enabled
 
     cdef object c_get_mid_price(self)
     cdef object c_create_base_proposal(self)
+    cdef bint c_fixed_point_proposal_supported(self)
+    cdef object c_create_fixed_point_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
     cdef c_apply_price_band(self, object proposal)
@@ -22,6 +22,8 @@ from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetP
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.utils import order_age
 from .data_types import PriceSize, Proposal
+from .fixed_point_proposal cimport FixedPointProposal
+from .fixed_point_proposal import FixedPointProposal
 from .inventory_cost_price_delegate import InventoryCostPriceDelegate
 from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_asset_ratio
 from .inventory_skew_calculator import calculate_total_order_size
@@ -85,7 +87,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     bid_order_level_spreads: List[Decimal] = None,
                     ask_order_level_spreads: List[Decimal] = None,
                     should_wait_order_cancel_confirmation: bool = True,
-                    moving_price_band: Optional[MovingPriceBand] = None
+                    moving_price_band: Optional[MovingPriceBand] = None,
+                    fixed_point_proposals_enabled: bool = False
                     ):
         if order_override is None:
             order_override = {}
@@ -144,6 +147,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._fixed_point_proposals_enabled = fixed_point_proposals_enabled
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -406,6 +410,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._moving_price_band.price_band_refresh_time = value
         self._moving_price_band.update(self._current_timestamp, self.get_price())
 
+    @property
+    def fixed_point_proposals_enabled(self) -> bool:
+        return self._fixed_point_proposals_enabled
+
+    @fixed_point_proposals_enabled.setter
+    def fixed_point_proposals_enabled(self, value: bool):
+        self._fixed_point_proposals_enabled = value
+
     @property
     def moving_price_band(self) -> MovingPriceBand:
         return self._moving_price_band
@@ -737,7 +749,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                                           f"making may be dangerous when markets or networks are unstable.")
 
             proposal = None
-            if self._create_timestamp <= self._current_timestamp:
+            if self._create_timestamp <= self._current_timestamp and self.c_fixed_point_proposal_supported():
+                proposal = self.c_create_fixed_point_proposal()
+            elif self._create_timestamp <= self._current_timestamp:
                 # 1. Create base order proposals
                 proposal = self.c_create_base_proposal()
                 # 2. Apply functions that limit numbers of buys and sells proposal
@@ -820,6 +834,140 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         return Proposal(buys, sells)
 
+    cdef bint c_fixed_point_proposal_supported(self):
+        """
+        The fixed point proposal pipeline supports the order levels, price band, ping pong, transaction costs, inventory
+        skew and budget constraint modifiers. The Decimal pipeline is used with order overrides and order optimization.
+        """
+        return (self._fixed_point_proposals_enabled
+                and (self._order_override is None or len(self._order_override) == 0)
+                and not self._order_optimization_enabled)
+
+    cdef object c_create_fixed_point_proposal(self):
+        """
+        Creates the proposal applying the same modifiers as the Decimal pipeline (see c_tick), but on levels stored as
+        integer price ticks and size lots. The proposal is converted to Decimal once all the modifiers are applied.
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            FixedPointProposal fixed_point_proposal
+            double bid_spread = float(self._bid_spread)
+            double ask_spread = float(self._ask_spread)
+            double order_level_spread = float(self._order_level_spread)
+            double order_amount = float(self._order_amount)
+            double order_level_amount = float(self._order_level_amount)
+            double buy_reference_price
+            double sell_reference_price
+            double ratio
+            int level
+            int64_t size_lots
+
+        price = self.get_price()
+        buy_reference_price = sell_reference_price = float(price)
+        if self._inventory_cost_price_delegate is not None:
+            inventory_cost_price = self._inventory_cost_price_delegate.get_price()
+            if inventory_cost_price is not None:
+                # Only limit sell price. Buy are always allowed.
+                sell_reference_price = max(float(inventory_cost_price), sell_reference_price)
+            else:
+                base_balance = float(market.get_balance(self._market_info.base_asset))
+                if base_balance > 0:
+                    raise RuntimeError("Initial inventory price is not set while inventory_cost feature is active.")
+        if price.is_nan():
+            return Proposal([], [])
+
+        fixed_point_proposal = FixedPointProposal(
+            market.c_get_order_price_quantum(self.trading_pair, price),
+            market.c_get_order_size_quantum(self.trading_pair, self._order_amount))
+
+        # 1. Create base order proposals
+        for level in range(0, self._buy_levels):
+            size_lots = fixed_point_proposal.c_size_to_lots(order_amount + order_level_amount * level)
+            if size_lots > 0:
+                fixed_point_proposal.c_add_level(
+                    True,
+                    fixed_point_proposal.c_price_to_ticks(
+                        buy_reference_price * (1.0 - bid_spread - level * order_level_spread)),
+                    size_lots)
+        for level in range(0, self._sell_levels):
+            size_lots = fixed_point_proposal.c_size_to_lots(order_amount + order_level_amount * level)
+            if size_lots > 0:
+                fixed_point_proposal.c_add_level(
+                    False,
+                    fixed_point_proposal.c_price_to_ticks(
+                        sell_reference_price * (1.0 + ask_spread + level * order_level_spread)),
+                    size_lots)
+
+        # 2. Apply functions that limit numbers of buys and sells proposal
+        if self._price_ceiling > 0 and price >= self._price_ceiling:
+            fixed_point_proposal.c_clear(True)
+        if self._price_floor > 0 and price <= self._price_floor:
+            fixed_point_proposal.c_clear(False)
+        if self.moving_price_band_enabled:
+            self._moving_price_band.check_and_update_price_band(self.current_timestamp, price)
+            if self._moving_price_band.check_price_ceiling_exceeded(price):
+                fixed_point_proposal.c_clear(True)
+            if self._moving_price_band.check_price_floor_exceeded(price):
+                fixed_point_proposal.c_clear(False)
+        if self._ping_pong_enabled:
+            self._ping_pong_warning_lines = []
+            if self._filled_buys_balance == self._filled_sells_balance:
+                self._filled_buys_balance = self._filled_sells_balance = 0
+            if self._filled_buys_balance > 0:
+                fixed_point_proposal.c_remove_first_levels(True, self._filled_buys_balance)
+                self._ping_pong_warning_lines.extend(
+                    [f"  Ping-pong removed {self._filled_buys_balance} buy orders."]
+                )
+            if self._filled_sells_balance > 0:
+                fixed_point_proposal.c_remove_first_levels(False, self._filled_sells_balance)
+                self._ping_pong_warning_lines.extend(
+                    [f"  Ping-pong removed {self._filled_sells_balance} sell orders."]
+                )
+
+        # 3. Apply functions that modify orders price
+        if self._add_transaction_costs_to_orders:
+            if fixed_point_proposal.c_levels_count(True) > 0:
+                fee = market.c_get_fee(self.base_asset, self.quote_asset, self._limit_order_type, TradeType.BUY,
+                                       Decimal(fixed_point_proposal.c_first_size(True)),
+                                       Decimal(fixed_point_proposal.c_first_price(True)))
+                fixed_point_proposal.c_scale_prices(True, 1.0 - float(fee.percent))
+            if fixed_point_proposal.c_levels_count(False) > 0:
+                fee = market.c_get_fee(self.base_asset, self.quote_asset, self._limit_order_type, TradeType.SELL,
+                                       Decimal(fixed_point_proposal.c_first_size(False)),
+                                       Decimal(fixed_point_proposal.c_first_price(False)))
+                fixed_point_proposal.c_scale_prices(False, 1.0 + float(fee.percent))
+
+        # 4. Apply functions that modify orders size
+        if self._inventory_skew_enabled:
+            base_balance, quote_balance = self.c_get_adjusted_available_balance(self.active_orders)
+            total_order_size = calculate_total_order_size(self._order_amount, self._order_level_amount,
+                                                          self._order_levels)
+            bid_ask_ratios = c_calculate_bid_ask_ratios_from_base_asset_ratio(
+                float(base_balance),
+                float(quote_balance),
+                float(price),
+                float(self._inventory_target_base_pct),
+                float(total_order_size * self._inventory_range_multiplier)
+            )
+            fixed_point_proposal.c_scale_sizes(True, bid_ask_ratios.bid_ratio)
+            fixed_point_proposal.c_scale_sizes(False, bid_ask_ratios.ask_ratio)
+
+        # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
+        base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
+        buy_fee_percent = 0.0
+        if fixed_point_proposal.c_levels_count(True) > 0:
+            buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
+                                       Decimal(fixed_point_proposal.c_first_size(True)),
+                                       Decimal(fixed_point_proposal.c_first_price(True)))
+            buy_fee_percent = float(buy_fee.percent)
+        fixed_point_proposal.c_apply_budget_constraint(float(base_balance), float(quote_balance), buy_fee_percent)
+
+        if not self._take_if_crossed:
+            fixed_point_proposal.c_filter_out_takers(float(market.c_get_price(self.trading_pair, True)),
+                                                     float(market.c_get_price(self.trading_pair, False)))
+
+        return fixed_point_proposal.to_proposal(market, self.trading_pair)
+
     cdef tuple c_get_adjusted_available_balance(self, list orders):
         """
         Calculates the available balance, plus the amount attributed to orders.
@@ -393,6 +393,14 @@ pure_market_making_config_map = {
                   type_str="bool",
                   default=True,
                   validator=validate_bool),
+    "fixed_point_proposals_enabled":
+        ConfigVar(key="fixed_point_proposals_enabled",
+                  prompt="Do you want to build the order proposals with integer price ticks and size lots "
+                         "instead of decimals? (Yes/No) >>> ",
+                  required_if=lambda: False,
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
     "split_order_levels_enabled":
         ConfigVar(key="split_order_levels_enabled",
                   prompt="Do you want bid and ask orders to be placed at multiple defined spread and amount? "
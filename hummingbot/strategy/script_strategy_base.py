@@ -1,18 +1,30 @@
 import logging
 from decimal import Decimal
-from typing import Any, Dict, List, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
 
 import numpy as np
 import pandas as pd
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
-from hummingbot.core.event.events import OrderType, PositionAction
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTopOfBookUpdateEvent,
+    OrderBookTradeEvent,
+    OrderType,
+    PositionAction,
+)
 from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.coalescing_event_dispatcher import CoalescingEventDispatcher, EventCallbackMetrics
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
 lsb_logger = None
 s_decimal_nan = Decimal("NaN")
 
@@ -43,6 +55,10 @@ class ScriptStrategyBase(StrategyPyBase):
         self.ready_to_trade: bool = False
         self.add_markets(list(connectors.values()))
 
+        self._order_book_update_dispatcher = CoalescingEventDispatcher(self._process_order_book_updates)
+        self._trade_dispatcher = CoalescingEventDispatcher(self._process_trades)
+        self._order_book_event_forwarders: List[Tuple[str, str, OrderBookEvent, EventForwarder]] = []
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point, is run every second (on normal tick setting).
@@ -56,9 +72,13 @@ class ScriptStrategyBase(StrategyPyBase):
                 for con in [c for c in self.connectors.values() if not c.ready]:
                     self.logger().warning(f"{con.name} is not ready. Please wait...")
                 return
+            self._subscribe_to_order_book_events()
         else:
             self.on_tick()
 
+    def stop(self, clock: Clock):
+        self._unsubscribe_from_order_book_events()
+
     def on_tick(self):
         """
         An event which is called on every tick, a sub class implements this to define what operation the strategy needs
@@ -66,9 +86,60 @@ class ScriptStrategyBase(StrategyPyBase):
         """
         pass
 
+    async def on_order_book_update(self, connector_name: str, trading_pair: str,
+                                   update: OrderBookTopOfBookUpdateEvent):
+        """
+        An optional callback, called when the best bid or best ask of one of the strategy markets changes. It runs
+        independently of the clock ticks, so a sub class can react to market changes as soon as they happen.
+        Updates received while a previous call for the same market is still pending or running are coalesced,
+        and only the most recent one is delivered.
+
+        :param connector_name: The name of the connector
+        :param trading_pair: The trading pair whose order book changed
+        :param update: The latest top of book update
+        """
+        pass
+
+    async def on_trade(self, connector_name: str, trading_pair: str, trades: List[OrderBookTradeEvent]):
+        """
+        An optional callback, called when public trades are received for one of the strategy markets. It runs
+        independently of the clock ticks. Trades received while a previous call for the same market is still pending
+        or running are delivered together in the next call.
+
+        :param connector_name: The name of the connector
+        :param trading_pair: The trading pair of the trades
+        :param trades: The trades received since the previous call, in order of arrival
+        """
+        pass
+
     def on_stop(self):
         pass
 
+    @property
+    def event_callbacks_metrics(self) -> Dict[str, EventCallbackMetrics]:
+        """
+        Latency metrics of the event callbacks implemented by the strategy
+        """
+        metrics = {}
+        if self._overrides_callback("on_order_book_update"):
+            metrics["on_order_book_update"] = self._order_book_update_dispatcher.metrics
+        if self._overrides_callback("on_trade"):
+            metrics["on_trade"] = self._trade_dispatcher.metrics
+        return metrics
+
+    def market_data_candles(self) -> List["CandlesBase"]:
+        """
+        Candles feeds of the strategy streamed by the MQTT market data publisher. A sub class returns the feeds it
+        wants to expose to external monitoring.
+        """
+        return []
+
+    def market_data_indicators(self) -> Dict[str, Any]:
+        """
+        Indicators of the strategy streamed by the MQTT market data publisher, as JSON serializable values.
+        """
+        return {}
+
     def buy(self,
             connector_name: str,
             trading_pair: str,
@@ -202,6 +273,25 @@ class ScriptStrategyBase(StrategyPyBase):
         df.sort_values(by=["Exchange", "Market", "Side"], inplace=True)
         return df
 
+    def event_callbacks_metrics_df(self) -> pd.DataFrame:
+        """
+        Returns a data frame with the latency metrics of the event callbacks for displaying purpose.
+        """
+        columns = ["Callback", "Calls", "Events", "Mean latency (ms)", "Max latency (ms)", "Mean duration (ms)",
+                   "Max duration (ms)"]
+        data = []
+        for callback_name, metrics in self.event_callbacks_metrics.items():
+            data.append([
+                callback_name,
+                metrics.calls,
+                metrics.events,
+                round(metrics.mean_latency * 1e3, 3),
+                round(metrics.max_latency * 1e3, 3),
+                round(metrics.mean_duration * 1e3, 3),
+                round(metrics.max_duration * 1e3, 3),
+            ])
+        return pd.DataFrame(data=data, columns=columns)
+
     def format_status(self) -> str:
         """
         Returns status of the current strategy on user balances and current active orders. This function is called
@@ -222,6 +312,11 @@ class ScriptStrategyBase(StrategyPyBase):
         except ValueError:
             lines.extend(["", "  No active maker orders."])
 
+        if len(self.event_callbacks_metrics) > 0:
+            callbacks_df = self.event_callbacks_metrics_df()
+            lines.extend(["", "  Event callbacks:"] +
+                         ["    " + line for line in callbacks_df.to_string(index=False).split("\n")])
+
         warning_lines.extend(self.balance_warning(self.get_market_trading_pair_tuples()))
         if len(warning_lines) > 0:
             lines.extend(["", "*** WARNINGS ***"] + warning_lines)
@@ -239,3 +334,40 @@ class ScriptStrategyBase(StrategyPyBase):
         """
         base, quote = split_hb_trading_pair(trading_pair)
         return MarketTradingPairTuple(self.connectors[connector_name], trading_pair, base, quote)
+
+    def _overrides_callback(self, callback_name: str) -> bool:
+        return getattr(type(self), callback_name) is not getattr(ScriptStrategyBase, callback_name)
+
+    def _subscribe_to_order_book_events(self):
+        events_to_subscribe = []
+        if self._overrides_callback("on_order_book_update"):
+            events_to_subscribe.append((OrderBookEvent.TopOfBookUpdateEvent, self._order_book_update_dispatcher))
+        if self._overrides_callback("on_trade"):
+            events_to_subscribe.append((OrderBookEvent.TradeEvent, self._trade_dispatcher))
+        for connector_name, connector in self.connectors.items():
+            for trading_pair in self.markets[connector_name]:
+                order_book = connector.get_order_book(trading_pair)
+                for event_tag, dispatcher in events_to_subscribe:
+                    forwarder = EventForwarder(self._dispatch_function(dispatcher, connector_name, trading_pair))
+                    order_book.add_listener(event_tag, forwarder)
+                    self._order_book_event_forwarders.append((connector_name, trading_pair, event_tag, forwarder))
+
+    def _unsubscribe_from_order_book_events(self):
+        for connector_name, trading_pair, event_tag, forwarder in self._order_book_event_forwarders:
+            self.connectors[connector_name].get_order_book(trading_pair).remove_listener(event_tag, forwarder)
+        self._order_book_event_forwarders.clear()
+        self._order_book_update_dispatcher.stop()
+        self._trade_dispatcher.stop()
+
+    @staticmethod
+    def _dispatch_function(dispatcher: CoalescingEventDispatcher, connector_name: str, trading_pair: str):
+        key = (connector_name, trading_pair)
+        return lambda event: dispatcher.dispatch(key, event)
+
+    async def _process_order_book_updates(self, key: Tuple[str, str], updates: List[OrderBookTopOfBookUpdateEvent]):
+        connector_name, trading_pair = key
+        await self.on_order_book_update(connector_name, trading_pair, updates[-1])
+
+    async def _process_trades(self, key: Tuple[str, str], trades: List[OrderBookTradeEvent]):
+        connector_name, trading_pair = key
+        await self.on_trade(connector_name, trading_pair, trades)
@@ -1,20 +1,21 @@
 import os
+import time
 from typing import Dict
 
-from hummingbot import data_path
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.connector_base import ConnectorBase
-from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.candles_feed.candles_downloader import CandlesDownloader
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
 class DownloadCandles(ScriptStrategyBase):
     """
-    This script provides an example of how to use the Candles Feed to download and store historical data.
-    It downloads 3-minute candles for 3 Binance trading pairs ["APE-USDT", "BTC-USDT", "BNB-USDT"] and stores them in
-    CSV files in the /data directory. The script stops after it has downloaded 50,000 max_records records for each pair.
-    Is important to notice that the component will fail if all the candles are not available since the idea of it is to
-    use it in production based on candles needed to compute technical indicators.
+    This script provides an example of how to use the Candles Downloader to download and store historical data.
+    It downloads the candles of the last DAYS_TO_DOWNLOAD days for the trading pairs and intervals configured, and stores
+    them in CSV files in the /data directory. The chunks already downloaded by a previous execution are not requested
+    again. The script stops when all the candles are stored.
+    The same download can be done without starting the client with `bin/download_candles.py`.
     """
     exchange = os.getenv("EXCHANGE", "binance_perpetual")
     trading_pairs = os.getenv("TRADING_PAIRS", "DODO-BUSD,LTC-USDT").split(",")
@@ -23,39 +24,23 @@ class DownloadCandles(ScriptStrategyBase):
     # we can initialize any trading pair since we only need the candles
     markets = {"binance_paper_trade": {"BTC-USDT"}}
 
-    @staticmethod
-    def get_max_records(days_to_download: int, interval: str) -> int:
-        conversion = {"m": 1, "h": 60, "d": 1440}
-        unit = interval[-1]
-        quantity = int(interval[:-1])
-        return int(days_to_download * 24 * 60 / (quantity * conversion[unit]))
-
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         super().__init__(connectors)
-        combinations = [(trading_pair, interval) for trading_pair in self.trading_pairs for interval in self.intervals]
-
-        self.candles = {f"{combinations[0]}_{combinations[1]}": {} for combinations in combinations}
-        # we need to initialize the candles for each trading pair
-        for combination in combinations:
-
-            candle = CandlesFactory.get_candle(CandlesConfig(connector=self.exchange, trading_pair=combination[0], interval=combination[1], max_records=self.get_max_records(self.days_to_download, combination[1])))
-            candle.start()
-            # we are storing the candles object and the csv path to save the candles
-            self.candles[f"{combination[0]}_{combination[1]}"]["candles"] = candle
-            self.candles[f"{combination[0]}_{combination[1]}"][
-                "csv_path"] = data_path() + f"/candles_{self.exchange}_{combination[0]}_{combination[1]}.csv"
+        self.downloader = CandlesDownloader(connector=self.exchange,
+                                            trading_pairs=self.trading_pairs,
+                                            intervals=self.intervals,
+                                            start_time=int(time.time()) - self.days_to_download * 24 * 60 * 60)
+        self.download_task = None
 
     def on_tick(self):
-        for trading_pair, candles_info in self.candles.items():
-            if not candles_info["candles"].is_ready:
-                self.logger().info(f"Candles not ready yet for {trading_pair}! Missing {candles_info['candles']._candles.maxlen - len(candles_info['candles']._candles)}")
-                pass
+        if self.download_task is None:
+            self.download_task = safe_ensure_future(self.downloader.download())
+        elif self.download_task.done():
+            if self.download_task.exception() is not None:
+                self.logger().error("The candles download failed. Start the script again to resume it.",
+                                    exc_info=self.download_task.exception())
             else:
-                df = candles_info["candles"].candles_df
-                df.to_csv(candles_info["csv_path"], index=False)
-        if all(candles_info["candles"].is_ready for candles_info in self.candles.values()):
+                for (trading_pair, interval), result in self.download_task.result().items():
+                    self.logger().info(f"{trading_pair} {interval}: {result.records} candles stored in "
+                                       f"{result.file_path}")
             HummingbotApplication.main_application().stop()
-
-    def on_stop(self):
-        for candles_info in self.candles.values():
-            candles_info["candles"].stop()
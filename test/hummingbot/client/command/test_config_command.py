@@ -60,46 +60,78 @@ class ConfigCommandTest(unittest.TestCase):
         self.assertEqual(6, len(captures))
         self.assertEqual("\nGlobal Configurations:", captures[0])
 
-        df_str_expected = ("    +-----------------------------------+----------------------+\n"
-                           "    | Key                               | Value                |\n"
-                           "    |-----------------------------------+----------------------|\n"
-                           "    | instance_id                       | TEST_ID              |\n"
-                           "    | kill_switch_mode                  | kill_switch_disabled |\n"
-                           "    | autofill_import                   | disabled             |\n"
-                           "    | telegram_mode                     | telegram_disabled    |\n"
-                           "    | mqtt_bridge                       |                      |\n"
-                           "    | ∟ mqtt_host                       | localhost            |\n"
-                           "    | ∟ mqtt_port                       | 1883                 |\n"
-                           "    | ∟ mqtt_username                   |                      |\n"
-                           "    | ∟ mqtt_password                   |                      |\n"
-                           "    | ∟ mqtt_namespace                  | hbot                 |\n"
-                           "    | ∟ mqtt_ssl                        | False                |\n"
-                           "    | ∟ mqtt_logger                     | True                 |\n"
-                           "    | ∟ mqtt_notifier                   | True                 |\n"
-                           "    | ∟ mqtt_commands                   | True                 |\n"
-                           "    | ∟ mqtt_events                     | True                 |\n"
-                           "    | ∟ mqtt_external_events            | True                 |\n"
-                           "    | ∟ mqtt_autostart                  | False                |\n"
-                           "    | send_error_logs                   | True                 |\n"
-                           "    | pmm_script_mode                   | pmm_script_disabled  |\n"
-                           "    | gateway                           |                      |\n"
-                           "    | ∟ gateway_api_host                | localhost            |\n"
-                           "    | ∟ gateway_api_port                | 15888                |\n"
-                           "    | rate_oracle_source                | binance              |\n"
-                           "    | global_token                      |                      |\n"
-                           "    | ∟ global_token_name               | USDT                 |\n"
-                           "    | ∟ global_token_symbol             | $                    |\n"
-                           "    | rate_limits_share_pct             | 100                  |\n"
-                           "    | commands_timeout                  |                      |\n"
-                           "    | ∟ create_command_timeout          | 10                   |\n"
-                           "    | ∟ other_commands_timeout          | 30                   |\n"
-                           "    | tables_format                     | psql                 |\n"
-                           "    | tick_size                         | 1.0                  |\n"
-                           "    | market_data_collection            |                      |\n"
-                           "    | ∟ market_data_collection_enabled  | True                 |\n"
-                           "    | ∟ market_data_collection_interval | 60                   |\n"
-                           "    | ∟ market_data_collection_depth    | 20                   |\n"
-                           "    +-----------------------------------+----------------------+")
+        df_str_expected = ("    +-----------------------------------+----------------------------------------+\n"
+                           "    | Key                               | Value                                  |\n"
+                           "    |-----------------------------------+----------------------------------------|\n"
+                           "    | instance_id                       | TEST_ID                                |\n"
+                           "    | kill_switch_mode                  | kill_switch_disabled                   |\n"
+                           "    | autofill_import                   | disabled                               |\n"
+                           "    | telegram_mode                     | telegram_disabled                      |\n"
+                           "    | mqtt_bridge                       |                                        |\n"
+                           "    | ∟ mqtt_host                       | localhost                              |\n"
+                           "    | ∟ mqtt_port                       | 1883                                   |\n"
+                           "    | ∟ mqtt_username                   |                                        |\n"
+                           "    | ∟ mqtt_password                   |                                        |\n"
+                           "    | ∟ mqtt_namespace                  | hbot                                   |\n"
+                           "    | ∟ mqtt_ssl                        | False                                  |\n"
+                           "    | ∟ mqtt_logger                     | True                                   |\n"
+                           "    | ∟ mqtt_notifier                   | True                                   |\n"
+                           "    | ∟ mqtt_commands                   | True                                   |\n"
+                           "    | ∟ mqtt_events                     | True                                   |\n"
+                           "    | ∟ mqtt_events_batch_window        | 0.0                                    |\n"
+                           "    | ∟ mqtt_events_compression         | False                                  |\n"
+                           "    | ∟ mqtt_events_queue_size          | 10000                                  |\n"
+                           "    | ∟ mqtt_market_data                | False                                  |\n"
+                           "    | ∟ mqtt_market_data_depth          | 5                                      |\n"
+                           "    | ∟ mqtt_market_data_interval       | 1.0                                    |\n"
+                           "    | ∟ mqtt_external_events            | True                                   |\n"
+                           "    | ∟ mqtt_autostart                  | False                                  |\n"
+                           "    | send_error_logs                   | True                                   |\n"
+                           "    | pmm_script_mode                   | pmm_script_disabled                    |\n"
+                           "    | gateway                           |                                        |\n"
+                           "    | ∟ gateway_api_host                | localhost                              |\n"
+                           "    | ∟ gateway_api_port                | 15888                                  |\n"
+                           "    | ∟ gateway_quote_cache_ttl         | None                                   |\n"
+                           "    | ∟ gateway_local_nonce_manager     | False                                  |\n"
+                           "    | rate_oracle_source                | binance                                |\n"
+                           "    | global_token                      |                                        |\n"
+                           "    | ∟ global_token_name               | USDT                                   |\n"
+                           "    | ∟ global_token_symbol             | $                                      |\n"
+                           "    | rate_limits_share_pct             | 100                                    |\n"
+                           "    | commands_timeout                  |                                        |\n"
+                           "    | ∟ create_command_timeout          | 10                                     |\n"
+                           "    | ∟ other_commands_timeout          | 30                                     |\n"
+                           "    | tables_format                     | psql                                   |\n"
+                           "    | tick_size                         | 1.0                                    |\n"
+                           "    | strategy_tick_size                | None                                   |\n"
+                           "    | market_data_collection            |                                        |\n"
+                           "    | ∟ market_data_collection_enabled  | True                                   |\n"
+                           "    | ∟ market_data_collection_interval | 60                                     |\n"
+                           "    | ∟ market_data_collection_depth    | 20                                     |\n"
+                           "    | trading_pairs_cache               |                                        |\n"
+                           "    | ∟ trading_pairs_cache_enabled     | True                                   |\n"
+                           "    | ∟ trading_pairs_cache_ttl         | 86400                                  |\n"
+                           "    | ∟ exchange_info_cache_enabled     | True                                   |\n"
+                           "    | market_data_workers               |                                        |\n"
+                           "    | ∟ market_data_workers_enabled     | False                                  |\n"
+                           "    | ∟ market_data_workers_depth       | 20                                     |\n"
+                           "    | ∟ market_data_workers_interval    | 0.05                                   |\n"
+                           "    | http_connections                  |                                        |\n"
+                           "    | ∟ connection_limit                | 100                                    |\n"
+                           "    | ∟ connection_limit_per_host       | 0                                      |\n"
+                           "    | ∟ dns_cache_ttl                   | 10                                     |\n"
+                           "    | ∟ keepalive_timeout               | 15.0                                   |\n"
+                           "    | ∟ keepalive_warmup_enabled        | False                                  |\n"
+                           "    | ∟ keepalive_warmup_connections    | 2                                      |\n"
+                           "    | ∟ keepalive_warmup_interval       | 10.0                                   |\n"
+                           "    | market_data_relay                 |                                        |\n"
+                           "    | ∟ market_data_relay_enabled       | False                                  |\n"
+                           "    | ∟ market_data_relay_socket        | /tmp/hummingbot_market_data_relay.sock |\n"
+                           "    | rate_limits_budget                |                                        |\n"
+                           "    | ∟ rate_limits_budget_sharing      | disabled                               |\n"
+                           "    | ∟ rate_limits_budget_dir          | /tmp/hummingbot_rate_limits            |\n"
+                           "    | ∟ high_priority_reserve_pct       | 20                                     |\n"
+                           "    +-----------------------------------+----------------------------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
         self.assertEqual("\nColor Settings:", captures[2])
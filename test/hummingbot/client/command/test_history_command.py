@@ -37,6 +37,8 @@ class HistoryCommandTest(unittest.TestCase):
         self.cli_mock_assistant.stop()
         db_path = Path(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
         db_path.unlink(missing_ok=True)
+        # The shared connection manager would keep using the deleted database file
+        SQLConnectionManager._scm_trade_fills_instance = None
         super().tearDown()
 
     @staticmethod
@@ -172,3 +174,45 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.command.history_command.PerformanceMetrics.create")
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances")
+    def test_history_report_by_market_loads_trades_of_each_market(
+            self, get_current_balances_mock: AsyncMock, create_metrics_mock: AsyncMock):
+        self.client_config_map.db_mode = DBSqliteMode()
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        get_current_balances_mock.return_value = {}
+        create_metrics_mock.side_effect = lambda symbol, trades, balances: MagicMock(
+            return_pct=Decimal(len(trades)))
+
+        trade_fee = AddedToCostTradeFee(percent=Decimal("5"))
+        with self.app.trade_fill_db.get_new_session() as session:
+            for i, market in enumerate(["binance", "binance", "kucoin"]):
+                session.add(TradeFill(
+                    config_file_path=f"{self.mock_strategy_name}.yml",
+                    strategy=self.mock_strategy_name,
+                    market=market,
+                    symbol="BTC-USDT",
+                    base_asset="BTC",
+                    quote_asset="USDT",
+                    timestamp=i + 1,
+                    order_id=f"someId{i}",
+                    trade_type="BUY",
+                    order_type="LIMIT",
+                    price=1,
+                    amount=2,
+                    leverage=1,
+                    trade_fee=trade_fee.to_json(),
+                    exchange_trade_id=f"someExchangeId{i}",
+                ))
+            session.commit()
+            markets_summary = TradeFill.get_markets_summary(session, [TradeFill.timestamp >= 0])
+
+        self.assertEqual([("binance", 2), ("kucoin", 1)],
+                         [(summary.market, summary.num_trades) for summary in markets_summary])
+
+        avg_return = self.async_run_with_timeout(
+            self.app.history_report_by_market(start_time=0, markets_summary=markets_summary, display_report=False))
+
+        self.assertEqual(Decimal("1.5"), avg_return)
+        self.assertEqual([2, 1], [len(call.args[1]) for call in create_metrics_mock.call_args_list])
@@ -1,8 +1,10 @@
 import asyncio
+import threading
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -15,6 +17,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
 class SecurityTest(unittest.TestCase):
@@ -77,6 +80,8 @@ class SecurityTest(unittest.TestCase):
         Security.__instance = None
         Security.secrets_manager = None
         Security._secure_configs = {}
+        Security._pending_config_files = {}
+        Security._decryption_futures = {}
         Security._decryption_done = asyncio.Event()
 
     def test_password_process(self):
@@ -150,3 +155,107 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_derived_keys_are_cached_for_the_session(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        encrypted_value = secrets_manager.encrypt_secret_value("attr", "someValue")
+
+        with patch("hummingbot.client.config.config_crypt.derive_keyfile_key",
+                   wraps=config_crypt.derive_keyfile_key) as derive_mock:
+            self.assertEqual("someValue", secrets_manager.decrypt_secret_value("attr", encrypted_value))
+            self.assertEqual("someValue", secrets_manager.decrypt_secret_value("attr", encrypted_value))
+
+        self.assertEqual(1, derive_mock.call_count)
+        self.assertEqual([], secrets_manager.pending_key_derivations([encrypted_value, "notEncrypted"]))
+
+        another_secrets_manager = ETHKeyFileSecretManger("another-password")
+        with self.assertRaises(ValueError) as error:
+            another_secrets_manager.decrypt_secret_value("attr", encrypted_value)
+        self.assertEqual("MAC mismatch", str(error.exception))
+
+    def test_keys_derived_in_parallel_are_used_to_decrypt(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+        file_path = get_connector_config_yml_path(self.connector)
+
+        Security.derive_keys_in_parallel([file_path])
+
+        self.assertEqual([], secrets_manager.pending_key_derivations(Security._encrypted_values_in_file(file_path)))
+        with patch("hummingbot.client.config.config_crypt.derive_keyfile_key") as derive_mock:
+            Security.decrypt_all()
+        derive_mock.assert_not_called()
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+
+    def test_connector_decrypted_on_demand_before_decrypt_all_ends(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+
+        Security._register_encrypted_files()
+
+        self.assertTrue(Security.any_secure_configs())
+        self.assertFalse(Security.is_connector_decrypted(self.connector))
+        self.assertTrue(Security.is_connector_decrypted("kucoin"))
+
+        self.async_run_with_timeout(Security.wait_til_connectors_decrypted([self.connector, "kucoin"]), timeout=10)
+
+        self.assertTrue(Security.is_connector_decrypted(self.connector))
+        self.assertFalse(Security.is_decryption_done())
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+
+    def test_connector_decryption_not_queued_behind_scheduled_calls(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        self.store_binance_config()
+        Security._register_encrypted_files()
+        call_started = threading.Event()
+        call_released = threading.Event()
+
+        def long_call():
+            call_started.set()
+            call_released.wait(5)
+
+        async def wait_for_connector():
+            # A long call (like the decryption of all the files) is running in the shared scheduler
+            scheduled_call = safe_ensure_future(
+                AsyncCallScheduler.shared_instance().call_async(long_call, timeout_seconds=5))
+            await self.ev_loop.run_in_executor(None, call_started.wait, 1)
+            await Security.wait_til_connectors_decrypted([self.connector])
+            return scheduled_call
+
+        scheduled_call = self.async_run_with_timeout(wait_for_connector(), timeout=5)
+
+        self.assertTrue(Security.is_connector_decrypted(self.connector))
+        self.assertFalse(scheduled_call.done())
+        call_released.set()
+        self.async_run_with_timeout(scheduled_call, timeout=5)
+
+    def test_pending_connector_not_decrypted_by_decrypted_value(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+        Security._register_encrypted_files()
+
+        with patch.object(Security, "decrypt_connector_config") as decrypt_mock:
+            self.assertIsNone(Security.decrypted_value(self.connector))
+            self.assertEqual({}, Security.api_keys(self.connector))
+        decrypt_mock.assert_not_called()
+
+        async def wait_for_connector():
+            with Security._decryption_lock:
+                # The connector waits for the decryption of all the files, which already holds the lock
+                waiting_task = safe_ensure_future(Security.wait_til_connectors_decrypted([self.connector]))
+                await asyncio.sleep(0)
+                self.assertFalse(waiting_task.done())
+                Security.decrypt_connector_config(get_connector_config_yml_path(self.connector))
+            await waiting_task
+
+        self.async_run_with_timeout(wait_for_connector(), timeout=10)
+
+        self.assertTrue(Security.is_connector_decrypted(self.connector))
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
@@ -0,0 +1,126 @@
+import json
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+from hummingbot.client.connector_manifest import (
+    CONNECTOR_MANIFEST_FILE_NAME,
+    CONNECTOR_MANIFEST_VERSION,
+    ConnectorManifest,
+    connector_sources_signature,
+    import_cost_report,
+    timed_import_module,
+    trade_fee_settings_from_json,
+    trade_fee_settings_to_json,
+)
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+
+class ConnectorManifestTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = Path(self._temp_dir.name) / "connector_manifest.json"
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def test_load_without_manifest_file_builds_all_entries(self):
+        manifest = ConnectorManifest(manifest_path=self.manifest_path)
+
+        entries = manifest.load()
+
+        self.assertIn("binance", entries)
+        self.assertEqual(sorted(entries.keys()), sorted(manifest.rebuilt_entries))
+        self.assertTrue(self.manifest_path.exists())
+
+        binance_entry = entries["binance"]
+        self.assertEqual("exchange", binance_entry["type_dir"])
+        self.assertEqual("hummingbot.connector.exchange.binance.binance_utils", binance_entry["utils_module"])
+        self.assertIn("binance_us", binance_entry["other_domains"])
+        self.assertEqual("us", binance_entry["other_domains"]["binance_us"]["domain_parameter"])
+
+    def test_load_reuses_valid_entries(self):
+        ConnectorManifest(manifest_path=self.manifest_path).build()
+
+        manifest = ConnectorManifest(manifest_path=self.manifest_path)
+        entries = manifest.load()
+
+        self.assertIn("binance", entries)
+        self.assertEqual([], manifest.rebuilt_entries)
+
+    def test_load_rebuilds_outdated_entries(self):
+        ConnectorManifest(manifest_path=self.manifest_path).build()
+        content = json.loads(self.manifest_path.read_text())
+        content["connectors"]["binance"]["sources_signature"] = "0:0"
+        content["connectors"]["binance"]["example_pair"] = "OUTDATED-PAIR"
+        self.manifest_path.write_text(json.dumps(content))
+
+        manifest = ConnectorManifest(manifest_path=self.manifest_path)
+        entries = manifest.load()
+
+        self.assertEqual(["binance"], manifest.rebuilt_entries)
+        self.assertNotEqual("OUTDATED-PAIR", entries["binance"]["example_pair"])
+        stored_content = json.loads(self.manifest_path.read_text())
+        self.assertNotEqual("0:0", stored_content["connectors"]["binance"]["sources_signature"])
+
+    def test_load_ignores_manifest_with_different_version(self):
+        self.manifest_path.write_text(json.dumps({"version": CONNECTOR_MANIFEST_VERSION + 1, "connectors": {}}))
+
+        manifest = ConnectorManifest(manifest_path=self.manifest_path)
+        entries = manifest.load()
+
+        self.assertEqual(sorted(entries.keys()), sorted(manifest.rebuilt_entries))
+
+    def test_load_ignores_manifest_built_by_other_client_version(self):
+        with patch("hummingbot.client.connector_manifest.hummingbot_version", return_value="1.0.0"):
+            ConnectorManifest(manifest_path=self.manifest_path).build()
+
+        manifest = ConnectorManifest(manifest_path=self.manifest_path)
+        entries = manifest.load()
+
+        self.assertEqual(sorted(entries.keys()), sorted(manifest.rebuilt_entries))
+
+    def test_sources_signature_changes_with_any_connector_source_file(self):
+        connector_path = Path(self._temp_dir.name) / "connector"
+        connector_path.mkdir()
+        (connector_path / "connector_utils.py").write_text("")
+        signature = connector_sources_signature(str(connector_path))
+
+        (connector_path / "connector_constants.py").write_text("")
+
+        self.assertNotEqual(signature, connector_sources_signature(str(connector_path)))
+
+    def test_manifest_stored_in_data_directory(self):
+        with patch("hummingbot.client.connector_manifest.data_path", return_value=self._temp_dir.name):
+            manifest = ConnectorManifest()
+
+        self.assertEqual(Path(self._temp_dir.name) / CONNECTOR_MANIFEST_FILE_NAME, manifest.manifest_path)
+
+    def test_trade_fee_schema_json_round_trip(self):
+        schema = TradeFeeSchema(
+            percent_fee_token="BNB",
+            maker_percent_fee_decimal=Decimal("0.001"),
+            taker_percent_fee_decimal=Decimal("0.002"),
+            maker_fixed_fees=[TokenAmount("ETH", Decimal("0.01"))],
+        )
+
+        json_value = json.loads(json.dumps(trade_fee_settings_to_json(schema)))
+
+        self.assertEqual(schema, trade_fee_settings_from_json(json_value))
+
+    def test_legacy_trade_fee_settings_json_round_trip(self):
+        self.assertEqual([0.1, 0.1], trade_fee_settings_from_json(trade_fee_settings_to_json([0.1, 0.1])))
+        self.assertIsNone(trade_fee_settings_from_json(trade_fee_settings_to_json(None)))
+
+    def test_import_cost_report_includes_timed_imports(self):
+        timed_import_module("hummingbot.connector.exchange.binance.binance_utils")
+
+        report = import_cost_report()
+
+        self.assertIn("hummingbot.connector.exchange.binance.binance_utils", report)
+        self.assertIn("total", report)
@@ -3,7 +3,8 @@ from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType, LazyConnectorSetting
+from hummingbot.connector.exchange.binance import binance_utils
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.gateway.clob_spot.data_sources.injective.injective_api_data_source import (
     InjectiveAPIDataSource,
@@ -195,3 +196,50 @@ class SettingsTest(unittest.TestCase):
 
         self.assertIsInstance(api_data_source, KujiraAPIDataSource)
         self.assertEqual(expected_params_without_api_data_source, params)
+
+    def test_lazy_connector_setting_loads_config_keys_from_utils_module(self):
+        conn_settings = LazyConnectorSetting(
+            utils_module_path="hummingbot.connector.exchange.binance.binance_utils",
+            name="binance",
+            type=ConnectorType.Exchange,
+            example_pair="BTC-USDT",
+            centralised=True,
+            use_ethereum_wallet=False,
+            trade_fee_schema=TradeFeeSchema(),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=False,
+        )
+        domain_settings = conn_settings.lazy_copy(
+            name="binance_us",
+            type=ConnectorType.Exchange,
+            example_pair="BTC-USDT",
+            centralised=True,
+            use_ethereum_wallet=False,
+            trade_fee_schema=TradeFeeSchema(),
+            is_sub_domain=True,
+            parent_name="binance",
+            domain_parameter="us",
+            use_eth_gas_lookup=False,
+        )
+
+        self.assertIs(binance_utils.KEYS, conn_settings.config_keys)
+        self.assertIs(binance_utils.KEYS, domain_settings.config_keys)
+
+        domain_settings = LazyConnectorSetting(
+            utils_module_path="hummingbot.connector.exchange.binance.binance_utils",
+            config_keys_domain="binance_us",
+            **{field: value for field, value in domain_settings._asdict().items() if field != "config_keys"}
+        )
+
+        self.assertIs(binance_utils.OTHER_DOMAINS_KEYS["binance_us"], domain_settings.config_keys)
+
+    def test_updated_config_keys_replace_lazy_loaded_keys(self):
+        AllConnectorSettings.create_connector_settings()
+        new_keys = BinanceConfigMap(binance_api_key="someKey", binance_api_secret="someSecret")
+
+        AllConnectorSettings.update_connector_config_keys(new_keys)
+
+        self.assertIs(new_keys, AllConnectorSettings.get_connector_config_keys("binance"))
+        AllConnectorSettings.create_connector_settings()
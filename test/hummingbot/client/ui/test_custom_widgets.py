@@ -6,7 +6,7 @@ from prompt_toolkit.document import Document
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
-from hummingbot.client.ui.custom_widgets import FormattedTextLexer
+from hummingbot.client.ui.custom_widgets import FormattedTextLexer, LogPaneTextArea
 
 
 class CustomWidgetUnitTests(unittest.TestCase):
@@ -91,3 +91,69 @@ class CustomWidgetUnitTests(unittest.TestCase):
         line_fragments = get_line(1)
         self.assertEqual(0, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
+
+
+class LogPaneTextAreaTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_field = LogPaneTextArea(max_line_count=5, initial_text="Running Logs", refresh_interval=0.1)
+        self.redraws = 0
+        self.log_field.control.on_lines_appended += self._on_redraw
+
+    def _on_redraw(self, _):
+        self.redraws += 1
+
+    def test_logged_lines_rendered_without_building_document(self):
+        self.log_field.log("first line\nsecond line")
+
+        content = self.log_field.control.create_content(width=100, height=10)
+
+        self.assertEqual(3, content.line_count)
+        self.assertEqual(2, content.cursor_position.y)
+        self.assertEqual([("", "second line"), ("", " ")], content.get_line(2))
+        self.assertEqual("", self.log_field.buffer.text)
+
+    def test_log_lines_bounded(self):
+        for i in range(10):
+            self.log_field.log(f"line {i}")
+
+        self.assertEqual([f"line {i}" for i in range(5, 10)], list(self.log_field.log_lines))
+        self.assertEqual(5, self.log_field.control.create_content(width=100, height=10).line_count)
+
+    def test_redraws_batched_per_refresh_interval(self):
+        self.log_field.control._render_loop = self.ev_loop
+
+        for i in range(100):
+            self.log_field.log(f"line {i}")
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+        self.assertEqual(1, self.redraws)
+
+        self.log_field.log("another line")
+        self.ev_loop.run_until_complete(asyncio.sleep(0.02))
+        self.assertEqual(1, self.redraws)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.15))
+        self.assertEqual(2, self.redraws)
+
+    def test_scrolling_up_stops_following_new_lines_until_bottom(self):
+        for i in range(4):
+            self.log_field.log(f"line {i}")
+
+        self.log_field.control.move_cursor_up()
+        self.assertEqual(3, self.log_field.control.create_content(width=100, height=10).cursor_position.y)
+
+        self.log_field.control.move_cursor_down()
+        self.assertEqual(4, self.log_field.control.create_content(width=100, height=10).cursor_position.y)
+
+    def test_buffer_document_built_for_search(self):
+        self.log_field.log("some line")
+
+        self.log_field.control._sync_buffer_document()
+
+        self.assertEqual("Running Logs\nsome line", self.log_field.buffer.text)
+        self.assertEqual(len(self.log_field.buffer.text), self.log_field.buffer.cursor_position)
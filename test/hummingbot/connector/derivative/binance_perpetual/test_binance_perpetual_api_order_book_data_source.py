@@ -259,6 +259,45 @@ class BinancePerpetualAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(result.next_funding_utc_timestamp, mock_response["nextFundingTime"])
         self.assertEqual(result.rate, Decimal(mock_response["lastFundingRate"]))
 
+    @aioresponses()
+    def test_get_all_funding_info_with_single_request(self, mock_api):
+        url = web_utils.rest_url(CONSTANTS.MARK_PRICE_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        mock_response = [
+            {
+                "symbol": self.ex_trading_pair,
+                "markPrice": "46382.32704603",
+                "indexPrice": "46385.80064948",
+                "estimatedSettlePrice": "46510.13598963",
+                "lastFundingRate": "0.00010000",
+                "interestRate": "0.00010000",
+                "nextFundingTime": 1641312000000,
+                "time": 1641288825000,
+            },
+            {
+                "symbol": "OTHERHBOT",
+                "markPrice": "1",
+                "indexPrice": "1",
+                "estimatedSettlePrice": "1",
+                "lastFundingRate": "0.00010000",
+                "interestRate": "0.00010000",
+                "nextFundingTime": 1641312000000,
+                "time": 1641288825000,
+            },
+        ]
+        mock_api.get(regex_url, body=json.dumps(mock_response))
+
+        with patch.object(self.connector, "_api_get", wraps=self.connector._api_get) as api_get_mock:
+            result = self.async_run_with_timeout(self.data_source.get_all_funding_info([self.trading_pair]))
+
+        self.assertEqual(CONSTANTS.ALL_MARK_PRICES_LIMIT_ID, api_get_mock.call_args.kwargs["limit_id"])
+        self.assertEqual([self.trading_pair], list(result))
+        self.assertEqual(Decimal(mock_response[0]["markPrice"]), result[self.trading_pair].mark_price)
+        self.assertEqual(mock_response[0]["nextFundingTime"], result[self.trading_pair].next_funding_utc_timestamp)
+        request = list(mock_api.requests.values())[0][0]
+        self.assertNotIn("symbol", request.kwargs["params"] or {})
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     def test_listen_for_subscriptions_cancelled_when_connecting(self, _, mock_ws):
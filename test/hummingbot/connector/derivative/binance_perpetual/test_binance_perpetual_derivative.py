@@ -527,6 +527,79 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
         pos = list(self.exchange.account_positions.values())[0]
         self.assertEqual(pos.amount, 2)
 
+    @aioresponses()
+    def test_fill_included_in_previous_account_update_not_applied_again(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        url = web_utils.rest_url(
+            CONSTANTS.POSITION_INFORMATION_URL, domain=self.domain, api_version=CONSTANTS.API_VERSION_V2
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        positions = self._get_position_risk_api_endpoint_single_position_list()
+        mock_api.get(regex_url, body=json.dumps(positions))
+        self.async_run_with_timeout(self.exchange._update_positions())
+
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="8886774",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10"),
+            amount=Decimal("1"),
+            order_type=OrderType.LIMIT,
+            leverage=1,
+            position_action=PositionAction.OPEN,
+        )
+
+        # The exchange sends the position including the fill before the fill itself
+        account_update = self._get_account_update_ws_event_single_position_dict()
+        account_update["T"] = 1568879465651
+        account_update["a"]["P"][0]["pa"] = "2"
+        trade_update = {
+            "e": "ORDER_TRADE_UPDATE",
+            "E": 1568879465652,
+            "T": 1568879465651,
+            "o": {
+                "s": self.symbol,
+                "c": "OID1",
+                "S": "BUY",
+                "o": "LIMIT",
+                "f": "GTC",
+                "q": "1",
+                "p": "10",
+                "ap": "10",
+                "sp": "0",
+                "x": "TRADE",
+                "X": "FILLED",
+                "i": 8886774,
+                "l": "1",
+                "z": "1",
+                "L": "10",
+                "N": self.quote_asset,
+                "n": "0.01",
+                "T": 1568879465651,
+                "t": 1,
+                "b": "0",
+                "a": "0",
+                "m": False,
+                "R": False,
+                "wt": "CONTRACT_PRICE",
+                "ot": "LIMIT",
+                "ps": "BOTH",
+                "cp": False,
+                "rp": "0"
+            }
+        }
+        mock_user_stream = AsyncMock()
+        mock_user_stream.get.side_effect = [account_update, trade_update, asyncio.CancelledError()]
+        self.exchange._user_stream_tracker._user_stream = mock_user_stream
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(self.exchange._user_stream_event_listener())
+
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+        pos = list(self.exchange.account_positions.values())[0]
+        self.assertEqual(Decimal("2"), pos.amount)
+
     @aioresponses()
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_closed_account_position_removed_on_stream_event(self, mock_api, ws_connect_mock):
@@ -1158,6 +1158,9 @@ class GateIoPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualD
             ]
         }
 
+    def test_rate_limits_budget_scope_shared_with_spot(self):
+        self.assertEqual("api.gateio.ws", self.exchange._rate_limits_budget_scope())
+
     def test_create_order_with_invalid_position_action_raises_value_error(self):
         self._simulate_trading_rules_initialized()
 
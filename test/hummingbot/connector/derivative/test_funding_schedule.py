@@ -0,0 +1,56 @@
+import unittest
+
+from hummingbot.connector.derivative.funding_schedule import FundingSchedule
+
+
+class FundingScheduleTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.schedule = FundingSchedule(settlement_delay=10, max_payment_wait=600)
+
+    def test_funding_event_due_after_settlement_delay(self):
+        self.schedule.update(self.trading_pair, 1000)
+        self.schedule.update("OTHER-HBOT", 2000)
+
+        self.assertEqual([], self.schedule.due_trading_pairs(1005))
+        self.assertEqual([self.trading_pair], self.schedule.due_trading_pairs(1010))
+
+    def test_milliseconds_timestamps_normalized(self):
+        self.schedule.update(self.trading_pair, 1641312000000)
+
+        self.assertEqual(1641312000, self.schedule.next_funding_timestamp(self.trading_pair))
+        self.assertEqual([self.trading_pair], self.schedule.due_trading_pairs(1641312010))
+
+    def test_due_until_payment_received(self):
+        self.schedule.update(self.trading_pair, 1000)
+        # The funding info moves to the next funding timestamp before the payment is available
+        self.schedule.update(self.trading_pair, 4600)
+
+        self.schedule.register_payment(self.trading_pair, payment_timestamp=900, timestamp=1020)
+        self.assertEqual([self.trading_pair], self.schedule.due_trading_pairs(1030))
+
+        self.schedule.register_payment(self.trading_pair, payment_timestamp=1000000, timestamp=1040)
+        self.assertEqual([], self.schedule.due_trading_pairs(1050))
+        self.assertEqual([self.trading_pair], self.schedule.due_trading_pairs(4610))
+
+    def test_stops_waiting_for_payment_after_max_wait(self):
+        self.schedule.update(self.trading_pair, 1000)
+
+        self.schedule.register_payment(self.trading_pair, payment_timestamp=0, timestamp=1500)
+        self.assertEqual([self.trading_pair], self.schedule.due_trading_pairs(1550))
+
+        self.schedule.register_payment(self.trading_pair, payment_timestamp=0, timestamp=1600)
+        self.assertEqual([], self.schedule.due_trading_pairs(1650))
+
+    def test_settled_funding_timestamp_rolled_forward(self):
+        schedule = FundingSchedule()
+        schedule.update(self.trading_pair, 1000)
+        schedule.register_payment(self.trading_pair, payment_timestamp=1000, timestamp=1001)
+        self.assertEqual(1000 + 8 * 60 * 60, schedule.next_funding_timestamp(self.trading_pair))
+
+        # The exchange keeps reporting the funding timestamp that already passed
+        schedule.update(self.trading_pair, 1000)
+        self.assertEqual([], schedule.due_trading_pairs(1001))
+        self.assertEqual([self.trading_pair], schedule.due_trading_pairs(1001 + 8 * 60 * 60))
@@ -0,0 +1,153 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+
+from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.perpetual_trading import PerpetualTrading
+from hummingbot.core.data_type.common import PositionAction, PositionMode, PositionSide, TradeType
+from hummingbot.core.data_type.funding_info import FundingInfo, FundingInfoUpdate
+
+
+class PositionEngineTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.perpetual_trading = PerpetualTrading([self.trading_pair])
+        self.perpetual_trading.enable_position_engine()
+        self.engine = self.perpetual_trading.position_engine
+
+    def tearDown(self) -> None:
+        self.perpetual_trading.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def fill(self, trade_type: TradeType, price: str, amount: str,
+             position_action: PositionAction = PositionAction.OPEN, timestamp: float = 1001):
+        self.perpetual_trading.process_fill(trading_pair=self.trading_pair,
+                                            trade_type=trade_type,
+                                            position_action=position_action,
+                                            price=Decimal(price),
+                                            amount=Decimal(amount),
+                                            leverage=Decimal("10"),
+                                            timestamp=timestamp)
+
+    def test_risk_values_updated_with_mark_price_stream(self):
+        self.perpetual_trading.start()
+        self.perpetual_trading.initialize_funding_info(FundingInfo(
+            trading_pair=self.trading_pair,
+            index_price=Decimal("100"),
+            mark_price=Decimal("100"),
+            next_funding_utc_timestamp=1000,
+            rate=Decimal("0.0001")))
+        self.perpetual_trading.set_position(self.trading_pair, Position(
+            trading_pair=self.trading_pair,
+            position_side=PositionSide.LONG,
+            unrealized_pnl=Decimal("0"),
+            entry_price=Decimal("100"),
+            amount=Decimal("2"),
+            leverage=Decimal("10")))
+
+        self.perpetual_trading.funding_info_stream.put_nowait(
+            FundingInfoUpdate(trading_pair=self.trading_pair, mark_price=Decimal("105")))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        position = self.perpetual_trading.get_position(self.trading_pair)
+        self.assertEqual(Decimal("10"), position.unrealized_pnl)
+        self.assertEqual(Decimal("105"), position.mark_price)
+        self.assertEqual(Decimal("20"), position.margin)
+        # Maintenance margin (2 * 105 * 0.005) over the margin balance (20 + 10)
+        self.assertEqual(Decimal("1.05") / Decimal("30"), position.margin_ratio)
+        self.assertEqual(Decimal("90") / Decimal("0.995"), position.liquidation_price)
+
+    def test_fills_update_one_way_position(self):
+        self.engine.update_mark_price(self.trading_pair, Decimal("110"))
+
+        self.fill(TradeType.BUY, price="100", amount="1")
+        self.fill(TradeType.BUY, price="120", amount="1")
+        position = self.perpetual_trading.get_position(self.trading_pair)
+        self.assertEqual(Decimal("2"), position.amount)
+        self.assertEqual(Decimal("110"), position.entry_price)
+        self.assertEqual(PositionSide.LONG, position.position_side)
+
+        # Reducing the position keeps the entry price, and flipping it uses the fill price
+        self.fill(TradeType.SELL, price="130", amount="1", position_action=PositionAction.CLOSE)
+        self.assertEqual(Decimal("110"), position.entry_price)
+        self.fill(TradeType.SELL, price="130", amount="3")
+        position = self.perpetual_trading.get_position(self.trading_pair)
+        self.assertEqual(Decimal("-2"), position.amount)
+        self.assertEqual(Decimal("130"), position.entry_price)
+        self.assertEqual(PositionSide.SHORT, position.position_side)
+        self.assertEqual(Decimal("40"), position.unrealized_pnl)
+
+        self.fill(TradeType.BUY, price="100", amount="2", position_action=PositionAction.CLOSE)
+        self.assertEqual({}, self.perpetual_trading.account_positions)
+
+    def test_fills_update_hedge_positions(self):
+        self.perpetual_trading.set_position_mode(PositionMode.HEDGE)
+
+        self.fill(TradeType.BUY, price="100", amount="1")
+        self.fill(TradeType.SELL, price="100", amount="2")
+        self.fill(TradeType.SELL, price="101", amount="1", position_action=PositionAction.CLOSE)
+
+        self.assertIsNone(self.perpetual_trading.get_position(self.trading_pair, PositionSide.LONG))
+        short_position = self.perpetual_trading.get_position(self.trading_pair, PositionSide.SHORT)
+        self.assertEqual(Decimal("-2"), short_position.amount)
+
+    def test_fills_before_exchange_update_not_applied_again(self):
+        self.perpetual_trading.set_position(self.trading_pair, Position(
+            trading_pair=self.trading_pair,
+            position_side=PositionSide.BOTH,
+            unrealized_pnl=Decimal("0"),
+            entry_price=Decimal("100"),
+            amount=Decimal("1"),
+            leverage=Decimal("10")), timestamp=1000)
+
+        # A fill older than the positions update is already included in the exchange position
+        self.fill(TradeType.BUY, price="100", amount="1", timestamp=999)
+        self.assertEqual(Decimal("1"), self.perpetual_trading.get_position(self.trading_pair).amount)
+        # The position update triggered by a fill carries the fill execution time
+        self.fill(TradeType.BUY, price="100", amount="1", timestamp=1000)
+        self.assertEqual(Decimal("1"), self.perpetual_trading.get_position(self.trading_pair).amount)
+
+        self.fill(TradeType.BUY, price="100", amount="1", timestamp=1001)
+        position = self.perpetual_trading.get_position(self.trading_pair)
+        self.assertEqual(Decimal("2"), position.amount)
+        self.assertEqual(PositionSide.BOTH, position.position_side)
+
+    def test_exchange_update_without_timestamp_includes_applied_fills(self):
+        self.fill(TradeType.BUY, price="100", amount="1", timestamp=1001)
+        self.perpetual_trading.set_position(self.trading_pair, Position(
+            trading_pair=self.trading_pair,
+            position_side=PositionSide.LONG,
+            unrealized_pnl=Decimal("0"),
+            entry_price=Decimal("100"),
+            amount=Decimal("1"),
+            leverage=Decimal("10")))
+
+        # A fill notified late, but executed before the last fill applied, is included in the exchange position
+        self.fill(TradeType.BUY, price="100", amount="1", timestamp=1000)
+        self.assertEqual(Decimal("1"), self.perpetual_trading.get_position(self.trading_pair).amount)
+
+        self.fill(TradeType.BUY, price="100", amount="1", timestamp=1002)
+        self.assertEqual(Decimal("2"), self.perpetual_trading.get_position(self.trading_pair).amount)
+
+    def test_fill_without_exchange_timestamp_applied(self):
+        self.perpetual_trading.set_position(self.trading_pair, Position(
+            trading_pair=self.trading_pair,
+            position_side=PositionSide.LONG,
+            unrealized_pnl=Decimal("0"),
+            entry_price=Decimal("100"),
+            amount=Decimal("1"),
+            leverage=Decimal("10")), timestamp=1000)
+
+        self.fill(TradeType.BUY, price="100", amount="1", timestamp=None)
+        self.assertEqual(Decimal("2"), self.perpetual_trading.get_position(self.trading_pair).amount)
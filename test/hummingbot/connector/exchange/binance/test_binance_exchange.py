@@ -16,7 +16,7 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -981,6 +981,142 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    def _order_status_response(self, order: InFlightOrder, status: str) -> Dict[str, Any]:
+        return {
+            "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "orderId": int(order.exchange_order_id),
+            "orderListId": -1,
+            "clientOrderId": order.client_order_id,
+            "price": str(order.price),
+            "origQty": str(order.amount),
+            "executedQty": "0.0",
+            "cummulativeQuoteQty": "0.0",
+            "status": status,
+            "timeInForce": "GTC",
+            "type": "LIMIT",
+            "side": "BUY",
+            "stopPrice": "0.0",
+            "icebergQty": "0.0",
+            "time": 1499827319559,
+            "updateTime": 1499827319559,
+            "isWorking": True,
+            "origQuoteOrderQty": "10000.000000"
+        }
+
+    @aioresponses()
+    def test_update_order_status_requests_open_orders_in_bulk(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for i in range(CONSTANTS.OPEN_ORDERS_BULK_STATUS_MIN_ORDERS):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"10023{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        orders = list(self.exchange.in_flight_orders.values())
+        canceled_order = orders[-1]
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        open_orders_regex_url = re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(open_orders_regex_url,
+                     body=json.dumps([self._order_status_response(order, "NEW") for order in orders[:-1]]))
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        order_regex_url = re.compile(f"^{order_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(order_regex_url, body=json.dumps(self._order_status_response(canceled_order, "CANCELED")))
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        open_orders_requests = self._all_executed_requests(mock_api, open_orders_url)
+        self.assertEqual(1, len(open_orders_requests))
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         open_orders_requests[0].kwargs["params"]["symbol"])
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual(canceled_order.client_order_id, order_requests[0].kwargs["params"]["origClientOrderId"])
+
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertEqual(canceled_order.client_order_id, self.order_cancelled_logger.event_log[0].order_id)
+        for order in orders[:-1]:
+            self.assertTrue(order.is_open)
+
+    @aioresponses()
+    def test_update_order_status_skips_orders_updated_by_user_stream_since_last_poll(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="100234",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+        order = self.exchange.in_flight_orders["OID1"]
+
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        order_regex_url = re.compile(f"^{order_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(order_regex_url, body=json.dumps(self._order_status_response(order, "NEW")), repeat=True)
+        trades_url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        trades_regex_url = re.compile(f"^{trades_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(trades_regex_url, body=json.dumps([]), repeat=True)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, order_url)))
+
+        # Orders updated only by the status polling are polled again
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, order_url)))
+
+        self.async_run_with_timeout(self.exchange._order_tracker.process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1640780001,
+            new_state=OrderState.PARTIALLY_FILLED,
+        )))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, order_url)))
+        # The pushed status doesn't confirm the fills of the order
+        self.assertEqual(3, len(self._all_executed_requests(mock_api, trades_url)))
+
+        self.exchange._order_tracker.process_trade_update(TradeUpdate(
+            trade_id="1",
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=self.trading_pair,
+            fill_timestamp=1640780002,
+            fill_price=Decimal("10000"),
+            fill_base_amount=Decimal("0.5"),
+            fill_quote_amount=Decimal("5000"),
+            fee=DeductedFromReturnsTradeFee(flat_fees=[TokenAmount(token=self.quote_asset, amount=Decimal("1"))]),
+        ))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.assertEqual(3, len(self._all_executed_requests(mock_api, order_url)))
+        self.assertEqual(3, len(self._all_executed_requests(mock_api, trades_url)))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.assertEqual(4, len(self._all_executed_requests(mock_api, order_url)))
+        self.assertEqual(4, len(self._all_executed_requests(mock_api, trades_url)))
+
+    @aioresponses()
+    def test_connections_keep_alive_loop_sends_network_check_requests(self, mock_api):
+        self.exchange._client_config.http_connections.keepalive_warmup_connections = 3
+        self.exchange._sleep = AsyncMock(side_effect=asyncio.CancelledError)
+        url = web_utils.public_rest_url(CONSTANTS.PING_PATH_URL)
+        mock_api.get(url, body=json.dumps({}), repeat=True)
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(self.exchange._connections_keep_alive_loop())
+
+        self.assertEqual(3, len(self._all_executed_requests(mock_api, url)))
+        self.exchange._sleep.assert_called_once_with(
+            self.exchange._client_config.http_connections.keepalive_warmup_interval)
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
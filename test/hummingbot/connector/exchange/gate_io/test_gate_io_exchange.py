@@ -278,6 +278,9 @@ class TestGateIoExchange(unittest.TestCase):
         supported_types = self.exchange.supported_order_types()
         self.assertEqual(self.expected_supported_order_types, supported_types)
 
+    def test_rate_limits_budget_scope_shared_with_perpetual(self):
+        self.assertEqual("api.gateio.ws", self.exchange._rate_limits_budget_scope())
+
     @aioresponses()
     def test_all_trading_pairs(self, mock_api):
         self.exchange._set_trading_pair_symbol_map(None)
@@ -35,6 +35,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.exchange_info_cache import ExchangeInfoCache
 
 
 class GatewayCLOBSPOTTest(unittest.TestCase):
@@ -464,6 +465,17 @@ class GatewayCLOBSPOTTest(unittest.TestCase):
         self.assertNotEqual(trading_rule_with_default_values.min_price_increment,
                             trading_rule.min_price_increment)
 
+    def test_update_trading_rules_does_not_use_exchange_info_cache(self):
+        exchange_info_cache = MagicMock()
+        ExchangeInfoCache.set_shared_instance(exchange_info_cache)
+        self.addCleanup(ExchangeInfoCache.set_shared_instance, None)
+
+        self.async_run_with_timeout(coroutine=self.exchange._update_trading_rules())
+
+        # The exchange info is only the symbol map, the trading rules always come from the data source
+        exchange_info_cache.load_entry.assert_not_called()
+        self.assertEqual(repr(self.expected_trading_rule), repr(self.exchange.trading_rules[self.trading_pair]))
+
     def test_create_buy_limit_order_successfully(self):
         self.exchange._set_current_timestamp(self.start_timestamp)
         self.clob_data_source_mock.configure_place_order_response(
@@ -0,0 +1,139 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.gateway.gateway_evm_nonce_manager import GatewayEVMNonceManager
+
+
+class GatewayEVMNonceManagerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.gateway_nonce = 10
+        self.gateway_patch = patch("hummingbot.connector.gateway.gateway_evm_nonce_manager.GatewayHttpClient")
+        gateway_mock = self.gateway_patch.start()
+        self.get_evm_nonce_mock = AsyncMock(side_effect=lambda *args: {"nonce": self.gateway_nonce})
+        gateway_mock.get_instance.return_value.get_evm_nonce = self.get_evm_nonce_mock
+        self.nonce_manager = GatewayEVMNonceManager(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            chain="ethereum",
+            network="mainnet",
+            address="0xWallet")
+
+    def tearDown(self) -> None:
+        self.gateway_patch.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_concurrent_transactions_get_sequential_nonces(self):
+        async def send_transaction():
+            async with self.nonce_manager.allocate_nonce() as nonce:
+                await asyncio.sleep(0)
+                return nonce
+
+        async def send_transactions():
+            return await asyncio.gather(*[send_transaction() for _ in range(3)])
+
+        nonces = self.async_run_with_timeout(send_transactions())
+
+        self.assertEqual([10, 11, 12], nonces)
+        self.assertEqual(1, self.get_evm_nonce_mock.call_count)
+        self.assertEqual(set(), self.nonce_manager.pending_nonces)
+
+    def test_nonce_of_failed_transaction_reused(self):
+        async def send_failing_transaction():
+            async with self.nonce_manager.allocate_nonce():
+                raise ValueError("Transaction failed")
+
+        first_nonce = self.async_run_with_timeout(self.nonce_manager.next_nonce())
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(send_failing_transaction())
+        self.nonce_manager.confirm_nonce(first_nonce)
+        self.gateway_nonce = 11
+
+        self.assertEqual(11, self.async_run_with_timeout(self.nonce_manager.next_nonce()))
+        self.assertEqual(12, self.async_run_with_timeout(self.nonce_manager.next_nonce()))
+        self.assertEqual(2, self.get_evm_nonce_mock.call_count)
+
+    def test_gap_reconciled_with_gateway_nonce(self):
+        nonce = self.async_run_with_timeout(self.nonce_manager.next_nonce())
+        self.async_run_with_timeout(self.nonce_manager.next_nonce())
+        self.nonce_manager.release_nonce(nonce)
+        # The released nonce was used by a transaction sent from outside the client
+        self.gateway_nonce = 15
+
+        self.assertEqual(15, self.async_run_with_timeout(self.nonce_manager.next_nonce()))
+
+    def test_sent_nonces_not_reused_while_not_mined(self):
+        with patch.object(self.nonce_manager, "_time") as time_mock:
+            time_mock.return_value = 1000
+            sent_nonces = []
+            for _ in range(3):
+                nonce = self.async_run_with_timeout(self.nonce_manager.next_nonce())
+                self.nonce_manager.confirm_nonce(nonce)
+                sent_nonces.append(nonce)
+            # Only the first transaction has been mined when the nonces are synced
+            self.gateway_nonce = 11
+            time_mock.return_value = 1000 + self.nonce_manager.NONCE_SYNC_INTERVAL + 1
+
+            next_nonces = [self.async_run_with_timeout(self.nonce_manager.next_nonce()) for _ in range(2)]
+
+        self.assertEqual([10, 11, 12], sent_nonces)
+        self.assertEqual([13, 14], next_nonces)
+        self.assertEqual({11, 12, 13, 14}, self.nonce_manager.in_flight_nonces)
+        self.assertEqual(2, self.get_evm_nonce_mock.call_count)
+
+    def test_gap_of_dropped_transaction_reconciled_when_idle(self):
+        with patch.object(self.nonce_manager, "_time") as time_mock:
+            time_mock.return_value = 1000
+            for _ in range(3):
+                nonce = self.async_run_with_timeout(self.nonce_manager.next_nonce())
+                self.nonce_manager.confirm_nonce(nonce)
+            # The transaction with nonce 11 was dropped, so the transaction with nonce 12 can not be mined
+            self.gateway_nonce = 11
+            time_mock.return_value = 1000 + self.nonce_manager.SENT_NONCE_EXPIRATION + 1
+
+            self.assertEqual(11, self.async_run_with_timeout(self.nonce_manager.next_nonce()))
+
+    def test_local_nonces_reset_after_nonce_error(self):
+        async def send_rejected_transaction():
+            async with self.nonce_manager.allocate_nonce():
+                raise ValueError("nonce too high")
+
+        pending_nonce = self.async_run_with_timeout(self.nonce_manager.next_nonce())
+        self.async_run_with_timeout(self.nonce_manager.next_nonce())
+        self.gateway_nonce = 5
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(send_rejected_transaction())
+
+        self.assertEqual({pending_nonce, 11}, self.nonce_manager.pending_nonces)
+        next_nonces = [self.async_run_with_timeout(self.nonce_manager.next_nonce()) for _ in range(7)]
+        # The nonces missing below the ones in flight are reused, and the ones in flight are not handed out again
+        self.assertEqual([5, 6, 7, 8, 9, 12, 13], next_nonces)
+
+    def test_nonces_synced_periodically_when_idle(self):
+        with patch.object(self.nonce_manager, "_time") as time_mock:
+            time_mock.return_value = 1000
+            nonce = self.async_run_with_timeout(self.nonce_manager.next_nonce())
+            self.nonce_manager.confirm_nonce(nonce)
+            self.gateway_nonce = 20
+            time_mock.return_value = 1000 + self.nonce_manager.NONCE_SYNC_INTERVAL + 1
+
+            self.assertEqual(20, self.async_run_with_timeout(self.nonce_manager.next_nonce()))
+
+    def test_get_instance_shared_by_wallet(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        manager = GatewayEVMNonceManager.get_instance(client_config_map, "ethereum", "goerli", "0xABC")
+
+        self.assertIs(manager, GatewayEVMNonceManager.get_instance(client_config_map, "ethereum", "goerli", "0xabc"))
+        self.assertIsNot(manager, GatewayEVMNonceManager.get_instance(client_config_map, "polygon", "goerli", "0xabc"))
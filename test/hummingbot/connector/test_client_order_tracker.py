@@ -1091,3 +1091,78 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def test_orders_with_pushed_updates_since_ignores_polled_updates(self):
+        for client_order_id in ["OID1", "OID2"]:
+            self.tracker.start_tracking_order(InFlightOrder(
+                client_order_id=client_order_id,
+                exchange_order_id=f"E{client_order_id}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+                initial_state=OrderState.OPEN,
+            ))
+        updates_count = self.tracker.order_updates_count
+
+        pushed_update = OrderUpdate(
+            client_order_id="OID1",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.PARTIALLY_FILLED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(pushed_update))
+        polled_update = OrderUpdate(
+            client_order_id="OID2",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.PARTIALLY_FILLED,
+        )
+        with self.tracker.processing_polled_updates():
+            self.async_run_with_timeout(self.tracker.process_order_update(polled_update))
+
+        self.assertEqual(updates_count + 2, self.tracker.order_updates_count)
+        self.assertEqual({"OID1"}, self.tracker.orders_with_pushed_updates_since(updates_count))
+        self.assertEqual(set(), self.tracker.orders_with_pushed_updates_since(self.tracker.order_updates_count))
+
+    def test_orders_with_pushed_fills_since_ignores_filled_orders_with_missing_fills(self):
+        for client_order_id in ["OID1", "OID2", "OID3"]:
+            self.tracker.start_tracking_order(InFlightOrder(
+                client_order_id=client_order_id,
+                exchange_order_id=f"E{client_order_id}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+                initial_state=OrderState.OPEN,
+            ))
+        updates_count = self.tracker.order_updates_count
+
+        for client_order_id in ["OID1", "OID2"]:
+            self.tracker.process_trade_update(TradeUpdate(
+                trade_id=f"T{client_order_id}",
+                client_order_id=client_order_id,
+                exchange_order_id=f"E{client_order_id}",
+                trading_pair=self.trading_pair,
+                fill_price=Decimal("1.0"),
+                fill_base_amount=Decimal("500.0"),
+                fill_quote_amount=Decimal("500.0"),
+                fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token=self.quote_asset, amount=Decimal("0.5"))]),
+                fill_timestamp=2,
+            ))
+        # Only one of the trades of the filled order was received
+        self.tracker.fetch_order("OID2").current_state = OrderState.FILLED
+        # The status of the order is pushed, but not its trades
+        self.async_run_with_timeout(self.tracker.process_order_update(OrderUpdate(
+            client_order_id="OID3",
+            trading_pair=self.trading_pair,
+            update_timestamp=3,
+            new_state=OrderState.PARTIALLY_FILLED,
+        )))
+
+        self.assertEqual({"OID3"}, self.tracker.orders_with_pushed_updates_since(updates_count))
+        self.assertEqual({"OID1"}, self.tracker.orders_with_pushed_fills_since(updates_count))
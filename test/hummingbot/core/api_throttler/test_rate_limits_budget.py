@@ -0,0 +1,131 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Awaitable
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import DEFAULT_PRIORITY, HIGH_PRIORITY, RateLimit
+from hummingbot.core.api_throttler.rate_limits_budget import HostRateLimitsBudget, InProcessRateLimitsBudget
+
+TEST_LIMIT_ID = "/orders"
+
+
+class RateLimitsBudgetTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_limit = RateLimit(limit_id=TEST_LIMIT_ID, limit=10, time_interval=60)
+        self.limits = [(self.rate_limit, 1)]
+
+    def tearDown(self) -> None:
+        InProcessRateLimitsBudget._budgets.clear()
+        HostRateLimitsBudget._budgets.clear()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def acquire_times(self, budget, consumer_id: str, priority: int) -> int:
+        acquired = 0
+        while budget.try_acquire(consumer_id=consumer_id, limits=self.limits, priority=priority):
+            acquired += 1
+        return acquired
+
+    def test_high_priority_requests_use_the_reserved_capacity(self):
+        budget = InProcessRateLimitsBudget(scope="binance-com")
+
+        self.assertEqual(8, self.acquire_times(budget, "consumer_1", DEFAULT_PRIORITY))
+        self.assertEqual(2, self.acquire_times(budget, "consumer_1", HIGH_PRIORITY))
+
+    def test_low_priority_requests_limited_to_fair_share_when_contended(self):
+        budget = InProcessRateLimitsBudget(scope="binance-com")
+
+        budget.try_acquire(consumer_id="consumer_2", limits=self.limits, priority=DEFAULT_PRIORITY)
+
+        self.assertEqual(4, self.acquire_times(budget, "consumer_1", DEFAULT_PRIORITY))
+        self.assertEqual(3, self.acquire_times(budget, "consumer_2", DEFAULT_PRIORITY))
+        self.assertEqual(2, self.acquire_times(budget, "consumer_1", HIGH_PRIORITY))
+
+    def test_expired_requests_release_capacity(self):
+        budget = InProcessRateLimitsBudget(scope="binance-com")
+        budget._time = lambda: 1000
+        self.acquire_times(budget, "consumer_1", HIGH_PRIORITY)
+
+        budget._time = lambda: 1000 + 60 * 1.05 + 1
+
+        self.assertTrue(budget.try_acquire(consumer_id="consumer_1", limits=self.limits, priority=HIGH_PRIORITY))
+
+    def test_process_budget_shared_by_scope(self):
+        budget = InProcessRateLimitsBudget.get_instance(scope="binance-com")
+
+        self.assertIs(budget, InProcessRateLimitsBudget.get_instance(scope="binance-com"))
+        self.assertIsNot(budget, InProcessRateLimitsBudget.get_instance(scope="binance_us-us"))
+
+    def test_host_budget_shared_through_file(self):
+        with tempfile.TemporaryDirectory() as budget_dir:
+            # Two instances using the same file behave like two client processes
+            budget = HostRateLimitsBudget(scope="binance-com", budget_dir=Path(budget_dir))
+            other_process_budget = HostRateLimitsBudget(scope="binance-com", budget_dir=Path(budget_dir))
+
+            for _ in range(6):
+                self.assertTrue(budget.try_acquire(consumer_id="consumer_1", limits=self.limits, priority=HIGH_PRIORITY))
+
+            self.assertEqual(4, self.acquire_times(other_process_budget, "consumer_2", HIGH_PRIORITY))
+            self.assertTrue(budget.file_path.exists())
+
+    def test_host_budget_file_accessed_out_of_the_event_loop(self):
+        with tempfile.TemporaryDirectory() as budget_dir:
+            budget = HostRateLimitsBudget(scope="binance-com", budget_dir=Path(budget_dir))
+            try_acquire_threads = []
+            original_try_acquire = budget.try_acquire
+
+            def try_acquire(**kwargs):
+                try_acquire_threads.append(threading.current_thread())
+                return original_try_acquire(**kwargs)
+
+            budget.try_acquire = try_acquire
+            acquired = self.async_run_with_timeout(
+                budget.try_acquire_async(consumer_id="consumer_1", limits=self.limits, priority=HIGH_PRIORITY))
+
+            self.assertTrue(acquired)
+            self.assertNotEqual([threading.current_thread()], try_acquire_threads)
+            self.assertTrue(budget.file_path.exists())
+
+    def test_throttlers_sharing_host_budget(self):
+        with tempfile.TemporaryDirectory() as budget_dir:
+            budget = HostRateLimitsBudget(scope="binance-com", budget_dir=Path(budget_dir))
+            throttler = AsyncThrottler(rate_limits=[self.rate_limit])
+            throttler.set_rate_limits_budget(budget)
+
+            async def execute_requests(count: int):
+                for _ in range(count):
+                    async with throttler.execute_task(limit_id=TEST_LIMIT_ID, priority=HIGH_PRIORITY):
+                        pass
+
+            self.async_run_with_timeout(execute_requests(10))
+            with self.assertRaises(asyncio.TimeoutError):
+                self.async_run_with_timeout(execute_requests(1), timeout=0.3)
+
+    def test_throttlers_sharing_budget(self):
+        budget = InProcessRateLimitsBudget.get_instance(scope="binance-com")
+        spot_throttler = AsyncThrottler(rate_limits=[self.rate_limit])
+        perpetual_throttler = AsyncThrottler(rate_limits=[self.rate_limit])
+        spot_throttler.set_rate_limits_budget(budget)
+        perpetual_throttler.set_rate_limits_budget(budget)
+
+        async def execute_requests(throttler: AsyncThrottler, count: int):
+            for _ in range(count):
+                async with throttler.execute_task(limit_id=TEST_LIMIT_ID, priority=HIGH_PRIORITY):
+                    pass
+
+        self.async_run_with_timeout(execute_requests(spot_throttler, 6))
+        self.async_run_with_timeout(execute_requests(perpetual_throttler, 4))
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(execute_requests(perpetual_throttler, 1), timeout=0.3)
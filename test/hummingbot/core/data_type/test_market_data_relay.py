@@ -0,0 +1,135 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Awaitable, Dict, List, Optional
+
+from hummingbot.core.data_type.market_data_relay import MarketDataRelay, decode_relay_message, encode_relay_message
+from hummingbot.core.data_type.market_data_relay_order_book_data_source import MarketDataRelayOrderBookDataSource
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class QueueOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Data source returning the messages added to its queues by the tests
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshot_requests = 0
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: 10.0 for trading_pair in trading_pairs}
+
+    async def listen_for_subscriptions(self):
+        await asyncio.Event().wait()
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_requests += 1
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": trading_pair, "update_id": 1, "bids": [["9.5", "1"]], "asks": [["10.5", "2"]]},
+            timestamp=1640000000.0)
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+
+class MarketDataRelayTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.connector_name = "test_exchange"
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = str(Path(self._temp_dir.name) / "relay.sock")
+        self.exchange_data_source = QueueOrderBookDataSource(trading_pairs=[self.trading_pair])
+        self.relay = MarketDataRelay(
+            data_sources={self.connector_name: self.exchange_data_source},
+            trading_pairs={self.connector_name: [self.trading_pair]},
+            socket_path=self.socket_path)
+        self.client_data_source = MarketDataRelayOrderBookDataSource(
+            trading_pairs=[self.trading_pair],
+            connector_name=self.connector_name,
+            exchange_data_source=QueueOrderBookDataSource(trading_pairs=[self.trading_pair]),
+            socket_path=self.socket_path)
+        self.client_task: Optional[asyncio.Task] = None
+
+    def tearDown(self) -> None:
+        self.client_task and self.client_task.cancel()
+        self.relay.stop()
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _start_relay_and_client(self) -> OrderBook:
+        await self.relay.start()
+        self.client_task = asyncio.get_event_loop().create_task(self.client_data_source.listen_for_subscriptions())
+        return await self.client_data_source.get_new_order_book(self.trading_pair)
+
+    def test_relay_message_encoding_round_trip(self):
+        message = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": self.trading_pair, "update_id": 5, "bids": [["9.9", "1.5"]], "asks": []},
+            timestamp=1640000000.5)
+
+        connector_name, decoded_message = decode_relay_message(encode_relay_message(self.connector_name, message))
+
+        self.assertEqual(self.connector_name, connector_name)
+        self.assertEqual(OrderBookMessageType.DIFF, decoded_message.type)
+        self.assertEqual(5, decoded_message.update_id)
+        self.assertEqual(message.bids, decoded_message.bids)
+        self.assertEqual(message.timestamp, decoded_message.timestamp)
+
+    def test_client_receives_snapshot_from_relay_order_book(self):
+        order_book = self.async_run_with_timeout(self._start_relay_and_client())
+
+        bids = list(order_book.bid_entries())
+        asks = list(order_book.ask_entries())
+        self.assertEqual(9.5, bids[0].price)
+        self.assertEqual(10.5, asks[0].price)
+        self.assertEqual(2.0, asks[0].amount)
+        # The relay requested the exchange snapshot only once
+        self.assertEqual(1, self.exchange_data_source.snapshot_requests)
+        self.assertEqual(1, self.relay.clients_count)
+
+    def test_relay_forwards_diffs_and_trades_and_updates_its_order_book(self):
+        self.async_run_with_timeout(self._start_relay_and_client())
+        diff = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": self.trading_pair, "update_id": 2, "bids": [["9.8", "3"]], "asks": []},
+            timestamp=1640000001.0)
+        trade = OrderBookMessage(
+            message_type=OrderBookMessageType.TRADE,
+            content={"trading_pair": self.trading_pair, "trade_type": 1.0, "trade_id": 7, "update_id": 2,
+                     "price": "9.8", "amount": "1"},
+            timestamp=1640000001.0)
+
+        self.exchange_data_source._message_queue[self.exchange_data_source._diff_messages_queue_key].put_nowait(diff)
+        self.exchange_data_source._message_queue[self.exchange_data_source._trade_messages_queue_key].put_nowait(trade)
+
+        diffs_queue = self.client_data_source._message_queue[self.client_data_source._diff_messages_queue_key]
+        trades_queue = self.client_data_source._message_queue[self.client_data_source._trade_messages_queue_key]
+        received_diff: OrderBookMessage = self.async_run_with_timeout(diffs_queue.get())
+        received_trade: OrderBookMessage = self.async_run_with_timeout(trades_queue.get())
+
+        self.assertEqual(2, received_diff.update_id)
+        self.assertEqual(9.8, received_diff.bids[0].price)
+        self.assertEqual(7, received_trade.trade_id)
+        relay_order_book = self.relay.order_books[(self.connector_name, self.trading_pair)]
+        self.assertEqual(9.8, next(iter(relay_order_book.bid_entries())).price)
@@ -3,6 +3,9 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +53,19 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_top_of_book_update_event_only_triggered_when_best_prices_change(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookUpdateEvent, event_logger)
+
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        order_book.apply_diffs([OrderBookRow(98, 1, 2)], [OrderBookRow(102, 1, 2)], 2)
+        order_book.apply_diffs([OrderBookRow(99.5, 1, 3)], [], 3)
+
+        self.assertEqual(2, len(event_logger.event_log))
+        self.assertEqual((99, 101, 1), tuple(event_logger.event_log[0]))
+        self.assertEqual((99.5, 101, 3), tuple(event_logger.event_log[1]))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,82 @@
+import unittest
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.shared_memory_order_book import SharedMemoryOrderBook, SharedMemoryOrderBookBuffer
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+
+
+class SharedMemoryOrderBookTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.writer_buffer = SharedMemoryOrderBookBuffer.create(depth=2, trades_capacity=3)
+        self.reader_buffer = SharedMemoryOrderBookBuffer.attach(self.writer_buffer.name)
+        self.order_book = SharedMemoryOrderBook(trading_pair=self.trading_pair, buffer=self.reader_buffer)
+
+    def tearDown(self) -> None:
+        self.reader_buffer.close()
+        self.writer_buffer.close()
+        super().tearDown()
+
+    def _trade(self, price: float, trade_type: TradeType = TradeType.BUY) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair=self.trading_pair, timestamp=1640001112.223, type=trade_type, price=price, amount=1.5)
+
+    def test_read_levels_before_first_write(self):
+        self.assertIsNone(self.reader_buffer.read_levels())
+        self.assertFalse(self.order_book.sync())
+        self.assertFalse(self.order_book.initialized)
+
+    def test_levels_round_trip_truncated_to_depth(self):
+        self.writer_buffer.write_levels(
+            bids=[OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1), OrderBookRow(97, 3, 1)],
+            asks=[OrderBookRow(101, 4, 1)],
+            update_id=5)
+
+        bids, asks, update_id = self.reader_buffer.read_levels()
+
+        self.assertEqual([[99, 1, 5], [98, 2, 5]], bids.tolist())
+        self.assertEqual([[101, 4, 5]], asks.tolist())
+        self.assertEqual(5, update_id)
+        self.assertEqual(2, self.reader_buffer.sequence)
+
+    def test_write_levels_recovers_from_interrupted_writer(self):
+        self.writer_buffer._data[SharedMemoryOrderBookBuffer.SEQUENCE_INDEX] = 3
+
+        self.writer_buffer.write_levels(bids=[OrderBookRow(99, 1, 1)], asks=[], update_id=1)
+
+        self.assertEqual(6, self.reader_buffer.sequence)
+        self.assertIsNotNone(self.reader_buffer.read_levels())
+
+    def test_read_trades_reports_lost_trades(self):
+        for price in range(1, 6):
+            self.writer_buffer.write_trade(self._trade(price=price))
+
+        trades, trades_count, lost_trades = self.reader_buffer.read_trades(from_count=0)
+
+        self.assertEqual([3, 4, 5], [price for _, _, price, _ in trades])
+        self.assertEqual(5, trades_count)
+        self.assertEqual(2, lost_trades)
+
+    def test_sync_applies_levels_and_trades(self):
+        trades_logger = EventLogger()
+        self.order_book.add_listener(OrderBookEvent.TradeEvent, trades_logger)
+        self.writer_buffer.write_levels(bids=[OrderBookRow(99, 1, 1)], asks=[OrderBookRow(101, 2, 1)], update_id=7)
+        self.writer_buffer.write_trade(self._trade(price=100, trade_type=TradeType.SELL))
+
+        self.assertTrue(self.order_book.sync())
+        self.assertFalse(self.order_book.sync())
+
+        self.assertTrue(self.order_book.initialized)
+        self.assertEqual(99, self.order_book.get_price(False))
+        self.assertEqual(101, self.order_book.get_price(True))
+        self.assertEqual(7, self.order_book.snapshot_uid)
+        self.assertEqual(100, self.order_book.last_trade_price)
+        self.assertEqual(1, len(trades_logger.event_log))
+        trade = trades_logger.event_log[0]
+        self.assertEqual(self.trading_pair, trade.trading_pair)
+        self.assertEqual(TradeType.SELL, trade.type)
+        self.assertEqual(1.5, trade.amount)
@@ -0,0 +1,153 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.shared_memory_order_book import SharedMemoryOrderBook, SharedMemoryOrderBookBuffer
+from hummingbot.core.data_type.worker_order_book_tracker import MarketDataWorker, WorkerOrderBookTracker
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class WorkerOrderBookTrackerTests(unittest.TestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.log_records = []
+        self.trading_pair = "COINALPHA-HBOT"
+        self.tracker = WorkerOrderBookTracker(
+            connector_name="binance",
+            data_source=MagicMock(),
+            trading_pairs=[self.trading_pair],
+            depth=5,
+            publish_interval=0.01)
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @patch("hummingbot.core.data_type.worker_order_book_tracker.WorkerOrderBookTracker._start_worker_process")
+    def test_order_books_synchronized_from_worker_buffers(self, start_worker_mock):
+        self.tracker.start()
+        self.tracker._worker_process = MagicMock()
+        self.tracker._worker_process.is_alive.return_value = True
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertIsInstance(order_book, SharedMemoryOrderBook)
+        self.assertFalse(self.tracker.ready)
+
+        worker_order_book = OrderBook()
+        worker_order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        worker_tracker = MagicMock()
+        worker_tracker.order_books = {self.trading_pair: worker_order_book}
+        worker_buffer = SharedMemoryOrderBookBuffer.attach(order_book.buffer.name)
+        worker = MarketDataWorker(
+            order_book_tracker=worker_tracker, buffers={self.trading_pair: worker_buffer}, publish_interval=0.01)
+        worker.publish_order_books()
+        worker_order_book.apply_trade(OrderBookTradeEvent(self.trading_pair, 1640001112.223, TradeType.BUY, 101, 2))
+
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertTrue(self.tracker.ready)
+        self.assertTrue(self._is_logged("INFO", "Initialized 1 order books from the binance market data worker."))
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(101, order_book.last_trade_price)
+        start_worker_mock.assert_called_once()
+        worker_buffer.close()
+
+    @patch("hummingbot.core.data_type.worker_order_book_tracker.WorkerOrderBookTracker._time")
+    @patch("hummingbot.core.data_type.worker_order_book_tracker.WorkerOrderBookTracker._start_worker_process")
+    def test_worker_restarted_with_backoff_when_it_stops(self, start_worker_mock, time_mock):
+        time_mock.return_value = 1000
+        self.tracker.start()
+        self.tracker._worker_process = MagicMock()
+        self.tracker._worker_process.is_alive.return_value = False
+        self.tracker._worker_process.exitcode = 1
+
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertTrue(self._is_logged(
+            "ERROR", "The binance market data worker stopped unexpectedly (exit code 1). Restarting it in 1 seconds."))
+        self.assertEqual(1, start_worker_mock.call_count)
+
+        time_mock.return_value = 1001
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+        self.assertEqual(2, start_worker_mock.call_count)
+
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+        self.assertTrue(self._is_logged(
+            "ERROR", "The binance market data worker stopped unexpectedly (exit code 1). Restarting it in 2 seconds."))
+        self.assertEqual(2, start_worker_mock.call_count)
+
+    @patch("hummingbot.core.data_type.worker_order_book_tracker.WorkerOrderBookTracker._time")
+    @patch("hummingbot.core.data_type.worker_order_book_tracker.WorkerOrderBookTracker._start_worker_process")
+    def test_worker_not_restarted_after_max_failures(self, start_worker_mock, time_mock):
+        time_mock.return_value = 1000
+        self.tracker.start()
+        self.tracker._worker_process = MagicMock()
+        self.tracker._worker_process.is_alive.return_value = False
+        self.tracker._worker_process.exitcode = 1
+
+        for _ in range(self.tracker.WORKER_MAX_RESTARTS):
+            self.async_run_with_timeout(asyncio.sleep(0.05))
+            time_mock.return_value += self.tracker.WORKER_RESTART_MAX_DELAY - 1
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual(1 + self.tracker.WORKER_MAX_RESTARTS, start_worker_mock.call_count)
+        self.assertTrue(self._is_logged(
+            "NETWORK", "The binance market data worker stopped unexpectedly 6 times in a row (exit code 1). "
+                       "Giving up restarting it."))
+        self.assertTrue(self.tracker._sync_task.done())
+
+    @patch("multiprocessing.get_context")
+    def test_worker_created_with_connector_settings_key_and_domain(self, get_context_mock):
+        tracker = WorkerOrderBookTracker(
+            connector_name="bybit_bybit_testnet",
+            data_source=MagicMock(),
+            trading_pairs=[self.trading_pair],
+            domain="bybit_testnet",
+            connector_settings_key="bybit")
+
+        tracker._start_worker_process()
+
+        process_kwargs = get_context_mock.return_value.Process.call_args.kwargs["kwargs"]
+        self.assertEqual("bybit", process_kwargs["connector_settings_key"])
+        self.assertEqual("bybit_testnet", process_kwargs["domain"])
+
+    def test_worker_only_publishes_changed_order_books(self):
+        buffer = SharedMemoryOrderBookBuffer.create(depth=2, trades_capacity=10)
+        order_book = OrderBook()
+        worker_tracker = MagicMock()
+        worker_tracker.order_books = {self.trading_pair: order_book}
+        worker = MarketDataWorker(
+            order_book_tracker=worker_tracker, buffers={self.trading_pair: buffer}, publish_interval=0.01)
+
+        worker.publish_order_books()
+        self.assertEqual(0, buffer.sequence)
+
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        worker.publish_order_books()
+        worker.publish_order_books()
+        self.assertEqual(2, buffer.sequence)
+
+        order_book.apply_diffs([OrderBookRow(99.5, 1, 2)], [], 2)
+        worker.publish_order_books()
+        self.assertEqual(4, buffer.sequence)
+        bids, _, update_id = buffer.read_levels()
+        self.assertEqual([[99.5, 1, 2], [99, 1, 2]], bids.tolist())
+        buffer.close()
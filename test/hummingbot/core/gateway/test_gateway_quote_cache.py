@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Any, Awaitable, Dict
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+
+
+class GatewayQuoteCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._previous_instance = GatewayHttpClient._GatewayHttpClient__instance
+        GatewayHttpClient._GatewayHttpClient__instance = None
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.client = GatewayHttpClient(client_config_map=self.client_config_map)
+        self.now = 1640000000.0
+        self.api_requests = []
+        self.api_response: Dict[str, Any] = {"price": "10", "expectedAmount": "1"}
+        self.response_event = asyncio.Event()
+        self.response_event.set()
+
+    def tearDown(self) -> None:
+        GatewayHttpClient._GatewayHttpClient__instance = self._previous_instance
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _api_request(self, method: str, path_url: str, params: Dict[str, Any], fail_silently: bool = False):
+        self.api_requests.append(params)
+        await self.response_event.wait()
+        return dict(self.api_response)
+
+    def _get_price(self, chain: str = "ethereum", amount: Decimal = Decimal("1")):
+        return self.client.get_price(chain=chain, network="mainnet", connector="uniswap",
+                                     base_asset="WETH", quote_asset="DAI", amount=amount, side=TradeType.BUY)
+
+    def test_quote_cached_during_chain_block_time(self):
+        with patch.object(self.client, "api_request", new=self._api_request), \
+                patch.object(self.client, "_time", side_effect=lambda: self.now):
+            first_quote = self.async_run_with_timeout(self._get_price())
+            self.now += 11
+            second_quote = self.async_run_with_timeout(self._get_price())
+            self.now += 2
+            self.async_run_with_timeout(self._get_price())
+
+        self.assertEqual(first_quote, second_quote)
+        self.assertEqual(2, len(self.api_requests))
+        self.assertEqual(1, self.client.quote_cache_metrics.hits)
+        self.assertEqual(2, self.client.quote_cache_metrics.misses)
+
+    def test_quote_cache_key_includes_amount_and_configured_ttl_used(self):
+        self.client_config_map.gateway.gateway_quote_cache_ttl = 0.5
+        with patch.object(self.client, "api_request", new=self._api_request), \
+                patch.object(self.client, "_time", side_effect=lambda: self.now):
+            self.async_run_with_timeout(self._get_price(amount=Decimal("1")))
+            self.async_run_with_timeout(self._get_price(amount=Decimal("2")))
+            self.now += 1
+            self.async_run_with_timeout(self._get_price(amount=Decimal("1")))
+
+        self.assertEqual(3, len(self.api_requests))
+        self.assertEqual(0, self.client.quote_cache_metrics.hits)
+
+    def test_quote_cache_disabled_and_error_responses_not_cached(self):
+        with patch.object(self.client, "api_request", new=self._api_request):
+            self.api_response = {"error": "Price query failed"}
+            self.async_run_with_timeout(self._get_price())
+            self.async_run_with_timeout(self._get_price())
+            self.assertEqual(2, len(self.api_requests))
+
+            self.client_config_map.gateway.gateway_quote_cache_ttl = 0
+            self.api_response = {"price": "10"}
+            self.async_run_with_timeout(self._get_price())
+            self.async_run_with_timeout(self._get_price())
+
+        self.assertEqual(4, len(self.api_requests))
+
+    def test_concurrent_identical_requests_coalesced(self):
+        self.response_event.clear()
+
+        async def get_prices():
+            tasks = [asyncio.ensure_future(self._get_price()) for _ in range(3)]
+            await asyncio.sleep(0)
+            self.response_event.set()
+            return await asyncio.gather(*tasks)
+
+        with patch.object(self.client, "api_request", new=self._api_request):
+            quotes = self.async_run_with_timeout(get_prices())
+
+        self.assertEqual(1, len(self.api_requests))
+        self.assertEqual([self.api_response] * 3, quotes)
+        self.assertEqual(2, self.client.quote_cache_metrics.coalesced)
+        self.assertEqual({}, self.client._in_flight_quotes)
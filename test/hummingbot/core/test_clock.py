@@ -7,9 +7,23 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class RecordingTimeIterator(PyTimeIterator):
+    def __init__(self, name: str, ticks: list, tick_duration: float = 0):
+        super().__init__()
+        self.name = name
+        self.ticks = ticks
+        self.tick_duration = tick_duration
+
+    def tick(self, timestamp: float):
+        self.ticks.append((self.name, timestamp))
+        if self.tick_duration > 0:
+            time.sleep(self.tick_duration)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +138,61 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_add_iterator_with_invalid_tick_interval_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.clock_backtest.add_iterator(TimeIterator(), tick_interval=0)
+
+    def test_backtest_with_per_iterator_tick_intervals(self):
+        ticks = []
+        fast_iterator = RecordingTimeIterator("fast", ticks)
+        default_iterator = RecordingTimeIterator("default", ticks)
+        slow_iterator = RecordingTimeIterator("slow", ticks)
+        self.clock_backtest.add_iterator(default_iterator)
+        self.clock_backtest.add_iterator(fast_iterator, tick_interval=0.5)
+        self.clock_backtest.add_iterator(slow_iterator, tick_interval=2)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 2)
+
+        start = self.backtest_start_timestamp
+        self.assertEqual(
+            [("fast", start + 0.5),
+             ("default", start + 1), ("fast", start + 1),
+             ("fast", start + 1.5),
+             ("default", start + 2), ("fast", start + 2), ("slow", start + 2)],
+            ticks)
+        self.assertEqual(start + 2, self.clock_backtest.current_timestamp)
+        self.assertEqual(4, self.clock_backtest.get_iterator_schedule(fast_iterator).tick_count)
+        self.assertEqual(self.tick_size, self.clock_backtest.get_iterator_schedule(default_iterator).tick_interval)
+
+    def test_removed_iterator_is_not_ticked(self):
+        ticks = []
+        iterator = RecordingTimeIterator("iterator", ticks)
+        self.clock_backtest.add_iterator(iterator, tick_interval=0.5)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 1)
+
+        self.clock_backtest.remove_iterator(iterator)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 3)
+
+        self.assertEqual(2, len(ticks))
+        self.assertIsNone(self.clock_backtest.get_iterator_schedule(iterator))
+        self.assertEqual(self.backtest_start_timestamp + 3, self.clock_backtest.current_timestamp)
+
+    def test_run_til_skips_ticks_missed_by_slow_iterators(self):
+        ticks = []
+        slow_iterator = RecordingTimeIterator("slow", ticks, tick_duration=0.25)
+        fast_iterator = RecordingTimeIterator("fast", ticks)
+        self.clock_realtime.add_iterator(slow_iterator, tick_interval=0.1)
+        self.clock_realtime.add_iterator(fast_iterator, tick_interval=0.05)
+
+        with self.clock_realtime:
+            self.ev_loop.run_until_complete(self.clock_realtime.run_til(time.time() + 1))
+
+        slow_schedule = self.clock_realtime.get_iterator_schedule(slow_iterator)
+        self.assertGreater(slow_schedule.skipped_ticks, 0)
+        self.assertLessEqual(slow_schedule.tick_count, 5)
+        self.assertGreaterEqual(slow_schedule.max_tick_duration, 0.25)
+        slow_tick_times = [timestamp for name, timestamp in ticks if name == "slow"]
+        self.assertEqual(slow_tick_times, sorted(set(slow_tick_times)))
+        fast_tick_times = [timestamp for name, timestamp in ticks if name == "fast"]
+        self.assertEqual(fast_tick_times, sorted(set(fast_tick_times)))
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Awaitable
+from unittest.mock import patch
+
+from aioresponses import aioresponses
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.utils.exchange_info_cache import ExchangeInfoCache, ExchangeInfoCacheEntry
+
+
+class ExchangeInfoCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ExchangeInfoCache(cache_dir=Path(self._temp_dir.name) / "exchange_info_cache")
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def test_save_and_load_entry(self):
+        entry = ExchangeInfoCacheEntry(
+            exchange_info={"symbols": []},
+            content_hash="someHash",
+            etag="someETag",
+        )
+
+        with patch("hummingbot.core.utils.exchange_info_cache.ExchangeInfoCache._time", return_value=1000):
+            self.cache.save_entry("binance-com", entry)
+        loaded_entry = self.cache.load_entry("binance-com")
+
+        self.assertEqual({"symbols": []}, loaded_entry.exchange_info)
+        self.assertEqual("someHash", loaded_entry.content_hash)
+        self.assertEqual("someETag", loaded_entry.etag)
+        self.assertIsNone(loaded_entry.last_modified)
+        self.assertEqual(1000, loaded_entry.timestamp)
+        self.assertIsNone(self.cache.load_entry("binance-us"))
+
+    def test_corrupted_entry_is_ignored(self):
+        self.cache.cache_dir.mkdir(parents=True)
+        (self.cache.cache_dir / "binance-com.json").write_text("{not json")
+
+        self.assertIsNone(self.cache.load_entry("binance-com"))
+
+    def test_parse_content_skips_decoding_known_content(self):
+        content_hash, exchange_info = self.cache.parse_content('{"symbols": []}')
+
+        self.assertEqual({"symbols": []}, exchange_info)
+        self.assertEqual((content_hash, None), self.cache.parse_content('{"symbols": []}', content_hash))
+
+
+class ExchangeInfoCacheConnectorTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ExchangeInfoCache(cache_dir=Path(self._temp_dir.name))
+        ExchangeInfoCache.set_shared_instance(self.cache)
+        self.url = web_utils.public_rest_url(CONSTANTS.EXCHANGE_INFO_PATH_URL)
+        self.url_regex = re.compile(f"^{self.url}".replace(".", r"\.").replace("?", r"\?") + ".*")
+
+    def tearDown(self) -> None:
+        ExchangeInfoCache.set_shared_instance(None)
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def create_exchange(self, with_symbol_map: bool = True) -> BinanceExchange:
+        exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        exchange._time_synchronizer.add_time_offset_ms_sample(0)
+        if with_symbol_map:
+            exchange._set_trading_pair_symbol_map(bidict({"COINALPHAHBOT": self.trading_pair}))
+        return exchange
+
+    @property
+    def exchange_info(self):
+        return {
+            "timezone": "UTC",
+            "serverTime": 1565246363776,
+            "rateLimits": [{}],
+            "exchangeFilters": [],
+            "symbols": [
+                {
+                    "symbol": "COINALPHAHBOT",
+                    "status": "TRADING",
+                    "baseAsset": "COINALPHA",
+                    "quoteAsset": "HBOT",
+                    "orderTypes": ["LIMIT", "LIMIT_MAKER"],
+                    "isSpotTradingAllowed": True,
+                    "filters": [
+                        {"filterType": "PRICE_FILTER", "tickSize": "0.00000100"},
+                        {"filterType": "LOT_SIZE", "minQty": "0.00100000", "stepSize": "0.00100000"},
+                        {"filterType": "MIN_NOTIONAL", "minNotional": "0.00100000"},
+                    ],
+                    "permissions": ["SPOT"],
+                }
+            ],
+        }
+
+    @aioresponses()
+    def test_trading_rules_stored_and_restored_from_cache(self, mock_api):
+        mock_api.get(self.url_regex, body=json.dumps(self.exchange_info), headers={"ETag": "someETag"})
+        exchange = self.create_exchange()
+
+        self.async_run_with_timeout(exchange._update_trading_rules())
+
+        self.assertIn(self.trading_pair, exchange.trading_rules)
+        self.assertEqual("someETag", self.cache.load_entry(exchange._name_and_domain_key()).etag)
+
+        # A new instance gets the rules and the symbol map from the cache, without any request
+        restarted_exchange = self.create_exchange(with_symbol_map=False)
+        with patch.object(restarted_exchange, "_format_trading_rules",
+                          wraps=restarted_exchange._format_trading_rules) as format_mock:
+            self.async_run_with_timeout(restarted_exchange._update_trading_rules())
+
+        # The rules are parsed by the connector, which might initialize other state while parsing them
+        format_mock.assert_called_once_with(self.exchange_info)
+
+        self.assertEqual(repr(exchange.trading_rules[self.trading_pair]),
+                         repr(restarted_exchange.trading_rules[self.trading_pair]))
+        self.assertTrue(restarted_exchange.trading_pair_symbol_map_ready())
+        self.assertEqual(1, len(mock_api.requests))
+
+    @aioresponses()
+    def test_not_modified_exchange_info_is_not_parsed_again(self, mock_api):
+        mock_api.get(self.url_regex, body=json.dumps(self.exchange_info), headers={"ETag": "someETag"})
+        mock_api.get(self.url_regex, status=304)
+        exchange = self.create_exchange()
+        self.async_run_with_timeout(exchange._update_trading_rules())
+
+        with patch.object(exchange, "_format_trading_rules") as format_mock:
+            self.async_run_with_timeout(exchange._update_trading_rules())
+
+        format_mock.assert_not_called()
+        self.assertIn(self.trading_pair, exchange.trading_rules)
+        request = list(mock_api.requests.values())[0][1]
+        self.assertEqual("someETag", request.kwargs["headers"]["If-None-Match"])
+
+    @aioresponses()
+    def test_unchanged_content_is_detected_by_hash(self, mock_api):
+        mock_api.get(self.url_regex, body=json.dumps(self.exchange_info))
+        mock_api.get(self.url_regex, body=json.dumps(self.exchange_info))
+        exchange = self.create_exchange()
+        self.async_run_with_timeout(exchange._update_trading_rules())
+
+        with patch.object(exchange, "_format_trading_rules") as format_mock:
+            self.async_run_with_timeout(exchange._update_trading_rules())
+
+        format_mock.assert_not_called()
+        self.assertEqual(2, len(list(mock_api.requests.values())[0]))
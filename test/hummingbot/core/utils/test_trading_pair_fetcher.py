@@ -1,7 +1,9 @@
 import asyncio
 import json
+import tempfile
 import unittest
 from decimal import Decimal
+from pathlib import Path
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +16,7 @@ from hummingbot.client.settings import ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
 
 
 class TestTradingPairFetcher(unittest.TestCase):
@@ -67,6 +70,32 @@ class TestTradingPairFetcher(unittest.TestCase):
         # Need to reset TradingPairFetcher module so next time it gets imported it works as expected
         TradingPairFetcher._sf_shared_instance = None
 
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self._temp_dir.name) / "trading_pairs_cache.json"
+        cache_path_patch = patch(
+            "hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._trading_pairs_cache_path",
+            return_value=self.cache_path)
+        self.cache_path_mock = cache_path_patch.start()
+        self.addCleanup(cache_path_patch.stop)
+        configured_connectors_patch = patch(
+            "hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._configured_connector_names",
+            return_value=set())
+        self.configured_connectors_mock = configured_connectors_patch.start()
+        self.addCleanup(configured_connectors_patch.stop)
+
+    def tearDown(self) -> None:
+        TradingPairsCache.set_shared_instance(None)
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def _save_cached_trading_pairs(self, connector_name: str, trading_pairs, timestamp: float):
+        cache = TradingPairsCache(file_path=self.cache_path, ttl=100)
+        with patch("hummingbot.core.utils.trading_pairs_cache.TradingPairsCache._time", return_value=timestamp):
+            cache.set_trading_pairs(connector_name, trading_pairs)
+        cache.save()
+
     def test_trading_pair_fetcher_returns_same_instance_when_get_new_instance_once_initialized(self):
         instance = TradingPairFetcher.get_instance()
         self.assertIs(instance, TradingPairFetcher.get_instance())
@@ -255,3 +284,74 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(1, len(perp_pairs))
         self.assertIn("ABC-USD", perp_pairs)
         self.assertNotIn("WETH-USDT", perp_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_fetched_trading_pairs_are_stored_in_cache(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mockConnector": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        cache = TradingPairsCache(file_path=self.cache_path, ttl=100)
+        cache.load()
+        self.assertEqual(["MOCK-HBOT"], cache.get_trading_pairs("mockConnector"))
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_cached_trading_pairs_are_served_without_fetching(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mockConnector": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+        # The entry is expired, but the connector is not configured by the user, so it is not refreshed
+        self._save_cached_trading_pairs("mockConnector", ["CACHED-HBOT"], timestamp=0)
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        connector.all_trading_pairs.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_expired_cached_trading_pairs_are_refreshed_for_configured_connectors(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mockConnector": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+        self.configured_connectors_mock.return_value = {"mockConnector"}
+        self._save_cached_trading_pairs("mockConnector", ["CACHED-HBOT"], timestamp=0)
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_cache_disabled_fetches_all_connectors(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mockConnector": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+        self._save_cached_trading_pairs("mockConnector", ["CACHED-HBOT"], timestamp=0)
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.trading_pairs_cache.trading_pairs_cache_enabled = False
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.assertIsNone(TradingPairsCache.shared_instance())
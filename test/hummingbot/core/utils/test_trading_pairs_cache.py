@@ -0,0 +1,133 @@
+import asyncio
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.derivative.binance_perpetual import binance_perpetual_constants as CONSTANTS
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_derivative import BinancePerpetualDerivative
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
+
+
+class TradingPairsCacheTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self._temp_dir.name) / "trading_pairs_cache.json"
+        self.cache = TradingPairsCache(file_path=self.cache_path, ttl=100)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+        TradingPairsCache.set_shared_instance(None)
+        super().tearDown()
+
+    def test_empty_cache_has_no_entries(self):
+        self.cache.load()
+
+        self.assertIsNone(self.cache.get_trading_pairs("binance"))
+        self.assertIsNone(self.cache.get_symbol_map("binance"))
+        self.assertFalse(self.cache.is_trading_pairs_entry_fresh("binance"))
+
+    def test_save_and_load_round_trip(self):
+        self.cache.set_trading_pairs("binance", ["ETH-BTC", "LTC-BTC"])
+        self.cache.set_symbol_map("binance", {"ETHBTC": "ETH-BTC", "LTCBTC": "LTC-BTC"})
+        self.cache.save()
+
+        loaded_cache = TradingPairsCache(file_path=self.cache_path, ttl=100)
+        loaded_cache.load()
+
+        self.assertEqual(["ETH-BTC", "LTC-BTC"], loaded_cache.get_trading_pairs("binance"))
+        self.assertEqual({"ETHBTC": "ETH-BTC", "LTCBTC": "LTC-BTC"}, loaded_cache.get_symbol_map("binance"))
+        self.assertTrue(loaded_cache.is_trading_pairs_entry_fresh("binance"))
+
+    def test_save_does_not_write_when_nothing_changed(self):
+        self.cache.save()
+
+        self.assertFalse(self.cache_path.exists())
+
+    @patch("hummingbot.core.utils.trading_pairs_cache.TradingPairsCache._time")
+    def test_expired_entries(self, time_mock):
+        time_mock.return_value = 1000
+        self.cache.set_trading_pairs("binance", ["ETH-BTC"])
+        self.cache.set_symbol_map("binance", {"ETHBTC": "ETH-BTC"})
+
+        time_mock.return_value = 1101
+
+        self.assertFalse(self.cache.is_trading_pairs_entry_fresh("binance"))
+        self.assertEqual(["ETH-BTC"], self.cache.get_trading_pairs("binance"))
+        self.assertIsNone(self.cache.get_symbol_map("binance"))
+        self.assertEqual({"ETHBTC": "ETH-BTC"}, self.cache.get_symbol_map("binance", only_fresh=False))
+
+    def test_corrupted_file_results_in_empty_cache(self):
+        self.cache_path.write_text("{not json")
+
+        self.cache.load()
+
+        self.assertIsNone(self.cache.get_trading_pairs("binance"))
+
+    def test_saved_file_content(self):
+        self.cache.set_trading_pairs("binance", ["ETH-BTC"])
+        self.cache.save()
+
+        content = json.loads(self.cache_path.read_text())
+
+        self.assertEqual(["ETH-BTC"], content[TradingPairsCache.TRADING_PAIRS_KEY]["binance"]["data"])
+        self.assertEqual({}, content[TradingPairsCache.SYMBOL_MAPS_KEY])
+
+    def test_save_async_writes_file_out_of_event_loop(self):
+        write_threads = []
+        write_entries = self.cache._write_entries
+
+        def write_entries_in_thread(entries):
+            write_threads.append(threading.current_thread())
+            return write_entries(entries)
+
+        self.cache.set_trading_pairs("binance", ["ETH-BTC"])
+        with patch.object(self.cache, "_write_entries", side_effect=write_entries_in_thread):
+            asyncio.get_event_loop().run_until_complete(self.cache.save_async())
+            asyncio.get_event_loop().run_until_complete(self.cache.save_async())
+
+        content = json.loads(self.cache_path.read_text())
+        self.assertEqual(["ETH-BTC"], content[TradingPairsCache.TRADING_PAIRS_KEY]["binance"]["data"])
+        # The file is only written again when the content changes
+        self.assertEqual(1, len(write_threads))
+        self.assertIsNot(threading.main_thread(), write_threads[0])
+
+    def test_connector_symbol_maps_cached_by_domain(self):
+        TradingPairsCache.set_shared_instance(self.cache)
+        exchange = BinancePerpetualDerivative(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                              trading_pairs=["COINALPHA-HBOT"])
+        self.cache.set_symbol_map(exchange._name_and_domain_key(), {"COINALPHAHBOT": "COINALPHA-HBOT"})
+        testnet_exchange = BinancePerpetualDerivative(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                                      trading_pairs=["COINALPHA-HBOT"],
+                                                      domain=CONSTANTS.TESTNET_DOMAIN)
+
+        with patch.object(exchange, "_make_trading_pairs_request", new_callable=AsyncMock) as request_mock:
+            asyncio.get_event_loop().run_until_complete(exchange._initialize_trading_pair_symbol_map())
+        with patch.object(testnet_exchange, "_make_trading_pairs_request", new_callable=AsyncMock,
+                          return_value={"symbols": []}) as testnet_request_mock:
+            asyncio.get_event_loop().run_until_complete(testnet_exchange._initialize_trading_pair_symbol_map())
+
+        # Both connectors have the same name, but the testnet can't use the symbols of the main domain
+        self.assertEqual(exchange.name, testnet_exchange.name)
+        request_mock.assert_not_called()
+        self.assertTrue(exchange.trading_pair_symbol_map_ready())
+        testnet_request_mock.assert_called_once()
+
+    def test_symbol_map_cache_not_used_by_connectors_not_supporting_it(self):
+        TradingPairsCache.set_shared_instance(self.cache)
+        exchange = BinancePerpetualDerivative(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                              trading_pairs=["COINALPHA-HBOT"])
+        self.cache.set_symbol_map(exchange._name_and_domain_key(), {"COINALPHAHBOT": "COINALPHA-HBOT"})
+
+        with patch.object(exchange, "_trading_pair_symbol_map_cache_supported", return_value=False):
+            with patch.object(exchange, "_make_trading_pairs_request", new_callable=AsyncMock,
+                              return_value={"symbols": []}) as request_mock:
+                asyncio.get_event_loop().run_until_complete(exchange._initialize_trading_pair_symbol_map())
+
+        request_mock.assert_called_once()
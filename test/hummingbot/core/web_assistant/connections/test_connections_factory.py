@@ -1,8 +1,14 @@
 import asyncio
 import unittest
+from types import SimpleNamespace
 from typing import Awaitable
 
+import aiohttp
+from multidict import CIMultiDict
+from yarl import URL
+
 from hummingbot.core.web_assistant.connections.connections_factory import (
+    ConnectionPoolSettings,
     ConnectionsFactory
 )
 from hummingbot.core.web_assistant.connections.rest_connection import (
@@ -34,3 +40,40 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_shared_client_uses_pool_settings(self):
+        factory = ConnectionsFactory()
+        factory.pool_settings = ConnectionPoolSettings(limit=50, limit_per_host=5, dns_cache_ttl=30,
+                                                       keepalive_timeout=60)
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        connector = rest_connection._client_session.connector
+
+        self.assertEqual(50, connector.limit)
+        self.assertEqual(5, connector.limit_per_host)
+        self.assertTrue(connector.use_dns_cache)
+        self.assertEqual(60, connector._keepalive_timeout)
+        self.async_run_with_timeout(rest_connection._client_session.close())
+
+    def test_host_metrics_register_new_and_reused_connections(self):
+        factory = ConnectionsFactory()
+
+        for reused in [False, True, True]:
+            trace_config_ctx = SimpleNamespace()
+            self.async_run_with_timeout(factory._on_request_start(
+                None,
+                trace_config_ctx,
+                aiohttp.TraceRequestStartParams(method="GET", url=URL("https://api.test.com/ping"),
+                                                headers=CIMultiDict())))
+            if reused:
+                self.async_run_with_timeout(factory._on_connection_reuseconn(
+                    None, trace_config_ctx, aiohttp.TraceConnectionReuseconnParams()))
+            else:
+                self.async_run_with_timeout(factory._on_connection_create_end(
+                    None, trace_config_ctx, aiohttp.TraceConnectionCreateEndParams()))
+
+        metrics = factory.host_metrics["api.test.com"]
+        self.assertEqual(3, metrics.requests)
+        self.assertEqual(1, metrics.new_connections)
+        self.assertEqual(2, metrics.reused_connections)
+        self.assertAlmostEqual(2 / 3, metrics.reuse_ratio)
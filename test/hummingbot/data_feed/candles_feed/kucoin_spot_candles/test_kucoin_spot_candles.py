@@ -145,6 +145,19 @@ class TestKucoinSpotCandles(unittest.TestCase):
         self.assertEqual(resp.shape[0], len(data_mock["data"]))
         self.assertEqual(resp.shape[1], 7)
 
+    @aioresponses()
+    def test_fetch_candles_range_returns_candles_base_columns_in_milliseconds(self, mock_api: aioresponses):
+        regex_url = re.compile(f"^{CONSTANTS.REST_URL}{CONSTANTS.CANDLES_ENDPOINT}".replace(".", r"\.") + ".*")
+        data_mock = self.get_candles_rest_data_mock()
+        mock_api.get(url=regex_url, body=json.dumps(data_mock))
+
+        resp = self.async_run_with_timeout(self.data_feed.fetch_candles_range(1672981200000, 1672992000000))
+
+        self.assertEqual((len(data_mock["data"]), len(self.data_feed.columns)), resp.shape)
+        self.assertEqual(1672981200000, resp[0][0])
+        request_params = list(mock_api.requests.values())[0][0].kwargs["params"]
+        self.assertEqual(1672981200, request_params["startAt"])
+
     def test_candles_empty(self):
         self.assertTrue(self.data_feed.candles_df.empty)
 
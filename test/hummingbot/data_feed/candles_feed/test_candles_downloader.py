@@ -0,0 +1,197 @@
+import asyncio
+import re
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+from aioresponses import CallbackResult, aioresponses
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.candles_downloader import CandlesDownloader
+from hummingbot.data_feed.candles_feed.gate_io_perpetual_candles import constants as GATE_IO_PERPETUAL_CONSTANTS
+
+HOUR_MS = 60 * 60 * 1000
+CHUNK_MS = CONSTANTS.MAX_RECORDS_PER_REQUEST * HOUR_MS
+
+
+class CandlesDownloaderTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.url_regex = re.compile(f"^{CONSTANTS.REST_URL}{CONSTANTS.CANDLES_ENDPOINT}".replace(".", r"\.") + ".*")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        # Two complete chunks and the open one
+        self.start_time = 10 * CHUNK_MS // 1000
+        self.now = 12 * CHUNK_MS // 1000 + 5 * 3600
+        self.missing_timestamps = set()
+        self.requested_ranges = []
+        time_patcher = patch("hummingbot.data_feed.candles_feed.candles_downloader.CandlesDownloader._time",
+                             return_value=self.now)
+        time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def create_downloader(self) -> CandlesDownloader:
+        return CandlesDownloader(connector="binance",
+                                 trading_pairs=["BTC-USDT"],
+                                 intervals=["1h"],
+                                 start_time=self.start_time,
+                                 data_dir=self._temp_dir.name)
+
+    def klines_callback(self, url, **kwargs):
+        start_time = int(url.query["startTime"])
+        end_time = min(int(url.query["endTime"]), self.now * 1000)
+        self.requested_ranges.append((start_time, end_time))
+        candles = [
+            [timestamp, "1", "2", "0.5", "1.5", "10", timestamp + HOUR_MS - 1, "15", 4, "5", "7", "0"]
+            for timestamp in range(start_time, end_time + 1, HOUR_MS)
+            if timestamp not in self.missing_timestamps
+        ]
+        return CallbackResult(payload=candles)
+
+    @aioresponses()
+    def test_download_stores_chunks_and_merged_file(self, mock_api):
+        mock_api.get(self.url_regex, callback=self.klines_callback, repeat=True)
+        downloader = self.create_downloader()
+
+        self.assertEqual(3, len(downloader.pending_chunks()))
+        results = self.async_run_with_timeout(downloader.download())
+
+        result = results[("BTC-USDT", "1h")]
+        self.assertEqual(2 * CONSTANTS.MAX_RECORDS_PER_REQUEST + 6, result.records)
+        self.assertEqual([], result.gaps)
+        df = pd.read_csv(result.file_path)
+        self.assertEqual(self.start_time * 1000, df["timestamp"].iloc[0])
+        self.assertEqual(self.now * 1000, df["timestamp"].iloc[-1])
+        self.assertEqual(sorted([(10 * CHUNK_MS, 11 * CHUNK_MS - 1),
+                                 (11 * CHUNK_MS, 12 * CHUNK_MS - 1),
+                                 (12 * CHUNK_MS, self.now * 1000)]),
+                         sorted(self.requested_ranges))
+        # Only the chunk with candles not closed yet is requested again
+        self.assertEqual([12 * CHUNK_MS], [chunk.start_time_ms for chunk in downloader.pending_chunks()])
+
+    @aioresponses()
+    def test_download_resumed_from_stored_chunks(self, mock_api):
+        mock_api.get(self.url_regex, callback=self.klines_callback, repeat=True)
+        self.async_run_with_timeout(self.create_downloader().download())
+        self.requested_ranges.clear()
+
+        results = self.async_run_with_timeout(self.create_downloader().download())
+
+        self.assertEqual([(12 * CHUNK_MS, self.now * 1000)], self.requested_ranges)
+        self.assertEqual(2 * CONSTANTS.MAX_RECORDS_PER_REQUEST + 6, results[("BTC-USDT", "1h")].records)
+
+    @aioresponses()
+    def test_gaps_reported(self, mock_api):
+        mock_api.get(self.url_regex, callback=self.klines_callback, repeat=True)
+        gap_start = 11 * CHUNK_MS - 2 * HOUR_MS
+        self.missing_timestamps = {gap_start + HOUR_MS, gap_start + 2 * HOUR_MS}
+
+        results = self.async_run_with_timeout(self.create_downloader().download())
+
+        self.assertEqual([(gap_start, gap_start + 3 * HOUR_MS)], results[("BTC-USDT", "1h")].gaps)
+
+    @aioresponses()
+    def test_empty_chunk_not_stored(self, mock_api):
+        mock_api.get(self.url_regex, callback=self.klines_callback, repeat=True)
+        self.missing_timestamps = set(range(10 * CHUNK_MS, 11 * CHUNK_MS, HOUR_MS))
+        downloader = self.create_downloader()
+
+        results = self.async_run_with_timeout(downloader.download())
+
+        self.assertEqual(CONSTANTS.MAX_RECORDS_PER_REQUEST + 6, results[("BTC-USDT", "1h")].records)
+        self.assertEqual([10 * CHUNK_MS, 12 * CHUNK_MS],
+                         sorted(chunk.start_time_ms for chunk in downloader.pending_chunks()))
+
+    def test_candles_without_the_candles_base_columns_rejected(self):
+        downloader = self.create_downloader()
+        feed = downloader._feeds[("BTC-USDT", "1h")]
+        # Candles with seven columns and the timestamps in seconds
+        candles = np.array([[10 * CHUNK_MS // 1000, 1, 2, 0.5, 1.5, 10, 15]], dtype=float)
+
+        with patch.object(feed, "fetch_candles_range", AsyncMock(return_value=candles)):
+            with self.assertRaises(ValueError):
+                self.async_run_with_timeout(downloader.download())
+        self.assertEqual(3, len(downloader.pending_chunks()))
+
+    def test_candles_with_timestamps_in_seconds_rejected(self):
+        downloader = self.create_downloader()
+        feed = downloader._feeds[("BTC-USDT", "1h")]
+        candles = np.array([[10 * CHUNK_MS // 1000, 1, 2, 0.5, 1.5, 10, 15, 4, 5, 7]], dtype=float)
+
+        with patch.object(feed, "fetch_candles_range", AsyncMock(return_value=candles)):
+            with self.assertRaises(ValueError):
+                self.async_run_with_timeout(downloader.download())
+        self.assertEqual(3, len(downloader.pending_chunks()))
+
+
+class GateioPerpetualCandlesDownloaderTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.candles_url_regex = re.compile(
+            f"^{GATE_IO_PERPETUAL_CONSTANTS.REST_URL}{GATE_IO_PERPETUAL_CONSTANTS.CANDLES_ENDPOINT}".replace(".", r"\.")
+            + ".*")
+        cls.contract_url = (GATE_IO_PERPETUAL_CONSTANTS.REST_URL
+                            + GATE_IO_PERPETUAL_CONSTANTS.CONTRACT_INFO_URL.format(contract="BTC_USDT"))
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.start_time = 10 * CHUNK_MS // 1000
+        self.now = 11 * CHUNK_MS // 1000 + 5 * 3600
+        time_patcher = patch("hummingbot.data_feed.candles_feed.candles_downloader.CandlesDownloader._time",
+                             return_value=self.now)
+        time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def candles_callback(self, url, **kwargs):
+        # The exchange expects and returns the timestamps in seconds, and the volumes in contracts
+        start_time = int(url.query["from"])
+        end_time = min(int(url.query["to"]), self.now)
+        candles = [
+            {"t": timestamp, "o": "1", "h": "2", "l": "0.5", "c": "1.5", "v": 10, "sum": "15"}
+            for timestamp in range(start_time, end_time + 1, 3600)
+        ]
+        return CallbackResult(payload=candles)
+
+    @aioresponses()
+    def test_download_without_network_started_converts_volumes(self, mock_api):
+        mock_api.get(self.contract_url, payload={"name": "BTC_USDT", "quanto_multiplier": "0.0001"}, repeat=True)
+        mock_api.get(self.candles_url_regex, callback=self.candles_callback, repeat=True)
+        downloader = CandlesDownloader(connector="gate_io_perpetual",
+                                       trading_pairs=["BTC-USDT"],
+                                       intervals=["1h"],
+                                       start_time=self.start_time,
+                                       data_dir=self._temp_dir.name)
+
+        results = self.async_run_with_timeout(downloader.download())
+
+        result = results[("BTC-USDT", "1h")]
+        self.assertEqual((self.now - self.start_time) // 3600 + 1, result.records)
+        self.assertEqual([], result.gaps)
+        df = pd.read_csv(result.file_path)
+        self.assertEqual(self.start_time * 1000, df["timestamp"].iloc[0])
+        self.assertEqual(self.now * 1000, df["timestamp"].iloc[-1])
+        self.assertTrue((df["volume"] == 0.001).all())
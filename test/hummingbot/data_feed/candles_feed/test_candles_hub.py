@@ -0,0 +1,206 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub, DerivedCandlesView, StreamCandlesView
+
+
+class CandlesHubTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.hub = CandlesHub(connector="binance")
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.hub.stop())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    def base_candle(timestamp: int, open: float, high: float, low: float, close: float, volume: float):
+        # The websocket candles are stored with the values received from the exchange
+        return np.array([timestamp, str(open), str(high), str(low), str(close), str(volume),
+                         str(volume * 10), 5, str(volume / 2), str(volume * 5)])
+
+    @staticmethod
+    def kline_message(symbol: str, timestamp: int, close: str):
+        return {
+            "e": "kline",
+            "E": timestamp + 1000,
+            "s": symbol,
+            "k": {"t": timestamp, "T": timestamp + 59999, "s": symbol, "i": "1m", "o": "10", "c": close,
+                  "h": "12", "l": "9", "v": "1", "n": 3, "x": False, "q": "10", "V": "0.5", "Q": "5"},
+        }
+
+    def test_subscriptions_share_views_and_streams(self):
+        view = self.hub.subscribe("BTC-USDT", "1m", max_records=10)
+        same_view = self.hub.subscribe("BTC-USDT", "1m", max_records=20)
+        derived_view = self.hub.subscribe("BTC-USDT", "5m", max_records=10)
+        other_derived_view = self.hub.subscribe("BTC-USDT", "1h", max_records=10)
+        native_view = self.hub.subscribe("BTC-USDT", "1w", max_records=10)
+
+        self.assertIs(view, same_view)
+        self.assertIsInstance(view, StreamCandlesView)
+        self.assertEqual(20, view.max_records)
+        self.assertIsInstance(derived_view, DerivedCandlesView)
+        self.assertIsInstance(other_derived_view, DerivedCandlesView)
+        self.assertIsInstance(native_view, StreamCandlesView)
+        self.assertEqual([("BTC-USDT", "1m"), ("BTC-USDT", "1w")], self.hub.streams)
+
+        self.hub.unsubscribe(native_view)
+        self.hub.unsubscribe(view)
+        self.assertEqual([("BTC-USDT", "1m")], self.hub.streams)
+        self.hub.unsubscribe(derived_view)
+        self.hub.unsubscribe(other_derived_view)
+        self.hub.unsubscribe(view)
+        self.assertEqual([], self.hub.streams)
+
+    def test_derived_candles_resampled_from_base_candles(self):
+        view = self.hub.subscribe("BTC-USDT", "5m", max_records=3)
+        base_feed = view.base_feed
+        history = np.array([
+            [1672980900000, 1, 2, 0.5, 1.5, 100, 1000, 50, 50, 500],
+            [1672981200000, 1.5, 1.8, 1.4, 1.6, 3, 30, 2, 1, 10],
+        ], dtype=float)
+        view.set_history(history)
+
+        # The 1m candles of the current 5m candle are available from its start
+        minute = 60 * 1000
+        for i in range(7):
+            base_feed._candles.append(
+                self.base_candle(1672981200000 + i * minute, open=2 + i, high=3 + i, low=1 + i, close=2.5 + i, volume=1))
+
+        df = view.candles_df
+
+        self.assertEqual([1672980900000, 1672981200000, 1672981500000], df["timestamp"].tolist())
+        # The oldest candle is the one received from the exchange
+        self.assertEqual(100, df["volume"].iloc[0])
+        self.assertEqual([2, 7, 1, 6.5, 5, 50, 25, 2.5, 25], df.iloc[1].tolist()[1:])
+        self.assertEqual([7, 9, 6, 8.5, 2, 20, 10, 1, 10], df.iloc[2].tolist()[1:])
+        self.assertTrue(view.is_ready)
+        self.assertEqual(1672981500000, view.last_candle[0])
+
+    def test_incomplete_derived_candle_not_replaced(self):
+        view = self.hub.subscribe("BTC-USDT", "5m", max_records=3)
+        view.set_history(np.array([[1672981200000, 1.5, 1.8, 1.4, 1.6, 3, 30, 2, 1, 10]], dtype=float))
+        # The first 1m candle received is in the middle of the 5m candle
+        view.base_feed._candles.append(self.base_candle(1672981320000, open=2, high=3, low=1, close=2.5, volume=1))
+
+        self.assertEqual([1672981200000, 1.5, 1.8, 1.4, 1.6, 3, 30, 2, 1, 10], view.last_candle)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    def test_streams_multiplexed_in_one_connection(self, _, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        btc_view = self.hub.subscribe("BTC-USDT", "1m", max_records=10)
+        eth_view = self.hub.subscribe("ETH-USDT", "1m", max_records=10)
+        eth_derived_view = self.hub.subscribe("ETH-USDT", "3m", max_records=10)
+
+        with patch.object(CandlesHub, "_load_history_if_started"):
+            self.async_run_with_timeout(self.hub.start())
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({"result": None, "id": 1}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.kline_message("ETHUSDT", 1672981200000, close="11")))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.kline_message("BTCUSDT", 1672981200000, close="10.5")))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, self.hub.connections_count)
+        self.assertEqual(1, ws_connect_mock.call_count)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m", "ethusdt@kline_1m"], "id": 1}],
+                         sent_messages)
+        self.assertEqual(10.5, btc_view.last_candle[4])
+        self.assertEqual(11, eth_view.last_candle[4])
+        self.assertEqual(1672981200000, eth_derived_view.last_candle[0])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    @patch("hummingbot.data_feed.candles_feed.candles_hub.SUBSCRIPTIONS_UPDATE_DELAY", new=0)
+    def test_streams_updated_through_open_connection(self, _, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        btc_view = self.hub.subscribe("BTC-USDT", "1m", max_records=10)
+        self.async_run_with_timeout(self.hub.start())
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.kline_message("BTCUSDT", 1672981200000, close="10.5")))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        eth_view = self.hub.subscribe("ETH-USDT", "1m", max_records=10)
+        sol_view = self.hub.subscribe("SOL-USDT", "1m", max_records=10)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.hub.unsubscribe(eth_view)
+        self.hub.unsubscribe(sol_view)
+        self.hub.subscribe("XRP-USDT", "1m", max_records=10)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(1, self.hub.connections_count)
+        self.assertEqual(1, ws_connect_mock.call_count)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        # The changes of the streams are sent in a single message per subscription method
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1},
+                          {"method": "SUBSCRIBE", "params": ["ethusdt@kline_1m", "solusdt@kline_1m"], "id": 1},
+                          {"method": "UNSUBSCRIBE", "params": ["ethusdt@kline_1m", "solusdt@kline_1m"], "id": 2},
+                          {"method": "SUBSCRIBE", "params": ["xrpusdt@kline_1m"], "id": 1}],
+                         sent_messages)
+        # The candles of the streams not changed are kept
+        self.assertEqual(10.5, btc_view.last_candle[4])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    @patch("hummingbot.data_feed.candles_feed.candles_hub.SUBSCRIPTIONS_UPDATE_DELAY", new=0)
+    def test_stream_added_and_removed_before_update_not_sent(self, _, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.hub.subscribe("BTC-USDT", "1m", max_records=10)
+        self.async_run_with_timeout(self.hub.start())
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.kline_message("BTCUSDT", 1672981200000, close="10.5")))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        eth_view = self.hub.subscribe("ETH-USDT", "1m", max_records=10)
+        self.hub.unsubscribe(eth_view)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1}], sent_messages)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.max_streams_per_connection",
+           new=2)
+    def test_new_connection_opened_when_connections_full(self, _, ws_connect_mock):
+        ws_connect_mock.side_effect = lambda *args, **kwargs: self.mocking_assistant.create_websocket_mock()
+        self.hub.subscribe("BTC-USDT", "1m", max_records=10)
+        eth_view = self.hub.subscribe("ETH-USDT", "1m", max_records=10)
+        self.async_run_with_timeout(self.hub.start())
+
+        self.hub.subscribe("SOL-USDT", "1m", max_records=10)
+        self.assertEqual(2, self.hub.connections_count)
+
+        self.hub.unsubscribe(eth_view)
+        self.hub.subscribe("XRP-USDT", "1m", max_records=10)
+        # The stream is added to the connection with room for it
+        self.assertEqual(2, self.hub.connections_count)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(2, ws_connect_mock.call_count)
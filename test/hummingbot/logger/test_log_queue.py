@@ -0,0 +1,109 @@
+import logging
+import threading
+import unittest
+
+from hummingbot.logger.log_queue import (
+    LogQueue,
+    QueueLogHandler,
+    add_log_handler,
+    install_log_queue,
+    remove_log_handler,
+    uninstall_log_queue,
+)
+
+
+class RecordsHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+        self.threads.add(threading.current_thread())
+
+
+class LogQueueTests(unittest.TestCase):
+    logger_name = "hummingbot.test_log_queue"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.logger = logging.getLogger(self.logger_name)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.handler = RecordsHandler()
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self) -> None:
+        uninstall_log_queue()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        super().tearDown()
+
+    def test_records_written_by_listener_thread(self):
+        install_log_queue({"loggers": {self.logger_name: {}}}, {"enabled": True})
+
+        self.assertIsInstance(self.logger.handlers[0], QueueLogHandler)
+        self.logger.info("Order %s created", "OID1")
+        uninstall_log_queue()
+
+        self.assertEqual(1, len(self.handler.records))
+        self.assertEqual("Order OID1 created", self.handler.records[0].getMessage())
+        self.assertNotIn(threading.current_thread(), self.handler.threads)
+
+    def test_target_handlers_levels_respected(self):
+        warning_handler = RecordsHandler(level=logging.WARNING)
+        self.logger.addHandler(warning_handler)
+        install_log_queue({"loggers": {self.logger_name: {}}}, {"enabled": True})
+
+        self.logger.info("Info message")
+        self.logger.warning("Warning message")
+        uninstall_log_queue()
+
+        self.assertEqual(2, len(self.handler.records))
+        self.assertEqual(["Warning message"], [record.getMessage() for record in warning_handler.records])
+
+    def test_debug_records_sampled_and_records_dropped_when_full(self):
+        log_queue = LogQueue(max_size=10, debug_sampling_threshold_pct=50, debug_sampling_rate=2)
+        queue_handler = QueueLogHandler(log_queue, [self.handler])
+
+        for i in range(5):
+            queue_handler.handle(self.logger.makeRecord(self.logger_name, logging.DEBUG, "", 0, f"{i}", None, None))
+        self.assertEqual(5, log_queue.queue_depth)
+
+        # Above the threshold only one of every two debug records is queued
+        for i in range(4):
+            queue_handler.handle(self.logger.makeRecord(self.logger_name, logging.DEBUG, "", 0, f"{i}", None, None))
+        self.assertEqual(7, log_queue.queue_depth)
+        self.assertEqual(2, log_queue.sampled_out_records)
+
+        for i in range(5):
+            queue_handler.handle(self.logger.makeRecord(self.logger_name, logging.WARNING, "", 0, f"{i}", None, None))
+
+        metrics = log_queue.metrics()
+        self.assertEqual(10, metrics["queue_depth"])
+        self.assertEqual(10, metrics["max_queue_depth"])
+        self.assertEqual({"WARNING": 2}, metrics["dropped_records"])
+
+    def test_caller_info_skipped_only_when_not_formatted(self):
+        install_log_queue({"formatters": {"simple": {"format": "%(name)s - %(message)s"}}}, {"enabled": True})
+        self.assertIsNone(logging._srcfile)
+        uninstall_log_queue()
+        self.assertIsNotNone(logging._srcfile)
+
+        install_log_queue({"formatters": {"simple": {"format": "%(funcName)s - %(message)s"}}}, {"enabled": True})
+        self.assertIsNotNone(logging._srcfile)
+
+    def test_handlers_added_behind_queue_handler(self):
+        install_log_queue({"loggers": {self.logger_name: {}}}, {"enabled": True})
+        mqtt_handler = RecordsHandler()
+
+        add_log_handler(self.logger, mqtt_handler)
+        self.logger.info("Forwarded message")
+        remove_log_handler(self.logger, mqtt_handler)
+        self.logger.info("Not forwarded message")
+        uninstall_log_queue()
+
+        self.assertEqual(1, len(self.logger.handlers))
+        self.assertEqual(["Forwarded message"], [record.getMessage() for record in mqtt_handler.records])
+        self.assertEqual(2, len(self.handler.records))
@@ -1,11 +1,21 @@
+from decimal import Decimal
 from unittest import TestCase
+from unittest.mock import patch
 
-from hummingbot.model.trade_fill import TradeFill
+import pandas as pd
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import MarketTradesSummary, TradeFill
 
 
 class TradeFillTests(TestCase):
 
-    def setUp(self) -> None:
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
         super().setUp()
         self.display_name = "test_market"
         self.config_file_path = "test_config"
@@ -16,6 +26,57 @@ class TradeFillTests(TestCase):
         self.quote = "HBOT"
         self.trading_pair = f"{self.base}-{self.quote}"
 
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.session = self.manager.get_new_session()
+
+    def tearDown(self) -> None:
+        self.session.close()
+        super().tearDown()
+
+    def add_trade(self, market: str, timestamp: int, order_id: str = "OID1"):
+        self.session.add(TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market,
+            symbol=self.trading_pair,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type="BUY",
+            order_type="LIMIT",
+            price=Decimal("1.5"),
+            amount=Decimal(timestamp),
+            leverage=1,
+            trade_fee={},
+            exchange_trade_id=f"{market}{timestamp}",
+        ))
+
+    def add_trades(self):
+        self.session.add(Order(
+            id="OID1",
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=self.display_name,
+            symbol=self.trading_pair,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            creation_timestamp=1000,
+            order_type="LIMIT",
+            amount=Decimal("10"),
+            leverage=1,
+            price=Decimal("1.5"),
+            last_status="FILLED",
+            last_update_timestamp=5000,
+        ))
+        for timestamp in (3000, 5000, 4000):
+            self.add_trade(self.display_name, timestamp)
+        self.add_trade("other_market", 2000, order_id="OID2")
+        self.session.commit()
+
     def test_attribute_names_for_file_export(self):
         expected_attributes = [
             "exchange_trade_id",
@@ -37,3 +98,24 @@ class TradeFillTests(TestCase):
             "position", ]
 
         self.assertEqual(expected_attributes, TradeFill.attribute_names_for_file_export())
+
+    def test_get_markets_summary(self):
+        self.add_trades()
+
+        summary = TradeFill.get_markets_summary(self.session, [TradeFill.timestamp >= 2500])
+
+        self.assertEqual([MarketTradesSummary(self.display_name, self.trading_pair, 3, 3000, 5000)], summary)
+
+    def test_iter_pandas_chunks_matches_to_pandas(self):
+        self.add_trades()
+        # The trades are exported from the most recent, like the trades listed by the client
+        trades = self.session.query(TradeFill).order_by(TradeFill.timestamp.desc()).all()
+
+        chunks = list(TradeFill.iter_pandas_chunks(self.session, [], chunk_size=3))
+
+        self.assertEqual([3, 1], [len(chunk) for chunk in chunks])
+        expected_df = TradeFill.to_pandas(trades)
+        self.assertTrue(expected_df.equals(pd.concat(chunks)))
+        self.assertTrue(pd.concat(chunks)["Timestamp"].is_monotonic_decreasing)
+        self.assertEqual("00:00:03", chunks[0]["Age"].iloc[1])
+        self.assertEqual(Decimal("4000"), chunks[0]["Amount"].iloc[1])
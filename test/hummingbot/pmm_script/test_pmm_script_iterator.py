@@ -0,0 +1,212 @@
+import asyncio
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Awaitable
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.pmm_script.pmm_script_channel import pmm_script_channel
+from hummingbot.pmm_script.pmm_script_interface import (
+    CallLog,
+    OnTick,
+    OnTickProcessed,
+    PMMParameters,
+    StrategyParameter,
+)
+from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
+
+SCRIPT = """
+from decimal import Decimal
+
+from hummingbot.pmm_script.pmm_script_base import PMMScriptBase
+
+
+class SpreadScript(PMMScriptBase):
+    def on_tick(self):
+        self.pmm_parameters.bid_spread = self.mid_price / Decimal("10000")
+"""
+
+SLOW_FIRST_TICK_SCRIPT = """
+import time
+from decimal import Decimal
+
+from hummingbot.pmm_script.pmm_script_base import PMMScriptBase
+
+
+class SlowSpreadScript(PMMScriptBase):
+    def on_tick(self):
+        if len(self.mid_prices) == 1:
+            time.sleep(1.5)
+        self.pmm_parameters.bid_spread = self.mid_price / Decimal("10000")
+"""
+
+
+class MockMarket:
+    name = "mock_exchange"
+
+    def add_listener(self, *args):
+        pass
+
+    def get_all_balances(self):
+        return {"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")}
+
+    def get_available_balance(self, token):
+        return self.get_all_balances()[token] / 2
+
+
+class MockStrategy:
+    trading_pair = "COINALPHA-HBOT"
+
+    def __init__(self):
+        self.market_info = SimpleNamespace(market=MockMarket())
+        self.mid_price = Decimal("100")
+        for attr in PMMParameters.__dict__.keys():
+            if attr[:1] != "_":
+                setattr(self, attr, None)
+        self.bid_spread = Decimal("0.01")
+        self.ask_spread = Decimal("0.01")
+
+    def all_markets_ready(self):
+        return True
+
+    def get_mid_price(self):
+        return self.mid_price
+
+
+class PMMScriptChannelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def on_tick(self, mid_price: str, bid_spread: str, balance: str, sequence_number: int = 0) -> OnTick:
+        pmm_parameters = PMMParameters()
+        pmm_parameters._bid_spread = Decimal(bid_spread)
+        pmm_parameters._hanging_orders_enabled = True
+        balances = {"mock_exchange": {"HBOT": Decimal(balance)}}
+        return OnTick(Decimal(mid_price), pmm_parameters, balances, balances, sequence_number=sequence_number)
+
+    def test_ticks_send_only_changes(self):
+        receiver, sender = pmm_script_channel()
+
+        sender.put(self.on_tick("100", "0.01", "10"))
+        first_tick = receiver.get()
+        sender.put(self.on_tick("101.5", "0.01", "10"))
+        unchanged_tick = receiver.get()
+        sender.put(self.on_tick("102", "0.02", "11"))
+        changed_tick = receiver.get()
+
+        self.assertEqual(Decimal("100"), first_tick.mid_price)
+        self.assertEqual(Decimal("101.5"), unchanged_tick.mid_price)
+        self.assertEqual(Decimal("0.01"), unchanged_tick.pmm_parameters.bid_spread)
+        self.assertTrue(unchanged_tick.pmm_parameters.hanging_orders_enabled)
+        self.assertIsNone(unchanged_tick.pmm_parameters.order_override)
+        self.assertEqual({"mock_exchange": {"HBOT": Decimal("10")}}, unchanged_tick.all_total_balances)
+        self.assertEqual(Decimal("0.02"), changed_tick.pmm_parameters.bid_spread)
+        self.assertEqual({"mock_exchange": {"HBOT": Decimal("11")}}, changed_tick.all_available_balances)
+        # The parameters and balances are not sent again when they do not change
+        self.assertLess(len(sender._encode_tick(self.on_tick("102", "0.02", "11"))), 30)
+
+    def test_tick_sequence_numbers_sent(self):
+        receiver, sender = pmm_script_channel()
+
+        sender.put(self.on_tick("100", "0.01", "10", sequence_number=7))
+        sender.put(OnTickProcessed(7))
+
+        self.assertEqual(7, receiver.get().sequence_number)
+        self.assertEqual(7, receiver.get().sequence_number)
+
+    def test_writer_does_not_block_and_replaces_pending_tick_when_pipe_full(self):
+        receiver, sender = pmm_script_channel()
+        sender.start_writer()
+
+        # The message is larger than the pipe buffer, so the writer blocks until it is received
+        sender.put(CallLog("x" * 1_000_000))
+        sender.put(self.on_tick("100", "0.01", "10", sequence_number=1))
+        sender.put(self.on_tick("101", "0.02", "10", sequence_number=2))
+        sender.put(self.on_tick("102", "0.03", "11", sequence_number=3))
+
+        self.assertEqual(1_000_000, len(receiver.get().msg))
+        tick = receiver.get()
+        sender.close()
+
+        self.assertEqual(3, tick.sequence_number)
+        self.assertEqual(Decimal("102"), tick.mid_price)
+        self.assertEqual(Decimal("0.03"), tick.pmm_parameters.bid_spread)
+        self.assertEqual({"mock_exchange": {"HBOT": Decimal("11")}}, tick.all_total_balances)
+        self.assertIsNone(receiver.get())
+
+    def test_messages_received_by_event_loop_reader(self):
+        receiver, sender = pmm_script_channel()
+        received = []
+        receiver.add_reader(self.ev_loop, received.append)
+        parameter = StrategyParameter("ask_spread")
+        parameter.updated_value = Decimal("0.005")
+
+        sender.put(parameter)
+        sender.put(CallLog("message"))
+        sender.close()
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual(3, len(received))
+        self.assertEqual("ask_spread", received[0].name)
+        self.assertEqual(Decimal("0.005"), received[0].updated_value)
+        self.assertEqual("message", received[1].msg)
+        # The closing of the other end is received as None
+        self.assertIsNone(received[2])
+
+
+class PMMScriptIteratorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.script_file_path = Path(self._temp_dir.name) / "spread_script.py"
+        self.script_file_path.write_text(SCRIPT)
+        self.strategy = MockStrategy()
+        self.clock = Clock(ClockMode.BACKTEST, start_time=1000, end_time=2000)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def test_parameters_changed_by_script_applied_in_same_tick(self):
+        iterator = PMMScriptIterator(self.script_file_path,
+                                     [self.strategy.market_info.market],
+                                     self.strategy,
+                                     tick_response_timeout=5,
+                                     is_unit_testing_mode=True)
+        try:
+            iterator.start(self.clock)
+            iterator.tick(1001)
+            self.assertEqual(Decimal("0.01"), self.strategy.bid_spread)
+
+            self.strategy.mid_price = Decimal("200")
+            iterator.tick(1002)
+            self.assertEqual(Decimal("0.02"), self.strategy.bid_spread)
+        finally:
+            iterator.stop(self.clock)
+
+    def test_late_tick_processed_message_does_not_end_next_tick_wait(self):
+        self.script_file_path.write_text(SLOW_FIRST_TICK_SCRIPT)
+        iterator = PMMScriptIterator(self.script_file_path,
+                                     [self.strategy.market_info.market],
+                                     self.strategy,
+                                     tick_response_timeout=1,
+                                     is_unit_testing_mode=True)
+        try:
+            iterator.start(self.clock)
+            # The script takes longer than the timeout to process the first tick
+            iterator.tick(1001)
+            self.assertEqual(Decimal("0.01"), self.strategy.bid_spread)
+
+            # The first tick is acknowledged while waiting for the second one
+            self.strategy.mid_price = Decimal("200")
+            iterator.tick(1002)
+            self.assertEqual(Decimal("0.02"), self.strategy.bid_spread)
+        finally:
+            iterator.stop(self.clock)
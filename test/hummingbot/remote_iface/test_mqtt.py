@@ -1,4 +1,5 @@
 import asyncio
+import queue
 from decimal import Decimal
 from typing import Awaitable
 from unittest import TestCase
@@ -1006,6 +1007,89 @@ class RemoteIfaceMQTTTests(TestCase):
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
         self.assertTrue(self.is_msg_received(events_topic, {}, msg_key = 'data'))
 
+    def test_mqtt_eventforwarder_batches_events(self):
+        self.client_config_map.mqtt_bridge.mqtt_events_batch_window = 0.2
+        self.addCleanup(setattr, self.client_config_map.mqtt_bridge, "mqtt_events_batch_window", 0.0)
+        self.client_config_map.mqtt_bridge.mqtt_events_compression = True
+        self.addCleanup(setattr, self.client_config_map.mqtt_bridge, "mqtt_events_compression", False)
+        self.start_mqtt()
+
+        self.emit_order_expired_event(self.test_market)
+        self.emit_order_expired_event(self.test_market)
+
+        events_topic = f"hbot/{self.instance_id}/events/batch"
+        self.ev_loop.run_until_complete(self.wait_for_rcv(events_topic))
+        batch_msg = self.fake_mqtt_broker.received_msgs[events_topic][0]
+        self.assertEqual(["OrderExpired", "OrderExpired"], [event["type"] for event in batch_msg["events"]])
+        self.assertFalse(self.is_msg_received(f"hbot/{self.instance_id}/events"))
+
+    def test_mqtt_eventforwarder_drops_events_when_queue_full(self):
+        self.start_mqtt()
+        market_events = self.gateway._market_events
+        # A queue not consumed by the worker thread, as if the broker was blocking it
+        market_events._events_queue = queue.Queue(maxsize=1)
+
+        market_events._send_mqtt_event(event_tag=999, pubsub=None, event={})
+        market_events._send_mqtt_event(event_tag=999, pubsub=None, event={})
+
+        self.assertEqual(1, market_events.dropped_events)
+        self.assertTrue(self._is_logged(
+            "WARNING",
+            "The MQTT broker is not keeping up with the market events. 1 events have not been forwarded."))
+
+    def test_mqtt_market_data_published_only_when_changed(self):
+        self.client_config_map.mqtt_bridge.mqtt_market_data = True
+        self.addCleanup(setattr, self.client_config_map.mqtt_bridge, "mqtt_market_data", False)
+        self.client_config_map.mqtt_bridge.mqtt_market_data_depth = 2
+        self.addCleanup(setattr, self.client_config_map.mqtt_bridge, "mqtt_market_data_depth", 5)
+        self.test_market.set_balanced_order_book("COINALPHA-HBOT", mid_price=100, min_price=50, max_price=150,
+                                                 price_step_size=1, volume_step_size=10)
+        candles = MagicMock()
+        candles.name = "binance"
+        candles.trading_pair = "COINALPHA-HBOT"
+        candles.interval = "1m"
+        candles.columns = ["timestamp", "open", "high", "low", "close", "volume"]
+        candles.last_candle = [1685000000000.0, 99.0, 101.0, 98.0, 100.0, 10.0]
+        strategy = MagicMock()
+        strategy.market_data_candles.return_value = [candles]
+        strategy.market_data_indicators.return_value = {"volatility": 0.01}
+        self.hbapp.strategy = strategy
+        self.addCleanup(setattr, self.hbapp, "strategy", None)
+        self.start_mqtt()
+
+        self.gateway._market_data.publish_market_data()
+        self.gateway._market_data.publish_market_data()
+
+        market_data_topic = f"hbot/{self.instance_id}/market_data/test_market_paper_trade/COINALPHA-HBOT"
+        indicators_topic = f"hbot/{self.instance_id}/market_data/indicators"
+        market_data_msgs = self.fake_mqtt_broker.received_msgs[market_data_topic]
+        self.assertEqual(1, len(market_data_msgs))
+        self.assertEqual(2, len(market_data_msgs[0]["bids"]))
+        self.assertEqual(2, len(market_data_msgs[0]["asks"]))
+        self.assertEqual(100, market_data_msgs[0]["mid_price"])
+        self.assertEqual(100, market_data_msgs[0]["micro_price"])
+        self.assertEqual([{"volatility": 0.01}],
+                         [msg["data"] for msg in self.fake_mqtt_broker.received_msgs[indicators_topic]])
+        candles_topic = f"hbot/{self.instance_id}/market_data/candles/binance/COINALPHA-HBOT/1m"
+        self.assertEqual([candles.last_candle],
+                         [msg["candle"] for msg in self.fake_mqtt_broker.received_msgs[candles_topic]])
+
+        strategy.market_data_indicators.return_value = {"volatility": 0.02}
+        self.gateway._market_data.publish_market_data()
+
+        self.assertEqual(1, len(self.fake_mqtt_broker.received_msgs[market_data_topic]))
+        self.assertEqual(2, len(self.fake_mqtt_broker.received_msgs[indicators_topic]))
+
+        # The indicators updated in place by the strategy are published again
+        indicators = {"volatility": 0.03}
+        strategy.market_data_indicators.return_value = indicators
+        self.gateway._market_data.publish_market_data()
+        indicators["volatility"] = 0.04
+        self.gateway._market_data.publish_market_data()
+
+        self.assertEqual([{"volatility": 0.01}, {"volatility": 0.02}, {"volatility": 0.03}, {"volatility": 0.04}],
+                         [msg["data"] for msg in self.fake_mqtt_broker.received_msgs[indicators_topic]])
+
     def test_mqtt_notifier_fakes(self):
         self.start_mqtt()
         self.assertEqual(self.gateway._notifier.start(), None)
@@ -1,9 +1,10 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub, CandlesView
 from hummingbot.smart_components.strategy_frameworks.controller_base import ControllerBase, ControllerConfigBase
 
 
@@ -68,17 +69,35 @@ class TestControllerBase(unittest.TestCase):
         self.controller.candles = [mock_candle]
         self.assertTrue(self.controller.all_candles_ready)
 
-    def test_start(self):
-        mock_candle = MagicMock()
-        self.controller.candles = [mock_candle]
-        self.controller.start()
-        mock_candle.start.assert_called_once()
-
-    def test_stop(self):
-        mock_candle = MagicMock()
-        self.controller.candles = [mock_candle]
-        self.controller.stop()
-        mock_candle.stop.assert_called_once()
+    @patch("hummingbot.smart_components.strategy_frameworks.controller_base.safe_ensure_future")
+    def test_start(self, safe_ensure_future_mock):
+        hub = CandlesHub(connector="binance")
+        with patch.object(CandlesHub, "get_instance", return_value=hub):
+            self.controller.start()
+
+        self.assertEqual(1, len(self.controller.candles))
+        self.assertIsInstance(self.controller.candles[0], CandlesView)
+        self.assertEqual([("BTC-USDT", "1m")], hub.streams)
+        safe_ensure_future_mock.assert_called_once()
+
+    @patch("hummingbot.smart_components.strategy_frameworks.controller_base.safe_ensure_future")
+    def test_stop(self, safe_ensure_future_mock):
+        hub = CandlesHub(connector="binance")
+        other_controller = ControllerBase(config=self.mock_controller_config)
+        with patch.object(CandlesHub, "get_instance", return_value=hub):
+            self.controller.start()
+            other_controller.start()
+            self.assertIs(self.controller.candles[0], other_controller.candles[0])
+            safe_ensure_future_mock.reset_mock()
+
+            self.controller.stop()
+            # The hub is still used by the other controller
+            self.assertEqual([("BTC-USDT", "1m")], hub.streams)
+            safe_ensure_future_mock.assert_not_called()
+
+            other_controller.stop()
+            self.assertEqual([], hub.streams)
+            safe_ensure_future_mock.assert_called_once()
 
     def test_get_csv_prefix(self):
         prefix = self.controller.get_csv_prefix()
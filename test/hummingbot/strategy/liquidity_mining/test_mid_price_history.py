@@ -0,0 +1,37 @@
+import math
+import unittest
+
+from hummingbot.strategy.liquidity_mining.mid_price_history import MidPriceHistory
+
+
+class MidPriceHistoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.history = MidPriceHistory(markets=["ETH-USDT", "BTC-USDT", "ETH-BTC"], max_length=6)
+
+    def test_prices_kept_in_ring_buffer(self):
+        for i in range(8):
+            self.history.add_prices({"ETH-USDT": 100 + i, "BTC-USDT": 1000 + i})
+
+        self.assertEqual(6, len(self.history))
+        self.assertEqual([102, 103, 104, 105, 106, 107], self.history.market_prices("ETH-USDT").tolist())
+        self.assertTrue(all(math.isnan(price) for price in self.history.market_prices("ETH-BTC")))
+
+    def test_volatility_with_incomplete_interval_uses_all_prices(self):
+        for price in [100, 105, 110]:
+            self.history.add_prices({"ETH-USDT": price, "BTC-USDT": 1000})
+
+        volatility = self.history.volatility(interval=5, periods=2)
+
+        self.assertAlmostEqual(0.1, volatility[0])
+        self.assertEqual(0, volatility[1])
+        self.assertTrue(math.isnan(volatility[2]))
+
+    def test_volatility_averages_last_complete_intervals(self):
+        for price in [90, 100, 110, 100, 100, 105, 120]:
+            self.history.add_prices({"ETH-USDT": price})
+
+        volatility = self.history.volatility(interval=3, periods=2)
+
+        # Intervals [110, 100, 100] and [100, 105, 120]
+        self.assertAlmostEqual((0.1 + 0.2) / 2, volatility[0])
@@ -2,8 +2,10 @@
 import unittest
 
 from hummingbot.strategy.pure_market_making.data_types import InventorySkewBidAskRatios
-from hummingbot.strategy.pure_market_making.inventory_skew_calculator import \
-    calculate_bid_ask_ratios_from_base_asset_ratio
+from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
+    calculate_bid_ask_ratios_from_base_asset_ratio,
+    calculate_bid_ask_ratios_from_base_asset_ratios,
+)
 
 
 class InventorySkewCalculatorUnitTest(unittest.TestCase):
@@ -103,6 +105,24 @@ class InventorySkewCalculatorUnitTest(unittest.TestCase):
         self.assertAlmostEqual(0.0, bid_ask_ratios.bid_ratio)
         self.assertAlmostEqual(0.0, bid_ask_ratios.ask_ratio)
 
+    def test_vectorized_ratios_match_single_market_ratios(self):
+        base_assets = [85000, 8500, 200000, 100, 10, 0, 50]
+        quote_assets = [10000, 10000, 10000, 10, 100, 0, 50]
+        prices = [0.0036, 0.0036, 0.0036, 1, 1, 1, 1]
+        base_ranges = [20000, 20000, 20000, 200, 200, 10, 0]
+        target_ratio = 0.35
+
+        bid_ratios, ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratios(
+            base_assets, quote_assets, prices, target_ratio, base_ranges
+        )
+
+        for i in range(len(base_assets)):
+            expected: InventorySkewBidAskRatios = calculate_bid_ask_ratios_from_base_asset_ratio(
+                base_assets[i], quote_assets[i], prices[i], target_ratio, base_ranges[i]
+            )
+            self.assertAlmostEqual(expected.bid_ratio, bid_ratios[i])
+            self.assertAlmostEqual(expected.ask_ratio, ask_ratios[i])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+from decimal import Decimal
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.fixed_point_proposal import FixedPointProposal
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+
+class FixedPointProposalUnitTest(unittest.TestCase):
+    def test_budget_constraint_reduces_sizes_in_order(self):
+        proposal = FixedPointProposal(Decimal("0.01"), Decimal("0.1"))
+        proposal.add_level(True, 9900, 10)
+        proposal.add_level(True, 9800, 20)
+        proposal.add_level(False, 10100, 10)
+        proposal.add_level(False, 10200, 20)
+
+        # 150 quote buys 1 unit at 99 and 0.5 at 98, 1.5 base sells 1 and 0.5
+        proposal.apply_budget_constraint(base_balance=1.5, quote_balance=150, buy_fee_percent=0)
+
+        self.assertEqual([(9900, 10), (9800, 5)], proposal.buys)
+        self.assertEqual([(10100, 10), (10200, 5)], proposal.sells)
+
+    def test_filter_out_takers(self):
+        proposal = FixedPointProposal(Decimal("0.01"), Decimal("0.1"))
+        proposal.add_level(True, 10050, 10)
+        proposal.add_level(True, 9900, 10)
+        proposal.add_level(False, 9950, 10)
+        proposal.add_level(False, 10100, 10)
+
+        proposal.filter_out_takers(top_ask=100.5, top_bid=99.5)
+
+        self.assertEqual([(9900, 10)], proposal.buys)
+        self.assertEqual([(10100, 10)], proposal.sells)
+
+
+class PMMFixedPointProposalTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair = "HBOT-ETH"
+    base_asset = trading_pair.split("-")[0]
+    quote_asset = trading_pair.split("-")[1]
+
+    def _run_strategy(self, balances: Dict[str, int], **params) -> Tuple[List[Tuple], List[Tuple]]:
+        clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(self.trading_pair,
+                                       mid_price=100,
+                                       min_price=1,
+                                       max_price=200,
+                                       price_step_size=1,
+                                       volume_step_size=10)
+        for asset, balance in balances.items():
+            market.set_balance(asset, balance)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        market_info = MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.015"),
+            order_amount=Decimal("1.5"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            minimum_spread=-1,
+            order_levels=4,
+            order_level_spread=Decimal("0.005"),
+            order_level_amount=Decimal("0.5"),
+            **params
+        )
+        clock.add_iterator(market)
+        clock.add_iterator(strategy)
+        clock.backtest_til(self.start_timestamp + 1)
+        buys = sorted([(o.price, o.quantity) for o in strategy.active_buys], reverse=True)
+        sells = sorted([(o.price, o.quantity) for o in strategy.active_sells])
+        return buys, sells
+
+    def _assert_same_orders_as_decimal_proposals(self, balances: Dict[str, int], size_tolerance: Decimal = Decimal(0),
+                                                 **params):
+        expected_buys, expected_sells = self._run_strategy(balances, **params)
+        buys, sells = self._run_strategy(balances, fixed_point_proposals_enabled=True, **params)
+
+        self.assertGreater(len(expected_buys) + len(expected_sells), 0)
+        self.assertEqual(len(expected_buys), len(buys))
+        self.assertEqual(len(expected_sells), len(sells))
+        for (expected_price, expected_size), (price, size) in zip(expected_buys + expected_sells, buys + sells):
+            self.assertEqual(expected_price, price)
+            self.assertLessEqual(abs(expected_size - size), size_tolerance)
+
+    def test_multiple_levels_orders(self):
+        self._assert_same_orders_as_decimal_proposals({"HBOT": 500, "ETH": 5000})
+
+    def test_budget_constrained_orders(self):
+        self._assert_same_orders_as_decimal_proposals({"HBOT": 3, "ETH": 300})
+
+    def test_inventory_skew_and_transaction_costs(self):
+        self._assert_same_orders_as_decimal_proposals(
+            {"HBOT": 20, "ETH": 5000},
+            # The Decimal pipeline can lose a lot when scaling by the float skew ratio
+            size_tolerance=Decimal("0.00001"),
+            inventory_skew_enabled=True,
+            inventory_target_base_pct=Decimal("0.5"),
+            inventory_range_multiplier=Decimal("1"),
+            add_transaction_costs_to_orders=True,
+        )
+
+    def test_price_band_and_ping_pong(self):
+        self._assert_same_orders_as_decimal_proposals(
+            {"HBOT": 500, "ETH": 5000},
+            price_ceiling=Decimal("99"),
+            ping_pong_enabled=True,
+        )
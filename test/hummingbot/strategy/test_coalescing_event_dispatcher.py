@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+from typing import Any, Awaitable, Hashable, List, Tuple
+
+from hummingbot.strategy.coalescing_event_dispatcher import CoalescingEventDispatcher
+
+
+class CoalescingEventDispatcherTests(unittest.TestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.log_records = []
+        self.calls: List[Tuple[Hashable, List[Any]]] = []
+        self.callback_release = asyncio.Event()
+        self.callback_release.set()
+        self.dispatcher = CoalescingEventDispatcher(self._callback)
+        self.dispatcher.logger().setLevel(1)
+        self.dispatcher.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.dispatcher.stop()
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def _callback(self, key: Hashable, events: List[Any]):
+        self.calls.append((key, events))
+        await self.callback_release.wait()
+        if "fail" in events:
+            raise ValueError("Test error")
+
+    def test_events_dispatched_in_the_same_iteration_are_coalesced(self):
+        self.dispatcher.dispatch("key", 1)
+        self.dispatcher.dispatch("key", 2)
+        self.dispatcher.dispatch("other_key", 3)
+
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([("key", [1, 2]), ("other_key", [3])], self.calls)
+        self.assertEqual(2, self.dispatcher.metrics.calls)
+        self.assertEqual(3, self.dispatcher.metrics.events)
+
+    def test_events_received_while_callback_is_running_are_delivered_in_next_call(self):
+        self.callback_release.clear()
+        self.dispatcher.dispatch("key", 1)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.dispatcher.dispatch("key", 2)
+        self.dispatcher.dispatch("key", 3)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([("key", [1])], self.calls)
+        self.assertEqual({"key"}, self.dispatcher.keys_with_pending_events)
+
+        self.callback_release.set()
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([("key", [1]), ("key", [2, 3])], self.calls)
+        self.assertEqual(set(), self.dispatcher.keys_with_pending_events)
+
+    def test_callback_errors_are_logged_and_processing_continues(self):
+        self.dispatcher.dispatch("key", "fail")
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.dispatcher.dispatch("key", 1)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([("key", ["fail"]), ("key", [1])], self.calls)
+        self.assertTrue(self._is_logged("ERROR", "Unexpected error processing events for key."))
+
+    def test_stop_discards_pending_events(self):
+        self.callback_release.clear()
+        self.dispatcher.dispatch("key", 1)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.dispatcher.dispatch("key", 2)
+
+        self.dispatcher.stop()
+        self.callback_release.set()
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual([("key", [1])], self.calls)
+        self.assertEqual(set(), self.dispatcher.keys_with_pending_events)
+
+    def test_metrics(self):
+        self.dispatcher.dispatch("key", 1)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        metrics = self.dispatcher.metrics
+        self.assertEqual(1, metrics.calls)
+        self.assertGreaterEqual(metrics.max_latency, metrics.last_latency)
+        self.assertEqual(metrics.last_latency, metrics.mean_latency)
+        self.assertEqual(metrics.last_duration, metrics.mean_duration)
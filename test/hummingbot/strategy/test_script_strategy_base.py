@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from decimal import Decimal
 from typing import List
@@ -10,7 +11,9 @@ from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import Quant
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock
 from hummingbot.core.clock_mode import ClockMode
-from hummingbot.core.event.events import OrderType
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderBookTopOfBookUpdateEvent, OrderBookTradeEvent, OrderType
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
@@ -19,6 +22,21 @@ class MockScriptStrategy(ScriptStrategyBase):
     pass
 
 
+class MockEventDrivenScriptStrategy(ScriptStrategyBase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.order_book_updates = []
+        self.received_trades = []
+
+    async def on_order_book_update(self, connector_name: str, trading_pair: str,
+                                   update: OrderBookTopOfBookUpdateEvent):
+        self.order_book_updates.append((connector_name, trading_pair, update))
+
+    async def on_trade(self, connector_name: str, trading_pair: str, trades: List[OrderBookTradeEvent]):
+        self.received_trades.append((connector_name, trading_pair, trades))
+
+
 class ScriptStrategyBaseTest(unittest.TestCase):
     level = 0
 
@@ -153,3 +171,40 @@ class ScriptStrategyBaseTest(unittest.TestCase):
                 message=f"({self.trading_pair}) Canceling the limit order {order_id}."
             )
         )
+
+    def test_event_callbacks_not_subscribed_if_not_implemented(self):
+        self.strategy.tick(self.start_timestamp)
+
+        self.assertEqual({}, self.strategy.event_callbacks_metrics)
+        self.assertEqual([], self.strategy._order_book_event_forwarders)
+
+    def test_event_callbacks_receive_coalesced_order_book_events(self):
+        strategy = MockEventDrivenScriptStrategy({self.connector_name: self.connector})
+        strategy.tick(self.start_timestamp)
+        order_book = self.connector.get_order_book(self.trading_pair)
+
+        order_book.apply_diffs([OrderBookRow(99.6, 1, 1000)], [], 1000)
+        order_book.apply_diffs([OrderBookRow(99.7, 1, 1001)], [], 1001)
+        trades = [
+            OrderBookTradeEvent(self.trading_pair, self.start_timestamp, TradeType.BUY, 101, 1),
+            OrderBookTradeEvent(self.trading_pair, self.start_timestamp, TradeType.SELL, 99, 2),
+        ]
+        for trade in trades:
+            order_book.apply_trade(trade)
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.01))
+
+        self.assertEqual(1, len(strategy.order_book_updates))
+        connector_name, trading_pair, update = strategy.order_book_updates[0]
+        self.assertEqual((self.connector_name, self.trading_pair), (connector_name, trading_pair))
+        self.assertEqual(99.7, update.best_bid)
+        self.assertEqual(1001, update.update_id)
+        self.assertEqual([(self.connector_name, self.trading_pair, trades)], strategy.received_trades)
+        self.assertEqual({"on_order_book_update", "on_trade"}, set(strategy.event_callbacks_metrics.keys()))
+        self.assertEqual(2, strategy.event_callbacks_metrics["on_order_book_update"].events)
+        self.assertIn("Event callbacks:", strategy.format_status())
+
+        strategy.stop(self.clock)
+        order_book.apply_diffs([OrderBookRow(99.8, 1, 1002)], [], 1002)
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.01))
+
+        self.assertEqual(1, len(strategy.order_book_updates))